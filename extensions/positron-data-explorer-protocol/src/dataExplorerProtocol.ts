@@ -282,6 +282,12 @@ export interface TableData {
 	 */
 	columns: Array<Array<ColumnValue>>;
 
+	/**
+	 * If set, the values were returned in the binary buffers of the comm
+	 * message using this encoding, and 'columns' is empty
+	 */
+	binary_format?: BinaryFormat;
+
 }
 
 /**
@@ -837,6 +843,12 @@ export interface ColumnHistogram {
 	 */
 	quantiles: Array<ColumnQuantileValue>;
 
+	/**
+	 * Whether the bin counts were computed from a row sample and are scaled
+	 * estimates of the true counts. May be omitted
+	 */
+	is_approximate?: boolean;
+
 }
 
 /**
@@ -870,6 +882,12 @@ export interface ColumnFrequencyTable {
 	 */
 	other_count?: number;
 
+	/**
+	 * Whether the counts were computed from a row sample and are scaled
+	 * estimates of the true counts. May be omitted
+	 */
+	is_approximate?: boolean;
+
 }
 
 /**
@@ -949,6 +967,11 @@ export interface SupportedFeatures {
 	 */
 	convert_to_code: ConvertToCodeFeatures;
 
+	/**
+	 * Support for 'get_data_values' RPC and its features
+	 */
+	get_data_values?: GetDataValuesFeatures;
+
 }
 
 /**
@@ -967,6 +990,17 @@ export interface SearchSchemaFeatures {
 
 }
 
+/**
+ * Feature flags for 'get_data_values' RPC
+ */
+export interface GetDataValuesFeatures {
+	/**
+	 * Binary encodings supported for returning unformatted values
+	 */
+	supported_binary_formats: Array<BinaryFormat>;
+
+}
+
 /**
  * Feature flags for 'set_column_filters' RPC
  */
@@ -1349,6 +1383,13 @@ export enum ExportFormat {
 	Html = 'html'
 }
 
+/**
+ * Possible values for BinaryFormat
+ */
+export enum BinaryFormat {
+	ArrowIpc = 'arrow_ipc'
+}
+
 /**
  * Possible values for SupportStatus
  */
@@ -1407,6 +1448,14 @@ export interface GetDataValuesParams {
 	 * Formatting options for returning data values as strings
 	 */
 	format_options: FormatOptions;
+
+	/**
+	 * Opt-in binary encoding for the result. If set and supported by the
+	 * backend, unformatted values are returned in the binary buffers of the
+	 * comm message (one buffer per column selection) instead of as formatted
+	 * strings
+	 */
+	binary_format?: BinaryFormat;
 }
 
 /**
@@ -1437,6 +1486,12 @@ export interface ExportDataSelectionParams {
 	 * Result string format
 	 */
 	format: ExportFormat;
+
+	/**
+	 * If set, the backend writes the exported data to this file path in
+	 * bounded chunks instead of returning it, and the result data is empty
+	 */
+	path?: string;
 }
 
 /**
@@ -5,9 +5,15 @@ This module provides implementations of data analysis functions for both
 NumPy and Polars to handle cases where one or the other may not be available.
 """
 
+import functools
 import math
+import re
+import threading
 import warnings
-from typing import TYPE_CHECKING, Optional, Tuple
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Optional, Tuple
+
+from .third_party import _pyarrow_compute
 
 if TYPE_CHECKING:
     import polars as pl
@@ -16,6 +22,677 @@ if TYPE_CHECKING:
 _EMPTY_HISTOGRAM = ([], [0.0, 1.0])
 
 
+def _estimate_nbytes(value) -> int:
+    """Estimate the memory used by a NumPy array, pandas or polars object."""
+    if hasattr(value, "estimated_size"):
+        # polars
+        return value.estimated_size()
+    elif hasattr(value, "nbytes"):
+        nbytes = int(value.nbytes)
+        if getattr(value, "dtype", None) == object:  # noqa: E721
+            # nbytes only counts the pointers to Python objects like
+            # strings, so we also estimate the size of the objects
+            nbytes += 64 * len(value)
+        return nbytes
+    else:
+        return 0
+
+
+class LRUCache:
+    """
+    A thread-safe least-recently-used cache bounded by memory use.
+
+    Each entry is stored with its size in bytes, and the least recently
+    used entries are evicted once the total size exceeds max_bytes.
+    Values larger than max_bytes are not cached at all.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: OrderedDict[Hashable, Tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value, nbytes: Optional[int] = None) -> None:
+        if nbytes is None:
+            nbytes = _estimate_nbytes(value)
+
+        with self._lock:
+            self._pop(key)
+            if nbytes > self.max_bytes:
+                return
+
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_nbytes
+
+    def pop(self, key: Hashable, default=None):
+        with self._lock:
+            entry = self._pop(key)
+            return default if entry is None else entry[0]
+
+    def _pop(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+# Boolean masks are converted to row indices in chunks of this many
+# rows, so that the indices are never materialized as int64
+_MASK_TO_INDICES_CHUNK_SIZE = 1 << 20
+
+
+def _compact_index_dtype(num_rows: int):
+    """Get the narrowest integer dtype for indices of a table of num_rows rows."""
+    import numpy as np
+
+    return np.uint32 if num_rows <= 1 << 32 else np.int64
+
+
+def _compact_indices(indices, num_rows: int):
+    """Convert row indices of a table of num_rows rows to the narrowest integer dtype."""
+    import numpy as np
+
+    return np.asarray(indices).astype(_compact_index_dtype(num_rows), copy=False)
+
+
+def _mask_to_row_indices(mask):
+    """
+    Convert a boolean NumPy row mask to the indices of the selected rows.
+
+    Consecutive selected rows are returned as a RowRange, and otherwise
+    the indices use the narrowest integer dtype for the number of rows.
+    """
+    import numpy as np
+
+    num_selected = int(np.count_nonzero(mask))
+    if num_selected > 0:
+        start = int(mask.argmax())
+        if mask[start : start + num_selected].all():
+            return RowRange(start, start + num_selected)
+
+    indices = np.empty(num_selected, dtype=_compact_index_dtype(len(mask)))
+    position = 0
+    for offset in range(0, len(mask) if num_selected > 0 else 0, _MASK_TO_INDICES_CHUNK_SIZE):
+        chunk = np.flatnonzero(mask[offset : offset + _MASK_TO_INDICES_CHUNK_SIZE])
+        np.add(chunk, offset, out=indices[position : position + len(chunk)], casting="unsafe")
+        position += len(chunk)
+    return indices
+
+
+class RowRange:
+    """
+    A contiguous range of row indices.
+
+    This stands in for the array of row indices of a filtered view
+    when the selected rows are consecutive, and supports the parts of
+    the NumPy array interface used for row indices. Views gather the
+    rows of a RowRange with zero-copy slices instead of takes.
+    """
+
+    nbytes = 0
+
+    def __init__(self, start: int, stop: int):
+        self.start = start
+        self.stop = max(start, stop)
+
+    def __repr__(self) -> str:
+        return f"RowRange({self.start}, {self.stop})"
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RowRange) and self.start == other.start and self.stop == other.stop
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.stop))
+
+    @property
+    def dtype(self):
+        return _compact_index_dtype(self.stop)
+
+    @property
+    def slice(self) -> slice:
+        return slice(self.start, self.stop)
+
+    def __array__(self, dtype=None, copy=None):
+        import numpy as np
+
+        return np.arange(self.start, self.stop, dtype=dtype or self.dtype)
+
+    def __iter__(self):
+        return iter(range(self.start, self.stop))
+
+    def __getitem__(self, key):
+        import numpy as np
+
+        if isinstance(key, slice):
+            rows = range(self.start, self.stop)[key]
+            if rows.step == 1:
+                return RowRange(rows.start, rows.stop)
+            return np.arange(rows.start, rows.stop, rows.step, dtype=self.dtype)
+
+        key = np.asarray(key)
+        if key.ndim == 0:
+            return range(self.start, self.stop)[int(key)]
+        elif key.dtype == bool:
+            return self.take(_mask_to_row_indices(key))
+        else:
+            return self.take(key)
+
+    def take(self, indices):
+        """Get the row indices at the positions of indices, like ndarray.take."""
+        import numpy as np
+
+        if isinstance(indices, RowRange):
+            if indices.stop > len(self):
+                raise IndexError(f"{indices} is out of bounds for {self}")
+            return RowRange(self.start + indices.start, self.start + indices.stop)
+
+        indices = np.asarray(indices)
+        if len(indices) > 0 and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError(f"Row indices are out of bounds for {self}")
+        return indices.astype(self.dtype, copy=False) + self.start
+
+
+class DictionaryEncoding:
+    """
+    A column encoded as integer codes into a dictionary of its distinct values.
+
+    The dictionary is a column (for example a pandas Series) of the
+    same type as the encoded column, holding a null value followed by
+    the distinct values, and code -1 is null. Elementwise operations
+    like filters can then be computed once per distinct value and
+    mapped through the codes, and value counts are a bincount of the
+    codes.
+    """
+
+    def __init__(self, codes, dictionary):
+        import numpy as np
+
+        # Use the smallest integer type that can index the dictionary
+        # after shifting the codes by one for the leading null
+        num_values = len(dictionary)
+        if num_values <= np.iinfo(np.int8).max:
+            code_dtype = np.int8
+        elif num_values <= np.iinfo(np.int16).max:
+            code_dtype = np.int16
+        else:
+            code_dtype = np.int32
+
+        self.codes = np.asarray(codes).astype(code_dtype, copy=False)
+        self.dictionary = dictionary
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + _estimate_nbytes(self.dictionary)
+
+    def _get_codes(self, row_indices=None):
+        if row_indices is None:
+            return self.codes
+        elif isinstance(row_indices, RowRange):
+            return self.codes[row_indices.slice]
+        return self.codes.take(row_indices)
+
+    def map_values(self, values, row_indices=None):
+        """Map a NumPy array of one value per dictionary entry to the (selected) rows."""
+        return values.take(self._get_codes(row_indices) + 1)
+
+    def value_counts(self, row_indices=None):
+        """Count the rows of each non-null dictionary value, in dictionary order."""
+        import numpy as np
+
+        codes = self._get_codes(row_indices) + 1
+        return np.bincount(codes, minlength=len(self.dictionary))[1:]
+
+
+class TextSearchPattern:
+    """
+    A compiled text search filter for Arrow, polars or Python strings.
+
+    Contains, starts-with and ends-with searches match the term
+    literally, and regex searches find the pattern anywhere in a value,
+    or only at its start if match_start is set (like re.match).
+    Case-insensitive searches are compiled with the case folded rather
+    than lowercasing every value. Nulls match no search, including
+    not-contains.
+
+    Use get_text_search_pattern to reuse patterns across evaluations.
+    """
+
+    def __init__(
+        self, search_type: str, term: str, *, case_sensitive: bool, match_start: bool = False
+    ):
+        if search_type not in (
+            "contains",
+            "not_contains",
+            "starts_with",
+            "ends_with",
+            "regex_match",
+        ):
+            raise ValueError(f"Unsupported text search type: {search_type}")
+
+        self.search_type = search_type
+        self.term = term
+        self.case_sensitive = case_sensitive
+        self.match_start = match_start
+
+        if search_type == "regex_match":
+            # Compile eagerly so that invalid patterns raise right away
+            _ = self.regex
+
+    @functools.cached_property
+    def regex(self) -> re.Pattern:
+        """The equivalent Python regular expression."""
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        if self.search_type == "regex_match":
+            return re.compile(self.term, flags)
+
+        pattern = re.escape(self.term)
+        if self.search_type == "ends_with":
+            pattern += r"\Z"
+        return re.compile(pattern, flags)
+
+    @functools.cached_property
+    def _matches(self) -> Callable[[str], Any]:
+        term = self.term
+        if self.search_type == "regex_match" or not self.case_sensitive:
+            if self.search_type == "starts_with" or (
+                self.search_type == "regex_match" and self.match_start
+            ):
+                return self.regex.match
+            return self.regex.search
+        elif self.search_type == "starts_with":
+            return lambda value: value.startswith(term)
+        elif self.search_type == "ends_with":
+            return lambda value: value.endswith(term)
+        else:
+            return lambda value: term in value
+
+    def python_mask(self, values):
+        """Evaluate the search on a sequence of Python strings, returning a NumPy mask."""
+        import numpy as np
+
+        matches = self._matches
+        mask = np.fromiter(
+            (isinstance(value, str) and bool(matches(value)) for value in values),
+            dtype=bool,
+            count=len(values),
+        )
+        if self.search_type == "not_contains":
+            is_str = np.fromiter(
+                (isinstance(value, str) for value in values), dtype=bool, count=len(values)
+            )
+            mask = is_str & ~mask
+        return mask
+
+    def arrow_mask(self, values):
+        """Evaluate the search on an Arrow (chunked) string array, returning an Arrow mask."""
+        import pyarrow as pa
+
+        pc = _pyarrow_compute()
+
+        ignore_case = not self.case_sensitive
+        if self.search_type == "regex_match":
+            pattern = f"^(?:{self.term})" if self.match_start else self.term
+            try:
+                mask = pc.match_substring_regex(values, pattern, ignore_case=ignore_case)
+            except pa.ArrowInvalid:
+                # Arrow uses RE2, which lacks some Python regex features
+                # like lookarounds and backreferences
+                return pa.array(self.python_mask(values.to_pylist()))
+        elif self.search_type in ("contains", "not_contains"):
+            mask = pc.match_substring(values, self.term, ignore_case=ignore_case)
+            if self.search_type == "not_contains":
+                mask = pc.invert(mask)
+        elif self.search_type == "starts_with":
+            mask = pc.starts_with(values, self.term, ignore_case=ignore_case)
+        else:
+            mask = pc.ends_with(values, self.term, ignore_case=ignore_case)
+
+        return pc.fill_null(mask, False)  # noqa: FBT003
+
+    def polars_mask(self, col):
+        """
+        Evaluate the search on a polars string Series or expression.
+
+        Nulls are left in the result for the caller to fill.
+        """
+        if self.search_type == "regex_match":
+            pattern = self.term
+            if self.match_start:
+                pattern = f"^(?:{pattern})"
+            if not self.case_sensitive:
+                pattern = "(?i)" + pattern
+            return col.str.contains(pattern)
+
+        if self.case_sensitive:
+            if self.search_type == "starts_with":
+                return col.str.starts_with(self.term)
+            elif self.search_type == "ends_with":
+                return col.str.ends_with(self.term)
+            mask = col.str.contains(self.term, literal=True)
+        else:
+            pattern = re.escape(self.term)
+            if self.search_type == "starts_with":
+                pattern = "^" + pattern
+            elif self.search_type == "ends_with":
+                pattern += "$"
+            mask = col.str.contains("(?i)" + pattern)
+
+        if self.search_type == "not_contains":
+            mask = ~mask
+        return mask
+
+
+@functools.lru_cache(maxsize=64)
+def get_text_search_pattern(
+    search_type: str, term: str, *, case_sensitive: bool, match_start: bool = False
+) -> TextSearchPattern:
+    """Get a compiled text search, reusing it for repeated evaluations of the same filter."""
+    return TextSearchPattern(
+        search_type, term, case_sensitive=case_sensitive, match_start=match_start
+    )
+
+
+class ColumnSortIndex:
+    """
+    A stable sort of a single column that can be reused across sorts.
+
+    Holds the stable ascending sort order of the rows, with nulls either
+    first or last. The dense rank of each row's value (-1 for nulls) is
+    computed on demand by get_ranks, and allows getting the order in the
+    other direction without re-sorting, integer keys for breaking ties
+    in multi-key sorts, and the order of any subset of rows by masking.
+    """
+
+    def __init__(self, order, num_nulls: int, get_ranks: Callable, *, nulls_last: bool):
+        import numpy as np
+
+        # Row positions fit in 32 bits for all but the largest tables
+        self.index_dtype = np.int32 if len(order) < 2**31 else np.int64
+
+        self.order = np.asarray(order).astype(self.index_dtype, copy=False)
+        self.num_nulls = num_nulls
+        self.nulls_last = nulls_last
+        self._get_ranks = get_ranks
+        self._ranks = None
+        self._num_unique = None
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def nbytes(self) -> int:
+        nbytes = self.order.nbytes
+        if self._ranks is not None:
+            nbytes += self._ranks.nbytes
+        return nbytes
+
+    @property
+    def ranks(self):
+        if self._ranks is None:
+            import numpy as np
+
+            ranks = np.asarray(self._get_ranks()).astype(self.index_dtype, copy=False)
+            self._num_unique = int(ranks.max()) + 1 if len(ranks) > 0 else 0
+            self._ranks = ranks
+        return self._ranks
+
+    @property
+    def num_unique(self) -> int:
+        _ = self.ranks
+        return self._num_unique  # type: ignore[return-value]
+
+    def get_order(self, *, ascending: bool, row_mask=None):
+        """
+        Get the stable sort order of the rows in the given direction.
+
+        If row_mask is passed, only the selected rows are included.
+        """
+        import numpy as np
+
+        if ascending and row_mask is None:
+            return self.order
+
+        num_values = len(self.order) - self.num_nulls
+        if self.nulls_last:
+            values, nulls = self.order[:num_values], self.order[num_values:]
+        else:
+            nulls, values = self.order[: self.num_nulls], self.order[self.num_nulls :]
+
+        if not ascending:
+            if self.num_unique == num_values:
+                values = values[::-1]
+            else:
+                values = _stable_reverse(values, self.ranks[values])
+
+        if row_mask is not None:
+            nulls = nulls[row_mask[nulls]]
+            values = values[row_mask[values]]
+
+        if self.nulls_last:
+            return np.concatenate([values, nulls])
+        else:
+            return np.concatenate([nulls, values])
+
+    def get_sort_key(self, *, ascending: bool):
+        """Get an integer key per row that sorts in the same order as the column."""
+        import numpy as np
+
+        ranks = self.ranks
+        null_key = self.num_unique if self.nulls_last else -1
+        key = ranks if ascending else self.num_unique - 1 - ranks
+        return np.where(ranks < 0, null_key, key)
+
+
+class ColumnSearchIndex:
+    """
+    An index of the column names and types of a table for schema search.
+
+    The names are lowercased once, and the positions of the columns
+    containing each n-gram of the lowercased names are indexed on first
+    use, so that a search term only needs to be checked against the
+    columns containing its rarest n-gram. Type displays are computed on
+    demand and memoized, since computing them can be expensive.
+
+    A search can also be restricted to the matches of a previous search,
+    for when the user types more of the same term.
+    """
+
+    NGRAM_LENGTH = 3
+
+    def __init__(self, names: list[str], get_type_display: Callable[[int], Any]):
+        self.names = names
+        self.lower_names = [name.lower() for name in names]
+        self._get_type_display = get_type_display
+        self._type_displays: list[Any] = [None] * len(names)
+        self._ngrams: dict[str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def type_display(self, index: int):
+        type_display = self._type_displays[index]
+        if type_display is None:
+            type_display = self._type_displays[index] = self._get_type_display(index)
+        return type_display
+
+    def search(self, term: str, *, case_sensitive: bool, candidates=None) -> list[int]:
+        """
+        Get the positions of the columns whose name contains a term, in order.
+
+        If candidates is passed, only those positions are checked.
+        """
+        lower_term = term.lower()
+        if candidates is None:
+            candidates = self._get_candidates(lower_term)
+
+        if case_sensitive:
+            return [i for i in candidates if term in self.names[i]]
+        lower_names = self.lower_names
+        return [i for i in candidates if lower_term in lower_names[i]]
+
+    def match_types(self, display_types, candidates=None) -> list[int]:
+        """Get the positions of the columns with one of the given type displays, in order."""
+        if candidates is None:
+            candidates = range(len(self))
+        display_types = set(display_types)
+        return [i for i in candidates if self.type_display(i) in display_types]
+
+    def _get_candidates(self, lower_term: str):
+        n = self.NGRAM_LENGTH
+        if len(lower_term) < n:
+            return range(len(self))
+
+        ngrams = self._get_ngrams()
+        postings = [ngrams.get(lower_term[i : i + n], []) for i in range(len(lower_term) - n + 1)]
+        return min(postings, key=len)
+
+    def _get_ngrams(self) -> dict[str, list[int]]:
+        if self._ngrams is None:
+            n = self.NGRAM_LENGTH
+            ngrams: dict[str, list[int]] = {}
+            for index, name in enumerate(self.lower_names):
+                for ngram in {name[i : i + n] for i in range(len(name) - n + 1)}:
+                    ngrams.setdefault(ngram, []).append(index)
+            self._ngrams = ngrams
+        return self._ngrams
+
+
+def _stable_reverse(order, sorted_keys):
+    """
+    Reverse an ascending stable sort order, keeping tied rows in their original order.
+
+    sorted_keys are the sort key values in the same order as order.
+    """
+    import numpy as np
+
+    n = len(order)
+    if n == 0:
+        return order
+
+    reversed_order = order[::-1]
+    reversed_keys = sorted_keys[::-1]
+
+    is_run_start = np.empty(n, dtype=bool)
+    is_run_start[0] = True
+    np.not_equal(reversed_keys[1:], reversed_keys[:-1], out=is_run_start[1:])
+
+    # Within each run of equal keys, reverse the positions again
+    starts = np.flatnonzero(is_run_start)
+    ends = np.append(starts[1:], n)
+    run_ids = np.cumsum(is_run_start) - 1
+    positions = starts[run_ids] + ends[run_ids] - 1 - np.arange(n)
+    return reversed_order[positions]
+
+
+def _break_sort_ties(order, primary_key, secondary_keys):
+    """
+    Refine a stable sort order by breaking ties in the primary key with secondary keys.
+
+    Only rows in runs of equal primary key values are re-sorted. Keys
+    are integer arrays over all the rows, with smaller values sorting
+    first.
+    """
+    import numpy as np
+
+    n = len(order)
+    if n < 2 or len(secondary_keys) == 0:
+        return order
+
+    sorted_primary = primary_key[order]
+    is_tie = np.empty(n, dtype=bool)
+    is_tie[0] = False
+    np.equal(sorted_primary[1:], sorted_primary[:-1], out=is_tie[1:])
+    if not is_tie.any():
+        return order
+
+    # Mark both the start and the rest of each run of ties
+    in_run = is_tie.copy()
+    in_run[:-1] |= is_tie[1:]
+    tied_positions = np.flatnonzero(in_run)
+    tied_rows = order[tied_positions]
+
+    # Runs are contiguous, so sorting first by run keeps each run in
+    # place
+    run_ids = np.cumsum(~is_tie)[tied_positions]
+    permutation = _lexsort_integer_keys([run_ids, *(key[tied_rows] for key in secondary_keys)])
+
+    result = order.copy()
+    result[tied_positions] = tied_rows[permutation]
+    return result
+
+
+def _lexsort_integer_keys(keys):
+    """
+    Stable sort order by multiple integer keys, the first key being the most significant.
+
+    If their ranges allow it, the keys are combined into a single int64
+    key, which sorts much faster than np.lexsort.
+    """
+    import numpy as np
+
+    composite = None
+    bound = 1
+    for key in reversed(keys):
+        low = int(key.min())
+        width = int(key.max()) - low + 1
+        if bound * width >= 2**63:
+            # np.lexsort sorts by the last key first
+            return np.lexsort(keys[::-1])
+
+        part = (key.astype(np.int64) - low) * bound
+        composite = part if composite is None else composite + part
+        bound *= width
+
+    assert composite is not None
+    return np.argsort(composite, kind="stable")
+
+
+def _multi_key_sort_order(sort_indexes, ascending, row_mask=None):
+    """
+    Stable sort order of the rows by multiple keys, using ColumnSortIndex objects.
+
+    The primary key's order is reused and ties are broken with the
+    remaining keys. If row_mask is passed, only the selected rows are
+    included.
+    """
+    primary = sort_indexes[0]
+    order = primary.get_order(ascending=ascending[0], row_mask=row_mask)
+    if len(sort_indexes) == 1:
+        return order
+
+    return _break_sort_ties(
+        order,
+        primary.get_sort_key(ascending=ascending[0]),
+        [index.get_sort_key(ascending=asc) for index, asc in zip(sort_indexes[1:], ascending[1:])],
+    )
+
+
 def _calculate_sqrt_fallback_binwidth(data_range: float, n: int) -> float:
     """Calculate fallback bin width using sqrt method."""
     return data_range / math.sqrt(n) if n > 0 else data_range
@@ -67,11 +744,111 @@ def _get_histogram_method(method):
     }[method]
 
 
-def _get_histogram_numpy(data, num_bins, method="fd", *, to_numpy=False):
+def _get_histogram_num_bins(
+    method: str,
+    num_bins: int,
+    count: int,
+    min_value,
+    max_value,
+    *,
+    iqr=None,
+    std=None,
+    is_integer: bool = False,
+) -> int:
+    """
+    Compute the number of equal-width bins that _get_histogram_numpy would use.
+
+    This applies NumPy's binning rules to a few aggregate statistics
+    of non-empty data with min_value < max_value, so that backends
+    that cannot load all the values, such as database tables, can bin
+    them in the same way.
+    """
+    data_range = max_value - min_value
+
+    if method == "fixed":
+        bins = num_bins
+    else:
+        if method == "sturges":
+            width = data_range / (math.log2(count) + 1.0)
+        elif method == "fd":
+            width = 2.0 * (iqr or 0) * count ** (-1.0 / 3.0)
+        elif method == "scott":
+            width = (24.0 * math.pi**0.5 / count) ** (1.0 / 3.0) * (std or 0)
+        else:
+            raise ValueError(f"Unknown histogram method {method}")
+        bins = math.ceil(data_range / width) if width else 1
+
+    num_edges = bins + 1
+    if num_edges > num_bins:
+        bins = num_bins
+
+    if is_integer:
+        int_width = int(data_range)
+        if num_edges > int_width > 0:
+            bins = int_width + 1
+
+    return bins
+
+
+def _sample_indices(length: int, size: int, seed: int = 0):
+    """
+    Draw sorted random row indices, with replacement, for approximating profiles.
+
+    Sampling with replacement avoids materializing a permutation of
+    all the rows, and sorting the indices keeps the gather cache-friendly.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, length, size)
+    indices.sort()
+    return indices
+
+
+def _array_digest(values, max_bytes: int | None = None) -> int:
+    """
+    Compute a checksum of the data of a NumPy array for change detection.
+
+    If max_bytes is given, larger arrays are checksummed on an evenly
+    spaced sample of their elements. Object arrays are checksummed on
+    the identities of their elements.
+    """
+    import zlib
+
+    import numpy as np
+
+    flat = values.ravel(order="K")
+    if flat.size == 0:
+        return 0
+    if max_bytes is not None:
+        step = max(1, -(-_array_digest_cost(flat) // max(max_bytes, 1)))
+        flat = flat[::step]
+    if flat.dtype == object:
+        return hash(tuple(map(id, flat)))
+    return zlib.crc32(np.ascontiguousarray(flat).view(np.uint8).data)
+
+
+def _array_digest_cost(values) -> int:
+    """Estimate the number of bytes checksummed by _array_digest."""
+    # Hashing object identities is much slower than checksumming bytes
+    return values.size * 64 if values.dtype == object else values.nbytes
+
+
+def _get_value_range(data):
+    """Return the (min, max) of a non-null NumPy array, or None if it is empty."""
+    if len(data) == 0 or data.dtype == object:
+        return None
+    return data.min(), data.max()
+
+
+def _get_histogram_numpy(data, num_bins, method="fd", *, to_numpy=False, value_range=None):
     """
     Compute histogram using NumPy.
 
     This is the original implementation that requires NumPy to be installed.
+
+    A precomputed (min, max) of the data can be passed as value_range
+    when computing several histograms of the same data.
     """
     try:
         import numpy as np
@@ -102,9 +879,9 @@ def _get_histogram_numpy(data, num_bins, method="fd", *, to_numpy=False):
         return _EMPTY_HISTOGRAM
 
     # Handle single value case - return single bin consistent with Polars implementation
-    unique_values = np.unique(data)
-    if len(unique_values) == 1:
-        return [len(data)], [unique_values[0], unique_values[0]]
+    min_value, max_value = value_range if value_range is not None else (data.min(), data.max())
+    if min_value == max_value:
+        return [len(data)], [min_value, min_value]
 
     # We optimistically compute the histogram once, and then do extra
     # work in the special cases where the binning method produces a
@@ -157,10 +934,10 @@ def _get_histogram_numpy(data, num_bins, method="fd", *, to_numpy=False):
     # If so, override the bin edges to be the same value instead of value +/- 0.5
     if len(bin_counts) == 1 and len(data) > 0:
         # Check if all non-null values are the same
-        unique_values = np.unique(data)
-        if len(unique_values) == 1:
+        min_value, max_value = data.min(), data.max()
+        if min_value == max_value:
             # All values are the same, set bin edges to [value, value]
-            bin_edges = np.array([unique_values[0], unique_values[0]])
+            bin_edges = np.array([min_value, min_value])
 
     return bin_counts.tolist(), bin_edges.tolist()
 
@@ -7,31 +7,52 @@
 # pyright: reportOptionalMemberAccess=false
 from __future__ import annotations
 
+import concurrent.futures
+import itertools
 import logging
 import math
 import operator
-from datetime import datetime
+import threading
+from datetime import datetime, timezone
 from decimal import Decimal
+from pathlib import Path
 from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    NamedTuple,
     Tuple,
 )
 
 import comm
 
 from ._data_explorer_internal import (
+    _EMPTY_HISTOGRAM,
+    ColumnSearchIndex,
+    ColumnSortIndex,
+    DictionaryEncoding,
+    LRUCache,
+    RowRange,
+    _array_digest,
+    _array_digest_cost,
+    _compact_indices,
     _get_histogram_method,
+    _get_histogram_num_bins,
     _get_histogram_numpy,
     _get_histogram_polars,
+    _get_value_range,
+    _mask_to_row_indices,
+    _multi_key_sort_order,
+    _sample_indices,
+    get_text_search_pattern,
 )
 from .access_keys import decode_access_key
 from .convert import PandasConverter, PolarsConverter
 from .data_explorer_comm import (
     ArraySelection,
     BackendState,
+    BinaryFormat,
     CodeSyntaxName,
     ColumnDisplayType,
     ColumnFilter,
@@ -75,6 +96,7 @@ from .data_explorer_comm import (
     FormatOptions,
     GetColumnProfilesFeatures,
     GetColumnProfilesParams,
+    GetDataValuesFeatures,
     GetDataValuesParams,
     GetRowLabelsParams,
     GetSchemaParams,
@@ -107,14 +129,25 @@ from .data_explorer_comm import (
     TextSearchType,
 )
 from .positron_comm import CommMessage, PositronComm
-from .third_party import is_ibis, is_pandas, is_polars
-from .utils import BackgroundJobQueue, guid
+from .third_party import (
+    _pyarrow_compute,
+    is_duckdb_relation,
+    is_ibis,
+    is_pandas,
+    is_polars,
+    is_polars_lazy,
+    is_pyarrow,
+)
+from .utils import BackgroundJobQueue, JobCancelledError, guid
 
 if TYPE_CHECKING:
+    import duckdb
+    import ibis
+    import numpy as np
     import pandas as pd
     import polars as pl
+    import pyarrow as pa
 
-IBIS_LIMIT_ROWS = 1000
 logger = logging.getLogger(__name__)
 
 
@@ -130,6 +163,13 @@ PathKey = Tuple[str, ...]
 SummarizerType = Callable[[Any, FormatOptions], ColumnSummaryStats]
 
 
+class BinaryResult(NamedTuple):
+    """An RPC result whose payload is sent in the binary buffers of the comm message."""
+
+    result: dict
+    buffers: list[bytes]
+
+
 def _summarize_not_implemented(col, options: FormatOptions):
     raise NotImplementedError
 
@@ -139,6 +179,60 @@ def _summarize_not_implemented(col, options: FormatOptions):
 # column schemas, which should take well under 10ms.
 SCHEMA_CACHE_THRESHOLD = 100
 
+# For wider tables, cheap fingerprints of the columns are computed in
+# a background job instead, in chunks of this many columns between
+# which the job can be cancelled
+SCHEMA_FINGERPRINT_CHUNK_SIZE = 1_000
+
+# Content fingerprints of tables checksum a sample of this many bytes
+# of their data, so that checking a variable for changes after every
+# execution is cheap. Larger tables are also checksummed in full in
+# the background, and their views are refreshed if the data changed
+# outside the sample
+CONTENT_FINGERPRINT_SAMPLE_BYTES = 1024 * 1024
+
+# Tables with more data than this are not fingerprinted, so their
+# views are refreshed whenever the variable may have changed
+CONTENT_FINGERPRINT_MAX_BYTES = 256 * 1024 * 1024
+
+# Memory budget for the per-table-view cache of evaluated row filter
+# masks. The least recently used masks are evicted beyond this limit
+FILTER_MASK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Memory budget for the per-table-view cache of column sort indexes,
+# which take 8 bytes per row for tables under 2^31 rows
+SORT_INDEX_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Memory budget for the per-table-view cache of computed column
+# profiles, which is carried over to the new view when the table is
+# updated
+PROFILE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Memory budget for the per-table-view cache of non-string columns
+# converted to strings for text search filters
+SEARCH_STRINGS_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Maximum number of background workers computing the columns of a
+# single get_column_profiles request concurrently, so that one large
+# request leaves workers free for other requests
+PROFILE_MAX_PARALLELISM = 8
+
+# Columns with more (filtered) rows than this have their histograms
+# and frequency tables approximated from a random sample of
+# PROFILE_SAMPLE_SIZE rows, with counts scaled up to the full column
+# and the results marked with is_approximate. Null counts and summary
+# statistics are always exact
+PROFILE_SAMPLE_THRESHOLD = 10_000_000
+PROFILE_SAMPLE_SIZE = 1_000_000
+
+# Number of rows exported at a time by export_data_selection, which
+# bounds the memory used when writing a large selection to a file
+EXPORT_CHUNK_ROWS = 100_000
+
+# Increasing priority for get_column_profiles requests, so that newer
+# requests run before older ones
+_profile_request_counter = itertools.count()
+
 
 class DataExplorerState:
     name: str
@@ -152,6 +246,16 @@ class DataExplorerState:
     inferred_dtypes: dict[int, str]
     schema_cache: list[ColumnSchema] | None = None
 
+    # Per-column fingerprints for tables too wide for the schema
+    # cache, filled in by a background job. Fingerprints are tuples
+    # starting with the column name, and equal fingerprints mean
+    # that the column schema is unchanged
+    column_fingerprints: list[tuple] | None = None
+
+    # Incremented each time the underlying table is updated, for
+    # keying caches of values computed from the table's data
+    table_version: int = 0
+
     def __init__(
         self,
         name: str,
@@ -161,6 +265,8 @@ class DataExplorerState:
         sort_keys=None,
         inferred_dtypes=None,
         schema_cache=None,
+        column_fingerprints=None,
+        table_version=0,
     ):
         self.name = name
         self.column_filters = column_filters or []
@@ -168,12 +274,97 @@ class DataExplorerState:
         self.sort_keys = sort_keys or []
         self.inferred_dtypes = inferred_dtypes or {}
         self.schema_cache = schema_cache
+        self.column_fingerprints = column_fingerprints
+        self.table_version = table_version
 
 
 # Return type for get_updated_state below
 StateUpdate = Tuple[bool, DataExplorerState]
 
 
+class _ColumnProfileData:
+    """
+    Filtered column data shared by the profiles of one column in a request.
+
+    The column is materialized once, and intermediate results that
+    several profiles need (such as the value counts used by both
+    frequency tables, or the non-null values used by both histograms)
+    are computed at most once and reused.
+    """
+
+    def __init__(self, column_index: int, column):
+        self.column_index = column_index
+        self.column = column
+        self._computed: dict[str, Any] = {}
+
+    def get(self, key: str, compute: Callable[[], Any]):
+        if key not in self._computed:
+            self._computed[key] = compute()
+        return self._computed[key]
+
+
+class _ColumnProfilesBatch:
+    """
+    Shared state of the workers computing one get_column_profiles request.
+
+    Results are stored by request position, so they are returned in
+    the requested order regardless of which worker computed them.
+    """
+
+    def __init__(self, params: GetColumnProfilesParams, num_workers: int):
+        self.params = params
+        self.results: list[dict] = [{} for _ in params.profiles]
+        self._next_index = 0
+        self._active_workers = num_workers
+        self._lock = threading.Lock()
+
+    def next_index(self) -> int | None:
+        with self._lock:
+            if self._next_index >= len(self.params.profiles):
+                return None
+            i = self._next_index
+            self._next_index += 1
+            return i
+
+    def worker_done(self) -> bool:
+        """Mark a worker as finished, returning True for the last one."""
+        with self._lock:
+            self._active_workers -= 1
+            return self._active_workers == 0
+
+
+def _is_narrower_search(last_filters: list[ColumnFilter], filters: list[ColumnFilter]) -> bool:
+    """
+    Whether the columns matching filters are a subset of the columns matching last_filters.
+
+    This is the case when the filters are the same, except for text
+    searches whose terms contain the previous terms.
+    """
+    if len(last_filters) != len(filters):
+        return False
+
+    for last, filt in zip(last_filters, filters):
+        if filt.filter_type != last.filter_type:
+            return False
+
+        if filt.filter_type == ColumnFilterType.TextSearch:
+            params, last_params = filt.params, last.params
+            assert isinstance(params, FilterTextSearch)
+            assert isinstance(last_params, FilterTextSearch)
+            if params.case_sensitive != last_params.case_sensitive:
+                return False
+
+            term, last_term = params.term, last_params.term
+            if not params.case_sensitive:
+                term, last_term = term.lower(), last_term.lower()
+            if last_term not in term:
+                return False
+        elif filt != last:
+            return False
+
+    return True
+
+
 class DataExplorerTableView:
     """
     A table interface.
@@ -184,6 +375,13 @@ class DataExplorerTableView:
     pyarrow.Table, and any others.
     """
 
+    # Implemented by each view with backend-specific signatures, for
+    # example building a schema from a pandas column or from a polars
+    # dtype. Lazy views get them from the in-memory view they extend
+    _construct_schema: Callable[..., ColumnSchema]
+    _get_type_display: Callable[..., ColumnDisplayType]
+    _format_values: Callable[..., list[ColumnValue]]
+
     def __init__(
         self,
         table,
@@ -220,35 +418,188 @@ class DataExplorerTableView:
         # Array of selected column indices
         self.column_view_indices = None
 
+        # Evaluated row filter masks, keyed by table version and
+        # filter spec, so that changing one filter does not require
+        # re-evaluating all the others
+        self._filter_mask_cache = LRUCache(FILTER_MASK_CACHE_MAX_BYTES)
+
+        # The (filter spec, condition) pairs that produced
+        # self.filtered_indices, to detect when new AND filters only
+        # narrow the current selection
+        self._applied_filters: list[tuple[str, RowFilterCondition]] = []
+
+        # Sort indexes for individual columns, keyed by table version
+        # and column index, so that changing the sort direction or
+        # keys, or the row filters, does not require re-sorting
+        self._sort_index_cache = LRUCache(SORT_INDEX_CACHE_MAX_BYTES)
+
+        # Computed column profiles, keyed by column index, profile
+        # spec, format options and the valid row filters. Entries
+        # hold the table version they were computed for, and for
+        # unfiltered profiles the column's content fingerprint, so
+        # that they stay valid across table updates that do not
+        # change the column
+        self._profile_cache = LRUCache(PROFILE_CACHE_MAX_BYTES)
+
+        # Non-string columns converted to strings for text search
+        # filters, keyed by table version and column index
+        self._search_strings_cache = LRUCache(SEARCH_STRINGS_CACHE_MAX_BYTES)
+
         # We store a tuple of (last_filters, matches) here so that we
         # can support scrolling through the schema search results
         # without having to recompute the search. If the search term
-        # changes, we discard the last search result. We might add an
-        # LRU cache here or something if it helps performance.
+        # changes and only narrows the last search (like when the user
+        # types more characters), we search the last matches only.
         self._search_schema_last_result: tuple[list[ColumnFilter], list[int]] | None = None
 
+        # Index of the column names and types for schema search, built
+        # on first use. Views are replaced when the schema changes, so
+        # it never needs to be invalidated.
+        self._column_search_index: ColumnSearchIndex | None = None
+
+        # Fingerprint of a sample of the table's data when the view
+        # was created, to cheaply detect variable updates that did not
+        # change anything. Larger tables are also fingerprinted in
+        # full in the background, to verify updates that passed the
+        # sampled check
+        self._content_fingerprint = self._get_content_fingerprint(
+            table, CONTENT_FINGERPRINT_SAMPLE_BYTES
+        )
+        self._full_content_fingerprint: concurrent.futures.Future | None = None
+        if (
+            self._content_fingerprint is not None
+            and self._get_content_size(table) > CONTENT_FINGERPRINT_SAMPLE_BYTES
+        ):
+            self._full_content_fingerprint = self.job_queue.submit(
+                self._get_content_fingerprint,
+                table,
+                key=(self.comm.comm_id, "content_fingerprint", self.state.table_version),
+            )
+
         self._update_schema_cache()
 
     def _update_schema_cache(self):
         # If the number of columns is below the fixed threshold, we
         # compute and store the ColumnSchema objects up front so that
         # we can more easily determine if there has been an in-place
-        # schema update. If the schema is large, then we don't cache
-        # and where relevant we assume that the schema could have
-        # changed.
-        if self._should_cache_schema(self.table) and self.state.schema_cache is None:
-            self.state.schema_cache = [
-                self._get_single_column_schema(i) for i in range(self.table.shape[1])
-            ]
+        # schema update. If the schema is large, then we compute
+        # cheaper column fingerprints in the background, and until
+        # they are ready we assume that the schema could have changed.
+        if self._should_cache_schema(self.table):
+            if self.state.schema_cache is None:
+                self.state.schema_cache = [
+                    self._get_single_column_schema(i) for i in range(self._get_num_columns())
+                ]
+        elif self._HAS_COLUMN_FINGERPRINTS and self.state.column_fingerprints is None:
+            self.job_queue.submit(
+                self._fill_column_fingerprints,
+                self.state,
+                self.table,
+                self._get_num_columns(),
+                key=(self.comm.comm_id, "column_fingerprints", self.state.table_version),
+            )
+
+    def _fill_column_fingerprints(self, state: DataExplorerState, table, num_columns: int):
+        token = self.job_queue.current_token()
+        fingerprints = []
+        for start in range(0, num_columns, SCHEMA_FINGERPRINT_CHUNK_SIZE):
+            # Stop between chunks if the table view has been closed
+            # or replaced
+            token.raise_if_cancelled()
+            stop = min(start + SCHEMA_FINGERPRINT_CHUNK_SIZE, num_columns)
+            fingerprints.extend(self._get_column_fingerprints(table, range(start, stop)))
+        state.column_fingerprints = fingerprints
+
+    def _get_num_columns(self) -> int:
+        return len(self.table.columns)
 
     @property
-    def _has_row_labels(self):
+    def _has_row_labels(self) -> bool:
         return False
 
     @classmethod
-    def _should_cache_schema(cls, _table):
+    def _should_cache_schema(cls, _table) -> bool:
         return False
 
+    @classmethod
+    def _get_content_fingerprint(cls, _table, _max_bytes: int | None = None) -> tuple | None:
+        """
+        Compute a fingerprint of the schema and data of a table.
+
+        If max_bytes is given, only a sample of about that many bytes
+        of the data is checksummed. Returns None if the table cannot be
+        fingerprinted, in which case the view is always refreshed when
+        the variable is updated.
+        """
+        return None
+
+    @classmethod
+    def _get_content_size(cls, _table) -> int:
+        """Return the number of bytes checksummed by a full content fingerprint."""
+        return 0
+
+    def _get_column_content_fingerprint(self, _column_index: int) -> tuple | None:
+        """
+        Compute a cheap fingerprint of the name, type and data of a column.
+
+        Cached profiles of a column are kept across table updates if
+        its fingerprint is unchanged. Returns None if unknown.
+        """
+        return None
+
+    def is_unchanged(self, new_table) -> bool:
+        """Whether a table has the same sampled fingerprint as the table when this view was created."""
+        if self._content_fingerprint is None:
+            return False
+        return (
+            self._get_content_fingerprint(new_table, CONTENT_FINGERPRINT_SAMPLE_BYTES)
+            == self._content_fingerprint
+        )
+
+    def verify_unchanged(self, new_table, on_changed: Callable[[], None]) -> None:
+        """
+        Verify in the background that a table passing is_unchanged has the same full fingerprint.
+
+        on_changed is called from the background job if the data
+        changed outside the sample that is_unchanged checked.
+        """
+        if self._full_content_fingerprint is None:
+            return
+
+        # A newer update supersedes the verification of an older one
+        key = (self.comm.comm_id, "verify_content", self.state.table_version)
+        self.job_queue.cancel(key)
+        self.job_queue.submit(self._verify_unchanged, new_table, on_changed, key=key)
+
+    def _verify_unchanged(self, new_table, on_changed: Callable[[], None]):
+        assert self._full_content_fingerprint is not None
+        try:
+            # The fingerprint job was queued first, so it is running
+            # or done by the time this job starts
+            fingerprint = self._full_content_fingerprint.result()
+        except concurrent.futures.CancelledError:
+            fingerprint = None
+        if fingerprint is not None and self._get_content_fingerprint(new_table) == fingerprint:
+            return
+        self.job_queue.current_token().raise_if_cancelled()
+        on_changed()
+
+    # Whether _get_column_fingerprints is implemented, for detecting
+    # schema changes in tables too wide for the schema cache
+    _HAS_COLUMN_FINGERPRINTS = False
+
+    @classmethod
+    def _get_column_fingerprints(cls, table, columns: range) -> list[tuple]:
+        """
+        Compute cheap fingerprints of a range of columns of a table.
+
+        A fingerprint is a tuple whose first element is the column
+        name. Two columns with equal fingerprints must have equal
+        schemas, but it's fine for a fingerprint to change while the
+        schema does not.
+        """
+        raise NotImplementedError
+
     def _set_sort_keys(self, sort_keys):
         self.state.sort_keys = sort_keys
 
@@ -284,7 +635,7 @@ class DataExplorerTableView:
                 raise IndexError
 
             # Break when the column index is too large.
-            if column_index >= len(self.table.columns):
+            if column_index >= self._get_num_columns():
                 break
 
             # Add the column schema.
@@ -308,84 +659,70 @@ class DataExplorerTableView:
         if self._search_schema_last_result is not None:
             last_filters, matches = self._search_schema_last_result
             if last_filters != filters:
-                matches = self._column_filter_get_matches(filters)
+                candidates = matches if _is_narrower_search(last_filters, filters) else None
+                matches = self._column_filter_get_matches(filters, candidates)
                 self._search_schema_last_result = (filters, matches)
         else:
             matches = self._column_filter_get_matches(filters)
             self._search_schema_last_result = (filters, matches)
 
+        index = self._get_column_search_index()
+
         # Apply sorting based on sort_order
         if sort_order == SearchSchemaSortOrder.AscendingName:
             # Sort by column name ascending
-            matches = sorted(matches, key=lambda idx: self._get_column_name(idx).lower())
+            matches = sorted(matches, key=lambda idx: index.lower_names[idx])
         elif sort_order == SearchSchemaSortOrder.DescendingName:
             # Sort by column name descending
-            matches = sorted(
-                matches, key=lambda idx: self._get_column_name(idx).lower(), reverse=True
-            )
+            matches = sorted(matches, key=lambda idx: index.lower_names[idx], reverse=True)
         elif sort_order == SearchSchemaSortOrder.AscendingType:
             # Sort by column type ascending (using lowercase type name)
-            matches = sorted(
-                matches, key=lambda idx: str(self._get_column_type_display(idx)).lower()
-            )
+            matches = sorted(matches, key=lambda idx: str(index.type_display(idx)).lower())
         elif sort_order == SearchSchemaSortOrder.DescendingType:
             # Sort by column type descending (using lowercase type name)
             matches = sorted(
                 matches,
-                key=lambda idx: str(self._get_column_type_display(idx)).lower(),
+                key=lambda idx: str(index.type_display(idx)).lower(),
                 reverse=True,
             )
         # For SearchSchemaSortOrder.Original, keep original order (no sorting needed)
 
         return SearchSchemaResult(matches=matches)
 
-    def _column_filter_get_matches(self, filters: list[ColumnFilter]):
-        matchers = self._get_column_filter_functions(filters)
-
-        return [
-            column_index
-            for column_index in range(self.table.shape[1])
-            if all(matcher(column_index) for matcher in matchers)
-        ]
-
-    def _get_column_filter_functions(self, filters: list[ColumnFilter]):
-        def _match_text_search(params: FilterTextSearch):
-            term = params.term
-            if not params.case_sensitive:
-                term = term.lower()
-
-                def matches(x):
-                    return term in x.lower()
-
-            else:
-
-                def matches(x):
-                    return term in x
-
-            def matcher(index):
-                return matches(self._get_column_name(index))
+    def _get_column_search_index(self) -> ColumnSearchIndex:
+        if self._column_search_index is None:
+            names = [self._get_column_name(i) for i in range(self._get_num_columns())]
+            self._column_search_index = ColumnSearchIndex(names, self._get_column_type_display)
+        return self._column_search_index
 
-            return matcher
+    def _column_filter_get_matches(self, filters: list[ColumnFilter], candidates=None):
+        """
+        Get the indices of the columns matching all the filters, in order.
 
-        def _match_display_types(params: FilterMatchDataTypes):
-            def matcher(index):
-                type_display = self._get_column_type_display(index)
-                return type_display in params.display_types
+        If candidates is passed, only those columns are checked.
+        """
+        index = self._get_column_search_index()
 
-            return matcher
+        # The text searches use the name index, so they go first to
+        # narrow down the columns whose types need to be checked
+        text_filters = [f for f in filters if f.filter_type == ColumnFilterType.TextSearch]
+        type_filters = [f for f in filters if f.filter_type == ColumnFilterType.MatchDataTypes]
 
-        matchers = []
-        for filt in filters:
-            if filt.filter_type == ColumnFilterType.TextSearch:
-                params = filt.params
-                assert isinstance(params, FilterTextSearch)
-                matchers.append(_match_text_search(params))
-            elif filt.filter_type == ColumnFilterType.MatchDataTypes:
-                params = filt.params
-                assert isinstance(params, FilterMatchDataTypes)
-                matchers.append(_match_display_types(params))
+        matches = candidates
+        for filt in text_filters:
+            params = filt.params
+            assert isinstance(params, FilterTextSearch)
+            matches = index.search(
+                params.term, case_sensitive=params.case_sensitive, candidates=matches
+            )
+        for filt in type_filters:
+            params = filt.params
+            assert isinstance(params, FilterMatchDataTypes)
+            matches = index.match_types(params.display_types, candidates=matches)
 
-        return matchers
+        if matches is None:
+            return list(range(len(index)))
+        return list(matches)
 
     def _get_column_name(self, column_index: int) -> str:
         raise NotImplementedError
@@ -395,11 +732,99 @@ class DataExplorerTableView:
 
     def get_data_values(self, params: GetDataValuesParams):
         self._recompute_if_needed()
+        if params.binary_format is not None:
+            result = self._get_data_values_binary(
+                params.columns,
+                params.format_options,
+                params.binary_format,
+            )
+            # If the binary format cannot be produced here, fall back
+            # to returning formatted values
+            if result is not None:
+                return result
+
         return self._get_data_values(
             params.columns,
             params.format_options,
         )
 
+    def _get_data_values_binary(
+        self,
+        selections: list[ColumnSelection],
+        format_options: FormatOptions,
+        binary_format: BinaryFormat,
+    ) -> BinaryResult | None:
+        features = self.FEATURES.get_data_values
+        if features is None or binary_format not in features.supported_binary_formats:
+            return None
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return None
+
+        # One Arrow IPC stream per column selection, since the
+        # selections can request different row ranges
+        buffers = [
+            _arrow_ipc_buffer(values)
+            for values in self._get_arrow_columns(selections, format_options)
+        ]
+        return BinaryResult({"columns": [], "binary_format": binary_format.value}, buffers)
+
+    def _get_arrow_columns(self, selections: list[ColumnSelection], format_options: FormatOptions):
+        return [
+            self._values_to_arrow(values, format_options)
+            for values in self._select_columns(selections)
+        ]
+
+    def _values_to_arrow(self, values, format_options: FormatOptions):
+        raise NotImplementedError
+
+    def _select_columns(self, selections: list[ColumnSelection]) -> list:
+        """Select the values of column selections, in view order."""
+        columns = [None] * len(selections)
+
+        # Selections of the same rows (usually all of them, for the
+        # columns of a viewport) are gathered from the table together
+        groups: dict[tuple, list[int]] = {}
+        for i, selection in enumerate(selections):
+            spec = selection.spec
+            if isinstance(spec, DataSelectionRange):
+                key = (spec.first_index, spec.last_index)
+            else:
+                key = (tuple(spec.indices),)
+            groups.setdefault(key, []).append(i)
+
+        for positions in groups.values():
+            column_indices = list(dict.fromkeys(selections[i].column_index for i in positions))
+            rows = self._get_view_rows(selections[positions[0]].spec)
+            values = dict(zip(column_indices, self._select_rows(column_indices, rows)))
+            for i in positions:
+                columns[i] = values[selections[i].column_index]
+
+        return columns
+
+    def _get_view_rows(self, spec: ArraySelection):
+        """
+        Get the rows of the table for a selection of rows of the view.
+
+        Returns a slice if the rows are consecutive, and otherwise the
+        row indices.
+        """
+        if isinstance(spec, DataSelectionRange):
+            rows = slice(spec.first_index, spec.last_index + 1)
+            if self.row_view_indices is not None:
+                rows = self.row_view_indices[rows]
+        elif self.row_view_indices is not None:
+            rows = self._gather(self.row_view_indices, spec.indices)
+        else:
+            rows = spec.indices
+        return rows.slice if isinstance(rows, RowRange) else rows
+
+    def _select_rows(self, column_indices: list[int], rows) -> list:
+        """Gather rows, a slice or row indices, of several columns."""
+        raise NotImplementedError
+
     def get_row_labels(self, params: GetRowLabelsParams):
         self._recompute_if_needed()
         return self._get_row_labels(
@@ -422,44 +847,74 @@ class DataExplorerTableView:
             row_index = sel.row_index
             if self.row_view_indices is not None:
                 row_index = self.row_view_indices[row_index]
-            return self._export_cell(row_index, sel.column_index, fmt)
+            result = self._export_cell(row_index, sel.column_index, fmt)
+            if params.path is not None:
+                return self._write_export([result.data], params.path, fmt)
+            return result
         elif kind == TableSelectionKind.CellRange:
             assert isinstance(sel, DataSelectionCellRange)
-            return self._export_tabular(
-                slice(sel.first_row_index, sel.last_row_index + 1),
-                slice(sel.first_column_index, sel.last_column_index + 1),
-                fmt,
-            )
+            row_selector = slice(sel.first_row_index, sel.last_row_index + 1)
+            column_selector = slice(sel.first_column_index, sel.last_column_index + 1)
         elif kind == TableSelectionKind.CellIndices:
             assert isinstance(sel, DataSelectionCellIndices)
-            return self._export_tabular(sel.row_indices, sel.column_indices, fmt)
+            row_selector, column_selector = sel.row_indices, sel.column_indices
         elif kind == TableSelectionKind.RowRange:
             assert isinstance(sel, DataSelectionRange)
-            return self._export_tabular(
-                slice(sel.first_index, sel.last_index + 1),
-                slice(None),
-                fmt,
-            )
+            row_selector = slice(sel.first_index, sel.last_index + 1)
+            column_selector = slice(None)
         elif kind == TableSelectionKind.ColumnRange:
             assert isinstance(sel, DataSelectionRange)
-            return self._export_tabular(
-                slice(None),
-                slice(sel.first_index, sel.last_index + 1),
-                fmt,
-            )
+            row_selector = slice(None)
+            column_selector = slice(sel.first_index, sel.last_index + 1)
         elif kind == TableSelectionKind.RowIndices:
             assert isinstance(sel, DataSelectionIndices)
-            return self._export_tabular(sel.indices, slice(None), fmt)
+            row_selector, column_selector = sel.indices, slice(None)
         elif kind == TableSelectionKind.ColumnIndices:
             assert isinstance(sel, DataSelectionIndices)
-            return self._export_tabular(slice(None), sel.indices, fmt)
+            row_selector, column_selector = slice(None), sel.indices
         else:
             raise NotImplementedError(f"Unknown data export: {kind}")
 
+        chunks = self._export_tabular(row_selector, column_selector, fmt)
+        if params.path is not None:
+            return self._write_export(chunks, params.path, fmt)
+        return ExportedData(data="".join(chunks), format=fmt)
+
+    def _write_export(self, chunks, path: str, fmt: ExportFormat):
+        # Produce the first chunk before creating the file, so that
+        # an unsupported format does not leave an empty file behind
+        chunks = iter(chunks)
+        first = next(chunks, "")
+        with Path(path).open("w", encoding="utf-8", newline="") as f:
+            f.write(first)
+            f.writelines(chunks)
+        return ExportedData(data="", format=fmt)
+
+    def _export_row_chunks(self, row_selector, *, chunked: bool = True) -> list:
+        """
+        Split the selected rows, in view order, into chunks of at most EXPORT_CHUNK_ROWS.
+
+        There is always at least one (possibly empty) chunk, so that
+        exporting an empty selection still produces a header.
+        """
+        if self.row_view_indices is not None:
+            rows = self.row_view_indices[row_selector]
+            if isinstance(rows, RowRange):
+                rows = range(rows.start, rows.stop)
+        elif isinstance(row_selector, slice):
+            rows = range(self.table.shape[0])[row_selector]
+        else:
+            rows = row_selector
+
+        if not chunked or len(rows) <= EXPORT_CHUNK_ROWS:
+            return [rows]
+        return [rows[i : i + EXPORT_CHUNK_ROWS] for i in range(0, len(rows), EXPORT_CHUNK_ROWS)]
+
     def _export_cell(self, row_index: int, column_index: int, fmt: ExportFormat):
         raise NotImplementedError
 
     def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat):
+        """Yield the exported selection as strings, one chunk of rows at a time."""
         raise NotImplementedError
 
     def set_column_filters(self, params: SetColumnFiltersParams):
@@ -482,41 +937,71 @@ class DataExplorerTableView:
         if len(self.state.row_filters) == 0:
             # Simply reset if empty filter set passed
             self.filtered_indices = None
+            self._applied_filters = []
             self._update_row_view_indices()
             return FilterResult(selected_num_rows=len(self.table), had_errors=False)
 
-        # Evaluate all the filters and combine them using the
-        # indicated conditions
-        combined_mask = None
-        had_errors = False
-        for filt in filters:
-            if filt.is_valid is False:
-                # If filter is invalid, do not evaluate it
-                continue
+        # If is_valid is False, do not evaluate the filter
+        valid_filters = [filt for filt in filters if filt.is_valid is not False]
+        filter_keys = [(_row_filter_spec(filt), filt.condition) for filt in valid_filters]
+
+        num_applied = len(self._applied_filters)
+        can_narrow = (
+            self.filtered_indices is not None
+            and num_applied > 0
+            and filter_keys[:num_applied] == self._applied_filters
+            and all(
+                condition == RowFilterCondition.And for _, condition in filter_keys[num_applied:]
+            )
+        )
 
-            try:
-                single_mask = self._eval_filter(filt)
-            except Exception as e:
-                had_errors = True
+        had_errors = False
+        if can_narrow:
+            # The new filters are ANDed onto the current selection, so
+            # we only need to evaluate them over the selected rows
+            filtered_indices = self.filtered_indices
+            applied_filters = list(self._applied_filters)
+            for filt, key in zip(valid_filters[num_applied:], filter_keys[num_applied:]):
+                try:
+                    mask = self._filter_mask_cache.get((self.state.table_version, key[0]))
+                    if mask is not None:
+                        sub_mask = self._gather(mask, filtered_indices)
+                    else:
+                        sub_mask = self._eval_filter(filt, row_indices=filtered_indices)
+                except Exception as e:
+                    had_errors = True
+                    self._set_filter_error(filt, e)
+                    continue
 
-                # Filter fails: we capture the error message and mark
-                # the filter as invalid
-                filt.is_valid = False
-                filt.error_message = str(e)
+                filtered_indices = self._filter_indices(filtered_indices, sub_mask)
+                applied_filters.append(key)
+        else:
+            # Evaluate all the filters and combine them using the
+            # indicated conditions
+            combined_mask = None
+            applied_filters = []
+            for filt, key in zip(valid_filters, filter_keys):
+                try:
+                    single_mask = self._eval_filter_cached(filt, key[0])
+                except Exception as e:
+                    had_errors = True
+                    self._set_filter_error(filt, e)
+                    continue
 
-                # Perhaps use a different log level, but to help with
-                # debugging for now.
-                logger.warning(e, exc_info=True)
-                continue
+                # Masks may be cached, so they must not be modified in
+                # place
+                if combined_mask is None:
+                    combined_mask = single_mask
+                elif filt.condition == RowFilterCondition.And:
+                    combined_mask = combined_mask & single_mask
+                elif filt.condition == RowFilterCondition.Or:
+                    combined_mask = combined_mask | single_mask
+                applied_filters.append(key)
 
-            if combined_mask is None:
-                combined_mask = single_mask
-            elif filt.condition == RowFilterCondition.And:
-                combined_mask &= single_mask
-            elif filt.condition == RowFilterCondition.Or:
-                combined_mask |= single_mask
+            filtered_indices = self._mask_to_indices(combined_mask)
 
-        self.filtered_indices = self._mask_to_indices(combined_mask)
+        self.filtered_indices = filtered_indices
+        self._applied_filters = applied_filters
         selected_num_rows = (
             len(self.table) if self.filtered_indices is None else len(self.filtered_indices)
         )
@@ -525,10 +1010,63 @@ class DataExplorerTableView:
         self._update_row_view_indices()
         return FilterResult(selected_num_rows=selected_num_rows, had_errors=had_errors)
 
+    def _eval_filter_cached(self, filt: RowFilter, spec: str):
+        key = (self.state.table_version, spec)
+        mask = self._filter_mask_cache.get(key)
+        if mask is None:
+            mask = self._eval_filter(filt)
+            self._filter_mask_cache.put(key, mask)
+        return mask
+
+    @staticmethod
+    def _set_filter_error(filt: RowFilter, error: Exception):
+        # Filter fails: we capture the error message and mark the
+        # filter as invalid
+        filt.is_valid = False
+        filt.error_message = str(error)
+
+        # Perhaps use a different log level, but to help with
+        # debugging for now.
+        logger.warning(error, exc_info=error)
+
     def _mask_to_indices(self, mask):
         raise NotImplementedError
 
-    def _eval_filter(self, filt: RowFilter):
+    def _eval_filter(self, filt: RowFilter, row_indices=None):
+        """
+        Evaluate a row filter, returning a boolean mask.
+
+        If row_indices is passed, the filter is only evaluated for
+        those rows and the mask has the same length as row_indices.
+        """
+        raise NotImplementedError
+
+    def _gather(self, values, indices):
+        raise NotImplementedError
+
+    def _get_search_strings(self, column_index: int, col, to_strings: Callable, row_indices=None):
+        """
+        Convert a non-string column to strings for a text search filter.
+
+        The converted column is cached, so that refining a search does
+        not convert the column again. Searches of a subset of the rows
+        use the cached column if there is one, and otherwise only
+        convert those rows.
+        """
+        key = (self.state.table_version, column_index)
+        strings = self._search_strings_cache.get(key)
+        if strings is None:
+            if row_indices is not None:
+                return to_strings(self._gather(col, row_indices))
+
+            strings = to_strings(col)
+            self._search_strings_cache.put(key, strings)
+
+        if row_indices is not None:
+            strings = self._gather(strings, row_indices)
+        return strings
+
+    def _filter_indices(self, indices, mask):
         raise NotImplementedError
 
     def set_sort_columns(self, params: SetSortColumnsParams):
@@ -539,37 +1077,178 @@ class DataExplorerTableView:
             # trigger a sort
             self._sort_data()
 
-    def _sort_data(self):
+    # Whether null values sort after all other values, in both
+    # directions
+    _SORT_NULLS_LAST = True
+
+    def _sort_data(self) -> None:
+        import numpy as np
+
+        sort_keys = self.state.sort_keys
+        if len(sort_keys) == 0:
+            # No sort keys. This will be None if the data is
+            # unfiltered
+            self.row_view_indices = self.filtered_indices
+            return
+
+        sort_indexes = []
+        for key in sort_keys:
+            sort_index = self._get_sort_index(key.column_index)
+            if sort_index is None:
+                # The column values cannot be ranked, so fall back to
+                # sorting the data directly
+                self._sort_data_direct()
+                return
+            sort_indexes.append(sort_index)
+
+        row_mask = None
+        if self.filtered_indices is not None:
+            row_mask = np.zeros(len(sort_indexes[0]), dtype=bool)
+            if isinstance(self.filtered_indices, RowRange):
+                row_mask[self.filtered_indices.slice] = True
+            else:
+                row_mask[np.asarray(self.filtered_indices)] = True
+
+        order = _multi_key_sort_order(
+            sort_indexes, [key.ascending for key in sort_keys], row_mask=row_mask
+        )
+        self.row_view_indices = self._wrap_row_indices(order)
+
+        # Ranks are computed on demand, so update the cached sizes
+        for key, sort_index in zip(sort_keys, sort_indexes):
+            cache_key = (self.state.table_version, key.column_index)
+            self._sort_index_cache.put(cache_key, sort_index, sort_index.nbytes)
+
+    def _get_sort_index(self, column_index: int) -> ColumnSortIndex | None:
+        cache_key = (self.state.table_version, column_index)
+        sort_index = self._sort_index_cache.get(cache_key)
+        if sort_index is None:
+            result = self._get_sort_order(column_index)
+            if result is None:
+                return None
+
+            order, num_nulls = result
+            sort_index = ColumnSortIndex(
+                order,
+                num_nulls,
+                lambda: self._get_sort_ranks(column_index),
+                nulls_last=self._SORT_NULLS_LAST,
+            )
+            self._sort_index_cache.put(cache_key, sort_index, sort_index.nbytes)
+        return sort_index
+
+    def _get_sort_order(self, column_index: int):
+        """
+        Compute the stable ascending sort order of a column.
+
+        Returns a tuple of the order and the number of nulls, or None if
+        the column cannot be sorted this way.
+        """
+        raise NotImplementedError
+
+    def _get_sort_ranks(self, column_index: int):
+        """
+        Compute the dense rank of each value in a column.
+
+        Ranks start at 0 in ascending sort order, with -1 for nulls,
+        consistent with the order from _get_sort_order.
+        """
+        raise NotImplementedError
+
+    def _wrap_row_indices(self, indices) -> Any:
+        """Convert row indices to the type that the view indexes rows with."""
+        return _compact_indices(indices, len(self.table))
+
+    def _sort_data_direct(self) -> None:
         raise NotImplementedError
 
     def get_column_profiles(self, params: GetColumnProfilesParams):
         # Launch task to compute column profiles and return them
-        # asynchronously, and return an empty result right away
-        self.job_queue.submit(self._get_column_profiles_task, params)
+        # asynchronously, and return an empty result right away. The
+        # most recent request is for the columns the user is currently
+        # looking at, so it runs ahead of any older pending requests.
+        self.job_queue.submit(
+            self._get_column_profiles_task,
+            params,
+            key=(self.comm.comm_id, params.callback_id),
+            priority=next(_profile_request_counter),
+            on_cancel=lambda: self._send_column_profiles_cancelled(params),
+        )
         return {}
 
+    def cancel_jobs(self):
+        """Cancel the pending and running background jobs for this table view."""
+        self.job_queue.cancel_group(self.comm.comm_id)
+
     def _get_column_profiles_task(self, params: GetColumnProfilesParams):
         self._recompute_if_needed()
-        results = []
 
-        for req in params.profiles:
-            try:
-                result = self._compute_profiles(
-                    req.column_index,
-                    req.profiles,
-                    params.format_options,
-                )
-                results.append(result.dict())
-            except Exception as e:  # noqa: PERF203
-                # Error computing a profile -- don't swallow it and timeout
-                logger.error(e, exc_info=True)
-                # Append an empty result so the other profiles get computed
-                results.append({})
-
-        self.comm.send_event(
-            DataExplorerFrontendEvent.ReturnColumnProfiles.value,
-            {"callback_id": params.callback_id, "profiles": results},
-        )
+        # Fan the columns out over several background workers. NumPy
+        # and polars release the GIL for most of the profiling work,
+        # so columns are computed in parallel. Each worker pulls the
+        # next pending column until none remain, and the last worker
+        # to finish returns all the results together.
+        num_workers = min(len(params.profiles), self.job_queue.max_workers, PROFILE_MAX_PARALLELISM)
+        if num_workers == 0:
+            self._send_column_profiles(params, [])
+            return
+
+        # The workers inherit the key and priority of this job
+        batch = _ColumnProfilesBatch(params, num_workers)
+        token = self.job_queue.current_token()
+        for _ in range(num_workers):
+            self.job_queue.submit(
+                self._column_profiles_worker,
+                batch,
+                # A worker cancelled before it starts still counts as done
+                on_cancel=lambda: self._column_profiles_worker_done(batch, token),
+            )
+
+    def _column_profiles_worker(self, batch: _ColumnProfilesBatch):
+        params = batch.params
+        token = self.job_queue.current_token()
+        try:
+            while (i := batch.next_index()) is not None:
+                # Stop between columns if the request has been cancelled
+                token.raise_if_cancelled()
+                req = params.profiles[i]
+                try:
+                    result = self._compute_profiles(
+                        req.column_index,
+                        req.profiles,
+                        params.format_options,
+                    )
+                    batch.results[i] = result.dict()
+                except JobCancelledError:
+                    raise
+                except Exception as e:
+                    # Error computing a profile -- don't swallow it and timeout
+                    logger.error(e, exc_info=True)
+                    # Leave an empty result so the other profiles get computed
+        finally:
+            self._column_profiles_worker_done(batch, token)
+
+    def _column_profiles_worker_done(self, batch: _ColumnProfilesBatch, token):
+        # The last worker to finish replies to the request
+        if batch.worker_done():
+            if token.is_cancelled:
+                self._send_column_profiles_cancelled(batch.params)
+            else:
+                self._send_column_profiles(batch.params, batch.results)
+
+    def _send_column_profiles_cancelled(self, params: GetColumnProfilesParams):
+        self._send_column_profiles(params, [], error_message="Request cancelled")
+
+    def _send_column_profiles(
+        self,
+        params: GetColumnProfilesParams,
+        results: list[dict],
+        error_message: str | None = None,
+    ):
+        event = {"callback_id": params.callback_id, "profiles": results}
+        if error_message is not None:
+            event["error_message"] = error_message
+        self.comm.send_event(DataExplorerFrontendEvent.ReturnColumnProfiles.value, event)
 
     def _compute_profiles(
         self,
@@ -577,37 +1256,79 @@ class DataExplorerTableView:
         profiles: list[ColumnProfileSpec],
         format_options: FormatOptions,
     ):
+        version = self.state.table_version
+        filters_key = tuple(
+            (_row_filter_spec(filt), filt.condition)
+            for filt in self.state.row_filters
+            if filt.is_valid is not False
+        )
+        format_key = format_options.json()
+
+        # The column data and its content fingerprint are only
+        # computed if needed, at most once
+        data = None
+        fingerprint = None
+
         results = {}
+        token = self.job_queue.current_token()
         for spec in profiles:
-            profile_type = spec.profile_type
-            if profile_type == ColumnProfileType.NullCount:
-                results["null_count"] = self._prof_null_count(column_index)
-            elif profile_type == ColumnProfileType.SummaryStats:
-                results["summary_stats"] = self._prof_summary_stats(column_index, format_options)
-            elif profile_type == ColumnProfileType.SmallFrequencyTable:
-                assert isinstance(spec.params, ColumnFrequencyTableParams)
-                results["small_frequency_table"] = self._prof_freq_table(
-                    column_index, spec.params, format_options
+            token.raise_if_cancelled()
+            cache_key = (column_index, spec.json(), format_key, filters_key)
+            entry = self._profile_cache.get(cache_key)
+            if entry is not None and entry[0] != version and entry[1] is not None:
+                # Computed for a previous version of the table, so
+                # only valid if the column has not changed since
+                fingerprint = fingerprint or self._get_column_content_fingerprint(column_index)
+                if entry[1] == fingerprint:
+                    entry = self._put_cached_profile(cache_key, fingerprint, entry[2])
+
+            if entry is None or entry[0] != version:
+                if data is None:
+                    data = self._get_profile_data(column_index)
+                result = self._compute_profile(data, spec, format_options)
+
+                # Only profiles of all the rows can stay valid after
+                # the table is updated, as the filters may then
+                # select other rows
+                if not filters_key:
+                    fingerprint = fingerprint or self._get_column_content_fingerprint(column_index)
+                entry = self._put_cached_profile(
+                    cache_key, None if filters_key else fingerprint, result
                 )
-            elif profile_type == ColumnProfileType.LargeFrequencyTable:
-                assert isinstance(spec.params, ColumnFrequencyTableParams)
-                results["large_frequency_table"] = self._prof_freq_table(
-                    column_index, spec.params, format_options
-                )
-            elif profile_type == ColumnProfileType.SmallHistogram:
-                assert isinstance(spec.params, ColumnHistogramParams)
-                results["small_histogram"] = self._prof_histogram(
-                    column_index, spec.params, format_options
-                )
-            elif profile_type == ColumnProfileType.LargeHistogram:
-                assert isinstance(spec.params, ColumnHistogramParams)
-                results["large_histogram"] = self._prof_histogram(
-                    column_index, spec.params, format_options
-                )
-            else:
-                raise NotImplementedError(profile_type)
+
+            results[spec.profile_type.value] = entry[2]
         return ColumnProfileResult(**results)
 
+    def _compute_profile(
+        self, data: _ColumnProfileData, spec: ColumnProfileSpec, format_options: FormatOptions
+    ):
+        profile_type = spec.profile_type
+        if profile_type == ColumnProfileType.NullCount:
+            return self._prof_null_count(data)
+        elif profile_type == ColumnProfileType.SummaryStats:
+            return self._prof_summary_stats(data, format_options)
+        elif profile_type in (
+            ColumnProfileType.SmallFrequencyTable,
+            ColumnProfileType.LargeFrequencyTable,
+        ):
+            assert isinstance(spec.params, ColumnFrequencyTableParams)
+            return self._prof_freq_table(data, spec.params, format_options)
+        elif profile_type in (ColumnProfileType.SmallHistogram, ColumnProfileType.LargeHistogram):
+            assert isinstance(spec.params, ColumnHistogramParams)
+            return self._prof_histogram(data, spec.params, format_options)
+        else:
+            raise NotImplementedError(profile_type)
+
+    def _put_cached_profile(self, cache_key: tuple, fingerprint: tuple | None, result) -> tuple:
+        entry = (self.state.table_version, fingerprint, result)
+        # Profile results are small, so their repr is a fine estimate
+        # of their size
+        self._profile_cache.put(cache_key, entry, nbytes=len(repr(result)))
+        return entry
+
+    def _get_profile_data(self, column_index: int) -> _ColumnProfileData:
+        return _ColumnProfileData(column_index, self._get_column(column_index))
+
     def get_state(self, _unused):
         self._recompute_if_needed()
 
@@ -646,29 +1367,192 @@ class DataExplorerTableView:
     def get_updated_state(self, new_table) -> StateUpdate:
         raise NotImplementedError
 
-    def _get_adjusted_filters(
-        self,
-        new_columns,
-        schema_changes,
-        shifted_columns,
-        deleted_columns,
-        schema_getter,
-    ):
-        # Shared by implementations of get_updated_state
-        new_filters = []
-        for filt in self.state.row_filters:
-            column_index = filt.column_schema.column_index
-            column_name = filt.column_schema.column_name
-
-            filt = filt.copy(deep=True)
+    def _get_schema_update(self, new_table, new_columns: list, new_dtypes: list) -> StateUpdate:
+        """
+        Compare the column names and dtypes of a new table with the cached schema.
 
-            is_deleted = False
+        Shared by implementations of get_updated_state whose
+        _construct_schema builds a column schema from a dtype.
+        """
+        new_state = DataExplorerState(
+            self.state.name,
+            row_filters=self.state.row_filters,
+            sort_keys=self.state.sort_keys,
+        )
+
+        if self.state.schema_cache is None or not self._should_cache_schema(new_table):
+            # We always say the schema was updated. We'll let filter
+            # and sort keys get invalidated by downstream checking
+            # rather than proactive invalidation
+            return True, new_state
+
+        schema_updated = False
+
+        # We go through the columns in the new table and see whether
+        # there is a type change or whether a column name moved.
+        shifted_columns: dict[int, int] = {}
+        deleted_columns: set[int] = set()
+        schema_changes: dict[int, ColumnSchema] = {}
+
+        new_columns_set = {c: i for i, c in enumerate(new_columns)}
+
+        old_columns = [c.column_name for c in self.state.schema_cache]
+        old_columns_set = {c: i for i, c in enumerate(old_columns)}
+
+        for old_index, column in enumerate(old_columns):
+            if column not in new_columns_set:
+                deleted_columns.add(old_index)
+                schema_updated = True
+
+        for new_index, column_name in enumerate(new_columns):
+            # New table has more columns than the old table
+            out_of_bounds = new_index >= len(old_columns)
+
+            if out_of_bounds or old_columns[new_index] != column_name:
+                if column_name not in old_columns_set:
+                    # New column
+                    schema_updated = True
+                    continue
+                # Column was shifted
+                old_index = old_columns_set[column_name]
+                shifted_columns[old_index] = new_index
+            else:
+                old_index = new_index
+
+            new_dtype = new_dtypes[new_index]
+            old_schema = self.state.schema_cache[old_index]
+
+            if str(new_dtype) == old_schema.type_name:
+                # dtype is unchanged
+                continue
+
+            # The type changed
+            schema_updated = True
+            schema_changes[old_index] = self._construct_schema(new_dtype, column_name, new_index)
+
+        def schema_getter(column_name, column_index):
+            return self._construct_schema(new_dtypes[column_index], column_name, column_index)
+
+        new_state.row_filters = self._get_adjusted_filters(
+            new_columns,
+            schema_changes,
+            shifted_columns,
+            deleted_columns,
+            schema_getter,
+        )
+
+        new_state.sort_keys = self._get_adjusted_sort_keys(
+            new_columns, schema_changes, shifted_columns, deleted_columns
+        )
+
+        return schema_updated, new_state
+
+    def _get_fingerprint_update(
+        self, old_fingerprints: list[tuple], new_fingerprints: list[tuple], schema_getter
+    ) -> StateUpdate:
+        """
+        Compare the column fingerprints of a new table with those of the current table.
+
+        Used by implementations of get_updated_state for tables too
+        wide for the schema cache. Column schemas are only computed
+        for changed columns that have row filters or sort keys.
+        """
+        new_state = DataExplorerState(
+            self.state.name,
+            row_filters=self.state.row_filters,
+            sort_keys=self.state.sort_keys,
+            column_fingerprints=new_fingerprints,
+        )
+
+        referenced_columns = {
+            filt.column_schema.column_index for filt in self.state.row_filters
+        } | {key.column_index for key in self.state.sort_keys}
+
+        schema_updated = len(new_fingerprints) != len(old_fingerprints)
+
+        shifted_columns: dict[int, int] = {}
+        deleted_columns: set[int] = set()
+        schema_changes: dict[int, ColumnSchema] = {}
+
+        new_columns = [fingerprint[0] for fingerprint in new_fingerprints]
+        new_columns_set = {c: i for i, c in enumerate(new_columns)}
+
+        old_columns = [fingerprint[0] for fingerprint in old_fingerprints]
+        old_columns_set = {c: i for i, c in enumerate(old_columns)}
+
+        for old_index, column in enumerate(old_columns):
+            if column not in new_columns_set:
+                deleted_columns.add(old_index)
+                schema_updated = True
+
+        for new_index, column_name in enumerate(new_columns):
+            # New table has more columns than the old table
+            out_of_bounds = new_index >= len(old_columns)
+
+            if out_of_bounds or old_columns[new_index] != column_name:
+                # Column was added or moved
+                schema_updated = True
+                if column_name not in old_columns_set:
+                    continue
+                old_index = old_columns_set[column_name]
+                shifted_columns[old_index] = new_index
+            else:
+                old_index = new_index
+
+            if new_fingerprints[new_index] == old_fingerprints[old_index]:
+                # The schema is unchanged, so any inferred dtype can
+                # be kept
+                if old_index in self.state.inferred_dtypes:
+                    new_state.inferred_dtypes[new_index] = self.state.inferred_dtypes[old_index]
+                continue
+
+            # The type maybe changed
+            schema_updated = True
+
+            if old_index in referenced_columns:
+                schema_changes[old_index] = schema_getter(column_name, new_index)
+
+        new_state.row_filters = self._get_adjusted_filters(
+            new_columns,
+            schema_changes,
+            shifted_columns,
+            deleted_columns,
+            schema_getter,
+        )
+
+        new_state.sort_keys = self._get_adjusted_sort_keys(
+            new_columns, schema_changes, shifted_columns, deleted_columns
+        )
+
+        return schema_updated, new_state
+
+    def _get_adjusted_filters(
+        self,
+        new_columns,
+        schema_changes,
+        shifted_columns,
+        deleted_columns,
+        schema_getter,
+    ):
+        # Shared by implementations of get_updated_state
+        new_filters = []
+        for filt in self.state.row_filters:
+            column_index = filt.column_schema.column_index
+            column_name = filt.column_schema.column_name
+
+            filt = filt.copy(deep=True)
+
+            is_deleted = False
             if column_index in schema_changes:
                 # A schema change is only valid if the column name is
                 # the same, otherwise it's a deletion
                 change = schema_changes[column_index]
                 if column_name == change.column_name:
                     filt.column_schema = change.copy()
+                    # The column may also have moved
+                    filt.column_schema.column_index = shifted_columns.get(
+                        column_index, change.column_index
+                    )
                 else:
                     # Column may be deleted. We need to distinguish
                     # between the case of a deleted column that was
@@ -729,6 +1613,8 @@ class DataExplorerTableView:
                 if prior_name != change.column_name:
                     # Column deleted
                     continue
+                # The column may also have moved
+                key.column_index = shifted_columns.get(column_index, column_index)
             elif column_index in shifted_columns:
                 key.column_index = shifted_columns[column_index]
             elif column_index in deleted_columns or prior_name != str(new_columns[column_index]):
@@ -790,14 +1676,15 @@ class DataExplorerTableView:
             ]
             return True
 
-    def _prof_null_count(self, column_index: int) -> int:
+    def _prof_null_count(self, data: _ColumnProfileData) -> int:
         raise NotImplementedError
 
     _SUMMARIZERS: MappingProxyType[str, SummarizerType] = MappingProxyType({})
 
-    def _prof_summary_stats(self, column_index: int, options: FormatOptions) -> ColumnSummaryStats:
-        col_schema = self._get_single_column_schema(column_index)
-        col = self._get_column(column_index)
+    def _prof_summary_stats(
+        self, data: _ColumnProfileData, options: FormatOptions
+    ) -> ColumnSummaryStats:
+        col_schema = self._get_single_column_schema(data.column_index)
 
         ui_type = col_schema.type_display
         handler = self._SUMMARIZERS.get(ui_type, _summarize_not_implemented)
@@ -806,14 +1693,14 @@ class DataExplorerTableView:
             # Return nothing for types we don't yet know how to summarize
             return ColumnSummaryStats(type_display=ui_type)
         else:
-            return handler(col, options)
+            return handler(data.column, options)
 
     def _get_column(self, column_index: int):
         raise NotImplementedError
 
     def _prof_freq_table(
         self,
-        column_index: int,
+        data: _ColumnProfileData,
         params: ColumnFrequencyTableParams,
         format_options: FormatOptions,
     ) -> ColumnFrequencyTable:
@@ -821,7 +1708,7 @@ class DataExplorerTableView:
 
     def _prof_histogram(
         self,
-        column_index: int,
+        data: _ColumnProfileData,
         params: ColumnHistogramParams,
         format_options: FormatOptions,
     ) -> ColumnHistogram:
@@ -852,9 +1739,33 @@ class DataExplorerTableView:
         convert_to_code=ConvertToCodeFeatures(
             support_status=SupportStatus.Unsupported,
         ),
+        get_data_values=GetDataValuesFeatures(supported_binary_formats=[]),
     )
 
 
+def _arrow_ipc_buffer(values) -> bytes:
+    """Serialize a pyarrow (chunked) array as a single-column Arrow IPC stream."""
+    import pyarrow as pa
+
+    table = pa.Table.from_arrays([values], names=["values"])
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _arrow_formatted_values(formatted: list[ColumnValue]):
+    """
+    Convert formatted values to a pyarrow string array.
+
+    Used for values that Arrow cannot represent natively, like mixed-type
+    object columns. Special values are sent as nulls.
+    """
+    import pyarrow as pa
+
+    return pa.array([x if isinstance(x, str) else None for x in formatted], type=pa.string())
+
+
 def _box_number_stats(
     min_val, max_val, mean_val, median_val, std_val, display_type=ColumnDisplayType.Floating
 ):
@@ -1014,7 +1925,7 @@ def _builtin_isinf(value):
     return math.isinf(value)
 
 
-def _get_float_formatter(options: FormatOptions) -> Callable:
+def _get_float_format_specs(options: FormatOptions):
     sci_format = f".{options.large_num_digits}E"
     medium_format = f".{options.large_num_digits}f"
     small_format = f".{options.small_num_digits}f"
@@ -1027,12 +1938,23 @@ def _get_float_formatter(options: FormatOptions) -> Callable:
     # notation
     lower_threshold = float("0." + "0" * (options.small_num_digits - 1) + "1")
 
-    thousands_sep = options.thousands_sep
-
-    if thousands_sep is not None:
+    if options.thousands_sep is not None:
         # We format with comma then replace later
         medium_format = "," + medium_format
 
+    return sci_format, medium_format, small_format, upper_threshold, lower_threshold
+
+
+def _get_float_formatter(options: FormatOptions) -> Callable:
+    (
+        sci_format,
+        medium_format,
+        small_format,
+        upper_threshold,
+        lower_threshold,
+    ) = _get_float_format_specs(options)
+    thousands_sep = options.thousands_sep
+
     def base_float_format(x) -> str:
         abs_x = abs(x)
 
@@ -1066,6 +1988,110 @@ def _get_float_formatter(options: FormatOptions) -> Callable:
         return base_float_format
 
 
+def _format_float_array(values, options: FormatOptions) -> list[str]:
+    """
+    Vectorized counterpart of _get_float_formatter.
+
+    Formats a 1-D array of floats in batch: the notation for each value
+    is chosen with masks and all values are rendered with a single
+    str.format call. The output is identical to calling the scalar
+    formatter on each value, including for NaN and infinity.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return []
+
+    (
+        sci_format,
+        medium_format,
+        small_format,
+        upper_threshold,
+        lower_threshold,
+    ) = _get_float_format_specs(options)
+
+    abs_values = np.abs(values)
+    is_medium = (abs_values == 0) | ((abs_values >= 1) & (abs_values < upper_threshold))
+    is_small = (abs_values >= lower_threshold) & (abs_values < 1)
+
+    # Digit grouping is comparatively slow, so medium numbers that
+    # cannot reach 1,000 after rounding are formatted without it
+    is_grouped = is_medium & (abs_values >= 999)
+
+    # Everything else, including NaN and infinity, uses scientific
+    # notation, the same as the scalar formatter
+    templates = np.array(
+        [
+            "{:" + sci_format + "}\n",
+            "{:" + medium_format.lstrip(",") + "}\n",
+            "{:" + small_format + "}\n",
+            "{:" + medium_format + "}\n",
+        ],
+        dtype=object,
+    )
+    notation = is_medium.view(np.int8) + 2 * is_small.view(np.int8) + 2 * is_grouped.view(np.int8)
+    result = "".join(templates[notation].tolist()).format(*values.tolist())
+
+    thousands_sep = options.thousands_sep
+    if thousands_sep is not None and thousands_sep != ",":
+        result = result.replace(",", thousands_sep)
+
+    return result[:-1].split("\n")
+
+
+def _format_float_column(
+    values,
+    options: FormatOptions,
+    *,
+    null_mask=None,
+    null_value: int = _VALUE_NULL,
+    inf_as_special: bool = True,
+) -> list[ColumnValue]:
+    """
+    Format a 1-D float array with _format_float_array, replacing special values with their codes.
+
+    Positions set in null_mask are returned as null_value. When
+    inf_as_special is False, infinite values are formatted like other
+    numbers.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    result: list[ColumnValue] = list(_format_float_array(values, options))
+
+    special = np.isnan(values)
+    if inf_as_special:
+        special |= np.isinf(values)
+    if null_mask is not None:
+        null_mask = np.asarray(null_mask, dtype=bool)
+        special |= null_mask
+
+    if special.any():
+        for i in np.flatnonzero(special).tolist():
+            x = values[i]
+            if null_mask is not None and null_mask[i]:
+                result[i] = null_value
+            elif x != x:
+                result[i] = _VALUE_NAN
+            else:
+                result[i] = _VALUE_INF if x > 0 else _VALUE_NEGINF
+
+    return result
+
+
+def _is_vectorizable_float_dtype(dtype) -> bool:
+    import numpy as np
+
+    # float128 values do not round-trip through float64
+    return isinstance(dtype, np.dtype) and dtype.kind == "f" and dtype.itemsize <= 8
+
+
+def _row_filter_spec(filt: RowFilter) -> str:
+    # The parts of a row filter that determine its mask
+    return filt.json(include={"filter_type", "column_schema", "params"})
+
+
 _FILTER_RANGE_COMPARE_SUPPORTED = {
     ColumnDisplayType.Floating,
     ColumnDisplayType.Integer,
@@ -1229,6 +2255,104 @@ PANDAS_CACHE_CELLS_THRESHOLD = 10_000_000
 # improve performance if needed.
 PANDAS_INFER_DTYPE_SIZE_LIMIT = 1_000_000
 
+# Row filters and frequency tables of categorical columns are computed
+# on the categories and mapped through the codes. String columns with
+# at least PANDAS_DICTIONARY_MIN_ROWS rows are factorized to do the
+# same if a sample of PANDAS_DICTIONARY_SAMPLE_SIZE rows has at most
+# PANDAS_DICTIONARY_SAMPLE_MAX_UNIQUE distinct values
+PANDAS_DICTIONARY_MIN_ROWS = 100_000
+PANDAS_DICTIONARY_SAMPLE_SIZE = 10_000
+PANDAS_DICTIONARY_SAMPLE_MAX_UNIQUE = 1_000
+
+# Memory budget for the per-table-view cache of dictionary encodings
+DICTIONARY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _arrow_data_arrays(values: pa.ChunkedArray) -> list:
+    """Return NumPy views of the buffers of a pyarrow ChunkedArray."""
+    import numpy as np
+
+    arrays = []
+    for chunk in values.chunks:
+        arrays.append(np.array([chunk.offset, len(chunk)]))
+        arrays.extend(np.frombuffer(buf, dtype=np.uint8) for buf in chunk.buffers() if buf)
+    return arrays
+
+
+def _data_arrays_fingerprint(arrays: list, max_bytes: int | None = None) -> tuple:
+    return tuple(
+        (
+            array.__array_interface__["data"][0],
+            array.shape,
+            _array_digest(array, max_bytes),
+        )
+        for array in arrays
+    )
+
+
+def _data_arrays_digest(arrays: list) -> tuple:
+    # Unlike _data_arrays_fingerprint, depends only on the contents
+    # of the arrays, so it's the same for copies of the data
+    return tuple((array.shape, _array_digest(array)) for array in arrays)
+
+
+def _pandas_data_arrays(values) -> list | None:
+    """
+    Return the NumPy arrays holding the data of a pandas array.
+
+    Returns None for extension arrays whose storage is not known.
+    """
+    import numpy as np
+
+    if isinstance(values, np.ndarray):
+        return [values]
+    elif hasattr(values, "_pa_array"):
+        # pyarrow-backed, including the default string dtype
+        return _arrow_data_arrays(values._pa_array)  # noqa: SLF001
+    elif hasattr(values, "_data") and hasattr(values, "_mask"):
+        # Nullable integer, float and boolean arrays
+        return [values._data, values._mask]  # noqa: SLF001
+    elif hasattr(values, "_ndarray"):
+        # Datetimes, timedeltas, categorical codes and Python strings
+        return [values._ndarray]  # noqa: SLF001
+    return None
+
+
+def _pandas_frame_data_arrays(table: pd.DataFrame) -> tuple[list, list] | None:
+    """
+    Return the NumPy arrays holding the index and block data of a pandas DataFrame.
+
+    Returns None if the storage of some of the data is not known.
+    """
+    import pandas as pd
+
+    index = table.index
+    if isinstance(index, pd.RangeIndex):
+        index_values = []
+    elif isinstance(index, pd.MultiIndex):
+        index_values = [*index.codes, *(level.array for level in index.levels)]
+    else:
+        index_values = [index.array]
+
+    # Array managers have no blocks and aren't fingerprinted
+    blocks = getattr(table._mgr, "blocks", None)  # noqa: SLF001
+    if blocks is None:
+        return None
+    data_arrays = []
+    for values in [*index_values, *(block.values for block in blocks)]:  # noqa: PD011
+        arrays = _pandas_data_arrays(values)
+        if arrays is None:
+            return None
+        data_arrays.append(arrays)
+    return data_arrays[: len(index_values)], data_arrays[len(index_values) :]
+
+
+def _pandas_values_digest(values) -> tuple | None:
+    arrays = _pandas_data_arrays(values)
+    if arrays is None:
+        return None
+    return _data_arrays_digest(arrays)
+
 
 class PandasView(DataExplorerTableView):
     TYPE_NAME_MAPPING = MappingProxyType({"boolean": "bool"})
@@ -1246,34 +2370,185 @@ class PandasView(DataExplorerTableView):
         # For lazy importing NumPy
         self.math_helper = NumPyMathHelper()
 
+        # Dictionary encodings of categorical and low-cardinality
+        # string columns, keyed by table version and column index.
+        # False marks columns that are not worth encoding
+        self._dictionary_cache = LRUCache(DICTIONARY_CACHE_MAX_BYTES)
+
         super().__init__(table, comm, state, job_queue, sql_string)
 
     @property
-    def _has_row_labels(self):
+    def _has_row_labels(self) -> bool:
         # pandas always has row labels
         return True
 
+    def _get_dictionary_encoding(self, column_index: int) -> DictionaryEncoding | None:
+        cache_key = (self.state.table_version, column_index)
+        encoding = self._dictionary_cache.get(cache_key)
+        if encoding is None:
+            encoding = self._encode_column(column_index)
+            if encoding is None:
+                self._dictionary_cache.put(cache_key, False, nbytes=0)  # noqa: FBT003
+            else:
+                self._dictionary_cache.put(cache_key, encoding, nbytes=encoding.nbytes)
+        return encoding or None
+
+    def _encode_column(self, column_index: int) -> DictionaryEncoding | None:
+        import numpy as np
+        import pandas as pd
+
+        column = self.table.iloc[:, column_index]
+        dtype = column.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            codes = column.cat.codes.to_numpy()
+            dictionary = pd.Series(
+                pd.Categorical.from_codes(np.arange(-1, len(dtype.categories)), dtype=dtype)
+            )
+            return DictionaryEncoding(codes, dictionary)
+
+        if len(column) < PANDAS_DICTIONARY_MIN_ROWS or not (
+            isinstance(dtype, pd.StringDtype)
+            or self._get_inferred_dtype(column, column_index, self.state) == "string"
+        ):
+            return None
+
+        sample = column.take(_sample_indices(len(column), PANDAS_DICTIONARY_SAMPLE_SIZE))
+        if sample.nunique() > PANDAS_DICTIONARY_SAMPLE_MAX_UNIQUE:
+            return None
+
+        try:
+            codes, uniques = pd.factorize(column)
+        except TypeError:
+            # Unhashable values beyond the inferred dtype limit
+            return None
+        dictionary = pd.concat(
+            [pd.Series([None], dtype=dtype), pd.Series(uniques, dtype=dtype)],
+            ignore_index=True,
+        )
+        return DictionaryEncoding(codes, dictionary)
+
     @classmethod
     def _should_cache_schema(cls, table):
         num_rows, num_columns = table.shape
         num_cells = num_rows * num_columns
         return num_columns < SCHEMA_CACHE_THRESHOLD and num_cells < PANDAS_CACHE_CELLS_THRESHOLD
 
-    def _maybe_wrap(self, value):
+    @classmethod
+    def _get_content_fingerprint(cls, table, max_bytes: int | None = None) -> tuple | None:
+        # The data is fingerprinted by the address and a checksum of
+        # each array of the block manager, so in-place modifications
+        # are detected
         import pandas as pd
 
-        if isinstance(value, pd.Series):
-            # track if the original value was a Series, so we can
-            # convert filters appropriately for the real type
-            self.was_series = True
-            if value.name is None:
-                return pd.DataFrame({"unnamed": value})
-            else:
-                return pd.DataFrame(value)
+        data_arrays = _pandas_frame_data_arrays(table)
+        if data_arrays is None:
+            return None
+        size = cls._get_content_size(table)
+        if size > CONTENT_FINGERPRINT_MAX_BYTES:
+            return None
+        index_arrays, block_arrays = data_arrays
+
+        # Each array is checksummed on a sample of its share of max_bytes
+        if max_bytes is not None and size > max_bytes:
+            max_bytes //= max(sum(len(arrays) for arrays in [*index_arrays, *block_arrays]), 1)
+        else:
+            max_bytes = None
+
+        index = table.index
+        parts = [table.shape, tuple(table.columns), tuple(index.names)]
+        if isinstance(index, pd.RangeIndex):
+            parts.append((index.start, index.stop, index.step))
+        parts.extend(_data_arrays_fingerprint(arrays, max_bytes) for arrays in index_arrays)
+        for block, arrays in zip(table._mgr.blocks, block_arrays):  # noqa: SLF001
+            parts.append(
+                (
+                    block.mgr_locs.as_array.tobytes(),
+                    block.dtype,
+                    _data_arrays_fingerprint(arrays, max_bytes),
+                )
+            )
+        return tuple(parts)
+
+    @classmethod
+    def _get_content_size(cls, table) -> int:
+        data_arrays = _pandas_frame_data_arrays(table)
+        if data_arrays is None:
+            return 0
+        index_arrays, block_arrays = data_arrays
+        return sum(
+            _array_digest_cost(array)
+            for arrays in [*index_arrays, *block_arrays]
+            for array in arrays
+        )
+
+    def _get_column_content_fingerprint(self, column_index: int) -> tuple | None:
+        # Operations like DataFrame.assign copy unchanged columns, so
+        # the data is fingerprinted by its contents only
+        column = self.table.iloc[:, column_index]
+        values_digest = _pandas_values_digest(column.array)
+        if values_digest is None:
+            return None
+        return (self.table.columns[column_index], column.dtype, len(column), values_digest)
+
+    _HAS_COLUMN_FINGERPRINTS = True
+
+    @classmethod
+    def _get_column_fingerprints(cls, table, columns: range) -> list[tuple]:
+        import pandas as pd
+
+        names = table.columns
+        dtypes = table.dtypes
+        fingerprints = []
+        for i in columns:
+            dtype = dtypes.iloc[i]
+            # The display type of object columns is inferred from the
+            # data, so we also need the identity of the data to know
+            # that it has not been replaced
+            if dtype == object:  # noqa: E721
+                values = table.iloc[:, i].to_numpy()
+            elif isinstance(dtype, pd.CategoricalDtype) and dtype.categories.dtype == object:
+                values = dtype.categories.to_numpy()
+            else:
+                values = None
+
+            identity = None
+            if values is not None:
+                identity = (values.__array_interface__["data"][0], len(values))
+            fingerprints.append((names[i], str(dtype), identity))
+        return fingerprints
+
+    def _maybe_wrap(self, value):
+        import pandas as pd
+
+        if isinstance(value, pd.Series):
+            # track if the original value was a Series, so we can
+            # convert filters appropriately for the real type
+            self.was_series = True
+            if value.name is None:
+                return pd.DataFrame({"unnamed": value})
+            else:
+                return pd.DataFrame(value)
         else:
             return value
 
     def get_updated_state(self, new_table) -> StateUpdate:
+        if self.state.schema_cache is None and self.state.column_fingerprints is not None:
+            # Too big for the schema cache, but the column
+            # fingerprints have been computed, so only the changed
+            # columns need analysis
+            def schema_getter(column_name, column_index):
+                return self._construct_schema(
+                    new_table.iloc[:, column_index],
+                    column_name,
+                    column_index,
+                    DataExplorerState(self.state.name),
+                )
+
+            new_fingerprints = self._get_column_fingerprints(new_table, range(new_table.shape[1]))
+            return self._get_fingerprint_update(
+                self.state.column_fingerprints, new_fingerprints, schema_getter
+            )
+
         filtered_columns = {
             filt.column_schema.column_index: filt.column_schema for filt in self.state.row_filters
         }
@@ -1593,48 +2868,39 @@ class PandasView(DataExplorerTableView):
         _, type_display, _ = self._get_type(column, column_index, self.state)
         return type_display
 
+    def _select_rows(self, column_indices: list[int], rows) -> list[pd.Series]:
+        # Taking the rows of all the columns at once takes each block
+        # of same-typed columns together
+        frame = self.table.iloc[rows, column_indices]
+        return [frame.iloc[:, i] for i in range(len(column_indices))]
+
     def _get_data_values(
         self,
         selections: list[ColumnSelection],
         format_options: FormatOptions,
     ) -> dict:
-        formatted_columns = []
-        for selection in selections:
-            col = self.table.iloc[:, selection.column_index]
-            spec = selection.spec
-            if isinstance(spec, DataSelectionRange):
-                if self.row_view_indices is not None:
-                    view_slice = self.row_view_indices[spec.first_index : spec.last_index + 1]
-                    values = col.take(view_slice)
-                else:
-                    # No filtering or sorting, just slice directly
-                    values = col.iloc[spec.first_index : spec.last_index + 1]
-            else:
-                if self.row_view_indices is not None:
-                    values = col.take(self.row_view_indices.take(spec.indices))
-                else:
-                    # No filtering or sorting, just slice directly
-                    values = col.take(spec.indices)
-
-            formatted_columns.append(self._format_values(values, format_options))
+        formatted_columns = [
+            self._format_values(values, format_options)
+            for values in self._select_columns(selections)
+        ]
 
         # Bypass pydantic model for speed
         return {"columns": formatted_columns}
 
+    def _values_to_arrow(self, values: pd.Series, format_options: FormatOptions):
+        import pyarrow as pa
+
+        try:
+            # from_pandas=False keeps NaN distinct from null
+            return pa.array(values, from_pandas=False)
+        except (pa.ArrowException, TypeError, ValueError):
+            # e.g. mixed-type object columns
+            return _arrow_formatted_values(self._format_values(values, format_options))
+
     def _get_row_labels(self, selection: ArraySelection, _: FormatOptions):
         import pandas as pd
 
-        if isinstance(selection, DataSelectionRange):
-            if self.row_view_indices is not None:
-                view_slice = self.row_view_indices[selection.first_index : selection.last_index + 1]
-                indices = self.table.index.take(view_slice)
-            else:
-                indices = self.table.index[selection.first_index : selection.last_index + 1]
-        else:
-            if self.row_view_indices is not None:
-                indices = self.table.index.take(self.row_view_indices.take(selection.indices))
-            else:
-                indices = self.table.index.take(selection.indices)
+        indices = self.table.index[self._get_view_rows(selection)]
 
         # Currently, we format MultiIndex in its flat tuple
         # representation. In the future we will return multiple lists
@@ -1647,6 +2913,17 @@ class PandasView(DataExplorerTableView):
     def _format_values(self, values, options: FormatOptions) -> list[ColumnValue]:
         import pandas as pd
 
+        dtype = getattr(values, "dtype", None)
+        if _is_vectorizable_float_dtype(dtype):
+            return _format_float_column(values, options)
+        elif isinstance(dtype, (pd.Float32Dtype, pd.Float64Dtype)):
+            return _format_float_column(
+                values.to_numpy(dtype="float64", na_value=0.0),
+                options,
+                null_mask=values.isna(),
+                null_value=_VALUE_NA,
+            )
+
         float_format = _get_float_formatter(options)
         max_length = options.max_value_length
 
@@ -1670,41 +2947,46 @@ class PandasView(DataExplorerTableView):
         return [_format_value(x) for x in values]
 
     def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat):
-        from io import StringIO
-
-        if self.row_view_indices is not None:
-            row_selector = self.row_view_indices[row_selector]
-
-        to_export = self.table.iloc[row_selector, column_selector]
-        buf = StringIO()
-
-        if fmt == ExportFormat.Csv:
-            to_export.to_csv(buf, index=False, sep=",")
-        elif fmt == ExportFormat.Tsv:
-            to_export.to_csv(buf, sep="\t", index=False)
-        elif fmt == ExportFormat.Html:
-            to_export.to_html(buf, index=False)
-        else:
+        if fmt not in (ExportFormat.Csv, ExportFormat.Tsv, ExportFormat.Html):
             raise NotImplementedError(f"Unsupported export format {fmt}")
 
-        result = buf.getvalue()
+        # HTML is exported as a single table
+        row_chunks = self._export_row_chunks(row_selector, chunked=fmt != ExportFormat.Html)
+        for i, rows in enumerate(row_chunks):
+            to_export = self.table.iloc[rows, column_selector]
+
+            if fmt == ExportFormat.Csv:
+                result = to_export.to_csv(index=False, sep=",", header=i == 0)
+            elif fmt == ExportFormat.Tsv:
+                result = to_export.to_csv(sep="\t", index=False, header=i == 0)
+            else:
+                result = to_export.to_html(index=False)
 
-        # pandas will put a line break at the end of CSV data. If
-        # present, remove it
-        if result[-1] == "\n":
-            result = result[:-1]
+            # pandas will put a line break at the end of CSV data. If
+            # present, remove it
+            if i == len(row_chunks) - 1 and result[-1] == "\n":
+                result = result[:-1]
 
-        return ExportedData(data=result, format=fmt)
+            yield result
 
     def _export_cell(self, row_index: int, column_index: int, fmt: ExportFormat):
         return ExportedData(data=str(self.table.iloc[row_index, column_index]), format=fmt)
 
     def _mask_to_indices(self, mask):
         if mask is not None:
-            return mask.nonzero()[0]
+            return _mask_to_row_indices(mask)
         return None
 
-    def _eval_filter(self, filt: RowFilter):
+    def _gather(self, values, indices):
+        if isinstance(indices, RowRange):
+            # Consecutive rows are a zero-copy slice
+            return getattr(values, "iloc", values)[indices.slice]
+        return values.take(indices)
+
+    def _filter_indices(self, indices, mask):
+        return indices[mask]
+
+    def _eval_filter(self, filt: RowFilter, row_indices=None):
         import pandas as pd
 
         column_index = filt.column_schema.column_index
@@ -1713,6 +2995,14 @@ class PandasView(DataExplorerTableView):
         dtype = col.dtype
         inferred_type = self._get_inferred_dtype(col, column_index, self.state)
 
+        encoding = self._get_dictionary_encoding(column_index)
+        if encoding is not None:
+            # Filters are elementwise, so we evaluate them once per
+            # distinct value and map the results through the codes
+            col = encoding.dictionary
+        elif row_indices is not None:
+            col = self._gather(col, row_indices)
+
         mask = None
         if filt.filter_type in (
             RowFilterType.Between,
@@ -1765,24 +3055,25 @@ class PandasView(DataExplorerTableView):
             assert isinstance(params, FilterTextSearch)
 
             if inferred_type != "string":
-                col = col.astype(str)
-
-            term = params.term
-
-            if params.search_type == TextSearchType.RegexMatch:
-                mask = col.str.match(term, case=params.case_sensitive)
-            else:
-                if not params.case_sensitive:
-                    col = col.str.lower()
-                    term = term.lower()
-                if params.search_type == TextSearchType.Contains:
-                    mask = col.str.contains(term)
-                elif params.search_type == TextSearchType.NotContains:
-                    mask = ~col.str.contains(term, na=True)
-                elif params.search_type == TextSearchType.StartsWith:
-                    mask = col.str.startswith(term)
-                elif params.search_type == TextSearchType.EndsWith:
-                    mask = col.str.endswith(term)
+                if encoding is None:
+                    col = self._get_search_strings(
+                        column_index,
+                        self.table.iloc[:, column_index],
+                        lambda x: x.astype(str),
+                        row_indices=row_indices,
+                    )
+                else:
+                    col = col.astype(str)
+
+            # Regex searches match at the start of values, like
+            # Series.str.match
+            pattern = get_text_search_pattern(
+                params.search_type,
+                params.term,
+                case_sensitive=params.case_sensitive,
+                match_start=True,
+            )
+            mask = pd.Series(self._search_mask(pattern, col), copy=False)
 
         assert mask is not None
 
@@ -1790,8 +3081,22 @@ class PandasView(DataExplorerTableView):
         if mask.dtype != bool:
             mask = mask.fillna(value=False).astype(bool)
 
-        # pandas 3.0 CoW returns read-only arrays; copy to allow in-place combination
-        return mask.to_numpy().copy()
+        if encoding is not None:
+            return encoding.map_values(mask.to_numpy(), row_indices)
+        return mask.to_numpy()
+
+    @staticmethod
+    def _search_mask(pattern, col):
+        values = getattr(col.array, "_pa_array", None)
+        if values is not None:
+            import pyarrow as pa
+
+            if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+                # Search Arrow-backed strings without converting them to
+                # Python objects
+                return pattern.arrow_mask(values).to_numpy()
+
+        return pattern.python_mask(col.to_numpy(dtype=object))
 
     @staticmethod
     def _coerce_value(value, dtype, inferred_type):
@@ -1825,28 +3130,47 @@ class PandasView(DataExplorerTableView):
                 dummy = dummy.astype(dtype)
             return dummy.iloc[0]
 
-    def _sort_data(self) -> None:
+    def _get_sort_order(self, column_index: int):
+        from pandas.core.sorting import nargsort
+
+        column = self.table.iloc[:, column_index]
+        if column.dtype == object and self._get_inferred_dtype(
+            column, column_index, self.state
+        ) in ("mixed", "mixed-integer", "unknown-array"):
+            # Values may not be hashable or comparable with each other
+            return None
+
+        # Mergesort is needed to make it stable
+        order = nargsort(column, kind="mergesort")
+        return order, int(column.isna().sum())
+
+    def _get_sort_ranks(self, column_index: int):
+        import pandas as pd
+
+        # Nulls get the code -1
+        ranks, _ = pd.factorize(self.table.iloc[:, column_index], sort=True)
+        return ranks
+
+    def _sort_data_direct(self) -> None:
         from pandas.core.sorting import lexsort_indexer, nargsort
 
         if len(self.state.sort_keys) == 1:
             key = self.state.sort_keys[0]
-            column = self.table.iloc[:, key.column_index]
+            # pandas's univariate null-friendly argsort (computes the
+            # sorting indices). Mergesort is needed to make it stable
+            sort_indexer = nargsort(
+                self._get_column(key.column_index),
+                kind="mergesort",
+                ascending=key.ascending,
+            )
             if self.filtered_indices is not None:
-                # pandas's univariate null-friendly argsort (computes
-                # the sorting indices). Mergesort is needed to make it
-                # stable
-                sort_indexer = nargsort(
-                    column.take(self.filtered_indices),
-                    kind="mergesort",
-                    ascending=key.ascending,
-                )
                 # Reorder the filtered_indices to provide the
                 # filtered, sorted virtual view for future data
                 # requests
                 self.row_view_indices = self.filtered_indices.take(sort_indexer)
             else:
                 # Data is not filtered
-                self.row_view_indices = nargsort(column, kind="mergesort", ascending=key.ascending)
+                self.row_view_indices = self._wrap_row_indices(sort_indexer)
         elif len(self.state.sort_keys) > 1:
             # Multiple sorting keys
             cols_to_sort = []
@@ -1862,7 +3186,7 @@ class PandasView(DataExplorerTableView):
                 # Create the filtered, sorted virtual view indices
                 self.row_view_indices = self.filtered_indices.take(sort_indexer)
             else:
-                self.row_view_indices = sort_indexer
+                self.row_view_indices = self._wrap_row_indices(sort_indexer)
         else:
             # This will be None if the data is unfiltered
             self.row_view_indices = self.filtered_indices
@@ -1870,11 +3194,11 @@ class PandasView(DataExplorerTableView):
     def _get_column(self, column_index: int) -> pd.Series:
         column = self.table.iloc[:, column_index]
         if self.filtered_indices is not None:
-            column = column.take(self.filtered_indices)
+            column = self._gather(column, self.filtered_indices)
         return column
 
-    def _prof_null_count(self, column_index: int) -> int:
-        return int(self._get_column(column_index).isna().sum())
+    def _prof_null_count(self, data: _ColumnProfileData) -> int:
+        return int(data.column.isna().sum())
 
     _SUMMARIZERS = MappingProxyType(
         {
@@ -1891,12 +3215,12 @@ class PandasView(DataExplorerTableView):
 
     def _prof_freq_table(
         self,
-        column_index: int,
+        data: _ColumnProfileData,
         params: ColumnFrequencyTableParams,
         format_options: FormatOptions,
     ) -> ColumnFrequencyTable:
-        col = self._get_column(column_index)
-        counts = col.value_counts()
+        # The small and large frequency tables share the same counts
+        counts, scale = data.get("value_counts", lambda: self._column_value_counts(data))
 
         top_counts = counts.iloc[: params.limit]
         other_group = counts.iloc[params.limit :]
@@ -1907,31 +3231,33 @@ class PandasView(DataExplorerTableView):
             values=formatted_groups,
             counts=[int(x) for x in top_counts],
             other_count=int(other_group.sum()),
+            is_approximate=scale != 1.0,
         )
 
     def _prof_histogram(
         self,
-        column_index: int,
+        data: _ColumnProfileData,
         params: ColumnHistogramParams,
         format_options: FormatOptions,
     ) -> ColumnHistogram:
         import numpy as np
         import pandas as pd
 
-        col = self._get_column(column_index)
-
-        # TODO: why does this type error?
-        data = col[col.notna()].to_numpy()  # type: ignore
-
-        dtype = data.dtype
+        # The small and large histograms share the same non-null
+        # values and value range, differing only in their binning
+        values, dtype, scale = data.get(
+            "histogram_values", lambda: self._histogram_values(data.column)
+        )
+        value_range = data.get("histogram_range", lambda: _get_value_range(values))
         is_datetime64 = np.issubdtype(dtype, np.datetime64)
 
-        if is_datetime64:
-            data = data.view(np.int64)
-
         method = _get_histogram_method(params.method)
 
-        bin_counts, bin_edges = _get_histogram_numpy(data, params.num_bins, method=method)
+        bin_counts, bin_edges = _get_histogram_numpy(
+            values, params.num_bins, method=method, value_range=value_range
+        )
+        if scale != 1.0:
+            bin_counts = [round(x * scale) for x in bin_counts]
 
         if is_datetime64:
             # A bit hacky for now, but will replace this with
@@ -1948,8 +3274,61 @@ class PandasView(DataExplorerTableView):
             bin_edges=[str(x) for x in formatted_edges],
             bin_counts=[int(x) for x in bin_counts],
             quantiles=[],
+            is_approximate=scale != 1.0,
         )
 
+    def _column_value_counts(self, data: _ColumnProfileData) -> tuple[pd.Series, float]:
+        import numpy as np
+        import pandas as pd
+
+        encoding = self._get_dictionary_encoding(data.column_index)
+        if encoding is None:
+            return self._value_counts(data.column)
+
+        # Exact counts from the codes, in descending order with ties
+        # in dictionary order
+        counts = encoding.value_counts(self.filtered_indices)
+        order = np.argsort(-counts, kind="stable")
+        if not isinstance(data.column.dtype, pd.CategoricalDtype):
+            # Like value_counts, only categories are listed when absent
+            order = order[counts[order] > 0]
+        values = pd.Index(encoding.dictionary.iloc[1:]).take(order)
+        return pd.Series(counts[order], index=values), 1.0
+
+    @staticmethod
+    def _value_counts(col: pd.Series) -> tuple[pd.Series, float]:
+        if len(col) <= PROFILE_SAMPLE_THRESHOLD:
+            return col.value_counts(), 1.0
+
+        # Approximate the counts from a sample of the column
+        sample = col.take(_sample_indices(len(col), PROFILE_SAMPLE_SIZE))
+        counts = sample.value_counts()
+        scale = float(col.count() / max(counts.sum(), 1))
+        return (counts * scale).round().astype("int64"), scale
+
+    @staticmethod
+    def _histogram_values(col: pd.Series):
+        import numpy as np
+
+        # TODO: why does this type error?
+        values = col[col.notna()].to_numpy()  # type: ignore
+
+        dtype = values.dtype
+        if np.issubdtype(dtype, np.datetime64):
+            values = values.view(np.int64)
+        elif dtype.kind == "O":
+            # For decimals, we convert to float which is lossy but works for now
+            values = values.astype(float)
+
+        scale = 1.0
+        if len(values) > PROFILE_SAMPLE_THRESHOLD:
+            # Bin a sample of the values, including the extremes so
+            # that the bins span the whole column
+            sample = values[_sample_indices(len(values), PROFILE_SAMPLE_SIZE)]
+            scale = len(values) / len(sample)
+            values = np.concatenate([sample, [values.min(), values.max()]])
+        return values, dtype, scale
+
     SUPPORTED_FILTERS = frozenset(
         {
             RowFilterType.Between,
@@ -2019,6 +3398,7 @@ class PandasView(DataExplorerTableView):
             support_status=SupportStatus.Supported,
             code_syntaxes=[CodeSyntaxName(code_syntax_name="pandas")],
         ),
+        get_data_values=GetDataValuesFeatures(supported_binary_formats=[BinaryFormat.ArrowIpc]),
     )
 
 
@@ -2209,6 +3589,26 @@ def _polars_summarize_datetime(col: pl.Series, _):
     )
 
 
+def _polars_digest(data: pl.DataFrame | pl.Series) -> int | None:
+    """
+    Checksum the hashes of the rows of a polars DataFrame or Series.
+
+    Returns None if the data cannot be hashed.
+    """
+    import polars as pl
+
+    num_rows = len(data)
+    if num_rows == 0 or (isinstance(data, pl.DataFrame) and data.width == 0):
+        return 0
+
+    try:
+        hashes = data.hash_rows() if isinstance(data, pl.DataFrame) else data.hash()
+    except pl.exceptions.PolarsError:
+        # Some dtypes cannot be hashed
+        return None
+    return _array_digest(hashes.to_numpy())
+
+
 class PolarsView(DataExplorerTableView):
     def __init__(
         self,
@@ -2224,7 +3624,54 @@ class PolarsView(DataExplorerTableView):
     def _should_cache_schema(cls, table):
         return table.shape[1] < SCHEMA_CACHE_THRESHOLD
 
+    @classmethod
+    def _get_content_fingerprint(cls, table, max_bytes: int | None = None) -> tuple | None:
+        # polars does not expose the addresses of its buffers, so the
+        # data is fingerprinted by a checksum of the hashes of the rows
+        size = table.estimated_size()
+        if size > CONTENT_FINGERPRINT_MAX_BYTES:
+            return None
+        sample = table
+        if max_bytes is not None and size > max_bytes:
+            # Hash an evenly spaced sample of the rows
+            sample = table[:: -(-size // max(max_bytes, 1))]
+        digest = _polars_digest(sample)
+        if digest is None:
+            return None
+        return (table.shape, tuple(table.columns), tuple(table.dtypes), digest)
+
+    @classmethod
+    def _get_content_size(cls, table) -> int:
+        return table.estimated_size()
+
+    def _get_column_content_fingerprint(self, column_index: int) -> tuple | None:
+        column = self.table[:, column_index]
+        digest = _polars_digest(column)
+        if digest is None:
+            return None
+        return (column.name, column.dtype, len(column), digest)
+
+    _HAS_COLUMN_FINGERPRINTS = True
+
+    @classmethod
+    def _get_column_fingerprints(cls, table, columns: range) -> list[tuple]:
+        names = table.columns
+        dtypes = table.dtypes
+        return [(names[i], str(dtypes[i])) for i in columns]
+
     def get_updated_state(self, new_table) -> StateUpdate:
+        if self.state.schema_cache is None and self.state.column_fingerprints is not None:
+
+            def schema_getter(column_name, column_index):
+                return self._construct_schema(
+                    new_table[:, column_index].dtype, column_name, column_index
+                )
+
+            new_fingerprints = self._get_column_fingerprints(new_table, range(new_table.shape[1]))
+            return self._get_fingerprint_update(
+                self.state.column_fingerprints, new_fingerprints, schema_getter
+            )
+
         new_state = DataExplorerState(
             self.state.name,
             row_filters=self.state.row_filters,
@@ -2292,11 +3739,13 @@ class PolarsView(DataExplorerTableView):
 
             # The type changed
             schema_updated = True
-            schema_changes[old_index] = self._construct_schema(new_column, column_name, new_index)
+            schema_changes[old_index] = self._construct_schema(
+                new_column.dtype, column_name, new_index
+            )
 
         def schema_getter(column_name, column_index):
             return self._construct_schema(
-                new_table[:, column_index],
+                new_table[:, column_index].dtype,
                 column_name,
                 column_index,
             )
@@ -2332,7 +3781,7 @@ class PolarsView(DataExplorerTableView):
             return self.schema_memo[column_index]
         else:
             column = self.table[:, column_index]
-            col_schema = self._construct_schema(column, column.name, column_index)
+            col_schema = self._construct_schema(column.dtype, column.name, column_index)
             self.schema_memo[column_index] = col_schema
             return col_schema
 
@@ -2346,28 +3795,28 @@ class PolarsView(DataExplorerTableView):
     @classmethod
     def _construct_schema(
         cls,
-        column: pl.Series,
+        dtype: pl.DataType,
         column_name: str,
         column_index: int,
     ):
         import polars as pl
 
-        if isinstance(column.dtype, pl.Categorical):
+        if isinstance(dtype, pl.Categorical):
             # Categorical is always string in polars
             type_display = "string"
             # For Categorical types, we just use "Categorical" for the type name
             # for simplicity
             type_name = "Categorical"
         else:
-            type_display = cls._get_type_display(column.dtype)
-            type_name = str(column.dtype)
+            type_display = cls._get_type_display(dtype)
+            type_name = str(dtype)
 
         return ColumnSchema(
             column_name=column_name,
             column_index=column_index,
             type_name=type_name,
             type_display=ColumnDisplayType(type_display),
-            timezone=getattr(column.dtype, "time_zone", None),
+            timezone=getattr(dtype, "time_zone", None),
         )
 
     TYPE_DISPLAY_MAPPING = MappingProxyType(
@@ -2411,32 +3860,37 @@ class PolarsView(DataExplorerTableView):
     ) -> SearchSchemaResult:
         raise NotImplementedError
 
+    def _select_rows(self, column_indices: list[int], rows) -> list[pl.Series]:
+        return self.table[:, column_indices][rows].get_columns()
+
     def _get_data_values(
         self,
         selections: list[ColumnSelection],
         format_options: FormatOptions,
     ) -> dict:
-        formatted_columns = []
-        for selection in selections:
-            col = self.table[:, selection.column_index]
-            spec = selection.spec
-            if isinstance(spec, DataSelectionRange):
-                if self.row_view_indices is not None:
-                    view_slice = self.row_view_indices[spec.first_index : spec.last_index + 1]
-                    values = col.gather(view_slice)
-                else:
-                    # No filtering or sorting, just slice
-                    values = col[spec.first_index : spec.last_index + 1]
-            else:
-                if self.row_view_indices is not None:
-                    values = col.gather(self.row_view_indices.gather(spec.indices))
-                else:
-                    values = col.gather(spec.indices)
-            formatted_columns.append(self._format_values(values, format_options))
+        formatted_columns = [
+            self._format_values(values, format_options)
+            for values in self._select_columns(selections)
+        ]
 
         # Bypass pydantic model for speed
         return {"columns": formatted_columns}
 
+    def _values_to_arrow(self, values: pl.Series, format_options: FormatOptions):
+        import polars as pl
+
+        if values.dtype == pl.Object:
+            # polars exports Object columns as raw pointers
+            return _arrow_formatted_values(self._format_values(values, format_options))
+
+        try:
+            # Avoid newer Arrow types like string_view that not all
+            # Arrow readers support
+            return values.to_arrow(compat_level=pl.CompatLevel.oldest())
+        except (AttributeError, TypeError):
+            # Older versions of polars do not have compat_level
+            return values.to_arrow()
+
     @classmethod
     def _format_values(cls, values, options: FormatOptions) -> list[ColumnValue]:
         import polars as pl
@@ -2453,7 +3907,22 @@ class PolarsView(DataExplorerTableView):
             else:
                 return _safe_stringify(x, max_length)
 
+        def _format_list_element(x: ColumnValue) -> str:
+            # Special values are spelled out within a formatted list
+            if isinstance(x, str):
+                return x
+            return "NaN" if x == _VALUE_NAN else "null"
+
         def _format_series(s):
+            if s.dtype in (pl.Float32, pl.Float64):
+                # polars formats infinity as a regular number
+                return _format_float_column(
+                    s.fill_null(0).to_numpy(),
+                    options,
+                    null_mask=s.is_null().to_numpy(),
+                    inf_as_special=False,
+                )
+
             result = []
             is_valid_mask = s.is_not_null()
             if s.dtype.base_type() is pl.List:
@@ -2462,7 +3931,7 @@ class PolarsView(DataExplorerTableView):
                     if is_valid_mask[i]:
                         inner_values = _format_series(v)
                         result.append(
-                            "[" + ", ".join("null" if v == 0 else v for v in inner_values) + "]"
+                            "[" + ", ".join(_format_list_element(v) for v in inner_values) + "]"
                         )
                     else:
                         result.append(_VALUE_NULL)
@@ -2477,19 +3946,16 @@ class PolarsView(DataExplorerTableView):
         return _format_series(values)
 
     def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat):
-        if self.row_view_indices is not None:
-            row_selector = self.row_view_indices[row_selector]
-
-        to_export = self.table[row_selector, column_selector]
-
         if fmt == ExportFormat.Csv:
-            result = to_export.write_csv()
+            separator = ","
         elif fmt == ExportFormat.Tsv:
-            result = to_export.write_csv(separator="\t")
-        elif fmt == ExportFormat.Html:
+            separator = "\t"
+        else:
             raise NotImplementedError(f"Unsupported export format {fmt}")
 
-        return ExportedData(data=result, format=fmt)
+        for i, rows in enumerate(self._export_row_chunks(row_selector)):
+            to_export = self.table[rows, column_selector]
+            yield to_export.write_csv(separator=separator, include_header=i == 0)
 
     def _export_cell(self, row_index: int, column_index: int, fmt: ExportFormat):
         return ExportedData(data=str(self.table[row_index, column_index]), format=fmt)
@@ -2516,14 +3982,56 @@ class PolarsView(DataExplorerTableView):
             return mask.arg_true()
         return None
 
-    def _eval_filter(self, filt: RowFilter):
+    def _gather(self, values, indices):
+        return values.gather(indices)
+
+    def _filter_indices(self, indices, mask):
+        return indices.filter(mask)
+
+    def _eval_filter(self, filt: RowFilter, row_indices=None):
         import polars as pl
 
         column_index = filt.column_schema.column_index
         col = self.table[:, column_index]
+        if row_indices is not None:
+            col = col.gather(row_indices)
 
-        dtype = col.dtype
-        display_type = self._get_type_display(dtype)
+        if filt.filter_type == RowFilterType.Search and isinstance(
+            col.dtype, (pl.Categorical, pl.Enum)
+        ):
+            # Text search would cast every value to a string, so we
+            # search the distinct values and select their rows
+            values = col.unique()
+            values_mask = self._filter_mask(filt, values, values.dtype).fill_null(False)  # noqa: FBT003
+            return col.is_in(values.filter(values_mask).implode(), nulls_equal=True)
+
+        if filt.filter_type == RowFilterType.Search and not col.dtype.is_(pl.String):
+            col = self._get_search_strings(
+                column_index,
+                self.table[:, column_index],
+                lambda x: x.cast(pl.String),
+                row_indices=row_indices,
+            )
+
+        mask = self._filter_mask(filt, col, col.dtype)
+
+        # Nulls are possible in the mask, so we just fill them if any
+        if mask.null_count() > 0:
+            mask[mask.is_null()] = False
+
+        return mask
+
+    @classmethod
+    def _filter_mask(cls, filt: RowFilter, col, dtype: pl.DataType):
+        """
+        Build the mask of a row filter from a column.
+
+        The column can be a Series or an expression, so this is shared
+        with PolarsLazyView.
+        """
+        import polars as pl
+
+        display_type = cls._get_type_display(dtype)
 
         mask = None
         if filt.filter_type in (
@@ -2532,8 +4040,8 @@ class PolarsView(DataExplorerTableView):
         ):
             params = filt.params
             assert isinstance(params, FilterBetween)
-            left_value = self._coerce_value(params.left_value, dtype, display_type)
-            right_value = self._coerce_value(params.right_value, dtype, display_type)
+            left_value = cls._coerce_value(params.left_value, dtype, display_type)
+            right_value = cls._coerce_value(params.right_value, dtype, display_type)
             mask = col.is_between(left_value, right_value)
             if filt.filter_type == RowFilterType.NotBetween:
                 mask = ~mask
@@ -2545,23 +4053,23 @@ class PolarsView(DataExplorerTableView):
                 raise ValueError(f"Unsupported filter type: {params.op}")
             op = COMPARE_OPS[params.op]
             # pandas comparison filters return False for null values
-            mask = op(col, self._coerce_value(params.value, dtype, display_type))
+            mask = op(col, cls._coerce_value(params.value, dtype, display_type))
         elif filt.filter_type == RowFilterType.IsEmpty:
-            if col.dtype.is_(pl.String):
+            if dtype.is_(pl.String):
                 mask = col.str.len_chars() == 0
-            elif col.dtype.is_(pl.Binary):
+            elif dtype.is_(pl.Binary):
                 # col == b"" segfaults in polars
                 mask = col.bin.encode("hex").str.len_chars() == 0
             else:
-                raise TypeError(col.dtype)
+                raise TypeError(dtype)
         elif filt.filter_type == RowFilterType.NotEmpty:
-            if col.dtype.is_(pl.String):
+            if dtype.is_(pl.String):
                 mask = col.str.len_chars() != 0
-            elif col.dtype.is_(pl.Binary):
+            elif dtype.is_(pl.Binary):
                 # col == b"" segfaults in polars
                 mask = col.bin.encode("hex").str.len_chars() != 0
             else:
-                raise TypeError(col.dtype)
+                raise TypeError(dtype)
         elif filt.filter_type == RowFilterType.IsNull:
             mask = col.is_null()
         elif filt.filter_type == RowFilterType.NotNull:
@@ -2577,9 +4085,9 @@ class PolarsView(DataExplorerTableView):
             # Per https://github.com/pola-rs/polars/issues/17771, we
             # have to be really careful here because this can fail on
             # polars 1.x or 0.x
-            coerced_values = [self._coerce_value(val, dtype, display_type) for val in params.values]  # noqa: PD011
+            coerced_values = [cls._coerce_value(val, dtype, display_type) for val in params.values]  # noqa: PD011
             try:
-                boxed_values = pl.Series(coerced_values, dtype=col.dtype)
+                boxed_values = pl.Series(coerced_values, dtype=dtype)
             except TypeError:
                 boxed_values = pl.Series(
                     coerced_values,
@@ -2587,43 +4095,1739 @@ class PolarsView(DataExplorerTableView):
                 )
             mask = col.is_in(boxed_values)
             if not params.inclusive:
-                # NOT-IN
-                mask = ~mask
+                # NOT-IN
+                mask = ~mask
+        elif filt.filter_type == RowFilterType.Search:
+            params = filt.params
+            assert isinstance(params, FilterTextSearch)
+
+            if not dtype.is_(pl.String):
+                col = col.cast(str)
+
+            pattern = get_text_search_pattern(
+                params.search_type, params.term, case_sensitive=params.case_sensitive
+            )
+            mask = pattern.polars_mask(col)
+
+        assert mask is not None
+        return mask
+
+    @staticmethod
+    def _coerce_value(value, dtype, display_type):
+        import polars as pl
+
+        if dtype.is_integer():
+            # For integer types, try to coerce to integer, but if this
+            # fails, allow a looser conversion to float
+            try:
+                return int(value)
+            except ValueError as e:
+                try:
+                    return pl.Series([value]).cast(pl.Float64)[0]
+                except ValueError:
+                    raise e from None
+        elif dtype.is_(pl.Boolean):
+            lvalue = value.lower()
+            if lvalue == "true":
+                return True
+            elif lvalue == "false":
+                return False
+            else:
+                raise ValueError(f"Unable to convert {value} to boolean")
+        elif display_type == "datetime":
+            return _parse_iso8601_like(value, tz=dtype.time_zone)
+        else:
+            # As a fallback, let polars.Series.cast do the coercion
+            dummy = pl.Series([value])
+            if dummy.dtype != dtype:
+                dummy = dummy.cast(dtype)
+            return dummy[0]
+
+    # polars sorts nulls first by default
+    _SORT_NULLS_LAST = False
+
+    def _get_sort_order(self, column_index: int):
+        import polars as pl
+
+        column = self.table[:, column_index]
+        if column.dtype == pl.Object or column.dtype.is_nested():
+            # Ranking these types is not supported and may panic
+            return None
+
+        to_sort = pl.DataFrame([pl.arange(len(column), eager=True).alias("index")])
+        try:
+            to_sort = to_sort.select(pl.all().sort_by(column, maintain_order=True))
+        except TypeError:
+            # Older versions of polars do not have maintain_order
+            to_sort = to_sort.select(pl.all().sort_by(column))
+        return to_sort["index"].to_numpy(), column.null_count()
+
+    def _get_sort_ranks(self, column_index: int):
+        ranks = self.table[:, column_index].rank("dense") - 1
+        return ranks.fill_null(-1).to_numpy()
+
+    def _wrap_row_indices(self, indices):
+        import polars as pl
+
+        return pl.Series(_compact_indices(indices, len(self.table)))
+
+    def _sort_data_direct(self) -> None:
+        import polars as pl
+
+        if len(self.state.sort_keys) > 0:
+            cols_to_sort = []
+            directions = []
+            for key in self.state.sort_keys:
+                col = self._get_column(key.column_index)
+                cols_to_sort.append(col)
+                directions.append(not key.ascending)
+
+            indexer_name = guid()
+
+            if self.filtered_indices is not None:
+                num_rows = len(self.filtered_indices)
+            else:
+                num_rows = len(self.table)
+
+            # Do a stable sort of the indices using the columns as sort keys
+            to_sort = pl.DataFrame([pl.arange(num_rows, eager=True).alias(indexer_name)])
+
+            try:
+                to_sort = to_sort.select(
+                    pl.all().sort_by(
+                        cols_to_sort,
+                        descending=directions,
+                        maintain_order=True,
+                    )
+                )
+            except TypeError:
+                # Older versions of polars do not have maintain_order
+                to_sort = to_sort.select(pl.all().sort_by(cols_to_sort, descending=directions))
+
+            sort_indexer = to_sort[indexer_name]
+            if self.filtered_indices is not None:
+                # Create the filtered, sorted virtual view indices
+                self.row_view_indices = self.filtered_indices.gather(sort_indexer)
+            else:
+                self.row_view_indices = sort_indexer
+        else:
+            # No sort keys. This will be None if the data is
+            # unfiltered
+            self.row_view_indices = self.filtered_indices
+
+    def _prof_null_count(self, data: _ColumnProfileData) -> int:
+        return data.column.null_count()
+
+    def _get_column(self, column_index: int) -> pl.Series:
+        column = self.table[:, column_index]
+        if self.filtered_indices is not None:
+            column = column.gather(self.filtered_indices)
+        return column
+
+    _SUMMARIZERS = MappingProxyType(
+        {
+            ColumnDisplayType.Boolean: _polars_summarize_boolean,
+            ColumnDisplayType.Floating: _polars_summarize_number,
+            ColumnDisplayType.Integer: _polars_summarize_number,
+            ColumnDisplayType.Decimal: _polars_summarize_number,
+            ColumnDisplayType.String: _polars_summarize_string,
+            ColumnDisplayType.Object: _polars_summarize_object,
+            ColumnDisplayType.Date: _polars_summarize_date,
+            ColumnDisplayType.Datetime: _polars_summarize_datetime,
+        }
+    )
+
+    def _prof_freq_table(
+        self,
+        data: _ColumnProfileData,
+        params: ColumnFrequencyTableParams,
+        format_options: FormatOptions,
+    ) -> ColumnFrequencyTable:
+        # The small and large frequency tables share the same counts
+        counts, scale = data.get("value_counts", lambda: self._value_counts(data.column))
+
+        top_counts = counts[: params.limit]
+        other_count = int(counts[params.limit :, 1].sum())
+
+        formatted_groups = self._format_values(top_counts[:, 0], format_options)
+
+        return ColumnFrequencyTable(
+            values=formatted_groups,
+            counts=[int(x) for x in top_counts[:, 1]],
+            other_count=other_count,
+            is_approximate=scale != 1.0,
+        )
+
+    @staticmethod
+    def _value_counts(col: pl.Series) -> tuple[pl.DataFrame, float]:
+        import polars as pl
+
+        col = col.alias("values")
+        col = col.filter(col.is_not_null())
+        if len(col) <= PROFILE_SAMPLE_THRESHOLD:
+            counts = col.value_counts()
+            return counts.sort(by=["count", "values"], descending=[True, False]), 1.0
+
+        # Approximate the counts from a sample of the column
+        sample = col.sample(PROFILE_SAMPLE_SIZE, with_replacement=True, seed=0)
+        scale = len(col) / len(sample)
+        counts = sample.value_counts().with_columns(
+            (pl.col("count") * scale).round().cast(pl.Int64)
+        )
+        return counts.sort(by=["count", "values"], descending=[True, False]), scale
+
+    def _prof_histogram(
+        self,
+        data: _ColumnProfileData,
+        params: ColumnHistogramParams,
+        format_options: FormatOptions,
+    ) -> ColumnHistogram:
+        import polars as pl
+
+        # The small and large histograms share the same non-null values
+        values, dtype, scale = data.get(
+            "histogram_values", lambda: self._histogram_values(data.column)
+        )
+        cast_bin_edges = isinstance(dtype, (pl.Datetime, pl.Time, pl.Date))
+
+        method = _get_histogram_method(params.method)
+
+        # Always use the Polars implementation for PolarsView
+        bin_counts, bin_edges = _get_histogram_polars(values, params.num_bins, method=method)
+        if scale != 1.0:
+            bin_counts = [round(x * scale) for x in bin_counts]
+        bin_edges = pl.Series(bin_edges)
+
+        if cast_bin_edges:
+            bin_edges = bin_edges.cast(dtype)
+
+        formatted_edges = self._format_values(bin_edges, format_options)
+
+        # TODO: make sure that formatted_edges has no special values
+
+        return ColumnHistogram(
+            bin_edges=[str(x) for x in formatted_edges],
+            bin_counts=[int(x) for x in bin_counts],
+            quantiles=[],
+            is_approximate=scale != 1.0,
+        )
+
+    @staticmethod
+    def _histogram_values(col: pl.Series):
+        import polars as pl
+
+        # remove nulls
+        values = col.filter(col.is_not_null())
+        dtype = values.dtype
+
+        if isinstance(dtype, (pl.Datetime, pl.Time)):
+            values = values.cast(pl.Int64)
+        elif isinstance(dtype, pl.Date):
+            values = values.cast(pl.Int32)
+
+        scale = 1.0
+        if len(values) > PROFILE_SAMPLE_THRESHOLD:
+            # Bin a sample of the values, including the extremes so
+            # that the bins span the whole column
+            sample = values.sample(PROFILE_SAMPLE_SIZE, with_replacement=True, seed=0)
+            scale = len(values) / len(sample)
+            if values.dtype.is_numeric():
+                extremes = pl.Series(values.name, [values.min(), values.max()], dtype=values.dtype)
+                sample = pl.concat([sample, extremes])
+            values = sample
+        return values, dtype, scale
+
+    FEATURES = SupportedFeatures(
+        search_schema=SearchSchemaFeatures(
+            support_status=SupportStatus.Unsupported, supported_types=[]
+        ),
+        set_column_filters=SetColumnFiltersFeatures(
+            support_status=SupportStatus.Unsupported, supported_types=[]
+        ),
+        set_row_filters=SetRowFiltersFeatures(
+            support_status=SupportStatus.Supported,
+            supports_conditions=SupportStatus.Unsupported,
+            supported_types=[
+                RowFilterTypeSupportStatus(
+                    row_filter_type=x, support_status=SupportStatus.Supported
+                )
+                for x in SUPPORTED_FILTERS
+            ],
+        ),
+        get_column_profiles=GetColumnProfilesFeatures(
+            support_status=SupportStatus.Supported,
+            supported_types=[
+                ColumnProfileTypeSupportStatus(
+                    profile_type=profile_type,
+                    support_status=SupportStatus.Supported,
+                )
+                for profile_type in ColumnProfileType
+            ],
+        ),
+        export_data_selection=ExportDataSelectionFeatures(
+            support_status=SupportStatus.Supported,
+            supported_formats=[ExportFormat.Csv, ExportFormat.Tsv],
+        ),
+        set_sort_columns=SetSortColumnsFeatures(support_status=SupportStatus.Supported),
+        convert_to_code=ConvertToCodeFeatures(
+            support_status=SupportStatus.Supported,
+            code_syntaxes=[
+                CodeSyntaxName(code_syntax_name="polars"),
+                CodeSyntaxName(code_syntax_name="pandas"),
+            ],
+        ),
+        get_data_values=GetDataValuesFeatures(supported_binary_formats=[BinaryFormat.ArrowIpc]),
+    )
+
+
+def _polars_dtype_from_display(display_type):
+    import polars as pl
+
+    return {
+        ColumnDisplayType.Floating: pl.Float64,
+        ColumnDisplayType.Integer: pl.Int64,
+        ColumnDisplayType.Decimal: pl.Float64,  # Polars doesn't have a separate decimal type
+    }.get(display_type)
+
+
+# ----------------------------------------------------------------------
+# pyarrow Data Explorer RPC implementations
+
+
+def _pyarrow_decode(col: pa.ChunkedArray) -> pa.ChunkedArray:
+    import pyarrow as pa
+
+    # Most compute kernels do not accept dictionary-encoded values
+    if pa.types.is_dictionary(col.type):
+        return col.cast(col.type.value_type)
+    return col
+
+
+def _pyarrow_to_mask(mask) -> np.ndarray:
+    import numpy as np
+
+    pc = _pyarrow_compute()
+
+    # Nulls in a mask do not select their rows
+    return np.asarray(pc.fill_null(mask, fill_value=False), dtype=bool)
+
+
+def _pyarrow_box_value(val, dtype: pa.DataType):
+    import pyarrow as pa
+
+    storage_type = pa.int32() if dtype.bit_width == 32 else pa.int64()
+    return pa.scalar(val, type=storage_type).cast(dtype).as_py()
+
+
+def _pyarrow_write_csv(table: pa.Table, delimiter: str, *, include_header: bool) -> str:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    sink = pa.BufferOutputStream()
+    options = pa_csv.WriteOptions(include_header=include_header, delimiter=delimiter)
+    pa_csv.write_csv(table, sink, write_options=options)
+    return sink.getvalue().to_pybytes().decode("utf-8")
+
+
+def _pyarrow_format_values(values, options: FormatOptions) -> list[ColumnValue]:
+    import numpy as np
+    import pyarrow as pa
+
+    pc = _pyarrow_compute()
+
+    values = _pyarrow_decode(values)
+    if pa.types.is_floating(values.type):
+        return _format_float_column(
+            np.asarray(pc.fill_null(values, 0)),
+            options,
+            null_mask=np.asarray(values.is_null()),
+        )
+
+    max_length = options.max_value_length
+    return [
+        _VALUE_NULL if x is None else _safe_stringify(x, max_length) for x in values.to_pylist()
+    ]
+
+
+def _pyarrow_is_nested(dtype: pa.DataType) -> bool:
+    import pyarrow as pa
+
+    return pa.types.is_nested(dtype) or pa.types.is_map(dtype)
+
+
+def _pyarrow_summarize_number(
+    col: pa.ChunkedArray, options: FormatOptions, display_type=ColumnDisplayType.Floating
+):
+    import pyarrow as pa
+
+    pc = _pyarrow_compute()
+
+    float_format = _get_float_formatter(options)
+    min_val = max_val = median_val = mean_val = std_val = None
+
+    if pa.types.is_decimal(col.type):
+        # Like pandas, convert decimals to float which is lossy but
+        # works for now
+        col = col.cast(pa.float64())
+    elif pa.types.is_floating(col.type):
+        # NaN is skipped like a null value
+        col = col.filter(pc.invert(pc.is_nan(col)))
+
+    if col.null_count < len(col):
+        min_max = pc.min_max(col)
+        min_val = min_max["min"].as_py()
+        max_val = min_max["max"].as_py()
+
+        if not _builtin_isinf(min_val) and not _builtin_isinf(max_val):
+            # These stats are not defined when there is an
+            # inf/-inf in the data
+            mean_val = float_format(pc.mean(col).as_py())
+            median_val = float_format(pc.quantile(col, q=0.5)[0].as_py())
+            std = pc.stddev(col, ddof=1).as_py()
+            std_val = None if std is None else float_format(std)
+
+        if display_type == ColumnDisplayType.Floating:
+            min_val = float_format(min_val)
+            max_val = float_format(max_val)
+        else:
+            min_val = str(min_val)
+            max_val = str(max_val)
+
+    return _box_number_stats(
+        min_val, max_val, mean_val, median_val, std_val, display_type=display_type
+    )
+
+
+def _pyarrow_summarize_floating(col: pa.ChunkedArray, options: FormatOptions):
+    return _pyarrow_summarize_number(col, options, display_type=ColumnDisplayType.Floating)
+
+
+def _pyarrow_summarize_integer(col: pa.ChunkedArray, options: FormatOptions):
+    return _pyarrow_summarize_number(col, options, display_type=ColumnDisplayType.Integer)
+
+
+def _pyarrow_summarize_string(col: pa.ChunkedArray, _):
+    pc = _pyarrow_compute()
+
+    col = _pyarrow_decode(col)
+    num_empty = pc.sum(pc.equal(pc.binary_length(col), 0)).as_py() or 0
+    num_unique = pc.count_distinct(col, mode="all").as_py()
+    return _box_string_stats(num_empty, num_unique)
+
+
+def _pyarrow_summarize_boolean(col: pa.ChunkedArray, _):
+    pc = _pyarrow_compute()
+
+    true_count = pc.sum(col).as_py() or 0
+    false_count = len(col) - true_count - col.null_count
+    return _box_boolean_stats(true_count, false_count)
+
+
+def _pyarrow_summarize_date(col: pa.ChunkedArray, _):
+    import pyarrow as pa
+
+    pc = _pyarrow_compute()
+
+    col = col.cast(pa.date32())
+    min_max = pc.min_max(col)
+    num_unique = pc.count_distinct(col, mode="all").as_py()
+
+    as_int32 = col.cast(pa.int32())
+    mean_date = _pyarrow_box_value(int(pc.mean(as_int32).as_py()), col.type)
+    median_date = _pyarrow_box_value(int(pc.quantile(as_int32, q=0.5)[0].as_py()), col.type)
+    return _box_date_stats(
+        num_unique, min_max["min"].as_py(), mean_date, median_date, min_max["max"].as_py()
+    )
+
+
+def _pyarrow_summarize_datetime(col: pa.ChunkedArray, _):
+    import pyarrow as pa
+
+    pc = _pyarrow_compute()
+
+    min_max = pc.min_max(col)
+    num_unique = pc.count_distinct(col, mode="all").as_py()
+
+    as_int64 = col.cast(pa.int64())
+    mean_date = _pyarrow_box_value(int(pc.mean(as_int64).as_py()), col.type)
+    median_date = _pyarrow_box_value(int(pc.quantile(as_int64, q=0.5)[0].as_py()), col.type)
+
+    return _box_datetime_stats(
+        col.type.unit,
+        num_unique,
+        min_max["min"].as_py(),
+        mean_date,
+        median_date,
+        min_max["max"].as_py(),
+        str(col.type.tz),
+    )
+
+
+def _pyarrow_compare_ops():
+    pc = _pyarrow_compute()
+
+    return {
+        FilterComparisonOp.Gt: pc.greater,
+        FilterComparisonOp.GtEq: pc.greater_equal,
+        FilterComparisonOp.Lt: pc.less,
+        FilterComparisonOp.LtEq: pc.less_equal,
+        FilterComparisonOp.Eq: pc.equal,
+        FilterComparisonOp.NotEq: pc.not_equal,
+    }
+
+
+class PyArrowView(DataExplorerTableView):
+    """
+    DataExplorer view implementation for pyarrow.Table.
+
+    Filters, sorts and profiles are computed with pyarrow.compute
+    kernels directly on the user's table, and viewports are sliced or
+    taken from its columns, so the table is never converted or copied.
+    Row view indices are NumPy arrays, like for pandas.
+    """
+
+    def __init__(
+        self,
+        table: pa.Table,
+        comm: PositronComm,
+        state: DataExplorerState,
+        job_queue: BackgroundJobQueue,
+        sql_string: str | None = None,
+    ):
+        super().__init__(table, comm, state, job_queue, sql_string)
+
+    @classmethod
+    def _should_cache_schema(cls, table):
+        return table.num_columns < SCHEMA_CACHE_THRESHOLD
+
+    @classmethod
+    def _get_content_fingerprint(cls, table, max_bytes: int | None = None) -> tuple | None:  # noqa: ARG003
+        # Arrow tables are immutable, and the view holds a reference to
+        # its table so that the id cannot be reused
+        return (id(table),)
+
+    def _get_column_content_fingerprint(self, column_index: int) -> tuple | None:
+        column = self.table.column(column_index)
+        return (
+            self.table.column_names[column_index],
+            str(column.type),
+            len(column),
+            _data_arrays_digest(_arrow_data_arrays(column)),
+        )
+
+    _HAS_COLUMN_FINGERPRINTS = True
+
+    @classmethod
+    def _get_column_fingerprints(cls, table, columns: range) -> list[tuple]:
+        schema = table.schema
+        return [(schema.names[i], str(schema.types[i])) for i in columns]
+
+    def get_updated_state(self, new_table) -> StateUpdate:
+        if self.state.schema_cache is None and self.state.column_fingerprints is not None:
+
+            def schema_getter(column_name, column_index):
+                return self._construct_schema(
+                    new_table.schema.types[column_index], column_name, column_index
+                )
+
+            new_fingerprints = self._get_column_fingerprints(
+                new_table, range(new_table.num_columns)
+            )
+            return self._get_fingerprint_update(
+                self.state.column_fingerprints, new_fingerprints, schema_getter
+            )
+
+        return self._get_schema_update(new_table, new_table.column_names, new_table.schema.types)
+
+    def _get_single_column_schema(self, column_index: int):
+        if self.state.schema_cache:
+            return self.state.schema_cache[column_index]
+        elif column_index in self.schema_memo:
+            return self.schema_memo[column_index]
+        else:
+            field = self.table.field(column_index)
+            col_schema = self._construct_schema(field.type, field.name, column_index)
+            self.schema_memo[column_index] = col_schema
+            return col_schema
+
+    def _get_column_name(self, column_index: int) -> str:
+        return self.table.field(column_index).name
+
+    def _get_column_type_display(self, column_index: int) -> ColumnDisplayType:
+        return self._get_type_display(self.table.field(column_index).type)
+
+    @classmethod
+    def _construct_schema(
+        cls,
+        dtype: pa.DataType,
+        column_name: str,
+        column_index: int,
+    ):
+        return ColumnSchema(
+            column_name=column_name,
+            column_index=column_index,
+            type_name=str(dtype),
+            type_display=cls._get_type_display(dtype),
+            timezone=getattr(dtype, "tz", None),
+        )
+
+    @classmethod
+    def _get_type_display(cls, dtype: pa.DataType) -> ColumnDisplayType:
+        import pyarrow as pa
+
+        types = pa.types
+        if types.is_dictionary(dtype):
+            # Dictionary-encoded columns are displayed as their values
+            return cls._get_type_display(dtype.value_type)
+        elif types.is_boolean(dtype):
+            return ColumnDisplayType.Boolean
+        elif types.is_integer(dtype):
+            return ColumnDisplayType.Integer
+        elif types.is_floating(dtype):
+            return ColumnDisplayType.Floating
+        elif types.is_decimal(dtype):
+            return ColumnDisplayType.Decimal
+        elif (
+            types.is_string(dtype)
+            or types.is_large_string(dtype)
+            or types.is_binary(dtype)
+            or types.is_large_binary(dtype)
+            or types.is_fixed_size_binary(dtype)
+            # string_view was added in pyarrow 16
+            or getattr(types, "is_string_view", lambda _: False)(dtype)
+        ):
+            return ColumnDisplayType.String
+        elif types.is_date(dtype):
+            return ColumnDisplayType.Date
+        elif types.is_timestamp(dtype):
+            return ColumnDisplayType.Datetime
+        elif types.is_time(dtype):
+            return ColumnDisplayType.Time
+        elif types.is_duration(dtype):
+            return ColumnDisplayType.Interval
+        elif types.is_list(dtype) or types.is_large_list(dtype) or types.is_fixed_size_list(dtype):
+            return ColumnDisplayType.Array
+        elif types.is_struct(dtype):
+            return ColumnDisplayType.Struct
+        else:
+            return ColumnDisplayType.Unknown
+
+    def _select_rows(self, column_indices: list[int], rows) -> list[pa.ChunkedArray]:
+        table = self.table.select(column_indices)
+        if isinstance(rows, slice):
+            # Zero-copy slice
+            start = min(rows.start, table.num_rows)
+            table = table.slice(start, max(rows.stop - start, 0))
+        else:
+            table = table.take(rows)
+        return table.columns
+
+    def _get_data_values(
+        self,
+        selections: list[ColumnSelection],
+        format_options: FormatOptions,
+    ) -> dict:
+        formatted_columns = [
+            self._format_values(values, format_options)
+            for values in self._select_columns(selections)
+        ]
+
+        # Bypass pydantic model for speed
+        return {"columns": formatted_columns}
+
+    def _values_to_arrow(self, values: pa.ChunkedArray, format_options: FormatOptions):  # noqa: ARG002
+        # The values are already Arrow data, so they are sent as is
+        return values
+
+    @classmethod
+    def _format_values(cls, values, options: FormatOptions) -> list[ColumnValue]:
+        return _pyarrow_format_values(values, options)
+
+    def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat):
+        if fmt == ExportFormat.Csv:
+            delimiter = ","
+        elif fmt == ExportFormat.Tsv:
+            delimiter = "\t"
+        else:
+            raise NotImplementedError(f"Unsupported export format {fmt}")
+
+        if isinstance(column_selector, slice):
+            column_selector = range(self.table.num_columns)[column_selector]
+        table = self.table.select(list(column_selector))
+
+        for i, rows in enumerate(self._export_row_chunks(row_selector)):
+            if isinstance(rows, range):
+                to_export = table.slice(rows.start, len(rows))
+            else:
+                to_export = table.take(rows)
+            yield _pyarrow_write_csv(to_export, delimiter, include_header=i == 0)
+
+    def _export_cell(self, row_index: int, column_index: int, fmt: ExportFormat):
+        value = self.table.column(column_index)[int(row_index)].as_py()
+        return ExportedData(data=str(value), format=fmt)
+
+    SUPPORTED_FILTERS = frozenset(
+        {
+            RowFilterType.Between,
+            RowFilterType.Compare,
+            RowFilterType.NotBetween,
+            RowFilterType.IsNull,
+            RowFilterType.NotNull,
+            RowFilterType.IsEmpty,
+            RowFilterType.NotEmpty,
+            RowFilterType.IsTrue,
+            RowFilterType.IsFalse,
+            RowFilterType.Search,
+            RowFilterType.SetMembership,
+        }
+    )
+
+    def _mask_to_indices(self, mask):
+        if mask is not None:
+            return _mask_to_row_indices(mask)
+        return None
+
+    def _gather(self, values, indices):
+        # values are NumPy masks or Arrow arrays
+        if isinstance(indices, RowRange):
+            return values[indices.slice]
+        return values.take(indices)
+
+    def _filter_indices(self, indices, mask):
+        return indices[mask]
+
+    def _eval_filter(self, filt: RowFilter, row_indices=None):
+        import pyarrow as pa
+
+        pc = _pyarrow_compute()
+
+        column_index = filt.column_schema.column_index
+        col = self.table.column(column_index)
+        if row_indices is not None:
+            col = self._gather(col, row_indices)
+        col = _pyarrow_decode(col)
+
+        dtype = col.type
+
+        mask = None
+        if filt.filter_type in (
+            RowFilterType.Between,
+            RowFilterType.NotBetween,
+        ):
+            params = filt.params
+            assert isinstance(params, FilterBetween)
+            left_value = self._coerce_value(params.left_value, dtype)
+            right_value = self._coerce_value(params.right_value, dtype)
+            mask = pc.and_(pc.greater_equal(col, left_value), pc.less_equal(col, right_value))
+            if filt.filter_type == RowFilterType.NotBetween:
+                mask = pc.invert(mask)
+        elif filt.filter_type == RowFilterType.Compare:
+            params = filt.params
+            assert isinstance(params, FilterComparison)
+
+            compare_ops = _pyarrow_compare_ops()
+            if params.op not in compare_ops:
+                raise ValueError(f"Unsupported filter type: {params.op}")
+            op = compare_ops[params.op]
+            mask = op(col, self._coerce_value(params.value, dtype))
+        elif filt.filter_type == RowFilterType.IsEmpty:
+            # binary_length counts bytes, which works for strings too
+            mask = pc.equal(pc.binary_length(col), 0)
+        elif filt.filter_type == RowFilterType.NotEmpty:
+            mask = pc.not_equal(pc.binary_length(col), 0)
+        elif filt.filter_type == RowFilterType.IsNull:
+            mask = pc.is_null(col)
+        elif filt.filter_type == RowFilterType.NotNull:
+            mask = pc.is_valid(col)
+        elif filt.filter_type == RowFilterType.IsTrue:
+            mask = col
+        elif filt.filter_type == RowFilterType.IsFalse:
+            mask = pc.invert(col)
+        elif filt.filter_type == RowFilterType.SetMembership:
+            params = filt.params
+            assert isinstance(params, FilterSetMembership)
+
+            coerced_values = [self._coerce_value(val, dtype) for val in params.values]  # noqa: PD011
+            try:
+                value_set = pa.array(coerced_values, type=dtype)
+            except (pa.ArrowException, TypeError, OverflowError):
+                # e.g. a float value for an integer column
+                value_set = pa.array(coerced_values)
+            mask = pc.is_in(col, value_set=value_set)
+            if not params.inclusive:
+                # NOT-IN
+                mask = pc.invert(mask)
+        elif filt.filter_type == RowFilterType.Search:
+            params = filt.params
+            assert isinstance(params, FilterTextSearch)
+
+            if not (pa.types.is_string(dtype) or pa.types.is_large_string(dtype)):
+                col = self._get_search_strings(
+                    column_index,
+                    self.table.column(column_index),
+                    lambda x: _pyarrow_decode(x).cast(pa.string()),
+                    row_indices=row_indices,
+                )
+
+            pattern = get_text_search_pattern(
+                params.search_type, params.term, case_sensitive=params.case_sensitive
+            )
+            mask = pattern.arrow_mask(col)
+
+        assert mask is not None
+        return _pyarrow_to_mask(mask)
+
+    @staticmethod
+    def _coerce_value(value, dtype: pa.DataType):
+        import pyarrow as pa
+
+        if pa.types.is_integer(dtype):
+            # For integer types, try to coerce to integer, but if this
+            # fails, allow a looser conversion to float
+            try:
+                return int(value)
+            except ValueError as e:
+                try:
+                    return float(value)
+                except ValueError:
+                    raise e from None
+        elif pa.types.is_boolean(dtype):
+            lvalue = value.lower()
+            if lvalue == "true":
+                return True
+            elif lvalue == "false":
+                return False
+            else:
+                raise ValueError(f"Unable to convert {value} to boolean")
+        elif pa.types.is_timestamp(dtype):
+            return pa.scalar(_parse_iso8601_like(value, tz=dtype.tz), type=dtype)
+        else:
+            # As a fallback, let pyarrow's cast do the coercion
+            return pa.scalar(value).cast(dtype)
+
+    def _get_sort_order(self, column_index: int):
+        pc = _pyarrow_compute()
+
+        column = _pyarrow_decode(self.table.column(column_index))
+        if _pyarrow_is_nested(column.type):
+            # Ranking these types is not supported
+            return None
+
+        # sort_indices is a stable sort, with nulls at the end by default
+        order = pc.sort_indices(column)
+        return order.to_numpy(), column.null_count
+
+    def _get_sort_ranks(self, column_index: int):
+        import numpy as np
+
+        pc = _pyarrow_compute()
+
+        column = _pyarrow_decode(self.table.column(column_index))
+        ranks = pc.rank(column, tiebreaker="dense")
+        ranks = ranks.to_numpy().astype(np.int64) - 1
+        ranks[np.asarray(column.is_null())] = -1
+        return ranks
+
+    def _sort_data_direct(self) -> None:
+        import pyarrow as pa
+
+        pc = _pyarrow_compute()
+
+        if len(self.state.sort_keys) > 0:
+            cols_to_sort = {}
+            sort_keys = []
+            for i, key in enumerate(self.state.sort_keys):
+                name = f"key{i}"
+                cols_to_sort[name] = self._get_column(key.column_index)
+                sort_keys.append((name, "ascending" if key.ascending else "descending"))
+
+            # Do a stable sort of the rows using the columns as sort keys
+            sort_indexer = pc.sort_indices(pa.table(cols_to_sort), sort_keys=sort_keys).to_numpy()
+            if self.filtered_indices is not None:
+                # Create the filtered, sorted virtual view indices
+                self.row_view_indices = self.filtered_indices[sort_indexer]
+            else:
+                self.row_view_indices = self._wrap_row_indices(sort_indexer)
+        else:
+            # No sort keys. This will be None if the data is
+            # unfiltered
+            self.row_view_indices = self.filtered_indices
+
+    def _get_column(self, column_index: int) -> pa.ChunkedArray:
+        column = self.table.column(column_index)
+        if self.filtered_indices is not None:
+            column = self._gather(column, self.filtered_indices)
+        return column
+
+    def _prof_null_count(self, data: _ColumnProfileData) -> int:
+        return data.column.null_count
+
+    _SUMMARIZERS = MappingProxyType(
+        {
+            ColumnDisplayType.Boolean: _pyarrow_summarize_boolean,
+            ColumnDisplayType.Floating: _pyarrow_summarize_floating,
+            ColumnDisplayType.Integer: _pyarrow_summarize_integer,
+            ColumnDisplayType.Decimal: _pyarrow_summarize_number,
+            ColumnDisplayType.String: _pyarrow_summarize_string,
+            ColumnDisplayType.Date: _pyarrow_summarize_date,
+            ColumnDisplayType.Datetime: _pyarrow_summarize_datetime,
+        }
+    )
+
+    def _prof_freq_table(
+        self,
+        data: _ColumnProfileData,
+        params: ColumnFrequencyTableParams,
+        format_options: FormatOptions,
+    ) -> ColumnFrequencyTable:
+        # The small and large frequency tables share the same counts
+        values, counts, scale = data.get("value_counts", lambda: self._value_counts(data.column))
+
+        formatted_groups = self._format_values(values[: params.limit], format_options)
+
+        return ColumnFrequencyTable(
+            values=formatted_groups,
+            counts=[int(x) for x in counts[: params.limit]],
+            other_count=int(counts[params.limit :].sum()),
+            is_approximate=scale != 1.0,
+        )
+
+    @staticmethod
+    def _value_counts(col: pa.ChunkedArray):
+        import numpy as np
+        import pyarrow as pa
+
+        pc = _pyarrow_compute()
+
+        col = _pyarrow_decode(col).drop_null()
+
+        scale = 1.0
+        if len(col) > PROFILE_SAMPLE_THRESHOLD:
+            # Approximate the counts from a sample of the column
+            sample = col.take(_sample_indices(len(col), PROFILE_SAMPLE_SIZE))
+            scale = len(col) / len(sample)
+            col = sample
+
+        value_counts = pc.value_counts(col)
+        values = value_counts.field("values")
+        counts = value_counts.field("counts")
+
+        # Most frequent values first, breaking ties by value where
+        # the values can be ordered
+        sort_keys = [("counts", "descending")]
+        if not _pyarrow_is_nested(values.type):
+            sort_keys.append(("values", "ascending"))
+        order = pc.sort_indices(pa.table({"values": values, "counts": counts}), sort_keys=sort_keys)
+
+        counts = counts.take(order).to_numpy()
+        if scale != 1.0:
+            counts = np.round(counts * scale).astype(np.int64)
+        return values.take(order), counts, scale
+
+    def _prof_histogram(
+        self,
+        data: _ColumnProfileData,
+        params: ColumnHistogramParams,
+        format_options: FormatOptions,
+    ) -> ColumnHistogram:
+        import numpy as np
+        import pyarrow as pa
+
+        # The small and large histograms share the same non-null
+        # values and value range, differing only in their binning
+        values, dtype, scale = data.get(
+            "histogram_values", lambda: self._histogram_values(data.column)
+        )
+        value_range = data.get("histogram_range", lambda: _get_value_range(values))
+
+        method = _get_histogram_method(params.method)
+
+        bin_counts, bin_edges = _get_histogram_numpy(
+            values, params.num_bins, method=method, value_range=value_range
+        )
+        if scale != 1.0:
+            bin_counts = [round(x * scale) for x in bin_counts]
+
+        if pa.types.is_temporal(dtype):
+            bin_edges = pa.array(np.floor(bin_edges).astype(np.int64))
+            bin_edges = bin_edges.cast(pa.from_numpy_dtype(values.dtype)).cast(dtype)
+        else:
+            bin_edges = pa.array(np.asarray(bin_edges, dtype=np.float64))
+
+        formatted_edges = self._format_values(bin_edges, format_options)
+
+        return ColumnHistogram(
+            bin_edges=[str(x) for x in formatted_edges],
+            bin_counts=[int(x) for x in bin_counts],
+            quantiles=[],
+            is_approximate=scale != 1.0,
+        )
+
+    @staticmethod
+    def _histogram_values(col: pa.ChunkedArray):
+        import numpy as np
+        import pyarrow as pa
+
+        values = _pyarrow_decode(col).drop_null()
+        dtype = values.type
+
+        if pa.types.is_temporal(dtype):
+            values = values.cast(pa.int32() if dtype.bit_width == 32 else pa.int64())
+        elif pa.types.is_decimal(dtype):
+            # For decimals, we convert to float which is lossy but works for now
+            values = values.cast(pa.float64())
+        values = np.asarray(values)
+
+        scale = 1.0
+        if len(values) > PROFILE_SAMPLE_THRESHOLD:
+            # Bin a sample of the values, including the extremes so
+            # that the bins span the whole column
+            sample = values[_sample_indices(len(values), PROFILE_SAMPLE_SIZE)]
+            scale = len(values) / len(sample)
+            values = np.concatenate([sample, [values.min(), values.max()]])
+        return values, dtype, scale
+
+    FEATURES = SupportedFeatures(
+        search_schema=PandasView.FEATURES.search_schema,
+        set_column_filters=SetColumnFiltersFeatures(
+            support_status=SupportStatus.Unsupported, supported_types=[]
+        ),
+        set_row_filters=SetRowFiltersFeatures(
+            support_status=SupportStatus.Supported,
+            supports_conditions=SupportStatus.Unsupported,
+            supported_types=[
+                RowFilterTypeSupportStatus(
+                    row_filter_type=x, support_status=SupportStatus.Supported
+                )
+                for x in SUPPORTED_FILTERS
+            ],
+        ),
+        get_column_profiles=GetColumnProfilesFeatures(
+            support_status=SupportStatus.Supported,
+            supported_types=[
+                ColumnProfileTypeSupportStatus(
+                    profile_type=profile_type,
+                    support_status=SupportStatus.Supported,
+                )
+                for profile_type in ColumnProfileType
+            ],
+        ),
+        export_data_selection=ExportDataSelectionFeatures(
+            support_status=SupportStatus.Supported,
+            supported_formats=[ExportFormat.Csv, ExportFormat.Tsv],
+        ),
+        set_sort_columns=SetSortColumnsFeatures(support_status=SupportStatus.Supported),
+        convert_to_code=ConvertToCodeFeatures(
+            support_status=SupportStatus.Unsupported,
+            code_syntaxes=[],
+        ),
+        get_data_values=GetDataValuesFeatures(supported_binary_formats=[BinaryFormat.ArrowIpc]),
+    )
+
+
+# ----------------------------------------------------------------------
+# Lazy table Data Explorer RPC implementations
+
+# Backend connections, such as DuckDB's, do not support running
+# queries from several threads at once, and profiles are computed by
+# several background workers, so queries are serialized
+_query_lock = threading.Lock()
+
+
+def _iter_arrow_batches(reader):
+    import pyarrow as pa
+
+    for batch in reader:
+        yield pa.Table.from_batches([batch])
+
+
+class LazyTableView(DataExplorerTableView):
+    """
+    Base class for views of tables that are queries rather than data in memory.
+
+    Nothing is loaded into memory up front: row filters and sort keys
+    are composed into the query, only the rows of the requested
+    viewports are fetched, and row counts are cached until the table
+    or the filters change.
+
+    Subclasses implement the query primitives below for their backend,
+    and reuse the formatting and profiling code of the corresponding
+    in-memory view.
+    """
+
+    def __init__(
+        self,
+        table,
+        comm: PositronComm,
+        state: DataExplorerState,
+        job_queue: BackgroundJobQueue,
+        sql_string: str | None = None,
+    ):
+        self._column_names, self._column_types = self._read_schema(table)
+
+        # The combined row filters, or None when there are no valid
+        # filters
+        self._predicate = None
+
+        # The filtered table, and the filtered and sorted table that
+        # viewports are fetched from
+        self._filtered = table
+        self._view = table
+
+        # Counting rows can be a full scan of the table, so the counts
+        # are kept until the table or the filters change
+        self._num_rows: int | None = None
+        self._filtered_num_rows: int | None = None
+
+        super().__init__(table, comm, state, job_queue, sql_string)
+
+    # ------------------------------------------------------------------
+    # Query primitives
+
+    @staticmethod
+    def _read_schema(table) -> tuple[list[str], list]:
+        """Return the column names and dtypes of a table."""
+        raise NotImplementedError
+
+    def _count(self, frame) -> int:
+        raise NotImplementedError
+
+    def _filter_expr(self, filt: RowFilter):
+        """Build the backend expression selecting the rows of a row filter."""
+        raise NotImplementedError
+
+    def _apply_filter(self, frame, predicate):
+        raise NotImplementedError
+
+    def _apply_sort(self, frame, sort_keys: list[ColumnSortKey]):
+        raise NotImplementedError
+
+    def _fetch_frame(self, frame, names: list[str], offset: int, num_rows: int | None):
+        """
+        Fetch a window of rows of some columns of a table.
+
+        All the rows from offset are fetched if num_rows is None.
+        """
+        raise NotImplementedError
+
+    def _iter_frames(self, frame, names: list[str], offset: int, num_rows: int | None):
+        """Like _fetch_frame, but fetch the rows in chunks of at most EXPORT_CHUNK_ROWS."""
+        raise NotImplementedError
+
+    # Fetched frames are pyarrow.Table by default
+
+    @staticmethod
+    def _frame_column(page: pa.Table, name: str):
+        return page.column(name)
+
+    @staticmethod
+    def _take(data, positions: list[int]):
+        """Take rows of a fetched frame or column by position."""
+        return data.take(positions)
+
+    @staticmethod
+    def _frame_to_csv(page: pa.Table, delimiter: str, *, include_header: bool) -> str:
+        return _pyarrow_write_csv(page, delimiter, include_header=include_header)
+
+    @staticmethod
+    def _values_to_pylist(values) -> list:
+        return values.to_pylist()
+
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def _should_cache_schema(cls, table):
+        names, _ = cls._read_schema(table)
+        return len(names) < SCHEMA_CACHE_THRESHOLD
+
+    # The schema is read up front, so there is no need to compute
+    # fingerprints in the background
+    _HAS_COLUMN_FINGERPRINTS = False
+
+    @classmethod
+    def _get_content_fingerprint(cls, table, max_bytes: int | None = None) -> tuple | None:  # noqa: ARG003
+        # Queries may read from data that changed in the backend, so
+        # lazy tables are always refreshed
+        return None
+
+    def _get_column_content_fingerprint(self, column_index: int) -> tuple | None:  # noqa: ARG002
+        return None
+
+    def _get_num_columns(self) -> int:
+        return len(self._column_names)
+
+    def get_updated_state(self, new_table) -> StateUpdate:
+        names, dtypes = self._read_schema(new_table)
+        if self.state.schema_cache is None:
+            # Too wide for the schema cache, but the names and dtypes
+            # of both tables are at hand to compare
+
+            def schema_getter(column_name, column_index):
+                return self._construct_schema(dtypes[column_index], column_name, column_index)
+
+            return self._get_fingerprint_update(
+                list(zip(self._column_names, map(str, self._column_types))),
+                list(zip(names, map(str, dtypes))),
+                schema_getter,
+            )
+        return self._get_schema_update(new_table, names, dtypes)
+
+    def get_state(self, _unused):
+        self._recompute_if_needed()
+
+        num_rows = self._get_num_rows()
+        num_columns = self._get_num_columns()
+        return BackendState(
+            display_name=self.state.name,
+            table_shape=TableShape(
+                num_rows=self._get_num_rows(filtered=True),
+                num_columns=num_columns,
+            ),
+            table_unfiltered_shape=TableShape(num_rows=num_rows, num_columns=num_columns),
+            has_row_labels=self._has_row_labels,
+            column_filters=self.state.column_filters,
+            row_filters=self.state.row_filters,
+            sort_keys=self.state.sort_keys,
+            supported_features=self.FEATURES,
+        )
+
+    def _get_num_rows(self, *, filtered: bool = False) -> int:
+        if self._num_rows is None:
+            self._num_rows = self._count(self.table)
+        if not filtered or self._predicate is None:
+            return self._num_rows
+
+        if self._filtered_num_rows is None:
+            self._filtered_num_rows = self._count(self._filtered)
+        return self._filtered_num_rows
+
+    def _get_single_column_schema(self, column_index: int):
+        if self.state.schema_cache:
+            return self.state.schema_cache[column_index]
+        elif column_index in self.schema_memo:
+            return self.schema_memo[column_index]
+        else:
+            col_schema = self._construct_schema(
+                self._column_types[column_index],
+                self._column_names[column_index],
+                column_index,
+            )
+            self.schema_memo[column_index] = col_schema
+            return col_schema
+
+    def _get_column_name(self, column_index: int) -> str:
+        return self._column_names[column_index]
+
+    def _get_column_type_display(self, column_index: int) -> ColumnDisplayType:
+        return self._get_type_display(self._column_types[column_index])
+
+    def suggest_code_syntax(self, request: SuggestCodeSyntaxRequest):
+        # Code generation assumes an in-memory table
+        raise NotImplementedError
+
+    def convert_to_code(self, request: ConvertToCodeParams):
+        raise NotImplementedError
+
+    def _update_view(self):
+        filtered = self.table
+        if self._predicate is not None:
+            filtered = self._apply_filter(filtered, self._predicate)
+
+        view = filtered
+        if len(self.state.sort_keys) > 0:
+            view = self._apply_sort(view, self.state.sort_keys)
+
+        self._filtered = filtered
+        self._view = view
+
+    def _fetch_columns(self, selections: list[ColumnSelection]) -> list:
+        columns = [None] * len(selections)
+
+        # Selections of the same rows (usually all of them) are
+        # fetched with a single query. Arbitrary row indices are taken
+        # from the range of rows that covers them.
+        groups: dict[tuple[int, int], list[int]] = {}
+        for i, selection in enumerate(selections):
+            spec = selection.spec
+            if isinstance(spec, DataSelectionRange):
+                first, last = spec.first_index, spec.last_index
+            elif len(spec.indices) > 0:
+                first, last = min(spec.indices), max(spec.indices)
+            else:
+                first, last = 0, -1
+            groups.setdefault((first, last), []).append(i)
+
+        for (first, last), positions in groups.items():
+            names = list(
+                dict.fromkeys(self._get_column_name(selections[i].column_index) for i in positions)
+            )
+            page = self._fetch_frame(self._view, names, first, max(last - first + 1, 0))
+            for i in positions:
+                spec = selections[i].spec
+                values = self._frame_column(page, self._get_column_name(selections[i].column_index))
+                if isinstance(spec, DataSelectionIndices):
+                    values = self._take(values, [index - first for index in spec.indices])
+                columns[i] = values
+
+        return columns
+
+    def _get_data_values(
+        self,
+        selections: list[ColumnSelection],
+        format_options: FormatOptions,
+    ) -> dict:
+        formatted_columns = [
+            self._format_values(values, format_options)
+            for values in self._fetch_columns(selections)
+        ]
+
+        # Bypass pydantic model for speed
+        return {"columns": formatted_columns}
+
+    def _get_arrow_columns(self, selections: list[ColumnSelection], format_options: FormatOptions):
+        return [
+            self._values_to_arrow(values, format_options)
+            for values in self._fetch_columns(selections)
+        ]
+
+    def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat):
+        if fmt == ExportFormat.Csv:
+            delimiter = ","
+        elif fmt == ExportFormat.Tsv:
+            delimiter = "\t"
+        else:
+            raise NotImplementedError(f"Unsupported export format {fmt}")
+
+        if isinstance(column_selector, slice):
+            names = self._column_names[column_selector]
+        else:
+            names = [self._get_column_name(i) for i in column_selector]
+
+        if isinstance(row_selector, slice):
+            start = row_selector.start or 0
+            num_rows = None
+            if row_selector.stop is not None:
+                num_rows = max(row_selector.stop - start, 0)
+
+            # The result is streamed from the backend in chunks of rows
+            include_header = True
+            for page in self._iter_frames(self._view, names, start, num_rows):
+                yield self._frame_to_csv(page, delimiter, include_header=include_header)
+                include_header = False
+
+            if include_header:
+                # Exporting an empty selection still produces a header
+                page = self._fetch_frame(self._view, names, 0, 0)
+                yield self._frame_to_csv(page, delimiter, include_header=True)
+        else:
+            rows = list(row_selector)
+            first = min(rows, default=0)
+            num_rows = max(rows, default=-1) - first + 1
+            page = self._fetch_frame(self._view, names, first, num_rows)
+            page = self._take(page, [i - first for i in rows])
+            yield self._frame_to_csv(page, delimiter, include_header=True)
+
+    def _export_cell(self, row_index: int, column_index: int, fmt: ExportFormat):
+        name = self._get_column_name(column_index)
+        page = self._fetch_frame(self._view, [name], int(row_index), 1)
+        value = self._values_to_pylist(self._frame_column(page, name))[0]
+        return ExportedData(data=str(value), format=fmt)
+
+    def _set_row_filters(self, filters: list[RowFilter]):
+        self.state.row_filters = filters
+        for filt in filters:
+            # If is_valid isn't set, set it based on what is currently
+            # supported
+            if filt.is_valid is None:
+                filt.is_valid = self._is_supported_filter(filt)
+
+        had_errors = False
+        filter_exprs = []
+        for filt in filters:
+            # If is_valid is False, do not evaluate the filter
+            if filt.is_valid is False:
+                continue
+            try:
+                filter_exprs.append((filt, self._filter_expr(filt)))
+            except Exception as e:
+                had_errors = True
+                self._set_filter_error(filt, e)
+
+        self._set_predicate(filter_exprs)
+        try:
+            selected_num_rows = self._get_num_rows(filtered=True)
+        except Exception:
+            # Some errors, like an invalid regular expression, are
+            # only raised by the backend when the query runs, so we
+            # run the filters one at a time to find which ones failed
+            had_errors = True
+            valid_exprs = []
+            for filt, expr in filter_exprs:
+                try:
+                    self._count(self._apply_filter(self.table, expr))
+                except Exception as e:
+                    self._set_filter_error(filt, e)
+                    continue
+                valid_exprs.append((filt, expr))
+
+            self._set_predicate(valid_exprs)
+            selected_num_rows = self._get_num_rows(filtered=True)
+
+        return FilterResult(selected_num_rows=selected_num_rows, had_errors=had_errors)
+
+    def _set_predicate(self, filter_exprs: list):
+        predicate = None
+        for filt, expr in filter_exprs:
+            if predicate is None:
+                predicate = expr
+            elif filt.condition == RowFilterCondition.And:
+                predicate = predicate & expr
+            elif filt.condition == RowFilterCondition.Or:
+                predicate = predicate | expr
+
+        self._predicate = predicate
+        self._filtered_num_rows = None
+        self._update_view()
+
+    def _sort_data(self) -> None:
+        # Sorting is part of the query that viewports are fetched from
+        self._update_view()
+
+
+# ----------------------------------------------------------------------
+# ibis Data Explorer RPC implementations
+
+
+_IBIS_TIME_UNITS = MappingProxyType({0: "s", 3: "ms", 6: "us", 9: "ns"})
+
+
+def _ibis_execute(expr):
+    with _query_lock:
+        return expr.to_pyarrow()
+
+
+def _ibis_aggregate(table: ibis.Table, **metrics) -> dict:
+    return _ibis_execute(table.aggregate(**metrics)).to_pylist()[0]
+
+
+def _ibis_column(table: ibis.Table) -> Any:
+    # Profiles are computed on a filtered table with a single column
+    return table[table.columns[0]]
+
+
+def _ibis_epoch(dtype):
+    import ibis
+
+    tzinfo = None if dtype.timezone is None else timezone.utc
+    return ibis.literal(datetime(1970, 1, 1, tzinfo=tzinfo), type=dtype)
+
+
+def _ibis_epoch_values(col):
+    """Convert temporal values to integer days or microseconds since the epoch."""
+    import ibis
+
+    dtype = col.type()
+    if dtype.is_date():
+        return col.delta(ibis.date(1970, 1, 1), unit="day")
+    elif dtype.is_timestamp():
+        return col.delta(_ibis_epoch(dtype), unit="microsecond")
+    return col
+
+
+def _ibis_epoch_arrow_type(dtype):
+    import pyarrow as pa
+
+    if dtype.is_date():
+        return pa.date32()
+    return pa.timestamp("us", tz=dtype.timezone)
+
+
+def _ibis_summarize_number(
+    table: ibis.Table, options: FormatOptions, display_type=ColumnDisplayType.Floating
+):
+    float_format = _get_float_formatter(options)
+    col = _ibis_column(table)
+    dtype = col.type()
+
+    if dtype.is_decimal():
+        # Like pandas, convert decimals to float which is lossy but
+        # works for now
+        col = col.cast("float64")
+    elif dtype.is_floating():
+        # NaN is skipped like a null value
+        table = table.filter(~col.isnan())
+        col = _ibis_column(table)
+
+    stats = _ibis_aggregate(
+        table,
+        min=col.min(),
+        max=col.max(),
+        mean=col.mean(),
+        median=col.median(),
+        std=col.std(),
+    )
+
+    min_val, max_val = stats["min"], stats["max"]
+    median_val = mean_val = std_val = None
+    if min_val is not None:
+        if not _builtin_isinf(min_val) and not _builtin_isinf(max_val):
+            # These stats are not defined when there is an
+            # inf/-inf in the data
+            mean_val = float_format(stats["mean"])
+            median_val = float_format(stats["median"])
+            std_val = None if stats["std"] is None else float_format(stats["std"])
+
+        if display_type == ColumnDisplayType.Floating:
+            min_val = float_format(min_val)
+            max_val = float_format(max_val)
+        else:
+            min_val = str(min_val)
+            max_val = str(max_val)
+
+    return _box_number_stats(
+        min_val, max_val, mean_val, median_val, std_val, display_type=display_type
+    )
+
+
+def _ibis_summarize_floating(table: ibis.Table, options: FormatOptions):
+    return _ibis_summarize_number(table, options, display_type=ColumnDisplayType.Floating)
+
+
+def _ibis_summarize_integer(table: ibis.Table, options: FormatOptions):
+    return _ibis_summarize_number(table, options, display_type=ColumnDisplayType.Integer)
+
+
+def _ibis_summarize_string(table: ibis.Table, _):
+    col = _ibis_column(table)
+    is_empty = col == b"" if col.type().is_binary() else col.length() == 0
+    stats = _ibis_aggregate(table, num_empty=is_empty.sum(), num_unique=col.nunique())
+    return _box_string_stats(stats["num_empty"] or 0, stats["num_unique"])
+
+
+def _ibis_summarize_boolean(table: ibis.Table, _):
+    col = _ibis_column(table)
+    stats = _ibis_aggregate(table, true_count=col.sum(), false_count=(~col).sum())
+    return _box_boolean_stats(stats["true_count"] or 0, stats["false_count"] or 0)
+
+
+def _ibis_summarize_temporal(table: ibis.Table):
+    # Means and medians are computed from the values since the epoch,
+    # and converted back to dates or datetimes
+    col = _ibis_column(table)
+    epoch_values = _ibis_epoch_values(col)
+    stats = _ibis_aggregate(
+        table,
+        num_unique=col.nunique(),
+        min=col.min(),
+        max=col.max(),
+        mean=epoch_values.mean(),
+        median=epoch_values.median(),
+    )
+
+    arrow_type = _ibis_epoch_arrow_type(col.type())
+    mean_date = _pyarrow_box_value(int(stats["mean"]), arrow_type)
+    median_date = _pyarrow_box_value(int(stats["median"]), arrow_type)
+    return stats, mean_date, median_date
+
+
+def _ibis_summarize_date(table: ibis.Table, _):
+    stats, mean_date, median_date = _ibis_summarize_temporal(table)
+    return _box_date_stats(stats["num_unique"], stats["min"], mean_date, median_date, stats["max"])
+
+
+def _ibis_summarize_datetime(table: ibis.Table, _):
+    stats, mean_date, median_date = _ibis_summarize_temporal(table)
+    dtype = _ibis_column(table).type()
+    return _box_datetime_stats(
+        _IBIS_TIME_UNITS.get(dtype.scale, "us"),
+        stats["num_unique"],
+        stats["min"],
+        mean_date,
+        median_date,
+        stats["max"],
+        str(dtype.timezone),
+    )
+
+
+class IbisView(LazyTableView):
+    """
+    DataExplorer view implementation for Ibis tables.
+
+    Row filters and sort keys are composed into an Ibis expression,
+    viewports are fetched one page at a time with ORDER BY / LIMIT /
+    OFFSET queries, and profiles are computed with aggregate queries,
+    so all the work is pushed down to the backend and the view covers
+    the whole table.
+    """
+
+    @staticmethod
+    def _read_schema(table: ibis.Table):
+        schema = table.schema()
+        return list(schema.keys()), list(schema.values())
+
+    def _count(self, frame: ibis.Table) -> int:
+        return _ibis_execute(frame.count()).as_py()
+
+    def _apply_filter(self, frame: ibis.Table, predicate):
+        return frame.filter(predicate)
+
+    def _apply_sort(self, frame: ibis.Table, sort_keys: list[ColumnSortKey]):
+        return frame.order_by([self._sort_key_expr(key) for key in sort_keys])
+
+    def _sort_key_expr(self, key: ColumnSortKey):
+        col = self.table[self._get_column_name(key.column_index)]
+        # Nulls sort last in both directions, like the other views
+        if key.ascending:
+            return col.asc(nulls_first=False)
+        return col.desc(nulls_first=False)
+
+    def _fetch_frame(self, frame: ibis.Table, names: list[str], offset: int, num_rows: int | None):
+        return _ibis_execute(frame.limit(num_rows, offset=offset).select(names))
+
+    def _iter_frames(self, frame: ibis.Table, names: list[str], offset: int, num_rows: int | None):
+        if num_rows is not None or offset > 0:
+            frame = frame.limit(num_rows, offset=offset)
+        with _query_lock:
+            reader = frame.select(names).to_pyarrow_batches(chunk_size=EXPORT_CHUNK_ROWS)
+            yield from _iter_arrow_batches(reader)
+
+    def _values_to_arrow(self, values, format_options: FormatOptions):  # noqa: ARG002
+        # The query results are already Arrow data, so they are sent as is
+        return values
+
+    @classmethod
+    def _format_values(cls, values, options: FormatOptions) -> list[ColumnValue]:
+        return _pyarrow_format_values(values, options)
+
+    @classmethod
+    def _construct_schema(cls, dtype, column_name: str, column_index: int):
+        return ColumnSchema(
+            column_name=column_name,
+            column_index=column_index,
+            type_name=str(dtype),
+            type_display=cls._get_type_display(dtype),
+            timezone=dtype.timezone if dtype.is_timestamp() else None,
+        )
+
+    @classmethod
+    def _get_type_display(cls, dtype) -> ColumnDisplayType:
+        if dtype.is_boolean():
+            return ColumnDisplayType.Boolean
+        elif dtype.is_integer():
+            return ColumnDisplayType.Integer
+        elif dtype.is_floating():
+            return ColumnDisplayType.Floating
+        elif dtype.is_decimal():
+            return ColumnDisplayType.Decimal
+        elif dtype.is_string() or dtype.is_binary():
+            return ColumnDisplayType.String
+        elif dtype.is_date():
+            return ColumnDisplayType.Date
+        elif dtype.is_timestamp():
+            return ColumnDisplayType.Datetime
+        elif dtype.is_time():
+            return ColumnDisplayType.Time
+        elif dtype.is_interval():
+            return ColumnDisplayType.Interval
+        elif dtype.is_array():
+            return ColumnDisplayType.Array
+        elif dtype.is_struct():
+            return ColumnDisplayType.Struct
+        else:
+            return ColumnDisplayType.Unknown
+
+    SUPPORTED_FILTERS = frozenset(
+        {
+            RowFilterType.Between,
+            RowFilterType.Compare,
+            RowFilterType.NotBetween,
+            RowFilterType.IsNull,
+            RowFilterType.NotNull,
+            RowFilterType.IsEmpty,
+            RowFilterType.NotEmpty,
+            RowFilterType.IsTrue,
+            RowFilterType.IsFalse,
+            RowFilterType.Search,
+            RowFilterType.SetMembership,
+        }
+    )
+
+    def _filter_expr(self, filt: RowFilter):
+        col = self.table[self._get_column_name(filt.column_schema.column_index)]
+        dtype = col.type()
+
+        expr = None
+        if filt.filter_type in (
+            RowFilterType.Between,
+            RowFilterType.NotBetween,
+        ):
+            params = filt.params
+            assert isinstance(params, FilterBetween)
+            left_value = self._coerce_value(params.left_value, dtype)
+            right_value = self._coerce_value(params.right_value, dtype)
+            expr = col.between(left_value, right_value)
+            if filt.filter_type == RowFilterType.NotBetween:
+                expr = ~expr
+        elif filt.filter_type == RowFilterType.Compare:
+            params = filt.params
+            assert isinstance(params, FilterComparison)
+
+            if params.op not in COMPARE_OPS:
+                raise ValueError(f"Unsupported filter type: {params.op}")
+            op = COMPARE_OPS[params.op]
+            expr = op(col, self._coerce_value(params.value, dtype))
+        elif filt.filter_type in (RowFilterType.IsEmpty, RowFilterType.NotEmpty):
+            expr = col == b"" if dtype.is_binary() else col.length() == 0
+            if filt.filter_type == RowFilterType.NotEmpty:
+                expr = ~expr
+        elif filt.filter_type == RowFilterType.IsNull:
+            expr = col.isnull()  # noqa: PD003
+        elif filt.filter_type == RowFilterType.NotNull:
+            expr = col.notnull()  # noqa: PD004
+        elif filt.filter_type == RowFilterType.IsTrue:
+            expr = col
+        elif filt.filter_type == RowFilterType.IsFalse:
+            expr = ~col
+        elif filt.filter_type == RowFilterType.SetMembership:
+            params = filt.params
+            assert isinstance(params, FilterSetMembership)
+
+            values = [self._coerce_value(val, dtype) for val in params.values]  # noqa: PD011
+            expr = col.isin(values)
+            if not params.inclusive:
+                # NOT-IN, which selects the null values like the other
+                # views do
+                expr = ~expr | col.isnull()  # noqa: PD003
         elif filt.filter_type == RowFilterType.Search:
             params = filt.params
             assert isinstance(params, FilterTextSearch)
 
-            if not col.dtype.is_(pl.String):
-                col = col.cast(str)
+            if not dtype.is_string():
+                col = col.cast("string")
 
             term = params.term
-
             if params.search_type == TextSearchType.RegexMatch:
                 if not params.case_sensitive:
                     term = "(?i)" + term
-                mask = col.str.contains(term)
+                expr = col.re_search(term)
             else:
                 if not params.case_sensitive:
-                    col = col.str.to_lowercase()
+                    col = col.lower()
                     term = term.lower()
+
                 if params.search_type == TextSearchType.Contains:
-                    mask = col.str.contains(term)
+                    expr = col.contains(term)
                 elif params.search_type == TextSearchType.StartsWith:
-                    mask = col.str.starts_with(term)
+                    expr = col.startswith(term)
                 elif params.search_type == TextSearchType.EndsWith:
-                    mask = col.str.ends_with(term)
-
-        assert mask is not None
+                    expr = col.endswith(term)
 
-        # Nulls are possible in the mask, so we just fill them if any
-        if mask.null_count() > 0:
-            mask[mask.is_null()] = False
-
-        return mask
+        assert expr is not None
+        return expr
 
     @staticmethod
-    def _coerce_value(value, dtype, display_type):
-        import polars as pl
+    def _coerce_value(value, dtype):
+        import ibis
 
         if dtype.is_integer():
             # For integer types, try to coerce to integer, but if this
@@ -2632,10 +5836,14 @@ class PolarsView(DataExplorerTableView):
                 return int(value)
             except ValueError as e:
                 try:
-                    return pl.Series([value]).cast(pl.Float64)[0]
+                    return float(value)
                 except ValueError:
                     raise e from None
-        elif dtype.is_(pl.Boolean):
+        elif dtype.is_floating():
+            return float(value)
+        elif dtype.is_decimal():
+            return Decimal(value)
+        elif dtype.is_boolean():
             lvalue = value.lower()
             if lvalue == "true":
                 return True
@@ -2643,149 +5851,176 @@ class PolarsView(DataExplorerTableView):
                 return False
             else:
                 raise ValueError(f"Unable to convert {value} to boolean")
-        elif display_type == "datetime":
-            return _parse_iso8601_like(value, tz=dtype.time_zone)
+        elif dtype.is_timestamp():
+            return _parse_iso8601_like(value, tz=dtype.timezone)
+        elif dtype.is_date():
+            return _parse_iso8601_like(value).date()
+        elif dtype.is_string():
+            return value
         else:
-            # As a fallback, let polars.Series.cast do the coercion
-            dummy = pl.Series([value])
-            if dummy.dtype != dtype:
-                dummy = dummy.cast(dtype)
-            return dummy[0]
-
-    def _sort_data(self) -> None:
-        import polars as pl
-
-        if len(self.state.sort_keys) > 0:
-            cols_to_sort = []
-            directions = []
-            for key in self.state.sort_keys:
-                col = self._get_column(key.column_index)
-                cols_to_sort.append(col)
-                directions.append(not key.ascending)
-
-            indexer_name = guid()
-
-            if self.filtered_indices is not None:
-                num_rows = len(self.filtered_indices)
-            else:
-                num_rows = len(self.table)
-
-            # Do a stable sort of the indices using the columns as sort keys
-            to_sort = pl.DataFrame([pl.arange(num_rows, eager=True).alias(indexer_name)])
+            # As a fallback, let the backend do the coercion
+            return ibis.literal(value).cast(dtype)
 
-            try:
-                to_sort = to_sort.select(
-                    pl.all().sort_by(
-                        cols_to_sort,
-                        descending=directions,
-                        maintain_order=True,
-                    )
-                )
-            except TypeError:
-                # Older versions of polars do not have maintain_order
-                to_sort = to_sort.select(pl.all().sort_by(cols_to_sort, descending=directions))
+    def _get_column(self, column_index: int) -> ibis.Table:
+        return self._filtered.select(self._get_column_name(column_index))
 
-            sort_indexer = to_sort[indexer_name]
-            if self.filtered_indices is not None:
-                # Create the filtered, sorted virtual view indices
-                self.row_view_indices = self.filtered_indices.gather(sort_indexer)
-            else:
-                self.row_view_indices = sort_indexer
-        else:
-            # No sort keys. This will be None if the data is
-            # unfiltered
-            self.row_view_indices = self.filtered_indices
+    def _prof_null_count(self, data: _ColumnProfileData) -> int:
+        counts = data.get("counts", lambda: self._column_counts(data.column))
+        return counts["count"] - counts["non_null"]
 
-    def _prof_null_count(self, column_index: int) -> int:
-        return self._get_column(column_index).null_count()
+    @staticmethod
+    def _column_counts(table: ibis.Table) -> dict:
+        import ibis
 
-    def _get_column(self, column_index: int) -> pl.Series:
-        column = self.table[:, column_index]
-        if self.filtered_indices is not None:
-            column = column.gather(self.filtered_indices)
-        return column
+        return _ibis_aggregate(table, count=ibis._.count(), non_null=_ibis_column(table).count())
 
     _SUMMARIZERS = MappingProxyType(
         {
-            ColumnDisplayType.Boolean: _polars_summarize_boolean,
-            ColumnDisplayType.Floating: _polars_summarize_number,
-            ColumnDisplayType.Integer: _polars_summarize_number,
-            ColumnDisplayType.Decimal: _polars_summarize_number,
-            ColumnDisplayType.String: _polars_summarize_string,
-            ColumnDisplayType.Object: _polars_summarize_object,
-            ColumnDisplayType.Date: _polars_summarize_date,
-            ColumnDisplayType.Datetime: _polars_summarize_datetime,
+            ColumnDisplayType.Boolean: _ibis_summarize_boolean,
+            ColumnDisplayType.Floating: _ibis_summarize_floating,
+            ColumnDisplayType.Integer: _ibis_summarize_integer,
+            ColumnDisplayType.Decimal: _ibis_summarize_number,
+            ColumnDisplayType.String: _ibis_summarize_string,
+            ColumnDisplayType.Date: _ibis_summarize_date,
+            ColumnDisplayType.Datetime: _ibis_summarize_datetime,
         }
     )
 
     def _prof_freq_table(
         self,
-        column_index: int,
+        data: _ColumnProfileData,
         params: ColumnFrequencyTableParams,
         format_options: FormatOptions,
     ) -> ColumnFrequencyTable:
-        col = self._get_column(column_index).alias("values")
-
-        col = col.filter(col.is_not_null())
-        counts = col.value_counts().sort(by=["count", "values"], descending=[True, False])
-
-        top_counts = counts[: params.limit]
-        other_count = int(counts[params.limit :, 1].sum())
-
-        formatted_groups = self._format_values(top_counts[:, 0], format_options)
+        values, counts = data.get(
+            f"value_counts_{params.limit}", lambda: self._value_counts(data.column, params.limit)
+        )
+        non_null = data.get("counts", lambda: self._column_counts(data.column))["non_null"]
 
         return ColumnFrequencyTable(
-            values=formatted_groups,
-            counts=[int(x) for x in top_counts[:, 1]],
-            other_count=other_count,
+            values=self._format_values(values, format_options),
+            counts=counts,
+            other_count=non_null - sum(counts),
+            is_approximate=False,
+        )
+
+    @staticmethod
+    def _value_counts(table: ibis.Table, limit: int):
+        import ibis
+
+        name = table.columns[0]
+        col = _ibis_column(table)
+        count_name = "count" if name != "count" else "count_"
+
+        # Most frequent values first, breaking ties by value where
+        # the values can be ordered
+        order_by = [ibis.desc(count_name)]
+        if not col.type().is_nested():
+            order_by.append(ibis.asc(name))
+
+        value_counts = (
+            table.drop_null()
+            .group_by(name)
+            .aggregate(**{count_name: ibis._.count()})
+            .order_by(order_by)
+            .limit(limit)
         )
+        result = _ibis_execute(value_counts)
+        return result.column(name), result.column(count_name).to_pylist()
 
     def _prof_histogram(
         self,
-        column_index: int,
+        data: _ColumnProfileData,
         params: ColumnHistogramParams,
         format_options: FormatOptions,
     ) -> ColumnHistogram:
-        import polars as pl
-
-        col = self._get_column(column_index)
-
-        # remove nulls
-        data = col.filter(col.is_not_null())
-        dtype = data.dtype
-
-        if isinstance(dtype, (pl.Datetime, pl.Time)):
-            data = data.cast(pl.Int64)
-            cast_bin_edges = True
-        elif isinstance(dtype, pl.Date):
-            data = data.cast(pl.Int32)
-            cast_bin_edges = True
-        else:
-            cast_bin_edges = False
+        import ibis
+        import numpy as np
+        import pyarrow as pa
 
         method = _get_histogram_method(params.method)
 
-        # Always use the Polars implementation for PolarsView
-        bin_counts, bin_edges = _get_histogram_polars(data, params.num_bins, method=method)
-        bin_edges = pl.Series(bin_edges)
+        # The values are binned in the backend, with the number of
+        # bins that NumPy would choose given the same statistics
+        table, values = data.get("histogram_values", lambda: self._histogram_values(data.column))
+        stats = data.get(
+            f"histogram_stats_{method}", lambda: self._histogram_stats(table, values, method)
+        )
 
-        if cast_bin_edges:
-            bin_edges = bin_edges.cast(dtype)
+        count, min_value, max_value = stats["count"], stats["min"], stats["max"]
+        if count == 0:
+            bin_counts, bin_edges = _EMPTY_HISTOGRAM
+        elif min_value == max_value:
+            bin_counts, bin_edges = [count], [min_value, min_value]
+        else:
+            num_bins = _get_histogram_num_bins(
+                method,
+                params.num_bins,
+                count,
+                min_value,
+                max_value,
+                iqr=stats.get("q3", 0) - stats.get("q1", 0),
+                std=stats.get("std"),
+                is_integer=values.type().is_integer(),
+            )
+            width = (max_value - min_value) / num_bins
+            bins = ibis.least(((values - min_value) / width).floor().cast("int64"), num_bins - 1)
+            result = _ibis_execute(table.group_by(bin=bins).aggregate(count=ibis._.count()))
+
+            bin_counts = [0] * num_bins
+            for i, n in zip(result.column("bin").to_pylist(), result.column("count").to_pylist()):
+                bin_counts[i] += n
+            bin_edges = np.linspace(min_value, max_value, num_bins + 1)
+
+        dtype = _ibis_column(data.column).type()
+        if dtype.is_date() or dtype.is_timestamp():
+            arrow_type = _ibis_epoch_arrow_type(dtype)
+            bin_edges = pa.array(np.floor(bin_edges).astype(np.int64))
+            bin_edges = bin_edges.cast(pa.int32() if arrow_type.bit_width == 32 else pa.int64())
+            bin_edges = bin_edges.cast(arrow_type)
+        else:
+            bin_edges = pa.array(np.asarray(bin_edges, dtype=np.float64))
 
         formatted_edges = self._format_values(bin_edges, format_options)
 
-        # TODO: make sure that formatted_edges has no special values
-
         return ColumnHistogram(
             bin_edges=[str(x) for x in formatted_edges],
             bin_counts=[int(x) for x in bin_counts],
             quantiles=[],
+            is_approximate=False,
         )
 
+    @staticmethod
+    def _histogram_values(table: ibis.Table):
+        col = _ibis_column(table)
+        dtype = col.type()
+
+        table = table.drop_null()
+        if dtype.is_floating():
+            # inf/-inf and NaN cannot be binned
+            table = table.filter(~col.isnan() & ~col.isinf())
+
+        values = _ibis_column(table)
+        if dtype.is_decimal():
+            # For decimals, we convert to float which is lossy but works for now
+            return table, values.cast("float64")
+        return table, _ibis_epoch_values(values)
+
+    @staticmethod
+    def _histogram_stats(table: ibis.Table, values, method: str) -> dict:
+        import ibis
+
+        metrics = {"count": ibis._.count(), "min": values.min(), "max": values.max()}
+        if method == "fd":
+            metrics["q1"] = values.quantile(0.25)
+            metrics["q3"] = values.quantile(0.75)
+        elif method == "scott":
+            # np.histogram uses the population standard deviation
+            metrics["std"] = values.std(how="pop")
+        return _ibis_aggregate(table, **metrics)
+
     FEATURES = SupportedFeatures(
-        search_schema=SearchSchemaFeatures(
-            support_status=SupportStatus.Unsupported, supported_types=[]
-        ),
+        search_schema=PandasView.FEATURES.search_schema,
         set_column_filters=SetColumnFiltersFeatures(
             support_status=SupportStatus.Unsupported, supported_types=[]
         ),
@@ -2814,72 +6049,284 @@ class PolarsView(DataExplorerTableView):
             supported_formats=[ExportFormat.Csv, ExportFormat.Tsv],
         ),
         set_sort_columns=SetSortColumnsFeatures(support_status=SupportStatus.Supported),
+        # convert_to_code is unsupported for now, tracked in #9514
         convert_to_code=ConvertToCodeFeatures(
-            support_status=SupportStatus.Supported,
-            code_syntaxes=[
-                CodeSyntaxName(code_syntax_name="polars"),
-                CodeSyntaxName(code_syntax_name="pandas"),
-            ],
+            support_status=SupportStatus.Unsupported,
+            code_syntaxes=[],
         ),
+        get_data_values=GetDataValuesFeatures(supported_binary_formats=[BinaryFormat.ArrowIpc]),
     )
 
 
-def _polars_dtype_from_display(display_type):
-    import polars as pl
+# ----------------------------------------------------------------------
+# polars LazyFrame Data Explorer RPC implementations
 
-    return {
-        ColumnDisplayType.Floating: pl.Float64,
-        ColumnDisplayType.Integer: pl.Int64,
-        ColumnDisplayType.Decimal: pl.Float64,  # Polars doesn't have a separate decimal type
-    }.get(display_type)
 
+def _polars_collect(query: pl.LazyFrame) -> pl.DataFrame:
+    # The streaming engine processes the query in batches, so that
+    # counts and profiles of large inputs do not need them in memory
+    try:
+        return query.collect(engine="streaming")
+    except (TypeError, ValueError):
+        # Older versions of polars
+        return query.collect(streaming=True)  # type: ignore
 
-class PyArrowView(DataExplorerTableView):
-    pass
 
+class PolarsLazyView(LazyTableView, PolarsView):
+    """
+    DataExplorer view implementation for polars.LazyFrame.
 
-# ----------------------------------------------------------------------
-# ibis Data Explorer RPC implementations
+    Filters and sorts are added to the user's query plan, and only the
+    rows of the requested viewports are collected. Profiles collect the
+    filtered values of the profiled column and reuse the PolarsView
+    profiling code.
+    """
 
+    @staticmethod
+    def _read_schema(table: pl.LazyFrame):
+        schema = table.collect_schema()
+        return schema.names(), schema.dtypes()
 
-class IbisView(PandasView):
-    """DataExplorer view implementation for Ibis tables."""
+    def _count(self, frame: pl.LazyFrame) -> int:
+        import polars as pl
 
-    def __init__(
-        self,
-        table,
-        comm: PositronComm,
-        state: DataExplorerState,
-        job_queue: BackgroundJobQueue,
-        sql_string: str | None = None,
+        return _polars_collect(frame.select(pl.len())).item()
+
+    def _filter_expr(self, filt: RowFilter):
+        import polars as pl
+
+        column_index = filt.column_schema.column_index
+        col = pl.col(self._get_column_name(column_index))
+        mask = self._filter_mask(filt, col, self._column_types[column_index])
+        return mask.fill_null(False)  # noqa: FBT003
+
+    def _apply_filter(self, frame: pl.LazyFrame, predicate):
+        return frame.filter(predicate)
+
+    def _apply_sort(self, frame: pl.LazyFrame, sort_keys: list[ColumnSortKey]):
+        # Nulls sort first in both directions, like PolarsView
+        return frame.sort(
+            [self._get_column_name(key.column_index) for key in sort_keys],
+            descending=[not key.ascending for key in sort_keys],
+            nulls_last=False,
+            maintain_order=True,
+        )
+
+    def _fetch_frame(
+        self, frame: pl.LazyFrame, names: list[str], offset: int, num_rows: int | None
+    ):
+        return _polars_collect(frame.slice(offset, num_rows).select(names))
+
+    def _iter_frames(
+        self, frame: pl.LazyFrame, names: list[str], offset: int, num_rows: int | None
     ):
-        self._ibis_table = table
-        # Convert to pandas dataframe (limit to 1000 rows for performance)
-        pandas_df = table.limit(IBIS_LIMIT_ROWS).execute()
+        query = frame.slice(offset, num_rows).select(names)
+        if hasattr(query, "collect_batches"):
+            yield from query.collect_batches(chunk_size=EXPORT_CHUNK_ROWS)
+        else:
+            yield from _polars_collect(query).iter_slices(EXPORT_CHUNK_ROWS)
 
-        super().__init__(pandas_df, comm, state, job_queue, sql_string)
+    @staticmethod
+    def _frame_column(page: pl.DataFrame, name: str):
+        return page.get_column(name)
 
-    def get_state(self, _unused):
-        state = super().get_state(_unused)
-        state.display_name = self.state.name + " (preview)"
+    @staticmethod
+    def _take(data, positions: list[int]):
+        return data[positions]
 
-        return state
+    @staticmethod
+    def _frame_to_csv(page: pl.DataFrame, delimiter: str, *, include_header: bool) -> str:
+        return page.write_csv(separator=delimiter, include_header=include_header)
+
+    @staticmethod
+    def _values_to_pylist(values: pl.Series) -> list:
+        return values.to_list()
+
+    def _get_column(self, column_index: int) -> pl.Series:
+        name = self._get_column_name(column_index)
+        return _polars_collect(self._filtered.select(name)).to_series()
 
-    # Override convert_to_code to be unsupported for now, tracked in #9514
     FEATURES = SupportedFeatures(
-        search_schema=PandasView.FEATURES.search_schema,
-        set_column_filters=PandasView.FEATURES.set_column_filters,
-        set_row_filters=PandasView.FEATURES.set_row_filters,
-        get_column_profiles=PandasView.FEATURES.get_column_profiles,
-        set_sort_columns=PandasView.FEATURES.set_sort_columns,
-        export_data_selection=PandasView.FEATURES.export_data_selection,
+        search_schema=PolarsView.FEATURES.search_schema,
+        set_column_filters=PolarsView.FEATURES.set_column_filters,
+        set_row_filters=PolarsView.FEATURES.set_row_filters,
+        get_column_profiles=PolarsView.FEATURES.get_column_profiles,
+        export_data_selection=PolarsView.FEATURES.export_data_selection,
+        set_sort_columns=PolarsView.FEATURES.set_sort_columns,
+        # The generated code assumes a DataFrame
         convert_to_code=ConvertToCodeFeatures(
             support_status=SupportStatus.Unsupported,
             code_syntaxes=[],
         ),
+        get_data_values=PolarsView.FEATURES.get_data_values,
     )
 
 
+# ----------------------------------------------------------------------
+# DuckDB relation Data Explorer RPC implementations
+
+
+def _duckdb_column(name: str):
+    import duckdb
+
+    # Quote the name so that it is not parsed as a qualified name
+    return duckdb.ColumnExpression(f'"{name}"')
+
+
+class DuckDBRelationView(LazyTableView, PyArrowView):
+    """
+    DataExplorer view implementation for duckdb.DuckDBPyRelation.
+
+    Filters and sorts are added to the user's relation, viewports are
+    fetched with LIMIT / OFFSET queries, and results are fetched as
+    Arrow data, so the PyArrowView formatting and profiling code is
+    reused. Profiles fetch the filtered values of the profiled column.
+    """
+
+    @staticmethod
+    def _read_schema(table: duckdb.DuckDBPyRelation):
+        with _query_lock:
+            schema = table.limit(0).to_arrow_table().schema
+        return schema.names, schema.types
+
+    def _count(self, frame: duckdb.DuckDBPyRelation) -> int:
+        with _query_lock:
+            row = frame.count("*").fetchone()
+        assert row is not None
+        return row[0]
+
+    def _filter_expr(self, filt: RowFilter):
+        import duckdb
+        import pyarrow as pa
+
+        column_index = filt.column_schema.column_index
+        col = _duckdb_column(self._get_column_name(column_index))
+        dtype = self._column_types[column_index]
+
+        def constant(value):
+            return self._coerce_constant(value, column_index)
+
+        expr = None
+        if filt.filter_type in (
+            RowFilterType.Between,
+            RowFilterType.NotBetween,
+        ):
+            params = filt.params
+            assert isinstance(params, FilterBetween)
+            expr = col.between(constant(params.left_value), constant(params.right_value))
+            if filt.filter_type == RowFilterType.NotBetween:
+                expr = ~expr
+        elif filt.filter_type == RowFilterType.Compare:
+            params = filt.params
+            assert isinstance(params, FilterComparison)
+
+            if params.op not in COMPARE_OPS:
+                raise ValueError(f"Unsupported filter type: {params.op}")
+            op = COMPARE_OPS[params.op]
+            expr = op(col, constant(params.value))
+        elif filt.filter_type in (RowFilterType.IsEmpty, RowFilterType.NotEmpty):
+            is_binary = pa.types.is_binary(dtype) or pa.types.is_large_binary(dtype)
+            length = "octet_length" if is_binary else "length"
+            expr = duckdb.FunctionExpression(length, col) == duckdb.ConstantExpression(0)
+            if filt.filter_type == RowFilterType.NotEmpty:
+                expr = ~expr
+        elif filt.filter_type == RowFilterType.IsNull:
+            expr = col.isnull()  # noqa: PD003
+        elif filt.filter_type == RowFilterType.NotNull:
+            expr = col.isnotnull()
+        elif filt.filter_type == RowFilterType.IsTrue:
+            expr = col == duckdb.ConstantExpression(True)  # noqa: FBT003
+        elif filt.filter_type == RowFilterType.IsFalse:
+            expr = col == duckdb.ConstantExpression(False)  # noqa: FBT003
+        elif filt.filter_type == RowFilterType.SetMembership:
+            params = filt.params
+            assert isinstance(params, FilterSetMembership)
+
+            expr = col.isin(*[constant(val) for val in params.values])  # noqa: PD011
+            if not params.inclusive:
+                # NOT-IN, which selects the null values like PyArrowView
+                expr = ~expr | col.isnull()  # noqa: PD003
+        elif filt.filter_type == RowFilterType.Search:
+            params = filt.params
+            assert isinstance(params, FilterTextSearch)
+
+            if not (pa.types.is_string(dtype) or pa.types.is_large_string(dtype)):
+                col = col.cast(duckdb.sqltype("VARCHAR"))
+
+            term = params.term
+            if params.search_type == TextSearchType.RegexMatch:
+                if not params.case_sensitive:
+                    term = "(?i)" + term
+                func = "regexp_matches"
+            else:
+                if not params.case_sensitive:
+                    col = duckdb.FunctionExpression("lower", col)
+                    term = term.lower()
+                func = {
+                    TextSearchType.Contains: "contains",
+                    TextSearchType.StartsWith: "starts_with",
+                    TextSearchType.EndsWith: "ends_with",
+                }[params.search_type]
+            expr = duckdb.FunctionExpression(func, col, duckdb.ConstantExpression(term))
+
+        assert expr is not None
+        return expr
+
+    def _coerce_constant(self, value, column_index: int):
+        import duckdb
+        import pyarrow as pa
+
+        try:
+            value = self._coerce_value(value, self._column_types[column_index])
+        except pa.ArrowNotImplementedError:
+            # As a fallback, let DuckDB do the coercion
+            return duckdb.ConstantExpression(value).cast(self.table.types[column_index])
+
+        if not isinstance(value, (bool, int, float)):
+            # Timestamps and other types are coerced to pyarrow scalars
+            value = value.as_py()
+        return duckdb.ConstantExpression(value)
+
+    def _apply_filter(self, frame: duckdb.DuckDBPyRelation, predicate):
+        return frame.filter(predicate)
+
+    def _apply_sort(self, frame: duckdb.DuckDBPyRelation, sort_keys: list[ColumnSortKey]):
+        exprs = []
+        for key in sort_keys:
+            col = _duckdb_column(self._get_column_name(key.column_index))
+            # Nulls sort last in both directions, like PyArrowView
+            col = col.asc() if key.ascending else col.desc()
+            exprs.append(col.nulls_last())
+        return frame.sort(*exprs)
+
+    def _select_frame_rows(
+        self, frame: duckdb.DuckDBPyRelation, names: list[str], offset: int, num_rows: int | None
+    ):
+        if num_rows is None:
+            # There is no way to only pass an offset
+            num_rows = 2**62
+        return frame.limit(num_rows, offset=offset).select(*[_duckdb_column(n) for n in names])
+
+    def _fetch_frame(
+        self, frame: duckdb.DuckDBPyRelation, names: list[str], offset: int, num_rows: int | None
+    ):
+        query = self._select_frame_rows(frame, names, offset, num_rows)
+        with _query_lock:
+            return query.to_arrow_table()
+
+    def _iter_frames(
+        self, frame: duckdb.DuckDBPyRelation, names: list[str], offset: int, num_rows: int | None
+    ):
+        query = self._select_frame_rows(frame, names, offset, num_rows)
+        with _query_lock:
+            yield from _iter_arrow_batches(query.to_arrow_reader(EXPORT_CHUNK_ROWS))
+
+    def _get_column(self, column_index: int) -> pa.ChunkedArray:
+        query = self._filtered.select(_duckdb_column(self._get_column_name(column_index)))
+        with _query_lock:
+            return query.to_arrow_table().column(0)
+
+
 def _get_table_view(
     table,
     comm: PositronComm,
@@ -2894,8 +6341,14 @@ def _get_table_view(
         return PandasView(table, comm, state, job_queue, sql_string)
     elif is_polars(table):
         return PolarsView(table, comm, state, job_queue)
+    elif is_polars_lazy(table):
+        return PolarsLazyView(table, comm, state, job_queue)
     elif is_ibis(table):
         return IbisView(table, comm, state, job_queue, sql_string)
+    elif is_duckdb_relation(table):
+        return DuckDBRelationView(table, comm, state, job_queue, sql_string)
+    elif is_pyarrow(table):
+        return PyArrowView(table, comm, state, job_queue)
     else:
         return UnsupportedView(table, comm, state, job_queue)
 
@@ -2905,6 +6358,12 @@ def _value_type_is_supported(value):
         return True
     if is_polars(value):
         return True
+    if is_pyarrow(value):
+        return True
+    if is_polars_lazy(value):
+        return True
+    if is_duckdb_relation(value):
+        return True
     return bool(is_ibis(value))
 
 
@@ -3033,7 +6492,7 @@ class DataExplorerService:
             logger.warning(err, exc_info=True)
 
         del self.comms[comm_id]
-        del self.table_views[comm_id]
+        self.table_views.pop(comm_id).cancel_jobs()
 
         if comm_id in self.comm_id_to_path:
             path = self.comm_id_to_path[comm_id]
@@ -3078,7 +6537,9 @@ class DataExplorerService:
             for comm_id in list(self.path_to_comm_ids[path]):
                 self._update_explorer_for_comm(comm_id, path, new_variable)
 
-    def _update_explorer_for_comm(self, comm_id: str, path: PathKey, new_variable):
+    def _update_explorer_for_comm(
+        self, comm_id: str, path: PathKey, new_variable, *, check_unchanged: bool = True
+    ):
         """
         If a variable is updated, we have to handle the different scenarios.
 
@@ -3135,12 +6596,38 @@ class DataExplorerService:
             # preserve state if we can confidently do so.
             schema_updated = True
             new_state = DataExplorerState(table_view.state.name)
+        elif check_unchanged and table_view.is_unchanged(new_table):
+            # The variable was updated but its data was not (for
+            # example a large mutable object checked after every
+            # execution), so we keep the view with its filter masks,
+            # sort indexes and profiles, and the UI need not refetch.
+            # The view holds the new object so the old one can be
+            # freed, and large tables are checked in full in the
+            # background, refreshing the view if they changed
+            table_view.table = new_table
+
+            def on_changed():
+                if self.table_views.get(comm_id) is table_view and table_view.table is new_table:
+                    self._update_explorer_for_comm(
+                        comm_id, path, new_variable, check_unchanged=False
+                    )
+
+            table_view.verify_unchanged(new_table, on_changed)
+            return None
         else:
             schema_updated, new_state = table_view.get_updated_state(new_table)
 
-        self.table_views[comm_id] = _get_table_view(
+        new_state.table_version = table_view.state.table_version + 1
+
+        # Work queued for the old table is stale
+        table_view.cancel_jobs()
+        new_view = _get_table_view(
             new_table, table_view.comm, new_state, self.job_queue, sql_string=table_view.sql_string
         )
+        if type(new_view) is type(table_view):
+            # Cached profiles of unchanged columns are still valid
+            new_view._profile_cache = table_view._profile_cache  # noqa: SLF001
+        self.table_views[comm_id] = new_view
 
         if schema_updated:
             comm.send_event(DataExplorerFrontendEvent.SchemaUpdate.value, {})
@@ -3167,6 +6654,10 @@ class DataExplorerService:
         # GetState is the only method that doesn't have params
         result = getattr(table, request.method.value)(getattr(request, "params", None))
 
+        buffers = None
+        if isinstance(result, BinaryResult):
+            result, buffers = result
+
         # To help remember to convert pydantic types to dicts
         if result is not None:
             # Convert pydantic types to dict
@@ -3178,7 +6669,7 @@ class DataExplorerService:
             else:
                 assert isinstance(result, dict)
 
-        comm.send_result(result)
+        comm.send_result(result, buffers=buffers)
 
     def _open_data_explorer(self, source_comm_id: str) -> None:
         """Open a new, independent data explorer for the same underlying data."""
@@ -3207,7 +6698,8 @@ def _get_column_profiles(table_view, schema, query_types, format_options):
         summary_stats = None
         if "summary_stats" in query_types:
             try:
-                summary_stats = table_view._prof_summary_stats(i, format_options)  # noqa: SLF001
+                data = table_view._get_profile_data(i)  # noqa: SLF001
+                summary_stats = table_view._prof_summary_stats(data, format_options)  # noqa: SLF001
             except Exception as e:
                 # Collect failed columns for later logging
                 skipped_columns.append((i, column.column_name, e))
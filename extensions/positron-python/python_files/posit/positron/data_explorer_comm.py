@@ -223,6 +223,15 @@ class ExportFormat(str, enum.Enum):
     Html = "html"
 
 
+@enum.unique
+class BinaryFormat(str, enum.Enum):
+    """
+    Possible values for BinaryFormat
+    """
+
+    ArrowIpc = "arrow_ipc"
+
+
 @enum.unique
 class SupportStatus(str, enum.Enum):
     """
@@ -434,6 +443,11 @@ class TableData(BaseModel):
         description="The columns of data",
     )
 
+    binary_format: Optional[BinaryFormat] = Field(
+        default=None,
+        description="If set, the values were returned in the binary buffers of the comm message using this encoding, and 'columns' is empty",
+    )
+
 
 class TableRowLabels(BaseModel):
     """
@@ -939,6 +953,11 @@ class ColumnHistogram(BaseModel):
         description="Sample quantiles that were also requested",
     )
 
+    is_approximate: Optional[StrictBool] = Field(
+        default=None,
+        description="Whether the bin counts were computed from a row sample and are scaled estimates of the true counts. May be omitted",
+    )
+
 
 class ColumnFrequencyTableParams(BaseModel):
     """
@@ -968,6 +987,11 @@ class ColumnFrequencyTable(BaseModel):
         description="Number of other values not accounted for in counts, excluding nulls/NA values. May be omitted",
     )
 
+    is_approximate: Optional[StrictBool] = Field(
+        default=None,
+        description="Whether the counts were computed from a row sample and are scaled estimates of the true counts. May be omitted",
+    )
+
 
 class ColumnQuantileValue(BaseModel):
     """
@@ -1034,6 +1058,11 @@ class SupportedFeatures(BaseModel):
         description="Support for 'convert_to_code' RPC and its features",
     )
 
+    get_data_values: Optional[GetDataValuesFeatures] = Field(
+        default=None,
+        description="Support for 'get_data_values' RPC and its features",
+    )
+
 
 class SearchSchemaFeatures(BaseModel):
     """
@@ -1049,6 +1078,16 @@ class SearchSchemaFeatures(BaseModel):
     )
 
 
+class GetDataValuesFeatures(BaseModel):
+    """
+    Feature flags for 'get_data_values' RPC
+    """
+
+    supported_binary_formats: List[BinaryFormat] = Field(
+        description="Binary encodings supported for returning unformatted values",
+    )
+
+
 class SetColumnFiltersFeatures(BaseModel):
     """
     Feature flags for 'set_column_filters' RPC
@@ -1450,6 +1489,11 @@ class GetDataValuesParams(BaseModel):
         description="Formatting options for returning data values as strings",
     )
 
+    binary_format: Optional[BinaryFormat] = Field(
+        default=None,
+        description="Opt-in binary encoding for the result. If set and supported by the backend, unformatted values are returned in the binary buffers of the comm message (one buffer per column selection) instead of as formatted strings",
+    )
+
 
 class GetDataValuesRequest(BaseModel):
     """
@@ -1517,6 +1561,11 @@ class ExportDataSelectionParams(BaseModel):
         description="Result string format",
     )
 
+    path: Optional[StrictStr] = Field(
+        default=None,
+        description="If set, the backend writes the exported data to this file path in bounded chunks instead of returning it, and the result data is empty",
+    )
+
 
 class ExportDataSelectionRequest(BaseModel):
     """
@@ -1931,6 +1980,8 @@ SupportedFeatures.update_forward_refs()
 
 SearchSchemaFeatures.update_forward_refs()
 
+GetDataValuesFeatures.update_forward_refs()
+
 SetColumnFiltersFeatures.update_forward_refs()
 
 SetRowFiltersFeatures.update_forward_refs()
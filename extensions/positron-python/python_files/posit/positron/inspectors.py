@@ -7,6 +7,7 @@ from __future__ import annotations
 import contextlib
 import copy
 import datetime
+import functools
 import inspect
 import logging
 import numbers
@@ -14,6 +15,7 @@ import pydoc
 import re
 import sys
 import types
+import zlib
 from abc import ABC, abstractmethod
 from collections.abc import (
     Mapping,
@@ -33,6 +35,7 @@ from typing import (
     Collection,
     FrozenSet,
     Generic,
+    Hashable,
     Iterable,
     Sized,
     Tuple,
@@ -41,7 +44,7 @@ from typing import (
     cast,
 )
 
-from .third_party import _numpy, _pandas, _pyodbc, _torch
+from .third_party import _numpy, _pandas, _pyodbc, _torch, _xxhash
 from .utils import (
     JsonData,
     get_qualname,
@@ -53,6 +56,7 @@ if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
     import polars as pl
+    import pyarrow as pa
 
     # temporary suppress for python 3.12
     with contextlib.suppress(ImportError):
@@ -62,6 +66,9 @@ if TYPE_CHECKING:
     with contextlib.suppress(ImportError):
         import ibis
 
+    with contextlib.suppress(ImportError):
+        import duckdb
+
 
 # General display settings
 ELLIPSIS = "…"
@@ -95,6 +102,7 @@ SIMPLER_NAMES = {
     "pandas.core.series.Series": "pandas.Series",
     "polars.dataframe.frame.DataFrame": "polars.DataFrame",
     "polars.series.series.Series": "polars.Series",
+    "polars.lazyframe.frame.LazyFrame": "polars.LazyFrame",
     "polars.internals.series.series.Series": "polars.Series",
     "polars.internals.dataframe.frame.DataFrame": "polars.DataFrame",
     "pandas.core.indexes.base.Index": "pandas.Index",
@@ -104,7 +112,10 @@ SIMPLER_NAMES = {
     # Just display Int64Index as pandas.Index, since the former is deprecated since pandas v1.4.0.
     "pandas.core.indexes.numeric.Int64Index": "pandas.Index",
     "duckdb.duckdb.DuckDBPyConnection": "duckdb.DuckDBPyConnection",
+    "duckdb.duckdb.DuckDBPyRelation": "duckdb.DuckDBPyRelation",
+    "_duckdb.DuckDBPyRelation": "duckdb.DuckDBPyRelation",
     "ibis.expr.types.relations.Table": "ibis.Table",
+    "pyarrow.lib.Table": "pyarrow.Table",
 }
 
 
@@ -195,6 +206,20 @@ class PositronInspector(Generic[T]):
     def get_comparison_cost(self) -> int:
         return self.get_size()
 
+    def get_fingerprint(self) -> Hashable | None:
+        """
+        Fingerprint the value's current contents for change detection, without copying it.
+
+        Two fingerprints of the same object compare equal only if the object was not mutated in
+        between. Returns None if the value cannot be fingerprinted, in which case change detection
+        falls back to `deepcopy` and `equals`.
+        """
+        return None
+
+    def get_fingerprint_cost(self) -> int:
+        """Estimate the number of bytes hashed by `get_fingerprint`."""
+        return self.get_size()
+
     def equals(self, value: T) -> bool:
         try:
             return self.value == value
@@ -721,6 +746,9 @@ class NumpyNdarrayInspector(_BaseArrayInspector["np.ndarray"]):
             True,
         )
 
+    def get_fingerprint(self) -> Hashable | None:
+        return _get_ndarray_fingerprint(self.value)
+
     def equals(self, value: np.ndarray) -> bool:
         return _numpy().array_equal(self.value, value)
 
@@ -760,6 +788,20 @@ class TorchTensorInspector(_BaseArrayInspector["torch.Tensor"]):
 
         return display_value, True
 
+    def get_fingerprint(self) -> Hashable | None:
+        # In-place operations increment a tensor's version counter, so
+        # there is no need to hash its data
+        return (
+            self.value.data_ptr(),
+            tuple(self.value.shape),
+            self.value.stride(),
+            self.value.dtype,
+            self.value._version,  # noqa: SLF001
+        )
+
+    def get_fingerprint_cost(self) -> int:
+        return 0
+
     def equals(self, value: torch.Tensor) -> bool:
         return _torch().equal(self.value, value)
 
@@ -793,6 +835,8 @@ MT = TypeVar(
     Mapping,
     "pd.DataFrame",
     "pl.DataFrame",
+    "pa.Table",
+    "ibis.expr.types.relations.Table",
     "pd.Series",
     "pl.Series",
     "pd.Index",
@@ -939,6 +983,15 @@ class PandasSeriesInspector(BaseColumnInspector["pd.Series"]):
         # #so that it shows up in the "data" section
         return "table"
 
+    def get_fingerprint(self) -> Hashable | None:
+        fingerprint = _get_pandas_fingerprint(self.value)
+        if fingerprint is None:
+            return None
+        return (fingerprint, self.value.name)
+
+    def get_fingerprint_cost(self) -> int:
+        return int(self.value.memory_usage(index=True, deep=False))
+
     def equals(self, value: pd.Series) -> bool:
         return self.value.equals(value)
 
@@ -1028,7 +1081,13 @@ class PolarsSeriesInspector(BaseColumnInspector["pl.Series"]):
         return self.value.to_frame().write_csv(file=None, separator="\t")
 
 
-Table = TypeVar("Table", "pd.DataFrame", "pl.DataFrame", "ibis.expr.types.relations.Table")
+Table = TypeVar(
+    "Table",
+    "pd.DataFrame",
+    "pl.DataFrame",
+    "pa.Table",
+    "ibis.expr.types.relations.Table",
+)
 
 
 class BaseTableInspector(_BaseMapInspector[Table], Generic[Table, Column], ABC):  # noqa: PYI059
@@ -1080,6 +1139,12 @@ class PandasDataFrameInspector(BaseTableInspector["pd.DataFrame", "pd.Series"]):
     def get_child(self, key: int) -> Any:
         return self.value.iloc[:, key]
 
+    def get_fingerprint(self) -> Hashable | None:
+        return _get_pandas_fingerprint(self.value)
+
+    def get_fingerprint_cost(self) -> int:
+        return int(self.value.memory_usage(index=True, deep=False).sum())
+
     def equals(self, value: pd.DataFrame) -> bool:
         return self.value.equals(value)
 
@@ -1181,6 +1246,36 @@ class PolarsDataFrameInspector(BaseTableInspector["pl.DataFrame", "pl.Series"]):
         return self.value.write_csv(file=None, separator="\t")
 
 
+class PyArrowTableInspector(BaseTableInspector["pa.Table", "pa.ChunkedArray"]):
+    # Simplified class name
+    CLASS_QNAME = ("pyarrow.Table",)
+
+    def get_children(self):
+        return self.value.column_names
+
+    def equals(self, value: pa.Table) -> bool:
+        return self.value.equals(value)
+
+    def deepcopy(self) -> pa.Table:
+        # Arrow tables are immutable, so there is nothing to copy
+        return self.value
+
+    def is_mutable(self) -> bool:
+        return False
+
+    def to_html(self) -> str:
+        # TODO: Support HTML
+        return self.to_plaintext()
+
+    def to_plaintext(self) -> str:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        sink = pa.BufferOutputStream()
+        pa_csv.write_csv(self.value, sink, write_options=pa_csv.WriteOptions(delimiter="\t"))
+        return sink.getvalue().to_pybytes().decode("utf-8")
+
+
 class IbisDataFrameInspector(BaseTableInspector["ibis.Table", "ibis.Column"]):
     CLASS_QNAME = ("ibis.expr.types.relations.Table", "ibis.Table")
 
@@ -1224,6 +1319,84 @@ class IbisDataFrameInspector(BaseTableInspector["ibis.Table", "ibis.Column"]):
         return False
 
 
+LazyTable = TypeVar("LazyTable", "pl.LazyFrame", "duckdb.DuckDBPyRelation")
+
+
+class BaseLazyTableInspector(PositronInspector[LazyTable], ABC):
+    """
+    Base inspector for lazy tables, such as queries.
+
+    Only the schema is inspected, since the number of rows is not known
+    without running the query. Unlike BaseTableInspector, the shape of
+    the table is never accessed.
+    """
+
+    def get_kind(self) -> str:
+        return "table"
+
+    def has_viewer(self) -> bool:
+        return True
+
+    def get_size(self) -> int:
+        # size of the object in memory, not the data it represents
+        return sys.getsizeof(self.value)
+
+    def get_display_value(self, *, level: int = 0) -> tuple[str, bool]:
+        display_value = _get_simplified_qualname(self.value)
+        display_value = f"[{self.get_length()} columns] {display_value}"
+
+        return (_maybe_truncate_string(display_value, level=level)[0], True)
+
+    def get_display_name(self, key: str) -> str:
+        return str(key)
+
+    def get_display_type(self) -> str:
+        type_name = type(self.value).__name__
+        return f"{type_name} [{self.get_length()} columns]"
+
+    def get_length(self) -> int:
+        return len(list(self.get_children()))
+
+    def has_child(self, key: Any) -> bool:
+        return key in self.get_children()
+
+    def is_mutable(self) -> bool:
+        return False
+
+    def equals(self, value) -> bool:
+        # Comparing the data would run the queries
+        return self.value is value
+
+
+class PolarsLazyFrameInspector(BaseLazyTableInspector["pl.LazyFrame"]):
+    CLASS_QNAME = ("polars.lazyframe.frame.LazyFrame", "polars.LazyFrame")
+
+    def get_children(self):
+        # Resolving the schema does not collect the data
+        return self.value.collect_schema().names()
+
+    def get_child(self, key: str) -> Any:
+        return self.value.select(key)
+
+
+class DuckDBRelationInspector(BaseLazyTableInspector["duckdb.DuckDBPyRelation"]):
+    CLASS_QNAME = ("duckdb.DuckDBPyRelation",)
+
+    def get_children(self):
+        return self.value.columns
+
+    def get_child(self, key: str) -> Any:
+        # Quote the name so that it is not parsed as a qualified name
+        return self.value.project(f'"{key}"')
+
+    def to_html(self) -> str:
+        return self.to_plaintext()
+
+    def to_plaintext(self) -> str:
+        # The repr of a relation runs the query
+        return self.value.sql_query()
+
+
 class BaseConnectionInspector(ObjectInspector):
     def has_viewer(self) -> bool:
         return self._is_active(self.value)
@@ -1388,10 +1561,13 @@ INSPECTOR_CLASSES: dict[str, type[PositronInspector]] = {
     TorchTensorInspector.CLASS_QNAME: TorchTensorInspector,
     **dict.fromkeys(PolarsDataFrameInspector.CLASS_QNAME, PolarsDataFrameInspector),
     **dict.fromkeys(PolarsSeriesInspector.CLASS_QNAME, PolarsSeriesInspector),
+    **dict.fromkeys(PolarsLazyFrameInspector.CLASS_QNAME, PolarsLazyFrameInspector),
     DatetimeInspector.CLASS_QNAME: DatetimeInspector,
     **dict.fromkeys(SQLiteConnectionInspector.CLASS_QNAME, SQLiteConnectionInspector),
     **dict.fromkeys(SQLAlchemyEngineInspector.CLASS_QNAME, SQLAlchemyEngineInspector),
     **dict.fromkeys(DuckDBConnectionInspector.CLASS_QNAME, DuckDBConnectionInspector),
+    **dict.fromkeys(DuckDBRelationInspector.CLASS_QNAME, DuckDBRelationInspector),
+    **dict.fromkeys(PyArrowTableInspector.CLASS_QNAME, PyArrowTableInspector),
     **dict.fromkeys(IbisDataFrameInspector.CLASS_QNAME, IbisDataFrameInspector),
     **dict.fromkeys(SnowflakeConnectionInspector.CLASS_QNAME, SnowflakeConnectionInspector),
     **dict.fromkeys(DatabricksConnectionInspector.CLASS_QNAME, DatabricksConnectionInspector),
@@ -1417,6 +1593,119 @@ INSPECTOR_CLASSES: dict[str, type[PositronInspector]] = {
 #
 
 
+class _ObjectIdentity:
+    """
+    Fingerprint component that compares equal only for the same object.
+
+    Holding a reference keeps the object alive, so that its id cannot be reused by another object
+    before the fingerprints are compared.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self.obj = obj
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ObjectIdentity) and self.obj is other.obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_xxhash():
+    try:
+        return _xxhash()
+    except ImportError:
+        return None
+
+
+def _hash_buffers(buffers: Iterable[Any]) -> int:
+    """Hash the contents of objects supporting the buffer protocol, without copying them."""
+    xxhash = _get_xxhash()
+    if xxhash is None:
+        result = 0
+        for buffer in buffers:
+            result = zlib.crc32(buffer, result)
+        return result
+
+    hasher = xxhash.xxh3_64()
+    for buffer in buffers:
+        hasher.update(buffer)
+    return hasher.intdigest()
+
+
+def _get_ndarray_fingerprint(array: np.ndarray) -> Hashable | None:
+    # Arrays of Python objects can be mutated through their elements,
+    # and non-contiguous arrays can't be hashed without a copy
+    if array.dtype.hasobject or not (array.flags.c_contiguous or array.flags.f_contiguous):
+        return None
+
+    data = array.reshape(-1, order="A").view(_numpy().uint8)
+    return (
+        array.__array_interface__["data"][0],
+        array.shape,
+        array.strides,
+        array.dtype,
+        _hash_buffers([data]),
+    )
+
+
+def _get_pandas_array_fingerprint(values: Any) -> Hashable | None:
+    np_ = _numpy()
+    if isinstance(values, np_.ndarray):
+        return _get_ndarray_fingerprint(values)
+
+    # Arrow arrays are immutable, and setting values in an Arrow-backed
+    # extension array replaces its array
+    pa_array = getattr(values, "_pa_array", None)
+    if pa_array is not None:
+        return (values.dtype, _ObjectIdentity(pa_array))
+
+    # Other extension arrays are backed by NumPy arrays: categorical
+    # codes, datetimes, and nullable masked arrays
+    ndarray = getattr(values, "_ndarray", None)
+    if ndarray is not None:
+        arrays = [ndarray]
+    elif isinstance(getattr(values, "_mask", None), np_.ndarray):
+        arrays = [values._data, values._mask]  # noqa: SLF001
+    else:
+        return None
+
+    fingerprints = []
+    for array in arrays:
+        fingerprint = _get_ndarray_fingerprint(array)
+        if fingerprint is None:
+            return None
+        fingerprints.append(fingerprint)
+    return (values.dtype, *fingerprints)
+
+
+def _get_pandas_fingerprint(value: pd.DataFrame | pd.Series) -> Hashable | None:
+    try:
+        # Array managers have no blocks and aren't fingerprinted
+        mgr: Any = value._mgr  # noqa: SLF001
+        blocks = mgr.blocks
+        axes = mgr.axes
+    except AttributeError:
+        return None
+
+    # Index objects are immutable apart from their names
+    parts: list[Any] = [
+        _ObjectIdentity(mgr),
+        *((_ObjectIdentity(axis), tuple(axis.names)) for axis in axes),
+    ]
+
+    for block in blocks:
+        values_fingerprint = _get_pandas_array_fingerprint(block.values)
+        if values_fingerprint is None:
+            return None
+        parts.append((_ObjectIdentity(block), _ObjectIdentity(block.mgr_locs), values_fingerprint))
+
+    return tuple(parts)
+
+
 def get_inspector(value: T) -> PositronInspector[T]:
     # Look for a specific inspector by qualified classname
     if isinstance(value, type):
@@ -1,5 +1,5 @@
 #
-# Copyright (C) 2023-2024 Posit Software, PBC. All rights reserved.
+# Copyright (C) 2023-2026 Posit Software, PBC. All rights reserved.
 # Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
 #
 
@@ -238,7 +238,12 @@ class PositronComm:
         """Messages sent to the frontend-side version of this comm, when recorded for testing purposes."""
         return getattr(self.comm, "messages")  # noqa: B009
 
-    def send_result(self, data: JsonData = None, metadata: JsonRecord | None = None) -> None:
+    def send_result(
+        self,
+        data: JsonData = None,
+        metadata: JsonRecord | None = None,
+        buffers: list[bytes] | None = None,
+    ) -> None:
         """
         Send a JSON-RPC result to the frontend-side version of this comm.
 
@@ -248,6 +253,9 @@ class PositronComm:
             The result data to send.
         metadata
             The metadata to send with the result.
+        buffers
+            Binary buffers to send alongside the result, for results that are too large or too
+            costly to encode as JSON.
         """
         result = {
             "jsonrpc": "2.0",
@@ -256,7 +264,7 @@ class PositronComm:
         self.comm.send(
             data=result,
             metadata=metadata,
-            buffers=None,
+            buffers=buffers,
         )
 
     def send_event(self, name: str, payload: JsonRecord) -> None:
@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import enum
 import importlib.util
 import logging
@@ -458,7 +459,12 @@ class PositronShell(ZMQInteractiveShell):
             logger.exception("Error polling working directory")
 
         try:
-            self.kernel.variables_service.poll_variables()
+            if self.kernel.handling_shell_request:
+                # Detect variable changes after the kernel replies to the
+                # request, see PositronIPyKernel.post_handler_hook
+                self.kernel.variables_service.defer_poll_variables()
+            else:
+                self.kernel.variables_service.poll_variables()
         except Exception:
             logger.exception("Error polling variables")
 
@@ -630,6 +636,9 @@ class PositronIPyKernel(IPythonKernel):
 
         self.job_queue = BackgroundJobQueue()
 
+        # Whether a shell request (e.g. an execute request) is being handled
+        self.handling_shell_request = False
+
         # Create Positron services
         self.data_explorer_service = DataExplorerService(_CommTarget.DataExplorer, self.job_queue)
         self.plots_service = PlotsService(_CommTarget.Plot, self.session_mode)
@@ -801,6 +810,8 @@ class PositronIPyKernel(IPythonKernel):
         except Exception as e:
             self.log.debug("Error in super().pre_handler_hook(): %s", e, exc_info=False)
 
+        self.handling_shell_request = True
+
     def post_handler_hook(self):
         # see the pre_handler_hook for details
         try:
@@ -808,6 +819,20 @@ class PositronIPyKernel(IPythonKernel):
         except Exception as e:
             self.log.debug("Error in super().post_handler_hook(): %s", e, exc_info=False)
 
+        self.handling_shell_request = False
+
+        # The reply and idle status are sent right after this hook, so
+        # a deferred poll scheduled on the event loop runs after the
+        # kernel is idle. It runs on the kernel's thread, so user code
+        # can't mutate variables while they're being inspected.
+        if self.variables_service.has_deferred_poll():
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.variables_service.flush_deferred_poll()
+            else:
+                loop.call_soon(self.variables_service.flush_deferred_poll)
+
 
 class PositronIPKernelApp(IPKernelApp):
     control_thread: ControlThread | None
@@ -9,6 +9,7 @@ import datetime
 import inspect
 import math
 import pprint
+import threading
 from decimal import Decimal
 from importlib.metadata import version
 from io import StringIO
@@ -17,10 +18,12 @@ from typing import Any, Dict, List, Optional, Type, cast
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 import pytz
 from packaging import version as pkg_version
 
+from .._data_explorer_internal import RowRange
 from .._vendor.pydantic import BaseModel
 from ..access_keys import encode_access_key
 from ..data_explorer import (
@@ -37,7 +40,10 @@ from ..data_explorer import (
     DataExplorerService,
     DataExplorerState,
     PandasView,
+    PolarsView,
+    _format_float_array,
     _get_float_formatter,
+    _value_type_is_supported,
 )
 from ..data_explorer_comm import (
     ColumnDisplayType,
@@ -53,11 +59,17 @@ from ..data_explorer_comm import (
     RowFilterTypeSupportStatus,
     SupportStatus,
 )
+from ..third_party import _pyarrow_compute
 from ..utils import guid
 from .conftest import DummyComm, PositronShell
 from .test_variables import BIG_ARRAY_LENGTH, _assign_variables
 from .utils import dummy_rpc_request, json_rpc_notification, json_rpc_request
 
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
 try:
     import ibis
 except ImportError:
@@ -270,6 +282,12 @@ def _get_comms_for_name(de_service, name):
     return [de_service.comms[comm_id] for p in paths for comm_id in de_service.path_to_comm_ids[p]]
 
 
+def _check_no_update_variable(de_service, name):
+    for comm in _get_comms_for_name(de_service, name):
+        dummy_comm = cast("DummyComm", comm.comm)
+        assert dummy_comm.messages == []
+
+
 def _check_update_variable(de_service, name, update_type="schema"):
     comms = _get_comms_for_name(de_service, name)
     if update_type == "schema":
@@ -510,6 +528,23 @@ class DataExplorerFixture:
             columns=columns,
         )
 
+    def get_data_values_arrow(self, table_name, columns, format_options=DEFAULT_FORMAT):
+        import pyarrow as pa
+
+        result = self.do_json_rpc(
+            table_name,
+            "get_data_values",
+            format_options=format_options,
+            columns=columns,
+            binary_format="arrow_ipc",
+        )
+        assert result == {"columns": [], "binary_format": "arrow_ipc"}
+
+        comm_id = self._get_comm_id(table_name)
+        buffers = get_last_message(self.de_service, comm_id)["buffers"]
+        assert len(buffers) == len(columns)
+        return [pa.ipc.open_stream(buf).read_all().column(0) for buf in buffers]
+
     def get_row_labels(self, table_name, selection, format_options=DEFAULT_FORMAT):
         return self.do_json_rpc(
             table_name,
@@ -1089,6 +1124,32 @@ def test_search_schema(dxf: DataExplorerFixture):
         assert result["matches"] == expected_reverse_sorted
 
 
+def test_search_schema_incremental(dxf: DataExplorerFixture):
+    # Typing a search term character by character narrows the previous
+    # matches, and the results are the same as searching from scratch
+    column_names = [f"{prefix}_{i}" for prefix in ["Gene", "gEnome", "protein"] for i in range(50)]
+    test_df = pd.DataFrame({name: [i] for i, name in enumerate(column_names)})
+    dxf.register_table("test_df", test_df)
+    dxf.register_table("test_df_fresh", test_df)
+
+    for case_sensitive in [False, True]:
+        terms = ["g", "ge", "gen", "gene", "gene_1", "gen", "ome", "x"]
+        for term in terms:
+            filters = [_text_search_filter(term, case_sensitive=case_sensitive)]
+            result = dxf.search_schema("test_df", filters)
+            if case_sensitive:
+                expected = [i for i, name in enumerate(column_names) if term in name]
+            else:
+                expected = [i for i, name in enumerate(column_names) if term in name.lower()]
+            assert result["matches"] == expected
+
+        # Narrowing the term after changing the type filter
+        for types in [[ColumnDisplayType.String], [ColumnDisplayType.Integer]]:
+            filters = [_text_search_filter("gen"), _match_types_filter(types)]
+            result = dxf.search_schema("test_df", filters)
+            assert result == dxf.search_schema("test_df_fresh", filters)
+
+
 def test_search_schema_sort_by_name(dxf: DataExplorerFixture):
     # Test comprehensive sort-by-name functionality
 
@@ -1250,6 +1311,45 @@ def test_pandas_get_data_values(dxf: DataExplorerFixture):
     assert response["columns"] == [[]]
 
 
+def test_pandas_get_data_values_arrow(dxf: DataExplorerFixture):
+    features = dxf.get_state("simple")["supported_features"]
+    assert features["get_data_values"] == {"supported_binary_formats": ["arrow_ipc"]}
+
+    result = dxf.get_data_values_arrow(
+        "simple",
+        columns=[
+            {"column_index": i, "spec": {"first_index": 0, "last_index": 20}}
+            for i in [0, 1, 3, 4, 5, 7]
+        ],
+    )
+    a, b, d, e, f, h = (x.to_pylist() for x in result)
+
+    assert a == [1, 2, 3, 4, 5]
+    assert b == [True, False, True, None, True]
+    assert d[:4] == [0.0, 1.2, -4.5, 6.0]
+    # NaN is kept distinct from null
+    assert math.isnan(d[4])
+    assert e[2] is None
+    assert e[1] == datetime.datetime(2024, 1, 2, 12, 34, 45)  # noqa: DTZ001
+    # Mixed-type object columns are sent as formatted strings
+    assert f == [None, "5", "-1", None, None]
+    assert h[:2] == [np.inf, -np.inf]
+
+    # Filtered and sorted view, selected by indices
+    schema = dxf.get_schema("simple")
+    dxf.set_row_filters("simple", filters=[_compare_filter(schema[0], ">", "1")])
+    dxf.set_sort_columns("simple", sort_keys=[{"column_index": 0, "ascending": False}])
+    result = dxf.get_data_values_arrow(
+        "simple",
+        columns=[
+            {"column_index": 0, "spec": {"indices": [0, 2]}},
+            {"column_index": 2, "spec": {"first_index": 1, "last_index": 2}},
+        ],
+    )
+    assert result[0].to_pylist() == [5, 3]
+    assert result[1].to_pylist() == ["bar", None]
+
+
 def test_pandas_get_row_labels(dxf: DataExplorerFixture):
     result = dxf.get_row_labels("simple", {"first_index": 0, "last_index": 20})
     assert result["row_labels"] == [["0", "1", "2", "3", "4"]]
@@ -1340,6 +1440,136 @@ def test_pandas_float_formatting(dxf: DataExplorerFixture):
     _check_format_cases(dxf, "test_df", cases)
 
 
+_FLOAT_PARITY_VALUES = [
+    0.0,
+    -0.0,
+    1.0,
+    -1.0,
+    0.5,
+    0.0001,
+    -0.0001,
+    0.00009999,
+    0.99999,
+    0.999999999,
+    998.995,
+    999.0,
+    999.995,
+    -999.999,
+    1234.5678,
+    9999999.0,
+    9999999.995,
+    10000000.0,
+    -10000000.0,
+    123456789.123,
+    5e-324,
+    1.7976931348623157e308,
+    float("nan"),
+    float("inf"),
+    float("-inf"),
+]
+
+_FLOAT_PARITY_FORMATS = [
+    DEFAULT_FORMAT,
+    DEFAULT_FORMAT.copy(update={"thousands_sep": None}),
+    DEFAULT_FORMAT.copy(update={"thousands_sep": ""}),
+    DEFAULT_FORMAT.copy(update={"thousands_sep": "_", "large_num_digits": 3}),
+    DEFAULT_FORMAT.copy(
+        update={"large_num_digits": 0, "small_num_digits": 0, "max_integral_digits": 1}
+    ),
+    DEFAULT_FORMAT.copy(
+        update={"large_num_digits": 6, "small_num_digits": 10, "max_integral_digits": 3}
+    ),
+]
+
+
+def _float_parity_values(dtype="float64"):
+    rng = np.random.default_rng(12345)
+    random_values = rng.standard_normal(2000) * 10.0 ** rng.integers(-12, 12, 2000)
+    with np.errstate(over="ignore"):
+        return np.concatenate([_FLOAT_PARITY_VALUES, random_values]).astype(dtype)
+
+
+@pytest.mark.parametrize("format_options", _FLOAT_PARITY_FORMATS)
+def test_format_float_array_parity(format_options):
+    float_format = _get_float_formatter(format_options)
+    values = _float_parity_values()
+
+    assert _format_float_array(values, format_options) == [float_format(x) for x in values]
+    assert _format_float_array(values[:0], format_options) == []
+
+
+def _scalar_float_format_reference(values, format_options, inf_as_special):
+    float_format = _get_float_formatter(format_options)
+
+    def _format(x):
+        if x is None or x is pd.NA:
+            return None
+        elif math.isnan(x):
+            return _VALUE_NAN
+        elif inf_as_special and math.isinf(x):
+            return _VALUE_INF if x > 0 else _VALUE_NEGINF
+        else:
+            return float_format(x)
+
+    return [_format(x) for x in values]
+
+
+@pytest.mark.parametrize("format_options", _FLOAT_PARITY_FORMATS)
+def test_float_formatting_vectorized_parity(dxf: DataExplorerFixture, format_options):
+    float64_values = _float_parity_values()
+    float32_values = _float_parity_values("float32")
+    float16_values = _float_parity_values("float16")
+
+    nullable_values = pd.array(float64_values, dtype="Float64")
+    nullable_values[::7] = pd.NA
+
+    test_df = pd.DataFrame(
+        {
+            "float64": float64_values,
+            "float32": float32_values,
+            "float16": float16_values,
+            "nullable": nullable_values,
+        }
+    )
+    dxf.register_table("test_df", test_df)
+
+    num_rows = len(test_df)
+    result = dxf.get_data_values(
+        "test_df",
+        columns=_select_all(num_rows, len(test_df.columns)),
+        format_options=format_options,
+    )
+    for name, formatted in zip(test_df.columns, result["columns"]):
+        expected = _scalar_float_format_reference(
+            test_df[name].tolist(), format_options, inf_as_special=True
+        )
+        if name == "nullable":
+            expected = [_VALUE_NA if x is None else x for x in expected]
+        assert formatted == expected, name
+
+    # polars formats infinity as a regular number
+    dfp = pl.DataFrame(
+        {
+            "float64": float64_values,
+            "float32": float32_values,
+            "nullable": pl.Series(float64_values).scatter(list(range(0, num_rows, 7)), None),
+        }
+    )
+    dxf.register_table("dfp", dfp)
+
+    result = dxf.get_data_values(
+        "dfp",
+        columns=_select_all(num_rows, len(dfp.columns)),
+        format_options=format_options,
+    )
+    for name, formatted in zip(dfp.columns, result["columns"]):
+        expected = _scalar_float_format_reference(
+            dfp[name].to_list(), format_options, inf_as_special=False
+        )
+        expected = [_VALUE_NULL if x is None else x for x in expected]
+        assert formatted == expected, name
+
+
 def test_get_data_values_max_value_length(dxf: DataExplorerFixture):
     test_df = pd.DataFrame({"a": ["a" * 100, "b" * 1000, "c" * 10000]})
     dxf.register_table("test_df", test_df)
@@ -1669,6 +1899,153 @@ def test_pandas_filter_reset(dxf: DataExplorerFixture):
     dxf.compare_tables(table_name, ex_id, test_df.shape)
 
 
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_row_filters_incremental(dxf: DataExplorerFixture, monkeypatch, lib):
+    data = {
+        "a": list(range(100)),
+        "b": [i % 7 for i in range(100)],
+        "c": [float(i % 13) for i in range(100)],
+    }
+    if lib == "pandas":
+        test_df = pd.DataFrame(data)
+        view_class = PandasView
+    else:
+        test_df = pl.DataFrame(data)
+        view_class = PolarsView
+
+    evaluated = []
+    original_eval_filter = view_class._eval_filter  # noqa: SLF001
+
+    def _eval_filter(self, filt, row_indices=None):
+        num_rows = None if row_indices is None else len(row_indices)
+        evaluated.append((filt.column_schema.column_index, num_rows))
+        return original_eval_filter(self, filt, row_indices=row_indices)
+
+    monkeypatch.setattr(view_class, "_eval_filter", _eval_filter)
+
+    dxf.register_table("test_df", test_df)
+    schema = dxf.get_schema("test_df")
+
+    def _check(filters, expected_num_rows, expected_evaluated):
+        evaluated.clear()
+        result = dxf.set_row_filters("test_df", filters=filters)
+        assert result == FilterResult(selected_num_rows=expected_num_rows, had_errors=False)
+        assert evaluated == expected_evaluated
+
+    f_a = _compare_filter(schema[0], "<", 50)
+    f_b = _compare_filter(schema[1], "=", 3)
+    f_c = _compare_filter(schema[2], ">", 5)
+
+    _check([f_a], 50, [(0, None)])
+
+    # A new AND filter is only evaluated over the selected rows
+    _check([f_a, f_b], 7, [(1, 50)])
+    _check([f_a, f_b, f_c], 4, [(2, 7)])
+
+    # Removing a filter reuses the cached masks, evaluating only
+    # filters whose full mask has not been computed yet
+    _check([f_a, f_c], 26, [(2, None)])
+    _check([f_b, f_c], 7, [(1, None)])
+    _check([f_a], 50, [])
+
+    # OR filters are evaluated over all the rows
+    f_b_or = _compare_filter(schema[1], "=", 3, condition="or")
+    _check([f_a, f_b_or], 57, [])
+
+    # The result is the same as filtering the full table
+    dxf.check_filter_case(test_df, [f_a, f_b, f_c], _filter_expected(test_df, lib))
+
+    # Masks are keyed by table version
+    table_view = dxf.de_service.table_views[dxf._get_comm_id("test_df")]  # noqa: SLF001
+    table_view.state.table_version += 1
+    _check([f_a], 50, [(0, None)])
+
+
+def _filter_expected(test_df, lib):
+    if lib == "pandas":
+        return test_df[(test_df["a"] < 50) & (test_df["b"] == 3) & (test_df["c"] > 5)]
+    else:
+        return test_df.filter((pl.col("a") < 50) & (pl.col("b") == 3) & (pl.col("c") > 5))
+
+
+def test_row_filters_mask_cache_budget(dxf: DataExplorerFixture, monkeypatch):
+    from .. import data_explorer
+
+    # Room for two boolean masks of 1000 rows
+    monkeypatch.setattr(data_explorer, "FILTER_MASK_CACHE_MAX_BYTES", 2000)
+
+    test_df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) % 10})
+    dxf.register_table("test_df", test_df)
+    schema = dxf.get_schema("test_df")
+
+    filters = [
+        _compare_filter(schema[0], ">", 100),
+        _compare_filter(schema[1], "<", 5, condition="or"),
+        _compare_filter(schema[0], "<", 900, condition="or"),
+    ]
+    dxf.set_row_filters("test_df", filters=filters)
+
+    table_view = dxf.de_service.table_views[dxf._get_comm_id("test_df")]  # noqa: SLF001
+    cache = table_view._filter_mask_cache  # noqa: SLF001
+    assert len(cache) == 2
+    assert cache.nbytes == 2000
+
+
+@pytest.mark.parametrize("lib", ["pandas", "pyarrow"])
+def test_row_view_indices_compact(dxf: DataExplorerFixture, lib):
+    data = {"a": list(range(20)), "b": [f"x{i}" for i in range(20)]}
+    test_df = pd.DataFrame(data)
+    table = test_df if lib == "pandas" else pa.table(data)
+
+    dxf.register_table("test_df", table)
+    schema = dxf.get_schema("test_df")
+    table_view = dxf.de_service.table_views[dxf._get_comm_id("test_df")]  # noqa: SLF001
+
+    def _check_values(expected_df):
+        columns = [
+            {"column_index": 1, "spec": {"first_index": 1, "last_index": 3}},
+            {"column_index": 0, "spec": {"first_index": 1, "last_index": 3}},
+            {"column_index": 1, "spec": {"indices": [0, 2]}},
+        ]
+        result = dxf.get_data_values("test_df", columns=columns)
+        assert result["columns"] == [
+            list(expected_df["b"].iloc[1:4]),
+            [str(x) for x in expected_df["a"].iloc[1:4]],
+            list(expected_df["b"].iloc[[0, 2]]),
+        ]
+
+    # Filters selecting consecutive rows are represented as a range
+    between = _between_filter(schema[0], "5", "9")
+    dxf.set_row_filters("test_df", [between])
+    assert table_view.filtered_indices == RowRange(5, 10)
+    _check_values(test_df.iloc[5:10])
+
+    dxf.set_sort_columns("test_df", sort_keys=[{"column_index": 0, "ascending": False}])
+    assert table_view.row_view_indices is not None
+    assert table_view.row_view_indices.dtype == np.uint32
+    _check_values(test_df.iloc[5:10].iloc[::-1])
+    dxf.set_sort_columns("test_df", sort_keys=[])
+
+    # Narrowing the range selects rows of the range
+    dxf.set_row_filters("test_df", [between, _compare_filter(schema[0], "<", 8)])
+    assert table_view.filtered_indices == RowRange(5, 8)
+    dxf.set_row_filters("test_df", [between, _compare_filter(schema[0], "!=", 7)])
+    np.testing.assert_array_equal(table_view.filtered_indices, [5, 6, 8, 9])
+    assert table_view.filtered_indices is not None
+    assert table_view.filtered_indices.dtype == np.uint32
+    _check_values(test_df.iloc[[5, 6, 8, 9]])
+
+    dxf.set_row_filters("test_df", [between])
+    result = dxf.export_data_selection("test_df", _select_row_range(1, 2))
+    assert _strip_newline(result["data"]).replace('"', "") == "a,b\n6,x6\n7,x7"
+
+    # Other filters use the narrowest integer type
+    dxf.set_row_filters("test_df", [_compare_filter(schema[0], "!=", 3)])
+    assert table_view.filtered_indices is not None
+    assert table_view.filtered_indices.dtype == np.uint32
+    _check_values(test_df[test_df["a"] != 3])
+
+
 def test_pandas_polars_filter_value_coercion(dxf: DataExplorerFixture):
     data = {
         "a": [1, 2, 3, 4, 5],
@@ -1898,6 +2275,110 @@ def test_pandas_filter_search(dxf: DataExplorerFixture):
         )
 
 
+def test_pandas_filter_search_non_string(dxf: DataExplorerFixture):
+    test_df = pd.DataFrame(
+        {
+            "a": ["x1.5", 11, None, "a.b", 15.5, 3],
+            "b": ["a.b", "a+b", "A.B", None, "ab", "a.b"],
+        }
+    )
+    dxf.register_table("test_df", test_df)
+    schema = dxf.get_schema("test_df")
+
+    # Columns of mixed values are searched by their string
+    # representation, which is cached for subsequent searches
+    mixed_schema = {**schema[0], "type_display": "string"}
+    search = _search_filter(mixed_schema, "1")
+    dxf.check_filter_case(test_df, [search], test_df.iloc[[0, 1, 4]])
+
+    result = dxf.set_row_filters("test_df", [search])
+    assert result["selected_num_rows"] == 3
+    table_view = dxf.de_service.table_views[dxf._get_comm_id("test_df")]  # noqa: SLF001
+    assert len(table_view._search_strings_cache) == 1  # noqa: SLF001
+
+    # Narrowing the search gathers the selected rows of the cached strings
+    result = dxf.set_row_filters(
+        "test_df", [search, _search_filter(mixed_schema, ".5", search_type="ends_with")]
+    )
+    assert result["selected_num_rows"] == 2
+    assert len(table_view._search_strings_cache) == 1  # noqa: SLF001
+
+    # Search terms other than regexes match literally
+    dxf.check_filter_case(test_df, [_search_filter(schema[1], "a.b")], test_df.iloc[[0, 2, 5]])
+    dxf.check_filter_case(
+        test_df,
+        [_search_filter(schema[1], "a.b", search_type="not_contains")],
+        test_df.iloc[[1, 4]],
+    )
+    dxf.check_filter_case(
+        test_df,
+        [_search_filter(schema[1], "a.b", search_type="regex_match")],
+        test_df.iloc[[0, 1, 2, 5]],
+    )
+
+
+@pytest.mark.parametrize("dtype", ["category", "object", "str"])
+def test_pandas_dictionary_encoded_filters(dxf: DataExplorerFixture, monkeypatch, dtype):
+    # Filters and frequency tables of categorical and low-cardinality
+    # string columns are computed once per distinct value
+    monkeypatch.setattr("positron.data_explorer.PANDAS_DICTIONARY_MIN_ROWS", 0)
+
+    values = ["foo1", "foo2", None, "2FOO", "FOO3", "bar1", "2BAR", "foo1"] * 3
+    test_df = pd.DataFrame({"a": pd.Series(values, dtype=dtype), "b": range(len(values))})
+    plain = test_df["a"].astype(object)
+
+    dxf.register_table("test_df", test_df)
+    schema = dxf.get_schema("test_df")
+
+    cases = [
+        (_search_filter(schema[0], "foo"), plain.str.lower().str.contains("foo")),
+        (_search_filter(schema[0], "foo", case_sensitive=True), plain.str.contains("foo")),
+        (
+            _search_filter(schema[0], "foo", search_type="not_contains"),
+            ~plain.str.lower().str.contains("foo", na=True),
+        ),
+        (
+            _search_filter(schema[0], "f[o]+", search_type="regex_match"),
+            plain.str.match("f[o]+", case=False),
+        ),
+        (_set_member_filter(schema[0], ["bar1", "foo1"]), plain.isin(["bar1", "foo1"])),
+        (_filter("is_null", schema[0]), plain.isna()),
+        (_compare_filter(schema[0], "=", "2FOO"), plain == "2FOO"),
+    ]
+    for filt, mask in cases:
+        expected_df = test_df[mask.fillna(value=False).astype(bool)]
+        dxf.check_filter_case(test_df, [filt], expected_df)
+
+    # Narrowing a filtered selection maps only the selected rows
+    dxf.set_row_filters("test_df", [_search_filter(schema[0], "foo")])
+    result = dxf.set_row_filters(
+        "test_df",
+        [_search_filter(schema[0], "foo"), _search_filter(schema[0], "1", case_sensitive=True)],
+    )
+    assert result["selected_num_rows"] == 6
+
+    table_view = dxf.de_service.table_views[dxf._get_comm_id("test_df")]  # noqa: SLF001
+    assert isinstance(table_view, PandasView)
+    assert table_view._get_dictionary_encoding(0)  # noqa: SLF001
+
+    # Frequency tables of the filtered rows, in descending order
+    freq_table = dxf.get_column_profiles("test_df", [_get_frequency_table(0, 10)])[0][
+        "small_frequency_table"
+    ]
+    # Unobserved categories are reported with zero counts
+    counts = dict(zip(freq_table["values"], freq_table["counts"]))
+    assert {k: v for k, v in counts.items() if v} == {"foo1": 6}
+    assert freq_table["values"][0] == "foo1"
+
+    dxf.set_row_filters("test_df", [])
+    freq_table = dxf.get_column_profiles("test_df", [_get_frequency_table(0, 2)])[0][
+        "small_frequency_table"
+    ]
+    assert freq_table["values"][0] == "foo1"
+    assert freq_table["counts"] == [6, 3]
+    assert freq_table["other_count"] == 12
+
+
 def _replicate_df_columns(test_df, new_width):
     # Create a "wide" version of the data frame by replicating its
     # columns and appending an index suffix to make the column names
@@ -1932,7 +2413,7 @@ def test_variable_updates(
         big_x=big_x,
         big_xpl=big_xpl,
         wide_xpl=wide_xpl,
-        y={"key1": SIMPLE_PANDAS_DF, "key2": SIMPLE_PANDAS_DF},
+        y={"key1": SIMPLE_PANDAS_DF.copy(), "key2": SIMPLE_PANDAS_DF.copy()},
     )
 
     # Check updates
@@ -1969,22 +2450,56 @@ def test_variable_updates(
         assert new_state["table_shape"]["num_columns"] == 1
         assert new_state["sort_keys"] == [ColumnSortKey(**k) for k in x_sort_keys]
 
-    # Execute code that triggers a schema update events for large data
-    # frames
-    shell.run_cell("None")
-    _check_update_variable(de_service, "big_x", update_type="schema")
+    # Large data frames are checked for changes after every
+    # execution, but are not refreshed if their data is unchanged
+    for name in ("big_x", "big_xpl", "wide_xpl"):
+        for comm in _get_comms_for_name(de_service, name):
+            cast("DummyComm", comm.comm).messages.clear()
 
-    # Always updates because the schema is wide
-    _check_update_variable(de_service, "wide_xpl", update_type="schema")
-
-    # Does not update because the schema was cached and is unchanged
-    _check_update_variable(de_service, "big_xpl", update_type="data")
+    shell.run_cell("None")
+    for name in ("big_x", "big_xpl", "wide_xpl"):
+        _check_no_update_variable(de_service, name)
+
+    # Views of reassigned but unchanged frames hold the new object
+    shell.run_cell("big_x = big_x.copy(deep=False)")
+    _check_no_update_variable(de_service, "big_x")
+    (big_x_comm_id,) = [c.comm_id for c in _get_comms_for_name(de_service, "big_x")]
+    assert de_service.table_views[big_x_comm_id].table is shell.user_ns["big_x"]
+
+    shell.run_cell("big_x.iloc[0, 0] = -1")
+    _check_update_variable(de_service, "big_x", update_type="data")
+
+    # Edits anywhere in the data are detected, those outside the
+    # sample checked after every execution by a full check in the
+    # background
+    for name, code in [
+        ("big_x", "big_x.iloc[1, 0] = -1"),
+        ("big_x", "big_x.iloc[5_000_001, 0] = -1"),
+        ("big_xpl", "big_xpl[1, 'a'] = -1"),
+        ("big_xpl", "big_xpl[5_000_001, 'a'] = -1"),
+    ]:
+        dxf.de_service.job_queue.wait_for_all()
+        for comm in _get_comms_for_name(de_service, name):
+            cast("DummyComm", comm.comm).messages.clear()
+        shell.run_cell(code)
+        dxf.de_service.job_queue.wait_for_all()
+        _check_update_variable(de_service, name, update_type="data")
+
+    # Large data frames are compared using column fingerprints that
+    # are computed in the background, so they do not have schema
+    # updates when only the data changed
+    dxf.de_service.job_queue.wait_for_all()
+    shell.run_cell("wide_xpl[0, 'f0'] = -1")
+    _check_update_variable(de_service, "wide_xpl", update_type="data")
 
     # Update nested values in y and check for data or schema updates
+    # Replacing a pandas frame that has object columns is a schema
+    # update as their inferred types may change, so the data of the
+    # frames is modified in place
     shell.run_cell(
-        """y = {'key1': y['key1'].iloc[:1]],
-    'key2': y['key2'].copy()}
-    """
+        """y['key1'].iloc[0, 0] = 100
+y['key2'].iloc[1, 0] = 100
+"""
     )
     _check_update_variable(de_service, "y", update_type="data")
 
@@ -1996,6 +2511,46 @@ def test_variable_updates(
     _check_update_variable(de_service, "y", update_type="schema")
 
 
+def test_content_fingerprint_size_limit(monkeypatch):
+    from .. import data_explorer
+
+    df = pd.DataFrame({"a": np.arange(1000)})
+    assert PandasView._get_content_fingerprint(df) is not None  # noqa: SLF001
+    assert PolarsView._get_content_fingerprint(pl.from_pandas(df)) is not None  # noqa: SLF001
+
+    # Tables too large to checksum are not fingerprinted, so their
+    # views are always refreshed
+    monkeypatch.setattr(data_explorer, "CONTENT_FINGERPRINT_MAX_BYTES", 1000)
+    assert PandasView._get_content_fingerprint(df) is None  # noqa: SLF001
+    assert PolarsView._get_content_fingerprint(pl.from_pandas(df)) is None  # noqa: SLF001
+
+
+def test_content_fingerprint_sampled():
+    df = pd.DataFrame({"a": np.arange(1_000_000)})
+    df_pl = pl.from_pandas(df)
+    max_bytes = 100_000
+    sampled = PandasView._get_content_fingerprint(df, max_bytes)  # noqa: SLF001
+    full = PandasView._get_content_fingerprint(df)  # noqa: SLF001
+    sampled_pl = PolarsView._get_content_fingerprint(df_pl, max_bytes)  # noqa: SLF001
+    full_pl = PolarsView._get_content_fingerprint(df_pl)  # noqa: SLF001
+    assert sampled != full
+    assert sampled_pl != full_pl
+
+    # Edits outside the sample are only detected by full fingerprints
+    df.iloc[1, 0] = -1
+    df_pl[1, "a"] = -1
+    assert PandasView._get_content_fingerprint(df, max_bytes) == sampled  # noqa: SLF001
+    assert PandasView._get_content_fingerprint(df) != full  # noqa: SLF001
+    assert PolarsView._get_content_fingerprint(df_pl, max_bytes) == sampled_pl  # noqa: SLF001
+    assert PolarsView._get_content_fingerprint(df_pl) != full_pl  # noqa: SLF001
+
+    # Tables smaller than the sample are checksummed in full
+    small = df.iloc[:100].copy()
+    assert PandasView._get_content_fingerprint(  # noqa: SLF001
+        small, max_bytes
+    ) == PandasView._get_content_fingerprint(small)  # noqa: SLF001
+
+
 # Test a variety of state change scenarios for pandas and polars to
 # make sure the updates are correct.
 
@@ -2311,6 +2866,75 @@ def test_pandas_set_sort_columns(dxf: DataExplorerFixture):
             dxf.check_sort_case(test_df, wrapped_keys, expected_filtered, filters=filters)
 
 
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_sort_index_cache(dxf: DataExplorerFixture, monkeypatch, lib):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 20, 1000).astype(float)
+    values[rng.random(1000) < 0.1] = np.nan
+    data = {"a": values, "b": rng.integers(0, 5, 1000), "c": rng.standard_normal(1000)}
+    if lib == "pandas":
+        test_df = pd.DataFrame(data)
+        view_class = PandasView
+    else:
+        test_df = pl.DataFrame(data).with_columns(pl.col("a").fill_nan(None))
+        view_class = PolarsView
+
+    computed = []
+    original_get_sort_order = view_class._get_sort_order  # noqa: SLF001
+    original_get_sort_ranks = view_class._get_sort_ranks  # noqa: SLF001
+
+    def _get_sort_order(self, column_index):
+        computed.append(("order", column_index))
+        return original_get_sort_order(self, column_index)
+
+    def _get_sort_ranks(self, column_index):
+        computed.append(("ranks", column_index))
+        return original_get_sort_ranks(self, column_index)
+
+    monkeypatch.setattr(view_class, "_get_sort_order", _get_sort_order)
+    monkeypatch.setattr(view_class, "_get_sort_ranks", _get_sort_ranks)
+
+    dxf.register_table("test_df", test_df)
+    table_view = dxf.de_service.table_views[dxf._get_comm_id("test_df")]  # noqa: SLF001
+    schema = dxf.get_schema("test_df")
+
+    def _check(sort_keys, expected_computed, filters=None):
+        computed.clear()
+        if filters is not None:
+            dxf.set_row_filters("test_df", filters=filters)
+        dxf.set_sort_columns(
+            "test_df",
+            sort_keys=[
+                {"column_index": index, "ascending": ascending} for index, ascending in sort_keys
+            ],
+        )
+        assert computed == expected_computed
+
+        # Same result as sorting directly
+        result = np.asarray(table_view.row_view_indices)
+        table_view._sort_data_direct()  # noqa: SLF001
+        np.testing.assert_array_equal(result, np.asarray(table_view.row_view_indices))
+
+    _check([(0, True)], [("order", 0)])
+
+    # Reversing the direction only needs the ranks for breaking ties
+    _check([(0, False)], [("ranks", 0)])
+    _check([(0, True)], [])
+
+    # Secondary keys only break ties in the cached primary order
+    _check([(0, False), (1, True)], [("order", 1), ("ranks", 1)])
+    _check([(0, True), (1, False), (2, True)], [("order", 2), ("ranks", 2)])
+    _check([(1, False), (0, True)], [])
+
+    # Filtering masks the cached order
+    _check([(1, False), (0, True)], [], filters=[_compare_filter(schema[2], ">", 0)])
+    _check([(0, False)], [], filters=[_compare_filter(schema[1], "<", 3)])
+
+    # Sort indexes are keyed by table version
+    table_view.state.table_version += 1
+    _check([(0, False)], [("order", 0), ("ranks", 0)])
+
+
 def test_pandas_change_schema_after_sort(
     shell: PositronShell,
     de_service: DataExplorerService,
@@ -2372,27 +2996,135 @@ def test_pandas_updated_with_sort_keys(dxf: DataExplorerFixture):
         view = dxf.de_service.table_views[comm_id]
         dxf.set_sort_columns(name, [{"column_index": 0, "ascending": False}])
 
+        # Wait for the column fingerprints of the wide table
+        dxf.de_service.job_queue.wait_for_all()
         state = view.state
+        assert (state.column_fingerprints is not None) == (
+            len(table.columns) > SCHEMA_CACHE_THRESHOLD
+        )
 
         new_view = PandasView(
             table,
-            None,  # type: ignore
-            DataExplorerState(name, row_filters=state.row_filters, sort_keys=state.sort_keys),
+            view.comm,
+            DataExplorerState(
+                name,
+                row_filters=state.row_filters,
+                sort_keys=state.sort_keys,
+                column_fingerprints=state.column_fingerprints,
+            ),
             dxf.de_service.job_queue,
         )
 
         schema_updated, new_state = new_view.get_updated_state(table)
-
-        if len(table.columns) > SCHEMA_CACHE_THRESHOLD:
-            # For tables with many columns, schema_updated is always true
-            assert schema_updated
-        else:
-            assert not schema_updated
+        assert not schema_updated
 
         assert new_state.row_filters == state.row_filters
         assert new_state.sort_keys == state.sort_keys
 
 
+def test_wide_table_schema_updates(dxf: DataExplorerFixture):
+    # Tables too wide for the schema cache are compared using column
+    # fingerprints computed in the background
+    test_df = pd.DataFrame(
+        {
+            "f0": [1, 2, 3, 4, 5],
+            "f1": [True, False, True, None, True],
+            "f2": np.array(["foo", "bar", None, "bar", "None"], dtype=object),
+        }
+    )
+    wide_pd = _replicate_df_columns(test_df, 300)
+    wide_pl = pl.DataFrame(wide_pd.iloc[:, :2].astype({"f1_1": "boolean"})).select(
+        [pl.col(f"f{i % 2}_{i % 2}").alias(f"f{i}") for i in range(300)]
+    )
+    wide_pa = wide_pl.to_arrow()
+
+    def move_last_column_first(table, names):
+        new_order = [names[-1], *names[:-1]]
+        return table[new_order] if isinstance(table, pd.DataFrame) else table.select(new_order)
+
+    def cast_column(table, names, i):
+        name = names[i]
+        if isinstance(table, pd.DataFrame):
+            return table.astype({name: "float64"})
+        elif isinstance(table, pl.DataFrame):
+            return table.with_columns(pl.col(name).cast(pl.Float64))
+        else:
+            return table.set_column(i, name, table.column(i).cast("float64"))
+
+    views = {}
+    for name, table in [("wide_pd", wide_pd), ("wide_pl", wide_pl), ("wide_pa", wide_pa)]:
+        comm_id = dxf.assign_and_open_viewer(name, table)
+        dxf.de_service.job_queue.wait_for_all()
+        view = views[name] = dxf.de_service.table_views[comm_id]
+        assert view.state.schema_cache is None
+        assert view.state.column_fingerprints is not None
+        assert len(view.state.column_fingerprints) == 300
+
+        dxf.set_sort_columns(name, [{"column_index": 1, "ascending": False}])
+        names = [str(c) for c in (table.columns if name != "wide_pa" else table.column_names)]
+
+        schema_updated, new_state = view.get_updated_state(table)
+        assert not schema_updated
+        assert new_state.sort_keys == view.state.sort_keys
+
+        schema_updated, new_state = view.get_updated_state(move_last_column_first(table, names))
+        assert schema_updated
+        assert new_state.sort_keys[0].column_index == 2
+
+        schema_updated, new_state = view.get_updated_state(cast_column(table, names, 0))
+        assert schema_updated
+        assert new_state.sort_keys == view.state.sort_keys
+
+        # A moved column whose type changed keeps its sort key
+        schema_updated, new_state = view.get_updated_state(
+            move_last_column_first(cast_column(table, names, 1), names)
+        )
+        assert schema_updated
+        assert new_state.sort_keys[0].column_index == 2
+
+    # Replacing the data of a pandas object column may change its
+    # inferred type
+    new_table = wide_pd.copy(deep=False)
+    schema_updated, _ = views["wide_pd"].get_updated_state(new_table)
+    assert not schema_updated
+
+    new_table["f2_2"] = pd.Series([1, 2, 3, 4, None], dtype=object)
+    schema_updated, _ = views["wide_pd"].get_updated_state(new_table)
+    assert schema_updated
+
+
+def test_wide_table_replaced_while_fingerprinting(dxf: DataExplorerFixture, monkeypatch):
+    # The fingerprints of the new view are computed even if the
+    # cancelled job of the old view is still running
+    from ..data_explorer import PandasView
+
+    started = threading.Event()
+    release = threading.Event()
+    get_column_fingerprints = PandasView._get_column_fingerprints  # noqa: SLF001
+
+    def blocking_fingerprints(table, columns):
+        if not started.is_set():
+            started.set()
+            release.wait()
+        return get_column_fingerprints(table, columns)
+
+    monkeypatch.setattr(PandasView, "_get_column_fingerprints", staticmethod(blocking_fingerprints))
+
+    wide_df = pd.DataFrame({f"f{i}": [i, i + 1] for i in range(300)})
+    comm_id = dxf.assign_and_open_viewer("wide_df", wide_df)
+    try:
+        assert started.wait(5)
+        dxf.assign_variable("wide_df", wide_df + 1)
+        new_view = dxf.de_service.table_views[comm_id]
+        assert new_view.state.table_version == 1
+    finally:
+        release.set()
+    dxf.de_service.job_queue.wait_for_all()
+
+    assert new_view.state.column_fingerprints is not None
+    assert len(new_view.state.column_fingerprints) == 300
+
+
 def _select_single_cell(row_index: int, col_index: int):
     return {
         "kind": "single_cell",
@@ -2583,6 +3315,42 @@ def test_export_data_selection(dxf: DataExplorerFixture):
                 assert filt_result["data"] == filt_expected
 
 
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_export_data_selection_to_path(dxf: DataExplorerFixture, monkeypatch, tmp_path, lib):
+    from .. import data_explorer
+
+    monkeypatch.setattr(data_explorer, "EXPORT_CHUNK_ROWS", 7)
+
+    data = {"a": np.arange(50), "b": [f"s{i}" for i in range(50)]}
+    test_df = pd.DataFrame(data) if lib == "pandas" else pl.DataFrame(data)
+    dxf.register_table("test_df", test_df)
+    schema = dxf.get_schema("test_df")
+    dxf.set_row_filters("test_df", [_compare_filter(schema[0], ">", 3)])
+
+    for selection, num_rows in [
+        (_select_row_range(1, 40), 40),
+        (_select_row_indices([30, 2, 17]), 3),
+    ]:
+        for fmt in ["csv", "tsv"]:
+            expected = dxf.export_data_selection("test_df", selection, fmt)
+
+            path = tmp_path / f"export.{fmt}"
+            result = dxf.do_json_rpc(
+                "test_df",
+                "export_data_selection",
+                selection=selection,
+                format=fmt,
+                path=str(path),
+            )
+            assert result == {"data": "", "format": fmt}
+            assert path.read_text(encoding="utf-8") == expected["data"]
+
+            # Only the first chunk has a header
+            lines = expected["data"].splitlines()
+            assert len(lines) == num_rows + 1
+            assert expected["data"].count("a") == 1
+
+
 def test_export_data_selection_with_sort(dxf: DataExplorerFixture):
     """Test that export_data_selection respects sort order for column selections."""
     # Create test DataFrames
@@ -3365,6 +4133,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 "bin_edges": ["0.00", "2.50", "5.00", "7.50", "10.00"],
                 "bin_counts": [3, 2, 3, 3],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         (
@@ -3379,6 +4148,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 ],
                 "bin_counts": [3, 2, 3, 3],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         (
@@ -3395,6 +4165,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 ],
                 "bin_counts": [1, 1, 1, 3, 2, 1],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         (
@@ -3409,6 +4180,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 ],
                 "bin_counts": [5, 0, 0, 6],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         (
@@ -3417,6 +4189,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 "bin_edges": ["0.00", "1.60", "3.20", "4.80", "6.40", "8.00"],
                 "bin_counts": [2, 2, 1, 2, 2],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         (
@@ -3425,6 +4198,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 "bin_edges": ["1.00", "1.00"],
                 "bin_counts": [11],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         (
@@ -3433,6 +4207,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 "bin_edges": ["1.00", "1.00"],
                 "bin_counts": [11],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         (
@@ -3441,6 +4216,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 "bin_edges": ["1.00", "1.00"],
                 "bin_counts": [11],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         # test decimal
@@ -3450,6 +4226,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 "bin_edges": ["1.10", "1.33", "1.55", "1.77", "2.00"],
                 "bin_counts": [3, 2, 2, 3],
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
         (
@@ -3458,6 +4235,7 @@ def test_pandas_polars_profile_histogram(dxf: DataExplorerFixture):
                 "bin_edges": [_format_float(x) for x in np.linspace(0.0, 10.0, 12)],
                 "bin_counts": [1] * 11,
                 "quantiles": [],
+                "is_approximate": False,
             },
         ),
     ]
@@ -3502,6 +4280,7 @@ def test_pandas_polars_profile_frequency_table(dxf: DataExplorerFixture):
                 "values": ["0", "1", "2"],
                 "counts": [3, 2, 2],
                 "other_count": 3,
+                "is_approximate": False,
             },
         ),
         (
@@ -3510,6 +4289,7 @@ def test_pandas_polars_profile_frequency_table(dxf: DataExplorerFixture):
                 "values": ["foo", "b0", "b1"],
                 "counts": [4, 2, 1],
                 "other_count": 2,
+                "is_approximate": False,
             },
         ),
     ]
@@ -3520,6 +4300,184 @@ def test_pandas_polars_profile_frequency_table(dxf: DataExplorerFixture):
             assert result[0]["small_frequency_table"] == ex_result
 
 
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_profiles_computed_in_single_pass(dxf: DataExplorerFixture, monkeypatch, lib):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 50, 1000).astype(float)
+    values[rng.random(1000) < 0.1] = np.nan
+    data = {
+        "a": values,
+        "b": rng.choice(["foo", "bar", "baz", "qux"], 1000),
+        "c": pd.date_range("2000-01-01", periods=1000, freq="h"),
+    }
+    if lib == "pandas":
+        test_df = pd.DataFrame(data)
+        view_class = PandasView
+    else:
+        test_df = pl.DataFrame(data).with_columns(pl.col("a").fill_nan(None))
+        view_class = PolarsView
+
+    dxf.register_table("test_df", test_df)
+    schema = dxf.get_schema("test_df")
+    dxf.set_row_filters("test_df", [_compare_filter(schema[0], ">", 10)])
+
+    def _all_profiles(column_index):
+        type_display = schema[column_index]["type_display"]
+        profiles = [{"profile_type": "null_count"}, {"profile_type": "summary_stats"}]
+        if type_display != "string":
+            profiles += [
+                {"profile_type": "small_histogram", "params": {"method": "fixed", "num_bins": 20}},
+                {
+                    "profile_type": "large_histogram",
+                    "params": {"method": "freedman_diaconis", "num_bins": 200},
+                },
+            ]
+        if type_display != "datetime":
+            profiles += [
+                {"profile_type": "small_frequency_table", "params": {"limit": 3}},
+                {"profile_type": "large_frequency_table", "params": {"limit": 10}},
+            ]
+        return _profile_request(column_index, profiles)
+
+    # Results computed one profile at a time, for comparison
+    expected = []
+    for i in range(len(schema)):
+        result = {}
+        for profile in _all_profiles(i)["profiles"]:
+            single = dxf.get_column_profiles("test_df", [_profile_request(i, [profile])])[0]
+            result.update({k: v for k, v in single.items() if v is not None})
+        expected.append(result)
+
+    get_column_calls = []
+    original_get_column = view_class._get_column  # noqa: SLF001
+
+    def _get_column(self, column_index):
+        get_column_calls.append(column_index)
+        return original_get_column(self, column_index)
+
+    monkeypatch.setattr(view_class, "_get_column", _get_column)
+
+    # The profiles computed above are cached
+    view = dxf.de_service.table_views[dxf._get_comm_id("test_df")]  # noqa: SLF001
+    view._profile_cache.clear()  # noqa: SLF001
+
+    results = dxf.get_column_profiles("test_df", [_all_profiles(i) for i in range(len(schema))])
+    assert [{k: v for k, v in r.items() if v is not None} for r in results] == expected
+
+    # Each column is materialized once for all of its profiles
+    assert sorted(get_column_calls) == list(range(len(schema)))
+
+
+def test_profiles_parallel_preserve_request_order(dxf: DataExplorerFixture):
+    # Column i has i null values
+    num_columns = 50
+    test_df = pd.DataFrame(
+        {f"c{i}": [None] * i + [1.0] * (num_columns - i) for i in range(num_columns)}
+    )
+    dxf.register_table("test_df", test_df)
+
+    # Request columns out of order, and with one repeated
+    column_indices = [*reversed(range(num_columns)), 3]
+    results = dxf.get_column_profiles("test_df", [_get_null_count(i) for i in column_indices])
+    assert [r["null_count"] for r in results] == column_indices
+
+
+def test_profiles_cancelled_before_start(dxf: DataExplorerFixture):
+    test_df = pd.DataFrame({"a": [1, 2, None], "b": ["x", None, "z"]})
+    comm_id = dxf.assign_and_open_viewer("test_df", test_df)
+    view = dxf.de_service.table_views[comm_id]
+
+    # Occupy every worker so the profile request stays pending
+    queue = dxf.de_service.job_queue
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def blocker():
+        started.release()
+        release.wait()
+
+    for _ in range(queue.max_workers):
+        queue.submit(blocker)
+        started.acquire()
+
+    callback_id = guid()
+    result = dxf.do_json_rpc(
+        "test_df",
+        "get_column_profiles",
+        callback_id=callback_id,
+        profiles=[_get_null_count(0), _get_null_count(1)],
+        format_options=DEFAULT_FORMAT,
+    )
+    assert result == {}
+
+    view.cancel_jobs()
+    release.set()
+    queue.wait_for_all()
+
+    # The request is still answered, with an error
+    comm = cast("DummyComm", view.comm)
+    replies = [
+        m["data"]["params"]
+        for m in comm.messages
+        if m["data"].get("method") == "return_column_profiles"
+        and m["data"]["params"]["callback_id"] == callback_id
+    ]
+    assert replies == [
+        {"callback_id": callback_id, "profiles": [], "error_message": "Request cancelled"}
+    ]
+
+
+@pytest.mark.parametrize("lib", ["pandas", "polars", "pyarrow"])
+def test_profiles_sampled_for_large_columns(dxf: DataExplorerFixture, monkeypatch, lib):
+    from .. import data_explorer
+
+    monkeypatch.setattr(data_explorer, "PROFILE_SAMPLE_THRESHOLD", 10_000)
+    monkeypatch.setattr(data_explorer, "PROFILE_SAMPLE_SIZE", 2_000)
+
+    rng = np.random.default_rng(0)
+    size = 50_000
+    data = {
+        "a": rng.normal(size=size),
+        # "x" is 80% of the values
+        "b": rng.choice(["x", "y", "z"], size, p=[0.8, 0.15, 0.05]),
+    }
+    if lib == "pandas":
+        test_df = pd.DataFrame(data)
+    elif lib == "polars":
+        test_df = pl.DataFrame(data)
+    else:
+        test_df = pa.table(data)
+    dxf.register_table("test_df", test_df)
+
+    histogram = {"profile_type": "small_histogram", "params": {"method": "fixed", "num_bins": 10}}
+    freq_table = {"profile_type": "small_frequency_table", "params": {"limit": 2}}
+    results = dxf.get_column_profiles(
+        "test_df", [_profile_request(0, [histogram]), _profile_request(1, [freq_table])]
+    )
+
+    # Bins span the whole column, with counts scaled up to the full size
+    hist = results[0]["small_histogram"]
+    assert float(hist["bin_edges"][0]) == pytest.approx(data["a"].min(), abs=0.01)
+    assert float(hist["bin_edges"][-1]) == pytest.approx(data["a"].max(), abs=0.01)
+    assert sum(hist["bin_counts"]) == pytest.approx(size, rel=0.01)
+
+    table = results[1]["small_frequency_table"]
+    assert table["values"] == ["x", "y"]
+    assert table["counts"][0] == pytest.approx(0.8 * size, rel=0.05)
+    assert sum(table["counts"]) + table["other_count"] == pytest.approx(size, rel=0.01)
+
+    # Sampled results are marked as estimates, unlike small columns
+    assert hist["is_approximate"]
+    assert table["is_approximate"]
+
+    dxf.register_table("small_df", test_df[:100])
+    results = dxf.get_column_profiles(
+        "small_df", [_profile_request(0, [histogram]), _profile_request(1, [freq_table])]
+    )
+    assert results[0]["small_histogram"]["is_approximate"] is False
+    assert results[1]["small_frequency_table"]["is_approximate"] is False
+
+
 def test_profile_histogram_windows_int32_bug():
     # See #5176 -- we catch errors caused by a bug in NumPy and cast
     # integer arrays to float as a fallback strategy to compute histograms
@@ -3816,6 +4774,39 @@ def test_polars_get_data_values(dxf: DataExplorerFixture):
     assert result["columns"] == []
 
 
+def test_polars_get_data_values_float_lists(dxf: DataExplorerFixture):
+    test_df = pl.DataFrame(
+        {"a": [[1.5, None], [float("nan"), float("inf")], None]},
+        schema={"a": pl.List(pl.Float64)},
+    )
+    name = guid()
+    dxf.register_table(name, test_df)
+
+    result = dxf.get_data_values(name, columns=_select_all(3, 1))
+    assert result["columns"] == [["[1.50, null]", "[NaN, INF]", _VALUE_NULL]]
+
+
+def test_polars_get_data_values_arrow(dxf: DataExplorerFixture):
+    test_df, _ = example_polars_df()
+    name = guid()
+    dxf.register_table(name, test_df)
+
+    result = dxf.get_data_values_arrow(name, columns=_select_all(10, test_df.shape[1]))
+    for i, values in enumerate(result):
+        column = test_df[:, i]
+        if column.dtype == pl.Object:
+            # Object columns are sent as formatted strings
+            assert values.to_pylist() == ["Hello", "True", None, "5"]
+        else:
+            assert pl.Series(values).to_list() == column.to_list()
+
+    dxf.set_sort_columns(name, sort_keys=[{"column_index": 2, "ascending": False}])
+    result = dxf.get_data_values_arrow(
+        name, columns=[{"column_index": 2, "spec": {"first_index": 0, "last_index": 3}}]
+    )
+    assert result[0].to_pylist() == [None, 3, 2, -1]
+
+
 def test_polars_filter_between(dxf: DataExplorerFixture):
     test_df, schema = example_polars_df()
 
@@ -4341,6 +5332,301 @@ def test_polars_profile_summary_stats(dxf: DataExplorerFixture):
         assert_summary_stats_equal(stats["type_display"], stats, ex_result)
 
 
+def example_pyarrow_table():
+    table = pa.table(
+        {
+            "a": pa.array([3, None, 1, 2, 5], type=pa.int32()),
+            "b": pa.array([1.5, np.nan, None, -2.25, 0.0]),
+            "c": pa.array(["foo", "", None, "bar", "Foo"]),
+            "d": pa.array([True, False, None, True, True]),
+            "e": pa.array(
+                [datetime.datetime(2000, 1, i + 1) for i in range(5)],  # noqa: DTZ001
+                type=pa.timestamp("ms"),
+            ),
+            "f": pa.array(["x", "y", "x", None, "x"]).dictionary_encode(),
+            "g": pa.array([[1, 2], [], None, [3], [4, None]]),
+        }
+    )
+    full_schema = [
+        ("int32", "integer"),
+        ("double", "floating"),
+        ("string", "string"),
+        ("bool", "boolean"),
+        ("timestamp[ms]", "datetime"),
+        ("dictionary<values=string, indices=int32, ordered=0>", "string"),
+        ("list<item: int64>", "array"),
+    ]
+    return table, [
+        {
+            "column_name": name,
+            "column_index": i,
+            "type_name": type_name,
+            "type_display": type_display,
+            "timezone": None,
+        }
+        for i, (name, (type_name, type_display)) in enumerate(zip(table.column_names, full_schema))
+    ]
+
+
+def test_pyarrow_get_state(dxf: DataExplorerFixture):
+    test_table, full_schema = example_pyarrow_table()
+    name = guid()
+    dxf.register_table(name, test_table)
+
+    state = dxf.get_state(name)
+    ex_shape = {"num_rows": 5, "num_columns": 7}
+    assert state["table_shape"] == ex_shape
+    assert state["table_unfiltered_shape"] == ex_shape
+    assert not state["has_row_labels"]
+
+    features = state["supported_features"]
+    assert features["search_schema"]["support_status"] == SupportStatus.Supported
+    assert features["set_row_filters"]["support_status"] == SupportStatus.Supported
+    assert features["set_sort_columns"]["support_status"] == SupportStatus.Supported
+    assert features["get_column_profiles"]["support_status"] == SupportStatus.Supported
+    assert features["export_data_selection"]["supported_formats"] == ["csv", "tsv"]
+    assert features["convert_to_code"]["support_status"] == SupportStatus.Unsupported
+
+    assert dxf.get_schema(name) == _wrap_json(ColumnSchema, full_schema)
+
+
+def test_pyarrow_get_data_values(dxf: DataExplorerFixture):
+    test_table, _ = example_pyarrow_table()
+    name = guid()
+    dxf.register_table(name, test_table)
+
+    expected_columns = [
+        ["3", _VALUE_NULL, "1", "2", "5"],
+        ["1.50", _VALUE_NAN, _VALUE_NULL, "-2.25", "0.00"],
+        ["foo", "", _VALUE_NULL, "bar", "Foo"],
+        ["True", "False", _VALUE_NULL, "True", "True"],
+        [f"2000-01-0{i + 1} 00:00:00" for i in range(5)],
+        ["x", "y", "x", _VALUE_NULL, "x"],
+        ["[1, 2]", "[]", _VALUE_NULL, "[3]", "[4, None]"],
+    ]
+
+    result = dxf.get_data_values(name, columns=_select_all(10, 7))
+    assert result["columns"] == expected_columns
+
+    result = dxf.get_data_values(
+        name, columns=[{"column_index": i, "spec": {"indices": [4, 0]}} for i in range(7)]
+    )
+    assert result["columns"] == [[col[4], col[0]] for col in expected_columns]
+
+    # Binary results are the table's own Arrow data
+    result = dxf.get_data_values_arrow(name, columns=_select_all(10, 7))
+    for values, column in zip(result, test_table.columns):
+        # equals() is False for NaN values
+        assert values.type == column.type
+        assert values.to_string() == column.to_string()
+
+    dxf.set_sort_columns(name, sort_keys=[{"column_index": 0, "ascending": False}])
+    result = dxf.get_data_values_arrow(
+        name, columns=[{"column_index": 0, "spec": {"first_index": 0, "last_index": 4}}]
+    )
+    assert result[0].to_pylist() == [5, 3, 2, 1, None]
+
+
+def test_pyarrow_filters(dxf: DataExplorerFixture):
+    pc = _pyarrow_compute()
+    test_table, schema = example_pyarrow_table()
+
+    def expected(mask):
+        return test_table.filter(pc.fill_null(mask, fill_value=False))
+
+    a, b, c = test_table["a"], test_table["b"], test_table["c"]
+    cases = [
+        ([_compare_filter(schema[0], ">=", "2")], pc.greater_equal(a, 2)),
+        ([_compare_filter(schema[0], "<", "2.5")], pc.less(a, 2.5)),
+        ([_compare_filter(schema[1], "!=", "0")], pc.not_equal(b, 0)),
+        (
+            [_compare_filter(schema[4], "<", "2000-01-03")],
+            pc.less(test_table["e"], pa.scalar(datetime.datetime(2000, 1, 3))),  # noqa: DTZ001
+        ),
+        (
+            [_between_filter(schema[0], "2", "3")],
+            pc.and_(pc.greater_equal(a, 2), pc.less_equal(a, 3)),
+        ),
+        ([_not_between_filter(schema[0], "2", "3")], pc.or_(pc.less(a, 2), pc.greater(a, 3))),
+        ([_filter("is_null", schema[0])], pc.is_null(a)),
+        ([_filter("not_null", schema[1])], pc.is_valid(b)),
+        ([_filter("is_empty", schema[2])], pc.equal(c, "")),
+        ([_filter("not_empty", schema[2])], pc.not_equal(c, "")),
+        ([_filter("is_true", schema[3])], test_table["d"]),
+        ([_filter("is_false", schema[3])], pc.invert(test_table["d"])),
+        ([_search_filter(schema[2], "foo")], pc.match_substring(c, "foo", ignore_case=True)),
+        (
+            [_search_filter(schema[2], "foo", case_sensitive=True)],
+            pc.equal(c, "foo"),
+        ),
+        ([_search_filter(schema[2], "^b", search_type="regex_match")], pc.equal(c, "bar")),
+        ([_set_member_filter(schema[0], ["1", "5"])], pc.is_in(a, pa.array([1, 5]))),
+        ([_set_member_filter(schema[5], ["y"])], pc.equal(test_table["f"].cast(pa.string()), "y")),
+        (
+            [_compare_filter(schema[0], ">", "1"), _search_filter(schema[2], "o")],
+            pc.and_(pc.greater(a, 1), pc.match_substring(c, "o", ignore_case=True)),
+        ),
+    ]
+
+    for filter_set, mask in cases:
+        dxf.check_filter_case(test_table, filter_set, expected(mask))
+
+
+def test_pyarrow_set_sort_columns(dxf: DataExplorerFixture):
+    pc = _pyarrow_compute()
+    rng = np.random.default_rng()
+    test_table = pa.table(
+        {
+            "a": rng.standard_normal(1000),
+            "b": np.tile(np.arange(2), 500),
+            "c": pa.array(np.tile(np.arange(10), 100).astype(str)).dictionary_encode(),
+            "d": pa.array([[i] for i in range(1000)]),
+        }
+    )
+    schema = dxf.get_schema_for(test_table)
+
+    cases = [
+        [("a", "ascending")],
+        [("c", "descending")],
+        [("b", "ascending"), ("a", "descending")],
+        [("c", "ascending"), ("b", "descending"), ("a", "ascending")],
+    ]
+
+    # pyarrow cannot sort dictionary-encoded columns directly
+    decoded = test_table.set_column(2, "c", test_table["c"].cast(pa.string()))
+
+    names = test_table.column_names
+    for keys in cases:
+        wrapped_keys = [
+            {"column_index": names.index(name), "ascending": order == "ascending"}
+            for name, order in keys
+        ]
+        expected = test_table.take(pc.sort_indices(decoded, sort_keys=keys))
+        dxf.check_sort_case(test_table, wrapped_keys, expected)
+
+        filtered = decoded.filter(pc.greater(decoded["a"], 0))
+        expected = filtered.take(pc.sort_indices(filtered, sort_keys=keys))
+        dxf.check_sort_case(
+            test_table,
+            wrapped_keys,
+            expected,
+            filters=[_compare_filter(schema[0], ">", "0")],
+        )
+
+
+def test_profile_cache(dxf: DataExplorerFixture, monkeypatch):
+    computed = []
+    compute_profile = PandasView._compute_profile  # noqa: SLF001
+
+    def counting_compute_profile(self, data, spec, format_options):
+        computed.append((data.column_index, spec.profile_type.value))
+        return compute_profile(self, data, spec, format_options)
+
+    monkeypatch.setattr(PandasView, "_compute_profile", counting_compute_profile)
+
+    df = pd.DataFrame({"a": np.arange(100), "b": np.arange(100.0)})
+    dxf.assign_and_open_viewer("df", df)
+
+    profiles = [_get_null_count(0), _get_histogram(0, bins=10), _get_summary_stats(1)]
+    results = dxf.get_column_profiles("df", profiles)
+    assert sorted(computed) == [(0, "null_count"), (0, "small_histogram"), (1, "summary_stats")]
+
+    # Cached, including when scrolling back after other columns
+    computed.clear()
+    dxf.get_column_profiles("df", [_get_summary_stats(0)])
+    assert dxf.get_column_profiles("df", profiles) == results
+    assert computed == [(0, "summary_stats")]
+
+    # Different params, format options or row filters are not cached
+    computed.clear()
+    dxf.get_column_profiles("df", [_get_histogram(0, bins=5)])
+    dxf.get_column_profiles(
+        "df",
+        [_get_histogram(0, bins=10)],
+        format_options=DEFAULT_FORMAT.copy(update={"large_num_digits": 3}),
+    )
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[0], ">", "49")])
+    filtered_results = dxf.get_column_profiles("df", profiles)
+    assert filtered_results != results
+    assert len(computed) == 5
+
+    computed.clear()
+    dxf.set_row_filters("df", filters=[])
+    assert dxf.get_column_profiles("df", profiles) == results
+    assert computed == []
+
+    # Profiles of unchanged columns are kept when the table is updated
+    dxf.execute_code("df = df.assign(b=df['b'] + 1)")
+    new_results = dxf.get_column_profiles("df", profiles)
+    assert new_results[:2] == results[:2]
+    assert new_results[2] != results[2]
+    assert computed == [(1, "summary_stats")]
+
+
+def test_pyarrow_profiles(dxf: DataExplorerFixture):
+    test_table, _ = example_pyarrow_table()
+    name = guid()
+    dxf.register_table(name, test_table)
+
+    results = dxf.get_column_profiles(name, [_get_null_count(i) for i in range(7)])
+    assert [r["null_count"] for r in results] == [1, 1, 1, 1, 0, 1, 1]
+
+    results = dxf.get_column_profiles(name, [_get_summary_stats(i) for i in range(5)])
+    stats = [r["summary_stats"] for r in results]
+    assert stats[0]["number_stats"] == {
+        "min_value": "1",
+        "max_value": "5",
+        "mean": "2.75",
+        "median": "2.50",
+        "stdev": "1.71",
+    }
+    assert stats[1]["number_stats"]["min_value"] == "-2.25"
+    assert stats[1]["number_stats"]["max_value"] == "1.50"
+    assert stats[2]["string_stats"] == {"num_empty": 1, "num_unique": 5}
+    assert stats[3]["boolean_stats"] == {"true_count": 3, "false_count": 1}
+    assert stats[4]["datetime_stats"]["min_date"] == "2000-01-01 00:00:00"
+    assert stats[4]["datetime_stats"]["median_date"] == "2000-01-03 00:00:00"
+
+    results = dxf.get_column_profiles(name, [_get_frequency_table(5, 1)])
+    assert results[0]["small_frequency_table"] == {
+        "values": ["x"],
+        "counts": [3],
+        "other_count": 1,
+        "is_approximate": False,
+    }
+
+    results = dxf.get_column_profiles(name, [_get_histogram(0, bins=2)])
+    assert results[0]["small_histogram"] == {
+        "bin_edges": ["1.00", "3.00", "5.00"],
+        "bin_counts": [2, 2],
+        "quantiles": [],
+        "is_approximate": False,
+    }
+
+    # Profiles respect the row filters
+    schema = dxf.get_schema(name)
+    dxf.set_row_filters(name, [_compare_filter(schema[0], ">", "2")])
+    results = dxf.get_column_profiles(name, [_get_null_count(1), _get_null_count(5)])
+    assert [r["null_count"] for r in results] == [0, 0]
+
+
+def test_pyarrow_export_data_selection(dxf: DataExplorerFixture):
+    test_table = pa.table({"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]})
+    name = guid()
+    dxf.register_table(name, test_table)
+
+    result = dxf.export_data_selection(name, _select_row_range(1, 2))
+    assert result["data"] == '"a","b"\n2,"x"\n3,"y"\n'
+
+    result = dxf.export_data_selection(name, _select_single_cell(3, 1))
+    assert result["data"] == "z"
+
+    dxf.set_sort_columns(name, sort_keys=[{"column_index": 0, "ascending": False}])
+    result = dxf.export_data_selection(name, _select_column_range(0, 0), format_="tsv")
+    assert result["data"] == '"a"\n4\n3\n2\n1\n'
+
+
 @pytest.mark.skipif(ibis is None, reason="ibis is not available")
 def test_ibis_supported_features(dxf: DataExplorerFixture):
     dxf.register_table("example", SIMPLE_IBIS_DF)
@@ -4380,6 +5666,356 @@ def test_ibis_supported_features(dxf: DataExplorerFixture):
     assert features["convert_to_code"]["support_status"] == SupportStatus.Unsupported
 
 
+def example_ibis_table():
+    # Same data as the pyarrow example, without the dictionary and list
+    # columns, to compare the results of the two views
+    test_table, _ = example_pyarrow_table()
+    test_table = test_table.select(["a", "b", "c", "d", "e"])
+    assert ibis is not None
+    return ibis.memtable(test_table), test_table
+
+
+@pytest.mark.skipif(ibis is None, reason="ibis is not available")
+def test_ibis_get_state(dxf: DataExplorerFixture):
+    # The whole table is shown, not a preview of its first rows
+    assert ibis is not None
+    test_table = ibis.memtable({"a": list(range(2500)), "b": [str(i) for i in range(2500)]})
+    name = guid()
+    dxf.register_table(name, test_table)
+
+    state = dxf.get_state(name)
+    assert state["display_name"] == name
+    assert state["table_shape"] == {"num_rows": 2500, "num_columns": 2}
+    assert state["table_unfiltered_shape"] == {"num_rows": 2500, "num_columns": 2}
+
+    schema = dxf.get_schema(name)
+    assert [(c["type_name"], c["type_display"]) for c in schema] == [
+        ("int64", "integer"),
+        ("string", "string"),
+    ]
+
+    result = dxf.get_data_values(
+        name, columns=[{"column_index": 0, "spec": {"first_index": 2498, "last_index": 2510}}]
+    )
+    assert result["columns"] == [["2498", "2499"]]
+
+    dxf.set_row_filters(name, [_compare_filter(schema[0], ">=", "2000")])
+    state = dxf.get_state(name)
+    assert state["table_shape"] == {"num_rows": 500, "num_columns": 2}
+    assert state["table_unfiltered_shape"] == {"num_rows": 2500, "num_columns": 2}
+
+
+@pytest.mark.skipif(ibis is None, reason="ibis is not available")
+def test_ibis_get_data_values(dxf: DataExplorerFixture):
+    ibis_table, arrow_table = example_ibis_table()
+    name, ex_name = guid(), guid()
+    dxf.register_table(name, ibis_table)
+    dxf.register_table(ex_name, arrow_table)
+
+    selections = [
+        _select_all(5, 5),
+        [{"column_index": i, "spec": {"first_index": 1, "last_index": 3}} for i in range(5)],
+        [{"column_index": i, "spec": {"indices": [4, 0, 2]}} for i in range(5)],
+        [
+            {"column_index": 0, "spec": {"first_index": 3, "last_index": 4}},
+            {"column_index": 2, "spec": {"indices": [1]}},
+        ],
+    ]
+    for columns in selections:
+        result = dxf.get_data_values(name, columns=columns)
+        assert result == dxf.get_data_values(ex_name, columns=columns)
+
+    result = dxf.get_data_values_arrow(
+        name, columns=[{"column_index": 0, "spec": {"first_index": 0, "last_index": 4}}]
+    )
+    assert result[0].to_pylist() == [3, None, 1, 2, 5]
+
+    dxf.set_sort_columns(name, sort_keys=[{"column_index": 0, "ascending": False}])
+    result = dxf.get_data_values_arrow(
+        name, columns=[{"column_index": 0, "spec": {"first_index": 0, "last_index": 4}}]
+    )
+    assert result[0].to_pylist() == [5, 3, 2, 1, None]
+
+
+@pytest.mark.skipif(ibis is None, reason="ibis is not available")
+def test_ibis_filters_and_sorts(dxf: DataExplorerFixture):
+    ibis_table, arrow_table = example_ibis_table()
+    schema = dxf.get_schema_for(arrow_table)
+
+    filter_cases = [
+        [_compare_filter(schema[0], ">=", "2")],
+        [_compare_filter(schema[0], "<", "2.5")],
+        [_compare_filter(schema[1], "!=", "0")],
+        [_compare_filter(schema[4], "<", "2000-01-03")],
+        [_between_filter(schema[0], "2", "3")],
+        [_not_between_filter(schema[0], "2", "3")],
+        [_filter("is_null", schema[0])],
+        [_filter("not_null", schema[1])],
+        [_filter("is_empty", schema[2])],
+        [_filter("not_empty", schema[2])],
+        [_filter("is_true", schema[3])],
+        [_filter("is_false", schema[3])],
+        [_search_filter(schema[2], "foo")],
+        [_search_filter(schema[2], "foo", case_sensitive=True)],
+        [_search_filter(schema[2], "^b", search_type="regex_match")],
+        [_search_filter(schema[2], "O", search_type="ends_with")],
+        [_set_member_filter(schema[0], ["1", "5"])],
+        [_set_member_filter(schema[0], ["1", "5"], inclusive=False)],
+        [_compare_filter(schema[0], ">", "1"), _search_filter(schema[2], "o")],
+    ]
+    sort_cases = [
+        [],
+        [{"column_index": 0, "ascending": True}],
+        [{"column_index": 4, "ascending": False}],
+    ]
+
+    for filters in filter_cases:
+        for sort_keys in sort_cases:
+            name, ex_name = guid(), guid()
+            dxf.register_table(name, ibis_table)
+            dxf.register_table(ex_name, arrow_table)
+
+            result = dxf.set_row_filters(name, filters)
+            assert result == dxf.set_row_filters(ex_name, filters)
+            assert not result["had_errors"]
+
+            dxf.set_sort_columns(name, sort_keys=sort_keys)
+            dxf.set_sort_columns(ex_name, sort_keys=sort_keys)
+            dxf.compare_tables(name, ex_name, (5, 5))
+
+
+@pytest.mark.skipif(ibis is None, reason="ibis is not available")
+def test_ibis_filter_errors(dxf: DataExplorerFixture):
+    assert ibis is not None
+    test_table = ibis.memtable({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    schema = dxf.get_schema_for(test_table)
+    name = guid()
+    dxf.register_table(name, test_table)
+
+    # The invalid regular expression is only rejected by the backend,
+    # and the other filter is still applied
+    filters = [
+        _compare_filter(schema[0], ">", "1"),
+        _search_filter(schema[1], "(", search_type="regex_match"),
+    ]
+    result = dxf.set_row_filters(name, filters)
+    assert result == {"selected_num_rows": 2, "had_errors": True}
+
+    row_filters = dxf.get_state(name)["row_filters"]
+    assert row_filters[0]["is_valid"]
+    assert not row_filters[1]["is_valid"]
+    assert row_filters[1]["error_message"]
+
+
+@pytest.mark.skipif(ibis is None, reason="ibis is not available")
+def test_ibis_profiles(dxf: DataExplorerFixture):
+    ibis_table, arrow_table = example_ibis_table()
+    name, ex_name = guid(), guid()
+    dxf.register_table(name, ibis_table)
+    dxf.register_table(ex_name, arrow_table)
+
+    def check_profiles(profiles):
+        assert dxf.get_column_profiles(name, profiles) == dxf.get_column_profiles(ex_name, profiles)
+
+    check_profiles([_get_null_count(i) for i in range(5)])
+    check_profiles([_get_frequency_table(i, 2) for i in (0, 2, 3)])
+    check_profiles([_get_histogram(0, bins=2), _get_histogram(1, bins=3)])
+    for method in ("sturges", "freedman_diaconis", "scott"):
+        check_profiles([_get_histogram(i, bins=10, method=method) for i in (0, 1, 4)])
+
+    results = dxf.get_column_profiles(name, [_get_summary_stats(i) for i in range(5)])
+    stats = [r["summary_stats"] for r in results]
+    assert stats[0]["number_stats"] == {
+        "min_value": "1",
+        "max_value": "5",
+        "mean": "2.75",
+        "median": "2.50",
+        "stdev": "1.71",
+    }
+    assert stats[1]["number_stats"]["min_value"] == "-2.25"
+    assert stats[1]["number_stats"]["max_value"] == "1.50"
+    # Unlike pyarrow, the null is not counted as a unique value
+    assert stats[2]["string_stats"] == {"num_empty": 1, "num_unique": 4}
+    assert stats[3]["boolean_stats"] == {"true_count": 3, "false_count": 1}
+    assert stats[4]["datetime_stats"]["min_date"] == "2000-01-01 00:00:00"
+    assert stats[4]["datetime_stats"]["median_date"] == "2000-01-03 00:00:00"
+
+    # Profiles respect the row filters
+    schema = dxf.get_schema(name)
+    for table_name in (name, ex_name):
+        dxf.set_row_filters(table_name, [_compare_filter(schema[0], ">", "2")])
+    check_profiles([_get_null_count(1), _get_histogram(0, bins=2)])
+
+
+@pytest.mark.skipif(ibis is None, reason="ibis is not available")
+def test_ibis_export_data_selection(dxf: DataExplorerFixture):
+    assert ibis is not None
+    test_table = ibis.memtable({"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]})
+    name = guid()
+    dxf.register_table(name, test_table)
+
+    result = dxf.export_data_selection(name, _select_row_range(1, 2))
+    assert result["data"] == '"a","b"\n2,"x"\n3,"y"\n'
+
+    result = dxf.export_data_selection(name, _select_single_cell(3, 1))
+    assert result["data"] == "z"
+
+    dxf.set_sort_columns(name, sort_keys=[{"column_index": 0, "ascending": False}])
+    result = dxf.export_data_selection(name, _select_column_range(0, 0), format_="tsv")
+    assert result["data"] == '"a"\n4\n3\n2\n1\n'
+
+
+def example_lazy_tables():
+    # Lazy tables paired with the equivalent in-memory tables, to
+    # compare the results of the views
+    test_table, _ = example_pyarrow_table()
+    test_table = test_table.select(["a", "b", "c", "d", "e"])
+    df = pl.DataFrame(test_table)
+    pairs: list[tuple[Any, Any]] = [(df.lazy(), df)]
+    if duckdb is not None:
+        pairs.append((duckdb.connect().from_arrow(test_table), test_table))
+    return pairs
+
+
+def test_lazy_get_state(dxf: DataExplorerFixture):
+    # Only the viewport is collected, and row counts are computed
+    # lazily
+    data = {"a": list(range(2500)), "b": [str(i) for i in range(2500)]}
+    lazy_tables: list[Any] = [pl.LazyFrame(data)]
+    if duckdb is not None:
+        lazy_tables.append(duckdb.connect().from_arrow(pa.table(data)))
+
+    for test_table in lazy_tables:
+        name = guid()
+        dxf.register_table(name, test_table)
+
+        state = dxf.get_state(name)
+        assert state["table_shape"] == {"num_rows": 2500, "num_columns": 2}
+
+        schema = dxf.get_schema(name)
+        assert [c["type_display"] for c in schema] == ["integer", "string"]
+
+        result = dxf.get_data_values(
+            name, columns=[{"column_index": 0, "spec": {"first_index": 2498, "last_index": 2510}}]
+        )
+        assert result["columns"] == [["2498", "2499"]]
+
+        dxf.set_row_filters(name, [_compare_filter(schema[0], ">=", "2000")])
+        state = dxf.get_state(name)
+        assert state["table_shape"] == {"num_rows": 500, "num_columns": 2}
+        assert state["table_unfiltered_shape"] == {"num_rows": 2500, "num_columns": 2}
+
+    # The user's LazyFrame is not collected to check its type
+    assert _value_type_is_supported(pl.LazyFrame(data))
+
+
+def test_lazy_get_data_values(dxf: DataExplorerFixture):
+    selections = [
+        _select_all(5, 5),
+        [{"column_index": i, "spec": {"first_index": 1, "last_index": 3}} for i in range(5)],
+        [{"column_index": i, "spec": {"indices": [4, 0, 2]}} for i in range(5)],
+    ]
+    for lazy_table, table in example_lazy_tables():
+        name, ex_name = guid(), guid()
+        dxf.register_table(name, lazy_table)
+        dxf.register_table(ex_name, table)
+
+        for columns in selections:
+            result = dxf.get_data_values(name, columns=columns)
+            assert result == dxf.get_data_values(ex_name, columns=columns)
+
+        # NaN is not equal to itself, so the floating column is skipped
+        columns = [selections[1][i] for i in (0, 2, 3, 4)]
+        result = dxf.get_data_values_arrow(name, columns=columns)
+        ex_result = dxf.get_data_values_arrow(ex_name, columns=columns)
+        assert [x.to_pylist() for x in result] == [x.to_pylist() for x in ex_result]
+
+
+def test_lazy_filters_and_sorts(dxf: DataExplorerFixture):
+    for lazy_table, table in example_lazy_tables():
+        schema = dxf.get_schema_for(table)
+
+        filter_cases = [
+            [_compare_filter(schema[0], ">=", "2")],
+            [_compare_filter(schema[4], "<", "2000-01-03")],
+            [_between_filter(schema[0], "2", "3")],
+            [_not_between_filter(schema[0], "2", "3")],
+            [_filter("is_null", schema[0])],
+            [_filter("is_empty", schema[2])],
+            [_filter("not_empty", schema[2])],
+            [_filter("is_true", schema[3])],
+            [_filter("is_false", schema[3])],
+            [_search_filter(schema[2], "foo")],
+            [_search_filter(schema[2], "^b", search_type="regex_match")],
+            [_search_filter(schema[2], "O", search_type="ends_with")],
+            [_set_member_filter(schema[0], ["1", "5"])],
+            [_set_member_filter(schema[0], ["1", "5"], inclusive=False)],
+            [_compare_filter(schema[0], ">", "1"), _search_filter(schema[2], "o")],
+        ]
+        sort_cases = [
+            [],
+            [{"column_index": 0, "ascending": True}],
+            [{"column_index": 4, "ascending": False}],
+        ]
+
+        for filters in filter_cases:
+            for sort_keys in sort_cases:
+                name, ex_name = guid(), guid()
+                dxf.register_table(name, lazy_table)
+                dxf.register_table(ex_name, table)
+
+                result = dxf.set_row_filters(name, filters)
+                assert result == dxf.set_row_filters(ex_name, filters)
+                assert not result["had_errors"]
+
+                dxf.set_sort_columns(name, sort_keys=sort_keys)
+                dxf.set_sort_columns(ex_name, sort_keys=sort_keys)
+                dxf.compare_tables(name, ex_name, (5, 5))
+
+
+def test_lazy_profiles(dxf: DataExplorerFixture):
+    for lazy_table, table in example_lazy_tables():
+        name, ex_name = guid(), guid()
+        dxf.register_table(name, lazy_table)
+        dxf.register_table(ex_name, table)
+
+        def check_profiles(profiles, name=name, ex_name=ex_name):
+            result = dxf.get_column_profiles(name, profiles)
+            assert result == dxf.get_column_profiles(ex_name, profiles)
+
+        check_profiles([_get_null_count(i) for i in range(5)])
+        check_profiles([_get_summary_stats(i) for i in range(5)])
+        check_profiles([_get_frequency_table(i, 2) for i in (0, 2, 3)])
+        check_profiles([_get_histogram(i, bins=10, method="sturges") for i in (0, 1, 4)])
+
+        # Profiles respect the row filters
+        schema = dxf.get_schema(ex_name)
+        for table_name in (name, ex_name):
+            dxf.set_row_filters(table_name, [_compare_filter(schema[0], ">", "2")])
+        check_profiles([_get_null_count(1), _get_histogram(0, bins=2)])
+
+
+def test_lazy_export_data_selection(dxf: DataExplorerFixture):
+    data = {"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]}
+    lazy_tables: list[Any] = [pl.LazyFrame(data)]
+    if duckdb is not None:
+        lazy_tables.append(duckdb.connect().from_arrow(pa.table(data)))
+
+    for test_table in lazy_tables:
+        name = guid()
+        dxf.register_table(name, test_table)
+
+        result = dxf.export_data_selection(name, _select_row_range(1, 2))
+        assert result["data"].replace('"', "") == "a,b\n2,x\n3,y\n"
+
+        result = dxf.export_data_selection(name, _select_single_cell(3, 1))
+        assert result["data"] == "z"
+
+        dxf.set_sort_columns(name, sort_keys=[{"column_index": 0, "ascending": False}])
+        result = dxf.export_data_selection(name, _select_column_range(0, 0), format_="tsv")
+        assert result["data"].replace('"', "") == "a\n4\n3\n2\n1\n"
+
+
 def test_histogram_edge_cases_empty_and_single_row(dxf: DataExplorerFixture):
     """Test histogram behavior for 0-row and 1-row DataFrames."""
     # Test 0-row DataFrames
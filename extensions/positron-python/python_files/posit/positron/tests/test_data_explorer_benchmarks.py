@@ -0,0 +1,323 @@
+#
+# Copyright (C) 2026 Posit Software, PBC. All rights reserved.
+# Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
+#
+
+"""
+Benchmarks of the data explorer RPCs on synthetic pandas and polars tables.
+
+The benchmarks are skipped unless the POSITRON_BENCHMARK environment
+variable is set, to "small" (the default grid of table shapes) or
+"full" (up to 1e8 rows and 10k columns, which needs tens of GB of
+memory). For example:
+
+    POSITRON_BENCHMARK=small \\
+    POSITRON_BENCHMARK_OUTPUT=after.json \\
+    POSITRON_BENCHMARK_BASELINE=before.json \\
+    pytest positron/tests/test_data_explorer_benchmarks.py
+
+Each RPC is timed over POSITRON_BENCHMARK_REPEAT runs (default 3) with
+the table view's caches cleared before each run, recording the fastest
+and median latency. The peak memory of one more run is measured with
+tracemalloc, which tracks allocations by Python and NumPy but not by
+polars or Arrow.
+
+Results are written as JSON to POSITRON_BENCHMARK_OUTPUT. If
+POSITRON_BENCHMARK_BASELINE names the results of an earlier run, a
+benchmark fails if its latency or peak memory grew by more than
+POSITRON_BENCHMARK_TOLERANCE (default 0.25, i.e. 25%).
+"""
+
+import functools
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from .._data_explorer_internal import LRUCache
+from ..data_explorer import DataExplorerService
+from .conftest import DummyComm, PositronShell
+from .test_data_explorer import (
+    DataExplorerFixture,
+    _between_filter,
+    _get_frequency_table,
+    _get_histogram,
+    _get_null_count,
+    _get_summary_stats,
+    _search_filter,
+    _text_search_filter,
+)
+
+BENCHMARK_SCALE = os.environ.get("POSITRON_BENCHMARK", "")
+BENCHMARK_REPEAT = int(os.environ.get("POSITRON_BENCHMARK_REPEAT", "3"))
+BENCHMARK_TOLERANCE = float(os.environ.get("POSITRON_BENCHMARK_TOLERANCE", "0.25"))
+BENCHMARK_OUTPUT = os.environ.get("POSITRON_BENCHMARK_OUTPUT")
+BENCHMARK_BASELINE = os.environ.get("POSITRON_BENCHMARK_BASELINE")
+
+# Changes smaller than these are within the noise of a single run
+LATENCY_NOISE_SECONDS = 0.005
+MEMORY_NOISE_BYTES = 1024 * 1024
+
+# (num_rows, num_columns) of the benchmarked tables
+BENCHMARK_SHAPES = {
+    "small": [
+        (1_000, 10),
+        (100_000, 10),
+        (1_000_000, 10),
+        (1_000, 1_000),
+    ],
+    "full": [
+        (1_000, 10),
+        (100_000, 10),
+        (1_000_000, 10),
+        (10_000_000, 10),
+        (100_000_000, 10),
+        (1_000, 1_000),
+        (10_000, 10_000),
+    ],
+}
+
+pytestmark = pytest.mark.skipif(
+    not BENCHMARK_SCALE, reason="Set POSITRON_BENCHMARK to run the data explorer benchmarks"
+)
+
+# The columns of the synthetic tables cycle through these types
+COLUMN_KINDS = ("int", "float", "string", "bool", "datetime", "category")
+
+TABLE_NAME = "bench"
+
+
+def _get_shapes():
+    return BENCHMARK_SHAPES.get(BENCHMARK_SCALE, BENCHMARK_SHAPES["small"])
+
+
+@functools.lru_cache(maxsize=1)
+def _make_table(lib: str, num_rows: int, num_columns: int):
+    rng = np.random.default_rng(0)
+    words = [f"word{i}" for i in range(1000)]
+
+    data = {}
+    for i in range(num_columns):
+        kind = COLUMN_KINDS[i % len(COLUMN_KINDS)]
+        if kind == "int":
+            values = rng.integers(0, 1_000_000, num_rows)
+        elif kind == "float":
+            values = rng.standard_normal(num_rows)
+            values[rng.random(num_rows) < 0.05] = np.nan
+        elif kind in ("string", "category"):
+            values = rng.integers(0, len(words), num_rows)
+        elif kind == "bool":
+            values = rng.random(num_rows) < 0.5
+        else:
+            values = np.datetime64("2020-01-01", "ms") + rng.integers(0, 10**12, num_rows).astype(
+                "timedelta64[ms]"
+            )
+        data[f"col_{i}_{kind}"] = (kind, values)
+
+    if lib == "pandas":
+        word_values = np.array(words, dtype=object)
+        columns = {}
+        for name, (kind, values) in data.items():
+            if kind == "string":
+                columns[name] = word_values[values]
+            elif kind == "category":
+                columns[name] = pd.Categorical.from_codes(values, categories=words)
+            else:
+                columns[name] = values
+        return pd.DataFrame(columns)
+    else:
+        word_values = pl.Series(words)
+        columns = []
+        for name, (kind, values) in data.items():
+            if kind == "string":
+                column = word_values.gather(values)
+            elif kind == "category":
+                column = word_values.gather(values).cast(pl.Categorical)
+            else:
+                column = pl.Series(values)
+            columns.append(column.alias(name))
+        return pl.DataFrame(columns)
+
+
+def _update_table(lib: str, table):
+    # A new version of the table with one column changed
+    name = table.columns[min(1, table.shape[1] - 1)]
+    if lib == "pandas":
+        return table.assign(**{name: table[name] * 2})
+    else:
+        return table.with_columns(pl.col(name) * 2)
+
+
+def _clear_caches(dxf: DataExplorerFixture):
+    table_view = dxf.de_service.table_views[dxf._get_comm_id(TABLE_NAME)]  # noqa: SLF001
+    for value in vars(table_view).values():
+        if isinstance(value, LRUCache):
+            value.clear()
+
+
+def _measure(run, setup=None) -> dict:
+    latencies = []
+    for _ in range(BENCHMARK_REPEAT):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    is_tracing = tracemalloc.is_tracing()
+    if not is_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    if not is_tracing:
+        tracemalloc.stop()
+
+    return {
+        "latency": min(latencies),
+        "median_latency": statistics.median(latencies),
+        "peak_memory": peak - before,
+    }
+
+
+def _find_regressions(key: str, result: dict, baseline: dict) -> list[str]:
+    if key not in baseline:
+        return []
+
+    regressions = []
+    for metric, noise in (("latency", LATENCY_NOISE_SECONDS), ("peak_memory", MEMORY_NOISE_BYTES)):
+        old, new = baseline[key][metric], result[metric]
+        if new > old * (1 + BENCHMARK_TOLERANCE) and new - old > noise:
+            regressions.append(f"{key}: {metric} regressed from {old:.6g} to {new:.6g}")
+    return regressions
+
+
+@pytest.fixture(scope="module")
+def benchmark_results():
+    results = {}
+    yield results
+
+    if BENCHMARK_OUTPUT is not None:
+        Path(BENCHMARK_OUTPUT).write_text(json.dumps(results, indent=2, sort_keys=True))
+
+
+@pytest.fixture(scope="module")
+def benchmark_baseline():
+    if BENCHMARK_BASELINE is None:
+        return {}
+    return json.loads(Path(BENCHMARK_BASELINE).read_text())
+
+
+@pytest.fixture
+def dxf(
+    shell: PositronShell,
+    de_service: DataExplorerService,
+    variables_comm: DummyComm,
+):
+    return DataExplorerFixture(shell, de_service, variables_comm)
+
+
+@pytest.mark.parametrize("shape", _get_shapes(), ids=lambda shape: f"{shape[0]}x{shape[1]}")
+@pytest.mark.parametrize("lib", ["pandas", "polars"])
+def test_data_explorer_benchmark(
+    dxf: DataExplorerFixture, benchmark_results, benchmark_baseline, lib, shape
+):
+    num_rows, num_columns = shape
+    table = _make_table(lib, num_rows, num_columns)
+    updated_table = _update_table(lib, table)
+
+    dxf.register_table(TABLE_NAME, table)
+    job_queue = dxf.de_service.job_queue
+    job_queue.wait_for_all()
+
+    # The first columns have one of each type
+    int_column, float_column, string_column = dxf.get_schema(TABLE_NAME, [0, 1, 2])
+    viewport_columns = range(min(20, num_columns))
+    profile_columns = range(min(10, num_columns))
+
+    def get_data_values():
+        first_index = num_rows // 2
+        dxf.get_data_values(
+            TABLE_NAME,
+            columns=[
+                {
+                    "column_index": i,
+                    "spec": {"first_index": first_index, "last_index": first_index + 99},
+                }
+                for i in viewport_columns
+            ],
+        )
+
+    def set_row_filters():
+        dxf.set_row_filters(
+            TABLE_NAME,
+            [
+                _between_filter(int_column, 250_000, 750_000),
+                _search_filter(string_column, "word1"),
+            ],
+        )
+
+    def reset_row_filters():
+        dxf.set_row_filters(TABLE_NAME, [])
+        _clear_caches(dxf)
+
+    def set_sort_columns():
+        dxf.set_sort_columns(
+            TABLE_NAME, [{"column_index": float_column["column_index"], "ascending": False}]
+        )
+
+    def reset_sort_columns():
+        dxf.set_sort_columns(TABLE_NAME, [])
+        _clear_caches(dxf)
+
+    def get_column_profiles():
+        profiles = []
+        for i in profile_columns:
+            kind = COLUMN_KINDS[i % len(COLUMN_KINDS)]
+            profiles.extend([_get_null_count(i), _get_summary_stats(i)])
+            if kind in ("int", "float"):
+                profiles.append(_get_histogram(i, bins=20, method="freedman_diaconis"))
+            elif kind in ("string", "category"):
+                profiles.append(_get_frequency_table(i, 10))
+        dxf.get_column_profiles(TABLE_NAME, profiles)
+
+    def search_schema():
+        dxf.search_schema(TABLE_NAME, [_text_search_filter("col_1")])
+
+    tables = [updated_table, table]
+
+    def get_updated_state():
+        # Alternate between two versions of the table so that every
+        # update changes the data
+        tables.reverse()
+        dxf.de_service.handle_variable_updated(TABLE_NAME, tables[0])
+        job_queue.wait_for_all()
+
+    rpcs = {
+        "get_data_values": (get_data_values, None),
+        "set_row_filters": (set_row_filters, reset_row_filters),
+        "set_sort_columns": (set_sort_columns, reset_sort_columns),
+        "get_column_profiles": (get_column_profiles, lambda: _clear_caches(dxf)),
+        "search_schema": (search_schema, None),
+        "get_updated_state": (get_updated_state, None),
+    }
+
+    regressions = []
+    for rpc, (run, setup) in rpcs.items():
+        key = f"{lib}-{num_rows}x{num_columns}-{rpc}"
+        result = _measure(run, setup)
+        benchmark_results[key] = result
+        regressions.extend(_find_regressions(key, result, benchmark_baseline))
+
+    if regressions:
+        pytest.fail("\n".join(regressions))
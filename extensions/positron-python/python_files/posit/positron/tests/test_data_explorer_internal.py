@@ -5,13 +5,27 @@ Tests the Polars-based histogram implementation and verifies consistency
 with NumPy implementation across various data types and edge cases.
 """
 
+import math
+
+import numpy as np
 import polars as pl
+import pyarrow as pa
 import pytest
 
 from positron._data_explorer_internal import (
+    ColumnSearchIndex,
+    ColumnSortIndex,
+    DictionaryEncoding,
+    LRUCache,
+    RowRange,
+    _array_digest,
     _get_histogram_method,
+    _get_histogram_num_bins,
     _get_histogram_numpy,
     _get_histogram_polars,
+    _mask_to_row_indices,
+    _multi_key_sort_order,
+    get_text_search_pattern,
 )
 
 
@@ -384,3 +398,291 @@ def test_histogram_integer_precision_loss():
     # Should handle precision edge cases
     _assert_histogram_valid(close_values, bin_counts, bin_edges)
     assert len(bin_counts) == 10
+
+
+@pytest.mark.parametrize("method", ["fixed", "sturges", "fd", "scott"])
+def test_histogram_num_bins_matches_numpy(method):
+    """Test that the number of bins from aggregate statistics matches NumPy's binning."""
+    rng = np.random.default_rng(42)
+    test_distributions = [
+        rng.uniform(0, 10, 1000),
+        rng.standard_normal(1000),
+        rng.exponential(2, 800),
+        rng.integers(0, 100, 500),
+        rng.integers(0, 5, 1000),
+        np.array([1, 1, 1, 2]),
+    ]
+
+    for values in test_distributions:
+        for num_bins in [5, 20, 200]:
+            bin_counts, _ = _get_histogram_numpy(values, num_bins, method=method)
+            q1, q3 = np.percentile(values, [25, 75])
+            assert _get_histogram_num_bins(
+                method,
+                num_bins,
+                len(values),
+                values.min(),
+                values.max(),
+                iqr=q3 - q1,
+                std=values.std(),
+                is_integer=issubclass(values.dtype.type, np.integer),
+            ) == len(bin_counts)
+
+
+def test_lru_cache_eviction():
+    """Test that the least recently used entries are evicted beyond the memory budget."""
+    cache = LRUCache(max_bytes=300)
+    cache.put("a", 1, nbytes=100)
+    cache.put("b", 2, nbytes=100)
+    cache.put("c", 3, nbytes=100)
+    assert cache.nbytes == 300
+
+    # Using "a" makes "b" the least recently used
+    assert cache.get("a") == 1
+    cache.put("d", 4, nbytes=100)
+    assert "b" not in cache
+    assert [cache.get(k) for k in ["a", "c", "d"]] == [1, 3, 4]
+
+    # Replacing an entry updates its size
+    cache.put("a", 5, nbytes=200)
+    assert cache.get("a") == 5
+    assert len(cache) == 2
+    assert cache.nbytes == 300
+
+    # Values larger than the budget are not cached
+    cache.put("e", 6, nbytes=301)
+    assert cache.get("e") is None
+    assert cache.get("e", "missing") == "missing"
+
+    assert cache.pop("a") == 5
+    assert cache.nbytes == 100
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_lru_cache_estimates_size():
+    """Test that value sizes are estimated for NumPy and Polars values."""
+    cache = LRUCache(max_bytes=10_000)
+    cache.put("numpy", np.zeros(1000, dtype=bool))
+    assert cache.nbytes == 1000
+
+    series = pl.Series([1, 2, 3], dtype=pl.Int64)
+    cache.put("polars", series)
+    assert cache.nbytes == 1000 + series.estimated_size()
+
+
+def _reference_sort_order(all_ranks, ascending, nulls_last, row_mask=None):
+    """Stable sort order of the rows by sorting tuples of keys."""
+    rows = range(len(all_ranks[0])) if row_mask is None else np.flatnonzero(row_mask)
+
+    def _key(ranks, asc, row):
+        if ranks[row] < 0:
+            return math.inf if nulls_last else -math.inf
+        return ranks[row] if asc else -ranks[row]
+
+    def _row_key(row):
+        return tuple(_key(ranks, asc, row) for ranks, asc in zip(all_ranks, ascending))
+
+    # sorted is stable
+    return sorted(rows, key=_row_key)
+
+
+def _make_sort_index(ranks, *, nulls_last):
+    order = np.argsort(ranks, kind="stable")
+    num_nulls = int((ranks < 0).sum())
+    if nulls_last:
+        order = np.concatenate([order[num_nulls:], order[:num_nulls]])
+    return ColumnSortIndex(order, num_nulls, lambda: ranks, nulls_last=nulls_last)
+
+
+@pytest.mark.parametrize("nulls_last", [True, False])
+def test_column_sort_index(nulls_last):
+    """Test sort orders from a ColumnSortIndex against a reference sort."""
+    rng = np.random.default_rng(0)
+    ranks = rng.integers(-1, 5, 200)
+    row_mask = rng.random(200) < 0.3
+
+    sort_index = _make_sort_index(ranks, nulls_last=nulls_last)
+    for ascending in [True, False]:
+        for mask in [None, row_mask]:
+            expected = _reference_sort_order([ranks], [ascending], nulls_last, mask)
+            result = sort_index.get_order(ascending=ascending, row_mask=mask)
+            np.testing.assert_array_equal(result, expected)
+
+    # All values unique
+    unique_ranks = rng.permutation(50)
+    sort_index = _make_sort_index(unique_ranks, nulls_last=nulls_last)
+    np.testing.assert_array_equal(
+        sort_index.get_order(ascending=False), np.argsort(unique_ranks)[::-1]
+    )
+
+
+@pytest.mark.parametrize("nulls_last", [True, False])
+def test_multi_key_sort_order(nulls_last):
+    """Test breaking ties in multi-key sorts against a reference sort."""
+    rng = np.random.default_rng(1)
+    all_ranks = [rng.integers(-1, 3, 300), rng.integers(-1, 4, 300), rng.integers(0, 50, 300)]
+    row_mask = rng.random(300) < 0.5
+    sort_indexes = [_make_sort_index(r, nulls_last=nulls_last) for r in all_ranks]
+
+    for ascending in [[True, True, True], [False, True, False], [False, False, True]]:
+        for mask in [None, row_mask]:
+            expected = _reference_sort_order(all_ranks, ascending, nulls_last, mask)
+            result = _multi_key_sort_order(sort_indexes, ascending, row_mask=mask)
+            np.testing.assert_array_equal(result, expected)
+
+
+def test_column_search_index():
+    names = ["Alpha", "alphabet", "beta", "ALP", "gamma_alpha", "al"]
+    types = ["integer", "string", "integer", "floating", "string", "integer"]
+    calls = []
+
+    def get_type_display(i):
+        calls.append(i)
+        return types[i]
+
+    index = ColumnSearchIndex(names, get_type_display)
+    assert len(index) == 6
+
+    # Terms shorter and longer than the n-gram length
+    for term in ["", "a", "al", "alp", "alpha", "ALPHA", "pha", "bet", "xyz"]:
+        for case_sensitive in [False, True]:
+            result = index.search(term, case_sensitive=case_sensitive)
+            if case_sensitive:
+                expected = [i for i, name in enumerate(names) if term in name]
+            else:
+                expected = [i for i, name in enumerate(names) if term.lower() in name.lower()]
+            assert result == expected
+
+    # Searching within previous matches
+    assert index.search("alph", case_sensitive=False, candidates=[0, 3, 4]) == [0, 4]
+
+    # Type displays are only computed for the candidates, once
+    assert index.match_types(["string"], candidates=[0, 1]) == [1]
+    assert index.match_types(["string", "floating"]) == [1, 3, 4]
+    assert sorted(calls) == list(range(6))
+
+
+def test_array_digest():
+    values = np.arange(1000, dtype=np.int64)
+    digest = _array_digest(values)
+    assert _array_digest(values.copy()) == digest
+
+    changed = values.copy()
+    changed[505] = -1
+    assert _array_digest(changed) != digest
+
+    # Object arrays are checksummed on the identities of the elements
+    objects = np.array([[1], [2], None], dtype=object)
+    digest = _array_digest(objects)
+    assert _array_digest(objects.copy()) == digest
+    objects[0] = [1]
+    assert _array_digest(objects) != digest
+
+    assert _array_digest(np.array([], dtype=np.float64)) == 0
+
+
+def test_dictionary_encoding():
+    dictionary = np.array([None, "a", "b", "c"], dtype=object)
+    codes = np.array([0, 2, -1, 0, 0, 1, -1])
+    encoding = DictionaryEncoding(codes, dictionary)
+
+    assert encoding.codes.dtype == np.int8
+    assert encoding.value_counts().tolist() == [3, 1, 1]
+    assert encoding.value_counts(np.array([1, 2, 5])).tolist() == [0, 1, 1]
+
+    values = np.array([x is not None and x > "a" for x in dictionary])
+    assert encoding.map_values(values).tolist() == [False, True, False, False, False, True, False]
+    assert encoding.map_values(values, np.array([1, 5, 6])).tolist() == [True, True, False]
+
+    # Larger dictionaries use wider codes
+    encoding = DictionaryEncoding(np.arange(1000), np.arange(1001))
+    assert encoding.codes.dtype == np.int16
+    assert encoding.value_counts().tolist() == [1] * 1000
+
+
+@pytest.mark.parametrize(
+    ("search_type", "term", "case_sensitive", "expected"),
+    [
+        ("contains", "a.b", False, [True, True, False, False, False]),
+        ("contains", "a.b", True, [True, False, False, False, False]),
+        ("not_contains", "a.b", False, [False, False, True, True, False]),
+        ("starts_with", "A.", False, [True, False, False, False, False]),
+        ("ends_with", "B(", False, [False, True, False, False, False]),
+        ("ends_with", "b", True, [True, False, True, True, False]),
+        ("regex_match", "a.b", False, [True, True, True, False, False]),
+        ("regex_match", "^x", True, [False, True, True, False, False]),
+    ],
+)
+def test_text_search_pattern(search_type, term, case_sensitive, expected):
+    values = ["a.b", "xA.B(", "xaxb", "b", None]
+    pattern = get_text_search_pattern(search_type, term, case_sensitive=case_sensitive)
+    assert pattern is get_text_search_pattern(search_type, term, case_sensitive=case_sensitive)
+
+    # Terms are matched literally and nulls never match, on every backend
+    assert pattern.python_mask(values).tolist() == expected
+    assert pattern.arrow_mask(pa.array(values)).to_pylist() == expected
+    mask = pattern.polars_mask(pl.Series(values, dtype=pl.String)).fill_null(value=False)
+    assert mask.to_list() == expected
+
+
+def test_text_search_pattern_match_start():
+    values = ["foo", "xfoo", "FOO", None]
+    pattern = get_text_search_pattern("regex_match", "f|o+", case_sensitive=False, match_start=True)
+    expected = [True, False, True, False]
+    assert pattern.python_mask(values).tolist() == expected
+    assert pattern.arrow_mask(pa.chunked_array([values[:2], values[2:]])).to_pylist() == expected
+
+    # Patterns that Arrow does not support fall back to Python regexes
+    pattern = get_text_search_pattern("regex_match", "f(?!oo)", case_sensitive=True)
+    assert pattern.arrow_mask(pa.array(["foo", "fa", None])).to_pylist() == [False, True, False]
+
+    with pytest.raises(Exception, match="unterminated"):
+        get_text_search_pattern("regex_match", "f(", case_sensitive=True)
+
+
+def test_mask_to_row_indices(monkeypatch):
+    from .. import _data_explorer_internal
+
+    monkeypatch.setattr(_data_explorer_internal, "_MASK_TO_INDICES_CHUNK_SIZE", 7)
+
+    mask = np.zeros(50, dtype=bool)
+    np.testing.assert_array_equal(_mask_to_row_indices(mask), [])
+
+    mask[10:30] = True
+    assert _mask_to_row_indices(mask) == RowRange(10, 30)
+
+    mask[[3, 45]] = True
+    mask[20] = False
+    indices = _mask_to_row_indices(mask)
+    assert indices.dtype == np.uint32
+    np.testing.assert_array_equal(indices, np.flatnonzero(mask))
+
+
+def test_row_range():
+    rows = RowRange(10, 20)
+    assert len(rows) == 10
+    assert rows.dtype == np.uint32
+    np.testing.assert_array_equal(rows, np.arange(10, 20))
+
+    assert rows[2:5] == RowRange(12, 15)
+    assert rows[8:20] == RowRange(18, 20)
+    np.testing.assert_array_equal(rows[5:2], [])
+    np.testing.assert_array_equal(rows[::3], [10, 13, 16, 19])
+    assert rows[3] == 13
+    assert rows[-1] == 19
+
+    np.testing.assert_array_equal(rows.take([4, 0]), [14, 10])
+    assert rows.take(RowRange(1, 3)) == RowRange(11, 13)
+    mask = np.zeros(10, dtype=bool)
+    mask[[1, 2, 3]] = True
+    assert rows[mask] == RowRange(11, 14)
+    mask[5] = True
+    np.testing.assert_array_equal(rows[mask], [11, 12, 13, 15])
+
+    with pytest.raises(IndexError):
+        rows.take([10])
+    with pytest.raises(IndexError):
+        rows[10]
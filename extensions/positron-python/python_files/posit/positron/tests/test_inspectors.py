@@ -12,6 +12,7 @@ from typing import Any, Callable, Iterable, Optional, Tuple
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 from fastcore.foundation import L
 
@@ -51,6 +52,11 @@ try:
 except ImportError:
     ibis = None
 
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
 
 def verify_inspector(
     *,
@@ -102,12 +108,20 @@ def verify_inspector(
                     "equals must work in both directions for change detection"
                 )
 
+                # Check that the fingerprint, if supported, is stable.
+                fingerprint = copied_inspector.get_fingerprint()
+                assert copied_inspector.get_fingerprint() == fingerprint
+
                 # Mutate the copied object, and check that the original object was not mutated.
                 assert mutate is not None, (
                     "mutate function must be provided to test mutable objects"
                 )
                 mutate(copied)
                 assert not inspector.equals(copied)
+
+                # Check that mutating the object changed its fingerprint.
+                if fingerprint is not None:
+                    assert get_inspector(copied).get_fingerprint() != fingerprint
             else:
                 # Deepcopying an immutable object should return the exact same object.
 
@@ -809,6 +823,24 @@ def test_inspect_polars_dataframe(value: pl.DataFrame) -> None:
     )
 
 
+def test_inspect_pyarrow_table() -> None:
+    value = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    rows, cols = value.shape
+    verify_inspector(
+        value=value,
+        display_value=f"[{rows} rows x {cols} columns] pyarrow.Table",
+        kind=VariableKind.Table,
+        display_type=f"Table [{rows}x{cols}]",
+        type_info=get_type_as_str(value),
+        has_children=True,
+        has_viewer=True,
+        is_truncated=True,
+        length=cols,
+        mutable=False,
+    )
+    assert get_inspector(value).to_plaintext() == '"a"\t"b"\n1\t"x"\n2\t"y"\n3\t"z"\n'
+
+
 @pytest.mark.parametrize(
     "value",
     [
@@ -842,6 +874,7 @@ def test_inspect_polars_series(value: pl.Series) -> None:
         (pl.Series([0, 1]), range(2)),
         (pd.DataFrame({"a": [1, 2], "b": ["3", "4"]}), range(2)),
         (pl.DataFrame({"a": [1, 2], "b": ["3", "4"]}), ["a", "b"]),
+        (pa.table({"a": [1, 2], "b": ["3", "4"]}), ["a", "b"]),
         (pd.Index([0, 1]), range(2)),
         (
             pd.Index(
@@ -942,6 +975,45 @@ def test_inspect_ibis_exprs() -> None:
     )
 
 
+def test_inspect_polars_lazyframe() -> None:
+    value = pl.LazyFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    verify_inspector(
+        value=value,
+        display_value="[2 columns] polars.LazyFrame",
+        kind=VariableKind.Table,
+        display_type="LazyFrame [2 columns]",
+        type_info=get_type_as_str(value),
+        has_children=True,
+        is_truncated=True,
+        length=2,
+        mutable=False,
+        has_viewer=True,
+    )
+
+
+@pytest.mark.skipif(duckdb is None, reason="duckdb not available")
+def test_inspect_duckdb_relation() -> None:
+    assert duckdb
+    value = duckdb.connect().from_arrow(pa.table({"a": [1, 2, 3], "b.c": ["x", "y", "z"]}))
+
+    verify_inspector(
+        value=value,
+        display_value="[2 columns] duckdb.DuckDBPyRelation",
+        kind=VariableKind.Table,
+        display_type="DuckDBPyRelation [2 columns]",
+        type_info=get_type_as_str(value),
+        has_children=True,
+        is_truncated=True,
+        length=2,
+        mutable=False,
+        has_viewer=True,
+    )
+
+    child = get_inspector(value).get_child("b.c")
+    assert child.columns == ["b.c"]
+
+
 # TODO(wesm): these size values are only currently used for computing
 # comparison costs. We should align on # of cells vs. # of bytes for
 # these comparisons (possibly based on more experiments)
@@ -1066,3 +1138,21 @@ def test_iterators_not_consumed(iterator_factory: Callable) -> None:
         f"Iterator {type(iterator).__name__} was consumed during inspection. "
         f"Expected first element but got StopIteration."
     )
+
+
+@pytest.mark.parametrize("hasher", ["xxhash", "crc32"])
+def test_fingerprint_hash_buffers(monkeypatch, hasher: str) -> None:
+    # Buffers are hashed with xxhash if it's installed, or zlib.crc32 otherwise
+    xxhash = pytest.importorskip("xxhash") if hasher == "xxhash" else None
+    monkeypatch.setattr(inspectors, "_get_xxhash", lambda: xxhash)
+
+    value = np.arange(1000)
+    fingerprint = get_inspector(value).get_fingerprint()
+    assert get_inspector(value).get_fingerprint() == fingerprint
+
+    value[500] = -1
+    assert get_inspector(value).get_fingerprint() != fingerprint
+
+    buffers = [b"abc", memoryview(b"def")]
+    assert inspectors._hash_buffers(buffers) == inspectors._hash_buffers([b"abc", b"def"])  # noqa: SLF001
+    assert inspectors._hash_buffers(buffers) != inspectors._hash_buffers([b"abd", b"def"])  # noqa: SLF001
@@ -3,9 +3,11 @@
 # Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
 #
 
+import threading
+
 import pytest
 
-from positron.utils import get_qualname
+from positron.utils import BackgroundJobQueue, get_qualname
 
 
 class BadGetAttrImpl:
@@ -22,3 +24,112 @@ def test_get_qualname_handles_bad_class(value) -> None:
     # qualname should be a valid string and not raise any errors
     assert isinstance(qualname, str), f"Expected string, got {type(qualname)}"
     assert qualname == "positron.tests.test_utils.BadGetAttrImpl"
+
+
+def test_background_job_queue_priority() -> None:
+    queue = BackgroundJobQueue(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def blocker():
+        started.set()
+        release.wait()
+
+    # Occupy the only worker so that the other jobs are queued
+    queue.submit(blocker)
+    started.wait()
+    queue.submit(order.append, "low")
+    queue.submit(order.append, "high", priority=10)
+    queue.submit(order.append, "low2")
+    release.set()
+    queue.wait_for_all()
+
+    assert order == ["high", "low", "low2"]
+
+
+def test_background_job_queue_cancel() -> None:
+    queue = BackgroundJobQueue(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    ran = []
+
+    def job(name):
+        token = queue.current_token()
+        started.set()
+        release.wait()
+        token.raise_if_cancelled()
+        ran.append(name)
+
+    running = queue.submit(job, "running", key=("comm1", "a"))
+    started.wait()
+    pending = queue.submit(job, "pending", key=("comm1", "b"))
+    other = queue.submit(job, "other", key=("comm2", "c"))
+
+    queue.cancel_group("comm1")
+    release.set()
+    queue.wait_for_all()
+
+    # The running job stops at its next check, and the pending job never runs
+    assert running.result() is None
+    assert pending.cancelled()
+    assert not other.cancelled()
+    assert ran == ["other"]
+
+
+def test_background_job_queue_on_cancel() -> None:
+    queue = BackgroundJobQueue(max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+    cancelled = []
+
+    def blocker():
+        started.set()
+        release.wait()
+
+    queue.submit(blocker)
+    started.wait()
+    pending = queue.submit(
+        lambda: None, key=("comm1", "a"), on_cancel=lambda: cancelled.append("a")
+    )
+    queue.submit(lambda: None, key=("comm2", "b"), on_cancel=lambda: cancelled.append("b"))
+
+    # Only the job cancelled before it starts gets its on_cancel callback
+    queue.cancel_group("comm1")
+    release.set()
+    queue.wait_for_all()
+
+    assert pending.cancelled()
+    assert cancelled == ["a"]
+
+
+def test_background_job_queue_resubmit_after_cancel() -> None:
+    queue = BackgroundJobQueue(max_workers=2)
+    started = threading.Event()
+    release = threading.Event()
+    ran = []
+
+    def job(name):
+        token = queue.current_token()
+        if name == "old":
+            started.set()
+            release.wait()
+        token.raise_if_cancelled()
+        ran.append(name)
+
+    key = ("comm1", "a")
+    old = queue.submit(job, "old", key=key)
+    started.wait()
+
+    # The job submitted after the cancellation runs, while the
+    # cancelled job is still blocked
+    queue.cancel(key)
+    new = queue.submit(job, "new", key=key)
+    try:
+        new.result(timeout=5)
+        assert ran == ["new"]
+    finally:
+        release.set()
+    queue.wait_for_all()
+    assert old.result() is None
+    assert ran == ["new"]
@@ -17,6 +17,7 @@ import pytest
 
 from positron import variables as variables_module
 from positron.access_keys import encode_access_key
+from positron.inspectors import get_inspector
 from positron.positron_comm import JsonRpcErrorCode
 from positron.utils import JsonData, JsonRecord, not_none
 from positron.variables import VariablesService, _summarize_variable
@@ -59,7 +60,7 @@ def test_comm_open(kernel: PositronIPyKernel) -> None:
     # Check that the comm_open and empty refresh messages were sent
     assert variables_comm.messages == [
         comm_open_message(TARGET_NAME),
-        json_rpc_notification("refresh", {"variables": [], "length": 0, "version": 0}),
+        json_rpc_notification("refresh", {"variables": [], "length": 0, "version": 1}),
     ]
 
 
@@ -169,6 +170,38 @@ def test_no_update_for_empty_cell(
     assert variables_comm.messages == []
 
 
+@pytest.mark.asyncio
+async def test_update_deferred_until_after_request(
+    shell: PositronShell, kernel: PositronIPyKernel, variables_comm: DummyComm
+) -> None:
+    # Simulate an execute request handled by the kernel.
+    kernel.pre_handler_hook()
+    shell.run_cell("x = 1").raise_error()
+    kernel.post_handler_hook()
+
+    # The update is sent once the kernel yields to the event loop after replying.
+    assert variables_comm.messages == []
+    await asyncio.sleep(0)
+    assert variables_comm.messages == [update_notification(shell, assigned=["x"])]
+
+
+def test_deferred_update_flushed_before_snapshot(
+    shell: PositronShell, kernel: PositronIPyKernel, variables_comm: DummyComm
+) -> None:
+    kernel.pre_handler_hook()
+    shell.run_cell("x = 1").raise_error()
+    assert variables_comm.messages == []
+
+    # The next execution sends the deferred update before snapshotting the namespace.
+    shell.run_cell("y = 2").raise_error()
+    assert variables_comm.messages == [update_notification(shell, assigned=["x"])]
+    variables_comm.messages.clear()
+
+    # Without a running event loop, the deferred update is sent right after the request.
+    kernel.post_handler_hook()
+    assert variables_comm.messages == [update_notification(shell, assigned=["y"])]
+
+
 def _assert_assigned(
     shell: PositronShell, value_code: str, varname: str, variables_comm: DummyComm, update_type: str
 ):
@@ -201,7 +234,8 @@ def update_notification(
             "assigned": summarize(assigned),
             "removed": summarize(removed),
             "unevaluated": summarize(unevaluated),
-            "version": 0,
+            # The version of the latest event sent by the service
+            "version": shell.kernel.variables_service._version,  # noqa: SLF001
         },
     )
 
@@ -214,8 +248,76 @@ def _import_library(shell: PositronShell, import_code: str):
         shell.run_cell(import_code)
 
 
+@pytest.mark.parametrize(
+    ("import_code", "value_code", "mutate_code"),
+    [
+        pytest.param(
+            "import numpy as np",
+            f" = np.arange({BIG_ARRAY_LENGTH})",
+            "[0] = -1",
+            id="numpy",
+        ),
+        pytest.param(
+            "import pandas as pd",
+            f" = pd.DataFrame({{'a': range({BIG_ARRAY_LENGTH})}})",
+            ".iloc[0, 0] = -1",
+            id="pandas_dataframe",
+        ),
+        pytest.param(
+            "import pandas as pd",
+            " = pd.DataFrame({'a': ['x', 'y'], 'b': pd.Categorical(['x', 'y'])})",
+            ".loc[0, 'b'] = 'y'",
+            id="pandas_dataframe_categorical",
+        ),
+        pytest.param(
+            "import pandas as pd",
+            " = pd.DataFrame({'a': ['x', 'y']})",
+            ".loc[0, 'a'] = 'z'",
+            id="pandas_dataframe_string",
+        ),
+        pytest.param(
+            "import pandas as pd",
+            " = pd.DataFrame({'a': [1, 2]})",
+            ".index.name = 'index'",
+            id="pandas_dataframe_index_name",
+        ),
+        pytest.param(
+            "import pandas as pd",
+            f" = pd.Series(range({BIG_ARRAY_LENGTH}))",
+            ".iloc[-1] = -1",
+            id="pandas_series",
+        ),
+    ],
+)
+@pytest.mark.parametrize("varname", ["x", "_"])
+def test_change_detection_fingerprint(
+    import_code: str,
+    value_code: str,
+    mutate_code: str,
+    varname: str,
+    shell: PositronShell,
+    variables_comm: DummyComm,
+) -> None:
+    """Test change detection of mutable objects that are fingerprinted instead of copied."""
+    _import_library(shell, import_code)
+
+    shell.run_cell(varname + value_code).raise_error()
+    variables_comm.messages.clear()
+
+    # No update is sent when the object is unchanged.
+    shell.run_cell("None").raise_error()
+    assert variables_comm.messages == []
+
+    # Mutating the object in place is detected.
+    _assert_assigned(shell, mutate_code, varname, variables_comm, "assigned")
+
+
 @pytest.mark.parametrize("varname", ["x", "_"])
-def test_change_detection_over_limit(shell: PositronShell, variables_comm: DummyComm, varname: str):
+def test_change_detection_over_limit(
+    shell: PositronShell, variables_comm: DummyComm, varname: str, monkeypatch
+):
+    # Disable fingerprinting to fall back to copy-and-compare.
+    monkeypatch.setattr(variables_module, "MAX_SNAPSHOT_FINGERPRINT_BUDGET", 0)
     _import_library(shell, "import numpy as np")
 
     big_array = f" = np.arange({BIG_ARRAY_LENGTH})"
@@ -262,7 +364,7 @@ large_list = [sample_dict for _ in range(1_000_000)]
     )
 
 
-def _do_list(variables_comm: DummyComm):
+def _do_list(variables_comm: DummyComm, version: int = 1):
     msg = json_rpc_request("list", comm_id="dummy_comm_id")
     variables_comm.handle_msg(msg)
 
@@ -272,7 +374,8 @@ def _do_list(variables_comm: DummyComm):
             {
                 "variables": ANY,
                 "length": ANY,
-                "version": 0,
+                # Defaults to the version of the refresh sent when the comm was opened
+                "version": version,
             }
         )
     ]
@@ -306,6 +409,132 @@ def test_list_1000(shell: PositronShell, variables_comm: DummyComm) -> None:
     assert variables[999].get("display_name") == "var998"
 
 
+def _do_list_range(variables_comm: DummyComm, start: int, count: int) -> JsonRecord:
+    msg = json_rpc_request("list_range", {"start": start, "count": count}, comm_id="dummy_comm_id")
+    variables_comm.handle_msg(msg)
+
+    result = variables_comm.messages[-1]["data"]["result"]
+    variables_comm.messages.clear()
+
+    return result
+
+
+def _display_names(result: JsonRecord) -> list[str]:
+    variables = cast("list[JsonRecord]", result["variables"])
+    return [cast("str", variable["display_name"]) for variable in variables]
+
+
+def test_list_range(
+    shell: PositronShell, kernel: PositronIPyKernel, variables_comm: DummyComm
+) -> None:
+    shell.run_cell("\n".join(f"var{j:03d} = {j}" for j in reversed(range(100)))).raise_error()
+    shell.run_cell("import os").raise_error()
+    variables_comm.messages.clear()
+
+    # Variables are sorted by name, and modules are excluded
+    result = _do_list_range(variables_comm, 10, 5)
+    assert result["start"] == 10
+    assert result["length"] == 100
+    assert result["version"] == 2
+    assert _display_names(result) == [f"var{j:03d}" for j in range(10, 15)]
+
+    # Ranges are clipped to the variables
+    result = _do_list_range(variables_comm, 98, 5)
+    assert _display_names(result) == ["var098", "var099"]
+    result = _do_list_range(variables_comm, 200, 5)
+    assert result["start"] == 100
+    assert result["variables"] == []
+
+    # Updates are applied to the sorted names, and bump the version
+    shell.run_cell("del var010\nvar010a = 0").raise_error()
+    variables_comm.messages.clear()
+    result = _do_list_range(variables_comm, 9, 3)
+    assert result["length"] == 100
+    assert result["version"] == 3
+    assert _display_names(result) == ["var009", "var010a", "var011"]
+
+    # A deferred update is sent before the range that reflects it
+    kernel.pre_handler_hook()
+    shell.run_cell("var100 = 100").raise_error()
+    msg = json_rpc_request("list_range", {"start": 100, "count": 1}, comm_id="dummy_comm_id")
+    variables_comm.handle_msg(msg)
+    kernel.post_handler_hook()
+    assert variables_comm.messages == [
+        update_notification(shell, assigned=["var100"]),
+        json_rpc_response(
+            {
+                "variables": [not_none(_summarize_variable("var100", 100)).dict()],
+                "start": 100,
+                "length": 101,
+                "version": 4,
+            }
+        ),
+    ]
+    variables_comm.messages.clear()
+
+    # Variables changed without an update are found by rebuilding the sorted names
+    del shell.user_ns["var001"]
+    shell.user_ns["var000a"] = 0
+    result = _do_list_range(variables_comm, 0, 3)
+    assert result["length"] == 101
+    assert result["version"] == 4
+    assert _display_names(result) == ["var000", "var000a", "var002"]
+
+
+@pytest.mark.parametrize(
+    ("value_code", "mutate_code"),
+    [
+        pytest.param("(1, 'a', None)", None, id="tuple"),
+        pytest.param("'a' * 1000", None, id="string"),
+        pytest.param("np.arange(10)", "x[0] = -1", id="numpy"),
+        pytest.param("pd.DataFrame({'a': range(10)})", "x.iloc[0, 0] = -1", id="pandas_dataframe"),
+    ],
+)
+def test_summary_cache(
+    value_code: str,
+    mutate_code: str | None,
+    shell: PositronShell,
+    variables_service: VariablesService,
+    variables_comm: DummyComm,
+    monkeypatch,
+) -> None:
+    shell.run_cell("import numpy as np\nimport pandas as pd").raise_error()
+    shell.run_cell(f"x = {value_code}").raise_error()
+    variables_comm.messages.clear()
+    value = shell.user_ns["x"]
+    expected = not_none(_summarize_variable("x", value))
+
+    # Count the display values computed for the variable
+    inspector_class = type(get_inspector(value))
+    get_display_value = inspector_class.get_display_value
+    summarized = []
+
+    def counting_get_display_value(self, **kwargs):
+        if self.value is shell.user_ns.get("x"):
+            summarized.append(self.value)
+        return get_display_value(self, **kwargs)
+
+    monkeypatch.setattr(inspector_class, "get_display_value", counting_get_display_value)
+
+    # The summary sent in the update is reused
+    assert _do_list(variables_comm, version=2)["variables"] == [expected]
+    assert summarized == []
+
+    if mutate_code is not None:
+        # A mutated value is summarized again, once
+        shell.run_cell(mutate_code).raise_error()
+        assert summarized == [value]
+        variables_comm.messages.clear()
+
+        expected = not_none(_summarize_variable("x", value))
+        assert _do_list(variables_comm, version=3)["variables"] == [expected]
+
+    # The summary is dropped when the variable is deleted
+    shell.run_cell("del x").raise_error()
+    cache = variables_service._summary_cache  # noqa: SLF001
+    assert cache.get(value, get_inspector(value)) is None
+
+
 @pytest.mark.parametrize("varname", ["x", "_"])
 def test_list_falls_back_on_variable_error(
     shell: PositronShell, variables_comm: DummyComm, monkeypatch, varname: str
@@ -433,10 +662,10 @@ async def test_clear(
                 "assigned": [],
                 "removed": _encode_path(["x", "y"]),
                 "unevaluated": [],
-                "version": 0,
+                "version": 2,
             },
         ),
-        json_rpc_notification("refresh", {"length": 1, "variables": [underscore], "version": 0}),
+        json_rpc_notification("refresh", {"length": 1, "variables": [underscore], "version": 3}),
     ]
 
     # All user variables are removed
@@ -789,6 +1018,77 @@ def test_inspect_error(shell: PositronShell, variables_comm: DummyComm, varname:
     ]
 
 
+def _do_inspect_range(
+    path: list[JsonData], start: int, count: int, variables_comm: DummyComm
+) -> JsonRecord:
+    msg = json_rpc_request(
+        "inspect_range", {"path": path, "start": start, "count": count}, comm_id="dummy_comm_id"
+    )
+    variables_comm.handle_msg(msg)
+
+    result = variables_comm.messages[-1]["data"]["result"]
+    variables_comm.messages.clear()
+
+    return result
+
+
+@pytest.mark.parametrize(
+    ("value", "display_name"),
+    [
+        pytest.param(list(range(1000)), str, id="list"),
+        pytest.param({f"k{i}": i for i in range(1000)}, lambda i: f"k{i}", id="dict"),
+        pytest.param(np.arange(1000), str, id="numpy"),
+        pytest.param(
+            pd.Series(range(1000), index=[f"r{i}" for i in range(1000)]),
+            lambda i: f"r{i}",
+            id="pandas_series",
+        ),
+    ],
+)
+def test_inspect_range(
+    value, display_name, shell: PositronShell, variables_comm: DummyComm
+) -> None:
+    shell.user_ns["x"] = value
+    path = _encode_path(["x"])
+
+    result = _do_inspect_range(path, 500, 3, variables_comm)
+    assert result["start"] == 500
+    assert result["length"] == 1000
+    children = cast("list[JsonRecord]", result["children"])
+    assert [child["display_name"] for child in children] == [
+        display_name(i) for i in range(500, 503)
+    ]
+    assert [child["display_value"] for child in children] == ["500", "501", "502"]
+
+    # Children in the range can be inspected by their access keys
+    access_key = children[0]["access_key"]
+    children = _do_inspect([*path, access_key], variables_comm)
+    assert [child.display_value for child in children] == ["500"]
+
+    # Ranges are clipped to the children
+    result = _do_inspect_range(path, 999, 5, variables_comm)
+    children = cast("list[JsonRecord]", result["children"])
+    assert [child["display_value"] for child in children] == ["999"]
+    result = _do_inspect_range(path, 2000, 5, variables_comm)
+    assert result["start"] == 1000
+    assert result["children"] == []
+
+
+def test_inspect_range_after_mutation(shell: PositronShell, variables_comm: DummyComm) -> None:
+    shell.run_cell("x = {'a': 1, 'b': 2}").raise_error()
+    path = _encode_path(["x"])
+    result = _do_inspect_range(path, 0, 10, variables_comm)
+    children = cast("list[JsonRecord]", result["children"])
+    assert [child["display_name"] for child in children] == ["a", "b"]
+
+    # The snapshot of the dict's keys is taken again after code is executed
+    shell.run_cell("del x['a']\nx['c'] = 3").raise_error()
+    variables_comm.messages.clear()
+    result = _do_inspect_range(path, 0, 10, variables_comm)
+    children = cast("list[JsonRecord]", result["children"])
+    assert [child["display_name"] for child in children] == ["b", "c"]
+
+
 @pytest.mark.parametrize(("varname", "expected"), [("x", "3"), ("_", "8")])
 def test_clipboard_format(
     shell: PositronShell, variables_comm: DummyComm, varname: str, expected: str
@@ -8,6 +8,8 @@
 # since we may also need to import the actual package inside an `if TYPE_CHECKING` block for type
 # checking.
 
+from typing import Any
+
 
 def _numpy():
     import numpy
@@ -45,6 +47,14 @@ def _pyarrow():
     return pa
 
 
+def _pyarrow_compute() -> Any:
+    # Most pyarrow.compute functions are generated when it's imported,
+    # so they are unknown to type checkers
+    import pyarrow.compute as pc
+
+    return pc
+
+
 def _sqlalchemy():
     import sqlalchemy
 
@@ -57,7 +67,25 @@ def _pyodbc():
     return pyodbc
 
 
-__all__ = ["_ibis", "_numpy", "_pandas", "_polars", "_pyarrow", "_pyodbc", "_sqlalchemy", "_torch"]
+def _xxhash():
+    # Optional faster hashing; callers fall back to zlib.crc32 if it's not installed
+    import xxhash  # type: ignore [reportMissingImports]
+
+    return xxhash
+
+
+__all__ = [
+    "_ibis",
+    "_numpy",
+    "_pandas",
+    "_polars",
+    "_pyarrow",
+    "_pyarrow_compute",
+    "_pyodbc",
+    "_sqlalchemy",
+    "_torch",
+    "_xxhash",
+]
 
 
 def is_pandas(table):
@@ -86,3 +114,30 @@ def is_ibis(table):
         return False
 
     return bool(isinstance(table, (ibis.Table, TableExpr)))
+
+
+def is_pyarrow(table):
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return False
+
+    return bool(isinstance(table, pa.Table))
+
+
+def is_polars_lazy(table):
+    try:
+        import polars as pl
+    except ImportError:
+        return False
+
+    return bool(isinstance(table, pl.LazyFrame))
+
+
+def is_duckdb_relation(table):
+    try:
+        import duckdb
+    except ImportError:
+        return False
+
+    return bool(isinstance(table, duckdb.DuckDBPyRelation))
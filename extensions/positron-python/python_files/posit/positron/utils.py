@@ -6,6 +6,7 @@
 import asyncio
 import concurrent.futures
 import functools
+import heapq
 import inspect
 import json
 import logging
@@ -145,40 +146,212 @@ async def cancel_tasks(tasks: Set[asyncio.Task]) -> None:
     tasks.clear()
 
 
+class JobCancelledError(Exception):
+    """Raised from a background job whose cancellation token was cancelled."""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared by the background jobs with the same key."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise JobCancelledError if cancelled; long jobs call this between chunks of work."""
+        if self._event.is_set():
+            raise JobCancelledError
+
+
+# Token for jobs without a key, or when not running in a background job
+_NEVER_CANCELLED = CancellationToken()
+
+_current_job = threading.local()
+
+
+class _Job:
+    def __init__(self, priority, seq, key, token, future, fn, args, kwargs, on_cancel=None):
+        self.priority = priority
+        self.seq = seq
+        self.key = key
+        self.token = token
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.on_cancel = on_cancel
+
+    def __lt__(self, other: "_Job") -> bool:
+        # Higher priority first, then first-in first-out
+        return (-self.priority, self.seq) < (-other.priority, other.seq)
+
+
 class BackgroundJobQueue:
-    """Simple threadpool-based background job queue for pseudo-asynchronous request handling in kernel services."""
+    """
+    Simple threadpool-based background job queue for pseudo-asynchronous request handling in kernel services.
+
+    Jobs can be submitted with a priority, in which case pending jobs
+    with a higher priority run first, and with a key (a tuple such as
+    ``(comm_id, callback_id)``) identifying the request they belong
+    to. Jobs with the same key share a CancellationToken, which a
+    running job can check via ``current_token()`` between chunks of
+    work. Jobs submitted from a running job inherit its key, token and
+    priority unless given. Jobs can be cancelled by key, or by key
+    prefix with ``cancel_group``, for example when a comm is closed.
+    Jobs submitted with a key after it was cancelled get a new token,
+    so they run even while the cancelled jobs are finishing.
+    A job cancelled before it starts never runs; its ``on_cancel``
+    callback, if given, runs instead, for example to reply to the
+    request the job would have answered.
+    """
 
     def __init__(self, max_workers=None):
         # Initialize the ThreadPoolExecutor with the specified number
         # of workers. Default to the number of CPU cores for optimal performance.
         if max_workers is None:
             max_workers = os.cpu_count() or 4
+        self.max_workers = max_workers
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
         self.pending_futures = set()
         self.lock = threading.Lock()
 
-    def submit(self, fn, *args, **kwargs):
-        # Submit a job to the thread pool and track the future
-        future = self.executor.submit(fn, *args, **kwargs)
+        # Jobs waiting for a worker, ordered by priority
+        self._heap: List[_Job] = []
+        self._seq = 0
+
+        # Cancellation tokens and number of unfinished jobs by key
+        self._tokens: Dict[tuple, CancellationToken] = {}
+        self._key_counts: Dict[tuple, int] = {}
+
+    def submit(
+        self,
+        fn,
+        *args,
+        key: Optional[tuple] = None,
+        priority: Optional[int] = None,
+        on_cancel: Optional[Callable[[], None]] = None,
+        **kwargs,
+    ):
+        # Queue a job by priority, and start a worker that runs the
+        # highest priority job pending at the time the worker is
+        # scheduled. The returned future tracks the submitted job.
+        parent = getattr(_current_job, "job", None)
+        if key is None and parent is not None:
+            key = parent.key
+        if priority is None:
+            priority = parent.priority if parent is not None else 0
+
+        future = concurrent.futures.Future()
         with self.lock:
+            if key is None:
+                token = _NEVER_CANCELLED
+            else:
+                if parent is not None and key == parent.key:
+                    # Cancelling the parent also cancels its children
+                    token = parent.token
+                else:
+                    token = self._tokens.setdefault(key, CancellationToken())
+                self._key_counts[key] = self._key_counts.get(key, 0) + 1
+            self._seq += 1
+            job = _Job(priority, self._seq, key, token, future, fn, args, kwargs, on_cancel)
+            heapq.heappush(self._heap, job)
             self.pending_futures.add(future)
 
         # Attach a callback to remove the future from the pending set when done
         future.add_done_callback(self._remove_future)
+        self.executor.submit(self._run_next)
         return future
 
+    def _run_next(self):
+        with self.lock:
+            job = heapq.heappop(self._heap)
+
+        try:
+            if job.token.is_cancelled or job.future.cancelled():
+                # Reply for the cancelled job before notifying waiters
+                if job.on_cancel is not None:
+                    try:
+                        job.on_cancel()
+                    except Exception as e:
+                        logger.error(e, exc_info=True)
+                job.future.cancel()
+
+            # Notifies waiters and returns False if the job was cancelled
+            if not job.future.set_running_or_notify_cancel():
+                return
+
+            _current_job.job = job
+            try:
+                result = job.fn(*job.args, **job.kwargs)
+            except JobCancelledError:
+                # Cooperatively cancelled while running
+                job.future.set_result(None)
+            except BaseException as e:
+                job.future.set_exception(e)
+            else:
+                job.future.set_result(result)
+            finally:
+                _current_job.job = None
+        finally:
+            self._release_key(job.key)
+
+    def _release_key(self, key):
+        if key is None:
+            return
+        with self.lock:
+            self._key_counts[key] -= 1
+            if self._key_counts[key] == 0:
+                del self._key_counts[key]
+                self._tokens.pop(key, None)
+
+    @staticmethod
+    def current_token() -> CancellationToken:
+        """Return the cancellation token of the job running in the current thread."""
+        job = getattr(_current_job, "job", None)
+        return job.token if job is not None else _NEVER_CANCELLED
+
+    def cancel(self, key: tuple) -> None:
+        """Cancel the pending and running jobs submitted with a key."""
+        # Jobs keep a reference to their token, so dropping it here
+        # gives jobs submitted later with the key a new token
+        with self.lock:
+            token = self._tokens.pop(key, None)
+        if token is not None:
+            token.cancel()
+
+    def cancel_group(self, *prefix) -> None:
+        """Cancel the pending and running jobs whose key starts with the given prefix."""
+        n = len(prefix)
+        with self.lock:
+            keys = [key for key in self._tokens if key[:n] == prefix]
+            tokens = [self._tokens.pop(key) for key in keys]
+        for token in tokens:
+            token.cancel()
+
     def _remove_future(self, future):
         # Callback to remove the future from the pending set when it's done
         with self.lock:
             self.pending_futures.discard(future)
 
     def wait_for_all(self):
-        # Wait for all pending futures to complete
-        with self.lock:
-            futures = list(self.pending_futures)
-
-        for future in futures:
-            future.result()  # This will block until the future is done
+        # Wait for all pending futures to complete, including any jobs
+        # submitted by the jobs we are waiting on
+        while True:
+            with self.lock:
+                futures = list(self.pending_futures)
+            if not futures:
+                break
+
+            concurrent.futures.wait(futures)
+            for future in futures:
+                if not future.cancelled():
+                    future.result()  # Raise any exception from the job
 
     def shutdown(self, *, wait=True):
         # Shut down the executor and optionally wait for all running
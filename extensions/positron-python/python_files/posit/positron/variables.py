@@ -4,16 +4,23 @@
 #
 from __future__ import annotations
 
+import bisect
 import contextlib
 import copy
+import datetime
+import decimal
+import fractions
+import itertools
 import json
 import logging
 import time
 import types
+import weakref
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from .access_keys import decode_access_key, encode_access_key
-from .inspectors import get_inspector
+from .inspectors import MAX_ITEMS_BY_LEVEL, PositronInspector, get_inspector
 from .positron_comm import CommMessage, JsonRpcErrorCode, PositronComm
 from .utils import (
     JsonData,
@@ -21,6 +28,7 @@ from .utils import (
     cancel_tasks,
     create_task,
     get_qualname,
+    safe_isinstance,
 )
 from .variables_comm import (
     ClearRequest,
@@ -29,7 +37,10 @@ from .variables_comm import (
     DeleteRequest,
     FormattedVariable,
     InspectedVariable,
+    InspectedVariableRange,
+    InspectRangeRequest,
     InspectRequest,
+    ListRangeRequest,
     ListRequest,
     QueryTableSummaryRequest,
     RefreshParams,
@@ -37,6 +48,7 @@ from .variables_comm import (
     Variable,
     VariableKind,
     VariableList,
+    VariableRange,
     VariablesBackendMessageContent,
     VariablesFrontendEvent,
     ViewRequest,
@@ -44,7 +56,7 @@ from .variables_comm import (
 
 if TYPE_CHECKING:
     import asyncio
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Callable, Hashable, Iterable, Mapping
 
     from comm.base_comm import BaseComm
 
@@ -59,11 +71,47 @@ MAX_CHILDREN: int = 100
 # full refresh is sent instead.
 MAX_ITEMS: int = 10000
 
+# Maximum number of names to insert into or remove from the sorted
+# index of variable names one at a time. If exceeded, the index is
+# rebuilt when it is next used instead.
+MAX_SORTED_NAME_UPDATES: int = 100
+
 # Budget for number of "units" of work to allow for namespace change
 # detection. The costs are defined in inspectors.py
 # Units are rough estimates of the number of bytes copied.
 MAX_SNAPSHOT_COMPARISON_BUDGET: int = 10_000_000
 
+# Budget for the number of bytes hashed to fingerprint mutable
+# variables for namespace change detection. Variables that cannot be
+# fingerprinted within the budget fall back to a copy and comparison.
+MAX_SNAPSHOT_FINGERPRINT_BUDGET: int = 256 * 1024 * 1024
+
+# Maximum number of bytes hashed to check whether a mutable variable's
+# cached summary is still valid. Larger variables are summarized from
+# scratch each time.
+MAX_SUMMARY_FINGERPRINT_COST: int = 1024 * 1024
+
+# Types whose values never change, so that their summaries can be
+# cached for as long as the value is alive
+_IMMUTABLE_SCALAR_TYPES = frozenset(
+    [
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        range,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        decimal.Decimal,
+        fractions.Fraction,
+    ]
+)
+
 
 def timestamp() -> int:
     """Returns the current time in milliseconds; used for timestamping updates."""
@@ -94,6 +142,69 @@ def _resolve_value_from_path(context: Any, path: Iterable[str]) -> Any:
     return is_known, value
 
 
+class _SummaryCacheEntry:
+    __slots__ = ("fingerprint", "ref", "summary")
+
+    def __init__(self, ref: Callable[[], Any], fingerprint: Hashable, summary: Variable) -> None:
+        self.ref = ref
+        self.fingerprint = fingerprint
+        self.summary = summary
+
+
+class _SummaryCache:
+    """
+    Cache of variable summaries, keyed by the identity of the value.
+
+    A cached summary is reused while the value is alive and its change
+    fingerprint is unchanged. Entries for values that support weak
+    references are dropped when the value is garbage collected. Other
+    values are held until `prune` is called without them.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[int, _SummaryCacheEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, value: Any, inspector: PositronInspector) -> Variable | None:
+        entry = self._entries.get(id(value))
+        if entry is None or entry.ref() is not value:
+            return None
+
+        if entry.fingerprint != _get_summary_fingerprint(value, inspector):
+            del self._entries[id(value)]
+            return None
+
+        return entry.summary
+
+    def set(self, value: Any, inspector: PositronInspector, summary: Variable) -> None:
+        fingerprint = _get_summary_fingerprint(value, inspector)
+        if fingerprint is None:
+            return
+
+        key = id(value)
+        try:
+            ref = weakref.ref(value, lambda ref: self._remove(key, ref))
+        except TypeError:
+            # Hold a strong reference instead, so that the id isn't reused
+            def ref():
+                return value
+
+        self._entries[key] = _SummaryCacheEntry(ref, fingerprint, summary)
+
+    def prune(self, values: Iterable[Any]) -> None:
+        """Remove the entries of all values except the given ones."""
+        live = {id(value) for value in values}
+        for key in [key for key in self._entries if key not in live]:
+            del self._entries[key]
+
+    def _remove(self, key: int, ref: weakref.ref) -> None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.ref is ref:
+            del self._entries[key]
+
+
 class VariablesService:
     def __init__(self, kernel: PositronIPyKernel) -> None:
         self.kernel = kernel
@@ -105,12 +216,33 @@ class VariablesService:
 
         self._snapshot: dict[str, Any] | None = None
 
+        # Whether to poll variables once the kernel has replied to the
+        # current request
+        self._poll_deferred = False
+
+        # The version of the frontend's view, incremented with each
+        # update or refresh event
+        self._version = 0
+
+        # The sorted names of the listed variables, used to page through
+        # the namespace with list_range requests. Built lazily
+        self._sorted_names: list[str] | None = None
+
+        # Summaries of unchanged variables, reused across updates
+        self._summary_cache = _SummaryCache()
+
+        # Ordered snapshots of the keys of inspected variables whose
+        # children can't be indexed by position, like dicts, keyed by
+        # path. Cleared whenever code may have changed the namespace
+        self._child_keys: dict[tuple[str, ...], tuple[Any, list[Any]]] = {}
+
     def on_comm_open(self, comm: BaseComm, _msg: JsonRecord) -> None:
         """Setup positron.variables comm to receive messages."""
         self._comm = PositronComm(comm)
         self._comm.on_msg(self.handle_msg, VariablesBackendMessageContent)
 
-        # Send list on comm initialization
+        # Send list on comm initialization, starting a new view
+        self._version = 0
         self.send_refresh_event()
 
     def handle_msg(
@@ -124,6 +256,9 @@ class VariablesService:
         if isinstance(request, ListRequest):
             self._send_list()
 
+        elif isinstance(request, ListRangeRequest):
+            self._send_range(request.params.start, request.params.count)
+
         elif isinstance(request, ClearRequest):
             self._delete_all_vars(raw_msg)
 
@@ -133,6 +268,9 @@ class VariablesService:
         elif isinstance(request, InspectRequest):
             self._inspect_var(request.params.path)
 
+        elif isinstance(request, InspectRangeRequest):
+            self._inspect_var_range(request.params.path, request.params.start, request.params.count)
+
         elif isinstance(request, ClipboardFormatRequest):
             self._send_formatted_var(request.params.path, request.params.format)
 
@@ -196,23 +334,30 @@ class VariablesService:
         if len(assigned) > MAX_ITEMS or len(removed) > MAX_ITEMS:
             return self.send_refresh_event()
 
+        self._update_sorted_names(assigned, unevaluated, removed)
+
+        # Drop the cached summaries of values that were replaced or deleted
+        if assigned or removed:
+            self._summary_cache.prune(self._get_user_ns().values())
+
         # Filter out hidden assigned variables
         variables = self._get_filtered_vars(assigned)
-        filtered_assigned = _summarize_children(variables, MAX_ITEMS)
+        filtered_assigned = _summarize_children(variables, MAX_ITEMS, self._summary_cache)
 
         # Filter out hidden unevaluated variables
         variables = self._get_filtered_vars(unevaluated)
-        filtered_unevaluated = _summarize_children(variables, MAX_ITEMS)
+        filtered_unevaluated = _summarize_children(variables, MAX_ITEMS, self._summary_cache)
 
         # We don't have to filter out hidden removed variables, but make sure to encode access keys
         filtered_removed = [encode_access_key(name) for name in sorted(removed)]
 
         if filtered_assigned or filtered_unevaluated or filtered_removed:
+            self._version += 1
             msg = UpdateParams(
                 assigned=filtered_assigned,
                 unevaluated=filtered_unevaluated,
                 removed=filtered_removed,
-                version=0,
+                version=self._version,
             )
             self._send_event(VariablesFrontendEvent.Update.value, msg.dict())
             return None
@@ -236,12 +381,18 @@ class VariablesService:
         }
         """
         variables = self._get_filtered_vars()
-        filtered_variables = _summarize_children(variables, MAX_ITEMS)
+        self._summary_cache.prune(variables.values())
+        filtered_variables = _summarize_children(variables, MAX_ITEMS, self._summary_cache)
+
+        # The index is rebuilt from the refreshed namespace when it is next used
+        self._sorted_names = None
+        self._child_keys.clear()
 
+        self._version += 1
         msg = RefreshParams(
             variables=filtered_variables,
             length=len(filtered_variables),
-            version=0,
+            version=self._version,
         )
         self._send_event(VariablesFrontendEvent.Refresh.value, msg.dict())
 
@@ -258,6 +409,8 @@ class VariablesService:
         if self._snapshot is None:
             return
 
+        self._child_keys.clear()
+
         try:
             # Try to detect the changes made since the last execution
             assigned, unevaluated, removed = self._compare_user_ns()
@@ -265,6 +418,27 @@ class VariablesService:
         except Exception as err:
             logger.warning(err, exc_info=True)
 
+    def defer_poll_variables(self) -> None:
+        """
+        Poll variables once the kernel has replied to the current request.
+
+        Keeps change detection and the resulting updates out of the
+        execution time of a cell. The kernel runs the deferred poll
+        with `flush_deferred_poll`, and it is flushed before the
+        namespace is snapshotted again.
+        """
+        self._poll_deferred = True
+
+    def has_deferred_poll(self) -> bool:
+        return self._poll_deferred
+
+    def flush_deferred_poll(self) -> None:
+        if not self._poll_deferred:
+            return
+
+        self._poll_deferred = False
+        self.poll_variables()
+
     def snapshot_user_ns(self) -> None:
         """
         Snapshot.
@@ -272,19 +446,31 @@ class VariablesService:
         Creates a conservative "snapshot" of the user namespace to
         enable variable change detection without having to do a full
         refresh of the variables view any time the user executes
-        code. Because many objects (any mutable Python collection, or
-        some data structures like pandas, NumPy, or PyTorch objects)
-        require a deep copy to support change detection, we only
-        copy-and-compare such objects up to a certain limit to keep
-        the execution overhead to a minimum when namespaces get large
-        or contain many large mutable objects.
+        code. Mutable NumPy, pandas, and PyTorch objects are
+        fingerprinted (see `PositronInspector.get_fingerprint`) so
+        that they can be compared without a copy. Other mutable
+        objects (like any mutable Python collection) require a deep
+        copy to support change detection, so we only copy-and-compare
+        such objects up to a certain limit to keep the execution
+        overhead to a minimum when namespaces get large or contain
+        many large mutable objects.
         """
+        # Send the changes detected against the previous snapshot, in
+        # case its poll was deferred and has not run yet
+        self.flush_deferred_poll()
+
+        self._child_keys.clear()
+
         ns = self._get_user_ns()
 
         # Variables which are immutable and thus can be compared by
         # reference
         immutable_vars = {}
 
+        # Mutable variables and their fingerprints, which are compared
+        # to the fingerprints of the same objects after code execution.
+        mutable_vars_fingerprinted = {}
+
         # Mutable variables which fall within the limit of
         # "reasonable" expense for a copy and deep comparison after
         # code execution.
@@ -298,6 +484,7 @@ class VariablesService:
         mutable_vars_excluded = {}
 
         comparison_cost = 0
+        fingerprint_cost = 0
 
         start = time.time()
 
@@ -308,6 +495,18 @@ class VariablesService:
             inspector = get_inspector(value)
 
             if inspector.is_mutable():
+                fingerprint = None
+                cost = inspector.get_fingerprint_cost()
+                if fingerprint_cost + cost <= MAX_SNAPSHOT_FINGERPRINT_BUDGET:
+                    try:
+                        fingerprint = inspector.get_fingerprint()
+                    except Exception:
+                        logger.debug(f"Failed to fingerprint variable '{key}'", exc_info=True)
+                if fingerprint is not None:
+                    fingerprint_cost += cost
+                    mutable_vars_fingerprinted[key] = (value, fingerprint)
+                    continue
+
                 cost = inspector.get_comparison_cost()
                 if comparison_cost + cost > MAX_SNAPSHOT_COMPARISON_BUDGET:
                     mutable_vars_excluded[key] = value
@@ -324,12 +523,16 @@ class VariablesService:
 
         self._snapshot = {
             "immutable": immutable_vars,
+            "mutable_fingerprinted": mutable_vars_fingerprinted,
             "mutable_copied": mutable_vars_copied,
             "mutable_excluded": mutable_vars_excluded,
         }
         elapsed = time.time() - start
         logger.debug(f"Snapshotting namespace took {elapsed:.4f} seconds")
 
+        fingerprinted = repr(list(self._snapshot["mutable_fingerprinted"].keys()))
+        logger.debug(f"Variables fingerprinted: {fingerprinted}")
+
         copied = repr(list(self._snapshot["mutable_copied"].keys()))
         logger.debug(f"Variables copied: {copied}")
 
@@ -360,6 +563,20 @@ class VariablesService:
             # For immutable objects we can compare object references
             return v1 is not v2
 
+        def _compare_fingerprinted(v1, v2):
+            # Reassigned objects are different, without computing
+            # another fingerprint
+            value, fingerprint = v1
+            if value is not v2:
+                return True
+
+            try:
+                return get_inspector(v2).get_fingerprint() != fingerprint
+            except Exception:
+                # Fingerprints containing objects that don't support
+                # bool(x == y), like NumPy arrays as pandas names
+                return True
+
         def _compare_mutable(v1, v2):
             inspector1 = get_inspector(v1)
             inspector2 = get_inspector(v2)
@@ -396,6 +613,11 @@ class VariablesService:
         _check_ns_subset(
             snapshot["immutable"], evaluated=True, are_different_func=_compare_immutable
         )
+        _check_ns_subset(
+            snapshot["mutable_fingerprinted"],
+            evaluated=True,
+            are_different_func=_compare_fingerprinted,
+        )
         _check_ns_subset(
             snapshot["mutable_copied"], evaluated=True, are_different_func=_compare_mutable
         )
@@ -469,14 +691,92 @@ class VariablesService:
 
     def _list_all_vars(self) -> list[Variable]:
         variables = self._get_filtered_vars()
-        return _summarize_children(variables, MAX_ITEMS)
+        return _summarize_children(variables, MAX_ITEMS, self._summary_cache)
 
     def _send_list(self) -> None:
         filtered_variables = self._list_all_vars()
         msg = VariableList(
             variables=filtered_variables,
             length=len(filtered_variables),
-            version=0,
+            version=self._version,
+        )
+        self._send_result(msg.dict())
+
+    def _get_sorted_names(self) -> list[str]:
+        if self._sorted_names is None:
+            self._sorted_names = sorted(
+                name for name, value in self._get_filtered_vars().items() if _is_listed(name, value)
+            )
+        return self._sorted_names
+
+    def _update_sorted_names(
+        self,
+        assigned: Mapping[str, Any],
+        unevaluated: Mapping[str, Any],
+        removed: set[str],
+    ) -> None:
+        """Apply the changes in an update to the sorted index of variable names, if it was built."""
+        names = self._sorted_names
+        if names is None:
+            return
+
+        # Each insertion or removal shifts the list, so rebuild the index
+        # instead when a lot has changed
+        if len(assigned) + len(unevaluated) + len(removed) > MAX_SORTED_NAME_UPDATES:
+            self._sorted_names = None
+            return
+
+        for name in removed:
+            _remove_sorted(names, name)
+
+        for variables in (assigned, unevaluated):
+            for name, value in variables.items():
+                if _is_listed(name, value) and not self._is_hidden(name, value):
+                    _insert_sorted(names, name)
+                else:
+                    _remove_sorted(names, name)
+
+    def _send_range(self, start: int, count: int) -> None:
+        """
+        Sends a range of the variables in the current user session, sorted by name.
+
+        Only the variables in the range are summarized, so the cost of a
+        request doesn't grow with the size of the namespace.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first variable to send.
+        count : int
+            The maximum number of variables to send.
+        """
+        # Send any pending update first, so that the frontend can apply it
+        # before the range, which reflects the current namespace
+        self.flush_deferred_poll()
+
+        start = max(0, start)
+        count = max(0, min(count, MAX_ITEMS))
+
+        user_ns = self._get_user_ns()
+        names = self._get_sorted_names()
+        if any(name not in user_ns for name in names[start : start + count]):
+            # The namespace changed without an update, e.g. in a comm
+            # message handler, so rebuild the index
+            self._sorted_names = None
+            names = self._get_sorted_names()
+        start = min(start, len(names))
+
+        variables = []
+        for name in names[start : start + count]:
+            summary = _summarize_variable(name, user_ns[name], cache=self._summary_cache)
+            if summary is not None:
+                variables.append(summary)
+
+        msg = VariableRange(
+            variables=variables,
+            start=start,
+            length=len(names),
+            version=self._version,
         )
         self._send_result(msg.dict())
 
@@ -545,6 +845,10 @@ class VariablesService:
             if exp_service.variable_has_active_explorers(name):
                 exp_service.handle_variable_deleted(name)
 
+        # The frontend removes the variables on receiving the result,
+        # rather than an update event, so the version is unchanged
+        self._update_sorted_names({}, {}, removed)
+
         self._send_result([encode_access_key(name) for name in sorted(removed)])
 
     def _inspect_var(self, path: list[str]) -> None:
@@ -565,6 +869,59 @@ class VariablesService:
                 f"Cannot find variable at '{path}' to inspect",
             )
 
+    def _inspect_var_range(self, path: list[str], start: int, count: int) -> None:
+        """
+        Describes a range of the children of the variable at the requested path.
+
+        Only the children in the range are summarized, so the cost of a
+        request doesn't grow with the number of children.
+
+        Parameters
+        ----------
+        path : List[str]
+            A list of names describing the path to the variable.
+        start : int
+            The index of the first child to send.
+        count : int
+            The maximum number of children to send.
+        """
+        is_known, value = self._find_var(path)
+        if not is_known:
+            self._send_error(
+                JsonRpcErrorCode.INVALID_PARAMS,
+                f"Cannot find variable at '{path}' to inspect",
+            )
+            return
+
+        inspector = get_inspector(value)
+        keys = self._get_child_keys(path, value, inspector) if inspector.has_children() else []
+
+        start = max(0, min(start, len(keys)))
+        count = max(0, min(count, MAX_ITEMS))
+
+        children = []
+        for key in keys[start : start + count]:
+            summary = _summarize_child(inspector, key)
+            if summary is not None:
+                children.append(summary)
+
+        msg = InspectedVariableRange(children=children, start=start, length=len(keys))
+        self._send_result(msg.dict())
+
+    def _get_child_keys(
+        self, path: list[str], value: Any, inspector: PositronInspector
+    ) -> Sequence[Any]:
+        children = inspector.get_children()
+        if isinstance(children, Sequence):
+            # Children that can be sliced directly, like the indices of a list
+            return children
+
+        snapshot = self._child_keys.get(tuple(path))
+        if snapshot is None or snapshot[0] is not value:
+            snapshot = (value, list(children))
+            self._child_keys[tuple(path)] = snapshot
+        return snapshot[1]
+
     def _perform_view_action(self, path: list[str]) -> None:
         """Performs the view action depending of the variable type."""
         if path is None:
@@ -784,7 +1141,12 @@ class VariablesService:
         )
 
 
-def _summarize_variable(key: Any, value: Any, display_name: str | None = None) -> Variable | None:
+def _summarize_variable(
+    key: Any,
+    value: Any,
+    display_name: str | None = None,
+    cache: _SummaryCache | None = None,
+) -> Variable | None:
     """
     Summarizes the given variable into a Variable object.
 
@@ -798,6 +1160,9 @@ def _summarize_variable(key: Any, value: Any, display_name: str | None = None) -
     display_name : str
         An optional string to use for the variable's display name. Is
         a stringified version of `key` if not passed.
+    cache : _SummaryCache
+        An optional cache of summaries to reuse if the value is
+        unchanged, and to add the summary to.
 
     Returns
     -------
@@ -814,19 +1179,31 @@ def _summarize_variable(key: Any, value: Any, display_name: str | None = None) -
         # Use an inspector to summarize the value
         ins = get_inspector(value)
 
+        access_key = encode_access_key(key)
+        updated_time = timestamp()
+
+        if cache is not None:
+            summary = cache.get(value, ins)
+            if summary is not None:
+                return summary.copy(
+                    update={
+                        "display_name": display_name,
+                        "access_key": access_key,
+                        "updated_time": updated_time,
+                    }
+                )
+
         kind_str = ins.get_kind()
         kind = VariableKind(kind_str)
         display_value, is_truncated = ins.get_display_value()
         display_type = ins.get_display_type()
         type_info = ins.get_type_info()
-        access_key = encode_access_key(key)
         length = ins.get_length()
         size = ins.get_size()
         has_children = ins.has_children()
         has_viewer = ins.has_viewer()
-        updated_time = timestamp()
 
-        return Variable(
+        summary = Variable(
             display_name=display_name,
             display_value=display_value,
             display_type=display_type,
@@ -841,6 +1218,11 @@ def _summarize_variable(key: Any, value: Any, display_name: str | None = None) -
             updated_time=updated_time,
         )
 
+        if cache is not None:
+            cache.set(value, ins, summary)
+
+        return summary
+
     except Exception as err:
         logger.warning(err, exc_info=True)
         return Variable(
@@ -859,25 +1241,93 @@ def _summarize_variable(key: Any, value: Any, display_name: str | None = None) -
         )
 
 
-def _summarize_children(parent: Any, limit: int = MAX_CHILDREN) -> list[Variable]:
+def _get_summary_fingerprint(value: Any, inspector: PositronInspector) -> Hashable | None:
+    """
+    Fingerprint the parts of a value that its summary depends on.
+
+    Returns None if the summary cannot be safely cached.
+    """
+    if type(value) in _IMMUTABLE_SCALAR_TYPES:
+        return ()
+
+    if type(value) in (tuple, frozenset):
+        # The summary only depends on the displayed items
+        items = itertools.islice(value, MAX_ITEMS_BY_LEVEL[0])
+        if all(type(item) in _IMMUTABLE_SCALAR_TYPES for item in items):
+            return ()
+        return None
+
+    if _is_frozen_ndarray(value):
+        return ()
+
+    try:
+        if (
+            not inspector.is_mutable()
+            or inspector.get_fingerprint_cost() > MAX_SUMMARY_FINGERPRINT_COST
+        ):
+            return None
+        return inspector.get_fingerprint()
+    except Exception:
+        logger.debug(f"Failed to fingerprint value of type {type(value)}", exc_info=True)
+        return None
+
+
+def _is_frozen_ndarray(value: Any) -> bool:
+    # A read-only array can still change if it views the memory of a
+    # writeable array, or of a buffer we don't know about
+    if not safe_isinstance(value, "numpy", "ndarray"):
+        return False
+    while safe_isinstance(value, "numpy", "ndarray"):
+        if value.flags.writeable:
+            return False
+        value = value.base
+    return value is None or type(value) is bytes
+
+
+def _is_listed(name: Any, value: Any) -> bool:
+    # Mirrors the variables skipped by _summarize_variable
+    return isinstance(name, str) and not isinstance(value, types.ModuleType)
+
+
+def _insert_sorted(names: list[str], name: str) -> None:
+    i = bisect.bisect_left(names, name)
+    if i == len(names) or names[i] != name:
+        names.insert(i, name)
+
+
+def _remove_sorted(names: list[str], name: str) -> None:
+    i = bisect.bisect_left(names, name)
+    if i < len(names) and names[i] == name:
+        del names[i]
+
+
+def _summarize_children(
+    parent: Any, limit: int = MAX_CHILDREN, cache: _SummaryCache | None = None
+) -> list[Variable]:
     inspector = get_inspector(parent)
     children = inspector.get_children()
     summaries = []
     for child in children:
         if len(summaries) >= limit:
             break
-        try:
-            value = inspector.get_child(child)
-        except Exception:
-            value = "Cannot get value."
-
-        display_name = inspector.get_display_name(child)
-        summary = _summarize_variable(child, value, display_name=display_name)
+        summary = _summarize_child(inspector, child, cache)
         if summary is not None:
             summaries.append(summary)
     return summaries
 
 
+def _summarize_child(
+    inspector: PositronInspector, child: Any, cache: _SummaryCache | None = None
+) -> Variable | None:
+    try:
+        value = inspector.get_child(child)
+    except Exception:
+        value = "Cannot get value."
+
+    display_name = inspector.get_display_name(child)
+    return _summarize_variable(child, value, display_name=display_name, cache=cache)
+
+
 def _format_value(value: Any, clipboard_format: ClipboardFormatFormat) -> str:
     """Formats the given value using the requested clipboard format."""
     inspector = get_inspector(value)
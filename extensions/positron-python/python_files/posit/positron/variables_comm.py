@@ -81,6 +81,29 @@ class VariableList(BaseModel):
     )
 
 
+class VariableRange(BaseModel):
+    """
+    A view containing a range of the variables in the session, sorted by
+    name.
+    """
+
+    variables: List[Variable] = Field(
+        description="The variables in the range.",
+    )
+
+    start: StrictInt = Field(
+        description="The index of the first variable in the range.",
+    )
+
+    length: StrictInt = Field(
+        description="The total number of variables in the session.",
+    )
+
+    version: StrictInt = Field(
+        description="The version of the view (incremented with each update)",
+    )
+
+
 class InspectedVariable(BaseModel):
     """
     An inspected variable.
@@ -95,6 +118,24 @@ class InspectedVariable(BaseModel):
     )
 
 
+class InspectedVariableRange(BaseModel):
+    """
+    A range of the children of an inspected variable.
+    """
+
+    children: List[Variable] = Field(
+        description="The children in the range.",
+    )
+
+    start: StrictInt = Field(
+        description="The index of the first child in the range.",
+    )
+
+    length: StrictInt = Field(
+        description="The total number of children of the variable.",
+    )
+
+
 class FormattedVariable(BaseModel):
     """
     An object formatted for copying to the clipboard.
@@ -190,6 +231,9 @@ class VariablesBackendRequest(str, enum.Enum):
     # List all variables
     List = "list"
 
+    # List a range of variables
+    ListRange = "list_range"
+
     # Clear all variables
     Clear = "clear"
 
@@ -199,6 +243,9 @@ class VariablesBackendRequest(str, enum.Enum):
     # Inspect a variable
     Inspect = "inspect"
 
+    # Inspect a range of a variable's children
+    InspectRange = "inspect_range"
+
     # Format for clipboard
     ClipboardFormat = "clipboard_format"
 
@@ -224,6 +271,43 @@ class ListRequest(BaseModel):
     )
 
 
+class ListRangeParams(BaseModel):
+    """
+    Returns a range of the variables in the current session, sorted by
+    name. Display values are only computed for the variables in the range,
+    so the frontend can page through a large session.
+    """
+
+    start: StrictInt = Field(
+        description="The index of the first variable to return.",
+    )
+
+    count: StrictInt = Field(
+        description="The maximum number of variables to return.",
+    )
+
+
+class ListRangeRequest(BaseModel):
+    """
+    Returns a range of the variables in the current session, sorted by
+    name. Display values are only computed for the variables in the range,
+    so the frontend can page through a large session.
+    """
+
+    params: ListRangeParams = Field(
+        description="Parameters to the ListRange method",
+    )
+
+    method: Literal[VariablesBackendRequest.ListRange] = Field(
+        description="The JSON-RPC method name (list_range)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
 class ClearParams(BaseModel):
     """
     Clears (deletes) all variables in the current session.
@@ -311,6 +395,47 @@ class InspectRequest(BaseModel):
     )
 
 
+class InspectRangeParams(BaseModel):
+    """
+    Returns a range of the children of a variable, as an array of
+    variables. Only the children in the range are summarized, so the
+    frontend can page through a large collection.
+    """
+
+    path: List[StrictStr] = Field(
+        description="The path to the variable to inspect, as an array of access keys.",
+    )
+
+    start: StrictInt = Field(
+        description="The index of the first child to return.",
+    )
+
+    count: StrictInt = Field(
+        description="The maximum number of children to return.",
+    )
+
+
+class InspectRangeRequest(BaseModel):
+    """
+    Returns a range of the children of a variable, as an array of
+    variables. Only the children in the range are summarized, so the
+    frontend can page through a large collection.
+    """
+
+    params: InspectRangeParams = Field(
+        description="Parameters to the InspectRange method",
+    )
+
+    method: Literal[VariablesBackendRequest.InspectRange] = Field(
+        description="The JSON-RPC method name (inspect_range)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
 class ClipboardFormatParams(BaseModel):
     """
     Requests a formatted representation of a variable for copying to the
@@ -414,9 +539,11 @@ class VariablesBackendMessageContent(BaseModel):
     comm_id: str
     data: Union[
         ListRequest,
+        ListRangeRequest,
         ClearRequest,
         DeleteRequest,
         InspectRequest,
+        InspectRangeRequest,
         ClipboardFormatRequest,
         ViewRequest,
         QueryTableSummaryRequest,
@@ -478,8 +605,12 @@ class RefreshParams(BaseModel):
 
 VariableList.update_forward_refs()
 
+VariableRange.update_forward_refs()
+
 InspectedVariable.update_forward_refs()
 
+InspectedVariableRange.update_forward_refs()
+
 FormattedVariable.update_forward_refs()
 
 QueryTableSummaryResult.update_forward_refs()
@@ -488,6 +619,10 @@ Variable.update_forward_refs()
 
 ListRequest.update_forward_refs()
 
+ListRangeParams.update_forward_refs()
+
+ListRangeRequest.update_forward_refs()
+
 ClearParams.update_forward_refs()
 
 ClearRequest.update_forward_refs()
@@ -500,6 +635,10 @@ InspectParams.update_forward_refs()
 
 InspectRequest.update_forward_refs()
 
+InspectRangeParams.update_forward_refs()
+
+InspectRangeRequest.update_forward_refs()
+
 ClipboardFormatParams.update_forward_refs()
 
 ClipboardFormatRequest.update_forward_refs()
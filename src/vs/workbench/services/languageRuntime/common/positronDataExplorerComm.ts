@@ -234,6 +234,12 @@ export interface TableData {
 	 */
 	columns: Array<Array<ColumnValue>>;
 
+	/**
+	 * If set, the values were returned in the binary buffers of the comm
+	 * message using this encoding, and 'columns' is empty
+	 */
+	binary_format?: BinaryFormat;
+
 }
 
 /**
@@ -789,6 +795,12 @@ export interface ColumnHistogram {
 	 */
 	quantiles: Array<ColumnQuantileValue>;
 
+	/**
+	 * Whether the bin counts were computed from a row sample and are scaled
+	 * estimates of the true counts. May be omitted
+	 */
+	is_approximate?: boolean;
+
 }
 
 /**
@@ -822,6 +834,12 @@ export interface ColumnFrequencyTable {
 	 */
 	other_count?: number;
 
+	/**
+	 * Whether the counts were computed from a row sample and are scaled
+	 * estimates of the true counts. May be omitted
+	 */
+	is_approximate?: boolean;
+
 }
 
 /**
@@ -901,6 +919,11 @@ export interface SupportedFeatures {
 	 */
 	convert_to_code: ConvertToCodeFeatures;
 
+	/**
+	 * Support for 'get_data_values' RPC and its features
+	 */
+	get_data_values?: GetDataValuesFeatures;
+
 }
 
 /**
@@ -919,6 +942,17 @@ export interface SearchSchemaFeatures {
 
 }
 
+/**
+ * Feature flags for 'get_data_values' RPC
+ */
+export interface GetDataValuesFeatures {
+	/**
+	 * Binary encodings supported for returning unformatted values
+	 */
+	supported_binary_formats: Array<BinaryFormat>;
+
+}
+
 /**
  * Feature flags for 'set_column_filters' RPC
  */
@@ -1301,6 +1335,13 @@ export enum ExportFormat {
 	Html = 'html'
 }
 
+/**
+ * Possible values for BinaryFormat
+ */
+export enum BinaryFormat {
+	ArrowIpc = 'arrow_ipc'
+}
+
 /**
  * Possible values for SupportStatus
  */
@@ -1359,6 +1400,14 @@ export interface GetDataValuesParams {
 	 * Formatting options for returning data values as strings
 	 */
 	format_options: FormatOptions;
+
+	/**
+	 * Opt-in binary encoding for the result. If set and supported by the
+	 * backend, unformatted values are returned in the binary buffers of the
+	 * comm message (one buffer per column selection) instead of as formatted
+	 * strings
+	 */
+	binary_format?: BinaryFormat;
 }
 
 /**
@@ -1389,6 +1438,12 @@ export interface ExportDataSelectionParams {
 	 * Result string format
 	 */
 	format: ExportFormat;
+
+	/**
+	 * If set, the backend writes the exported data to this file path in
+	 * bounded chunks instead of returning it, and the result data is empty
+	 */
+	path?: string;
 }
 
 /**
@@ -1614,11 +1669,15 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 	 * @param columns Array of column selections
 	 * @param formatOptions Formatting options for returning data values as
 	 * strings
+	 * @param binaryFormat Opt-in binary encoding for the result. If set and
+	 * supported by the backend, unformatted values are returned in the
+	 * binary buffers of the comm message (one buffer per column selection)
+	 * instead of as formatted strings
 	 *
 	 * @returns Requested values formatted as strings
 	 */
-	getDataValues(columns: Array<ColumnSelection>, formatOptions: FormatOptions): Promise<TableData> {
-		return super.performRpc('get_data_values', ['columns', 'format_options'], [columns, formatOptions]);
+	getDataValues(columns: Array<ColumnSelection>, formatOptions: FormatOptions, binaryFormat: BinaryFormat | undefined): Promise<TableData> {
+		return super.performRpc('get_data_values', ['columns', 'format_options', 'binary_format'], [columns, formatOptions, binaryFormat]);
 	}
 
 	/**
@@ -1644,11 +1703,14 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 	 *
 	 * @param selection The data selection
 	 * @param format Result string format
+	 * @param path If set, the backend writes the exported data to this file
+	 * path in bounded chunks instead of returning it, and the result data is
+	 * empty
 	 *
 	 * @returns Exported result
 	 */
-	exportDataSelection(selection: TableSelection, format: ExportFormat): Promise<ExportedData> {
-		return super.performRpc('export_data_selection', ['selection', 'format'], [selection, format]);
+	exportDataSelection(selection: TableSelection, format: ExportFormat, path: string | undefined): Promise<ExportedData> {
+		return super.performRpc('export_data_selection', ['selection', 'format', 'path'], [selection, format, path]);
 	}
 
 	/**
@@ -34,6 +34,33 @@ export interface VariableList {
 
 }
 
+/**
+ * A view containing a range of the variables in the session, sorted by
+ * name.
+ */
+export interface VariableRange {
+	/**
+	 * The variables in the range.
+	 */
+	variables: Array<Variable>;
+
+	/**
+	 * The index of the first variable in the range.
+	 */
+	start: number;
+
+	/**
+	 * The total number of variables in the session.
+	 */
+	length: number;
+
+	/**
+	 * The version of the view (incremented with each update)
+	 */
+	version: number;
+
+}
+
 /**
  * An inspected variable.
  */
@@ -51,6 +78,27 @@ export interface InspectedVariable {
 
 }
 
+/**
+ * A range of the children of an inspected variable.
+ */
+export interface InspectedVariableRange {
+	/**
+	 * The children in the range.
+	 */
+	children: Array<Variable>;
+
+	/**
+	 * The index of the first child in the range.
+	 */
+	start: number;
+
+	/**
+	 * The total number of children of the variable.
+	 */
+	length: number;
+
+}
+
 /**
  * An object formatted for copying to the clipboard.
  */
@@ -187,6 +235,21 @@ export enum VariableKind {
 	Connection = 'connection'
 }
 
+/**
+ * Parameters for the ListRange method.
+ */
+export interface ListRangeParams {
+	/**
+	 * The index of the first variable to return.
+	 */
+	start: number;
+
+	/**
+	 * The maximum number of variables to return.
+	 */
+	count: number;
+}
+
 /**
  * Parameters for the Clear method.
  */
@@ -217,6 +280,26 @@ export interface InspectParams {
 	path: Array<string>;
 }
 
+/**
+ * Parameters for the InspectRange method.
+ */
+export interface InspectRangeParams {
+	/**
+	 * The path to the variable to inspect, as an array of access keys.
+	 */
+	path: Array<string>;
+
+	/**
+	 * The index of the first child to return.
+	 */
+	start: number;
+
+	/**
+	 * The maximum number of children to return.
+	 */
+	count: number;
+}
+
 /**
  * Parameters for the ClipboardFormat method.
  */
@@ -360,9 +443,11 @@ export enum VariablesFrontendEvent {
 
 export enum VariablesBackendRequest {
 	List = 'list',
+	ListRange = 'list_range',
 	Clear = 'clear',
 	Delete = 'delete',
 	Inspect = 'inspect',
+	InspectRange = 'inspect_range',
 	ClipboardFormat = 'clipboard_format',
 	View = 'view',
 	QueryTableSummary = 'query_table_summary'
@@ -390,6 +475,23 @@ export class PositronVariablesComm extends PositronBaseComm {
 		return super.performRpc('list', [], []);
 	}
 
+	/**
+	 * List a range of variables
+	 *
+	 * Returns a range of the variables in the current session, sorted by
+	 * name. Display values are only computed for the variables in the range,
+	 * so the frontend can page through a large session.
+	 *
+	 * @param start The index of the first variable to return.
+	 * @param count The maximum number of variables to return.
+	 *
+	 * @returns A view containing a range of the variables in the session,
+	 * sorted by name.
+	 */
+	listRange(start: number, count: number): Promise<VariableRange> {
+		return super.performRpc('list_range', ['start', 'count'], [start, count]);
+	}
+
 	/**
 	 * Clear all variables
 	 *
@@ -430,6 +532,24 @@ export class PositronVariablesComm extends PositronBaseComm {
 		return super.performRpc('inspect', ['path'], [path]);
 	}
 
+	/**
+	 * Inspect a range of a variable's children
+	 *
+	 * Returns a range of the children of a variable, as an array of
+	 * variables. Only the children in the range are summarized, so the
+	 * frontend can page through a large collection.
+	 *
+	 * @param path The path to the variable to inspect, as an array of access
+	 * keys.
+	 * @param start The index of the first child to return.
+	 * @param count The maximum number of children to return.
+	 *
+	 * @returns A range of the children of an inspected variable.
+	 */
+	inspectRange(path: Array<string>, start: number, count: number): Promise<InspectedVariableRange> {
+		return super.performRpc('inspect_range', ['path', 'start', 'count'], [path, start, count]);
+	}
+
 	/**
 	 * Format for clipboard
 	 *
@@ -37,7 +37,8 @@ const FrequencyCount = React.memo(({
 	xAxisHeight,
 	countPercent,
 	xPosition,
-	hoverManager
+	hoverManager,
+	isApproximate
 }: {
 	count: number;
 	countIndex: number;
@@ -49,6 +50,7 @@ const FrequencyCount = React.memo(({
 	countPercent: string;
 	xPosition: number;
 	hoverManager: IHoverManager;
+	isApproximate: boolean;
 }) => {
 	const containerRef = useRef<HTMLDivElement>(null);
 	const [isHovered, setIsHovered] = useState(false);
@@ -90,7 +92,10 @@ const FrequencyCount = React.memo(({
 					if (containerRef.current) {
 						hoverManager.showHover(
 							containerRef.current,
-							`Value: ${formattedValue}\nCount: ${count} (${countPercent}%)`
+							`Value: ${formattedValue}\n` +
+							(isApproximate ?
+								`Count: ~${count} (${countPercent}%)\nEstimated from a row sample` :
+								`Count: ${count} (${countPercent}%)`)
 						);
 					}
 				}}
@@ -120,7 +125,8 @@ const OtherCount = React.memo(({
 	graphWidth,
 	xAxisHeight,
 	xPosition,
-	hoverManager
+	hoverManager,
+	isApproximate
 }: {
 	otherCount: number;
 	maxCount: number;
@@ -130,6 +136,7 @@ const OtherCount = React.memo(({
 	xAxisHeight: number;
 	xPosition: number;
 	hoverManager: IHoverManager;
+	isApproximate: boolean;
 }) => {
 	const containerRef = useRef<HTMLDivElement>(null);
 	const [isHovered, setIsHovered] = useState(false);
@@ -159,7 +166,13 @@ const OtherCount = React.memo(({
 				onMouseOver={() => {
 					setIsHovered(true);
 					if (containerRef.current) {
-						hoverManager.showHover(containerRef.current, `Other values\nCount: ${otherCount} (${otherCountPercent}%)`);
+						hoverManager.showHover(
+							containerRef.current,
+							'Other values\n' +
+							(isApproximate ?
+								`Count: ~${otherCount} (${otherCountPercent}%)\nEstimated from a row sample` :
+								`Count: ${otherCount} (${otherCountPercent}%)`)
+						);
 					}
 				}}
 			>
@@ -265,6 +278,7 @@ export const VectorFrequencyTable = (props: VectorFrequencyTableProps) => {
 							countWidth={countWidth}
 							graphHeight={props.graphHeight}
 							hoverManager={props.hoverManager}
+							isApproximate={!!props.columnFrequencyTable.is_approximate}
 							value={value}
 							xAxisHeight={props.xAxisHeight}
 							xPosition={positions[countIndex]}
@@ -276,6 +290,7 @@ export const VectorFrequencyTable = (props: VectorFrequencyTableProps) => {
 						graphHeight={props.graphHeight}
 						graphWidth={props.graphWidth}
 						hoverManager={props.hoverManager}
+						isApproximate={!!props.columnFrequencyTable.is_approximate}
 						maxCount={maxCount}
 						otherCount={props.columnFrequencyTable.other_count}
 						totalCount={totalCount}
@@ -41,6 +41,7 @@ const BinItem = React.memo(({
 	formatOptions,
 	graphHeight,
 	hoverManager,
+	isApproximate,
 	xAxisHeight
 }: {
 	binCount: number;
@@ -54,6 +55,7 @@ const BinItem = React.memo(({
 	formatOptions: FormatOptions;
 	graphHeight: number;
 	hoverManager: IHoverManager;
+	isApproximate: boolean;
 	xAxisHeight: number;
 }) => {
 	const containerRef = useRef<HTMLDivElement>(null);
@@ -107,7 +109,10 @@ const BinItem = React.memo(({
 					if (containerRef.current) {
 						hoverManager.showHover(
 							containerRef.current,
-							`Range: ${formattedMin} to ${formattedMax}\nCount: ${binCount} (${binCountPercent}%)`
+							`Range: ${formattedMin} to ${formattedMax}\n` +
+							(isApproximate ?
+								`Count: ~${binCount} (${binCountPercent}%)\nEstimated from a row sample` :
+								`Count: ${binCount} (${binCountPercent}%)`)
 						);
 					}
 				}}
@@ -242,6 +247,7 @@ export const VectorHistogram = (props: VectorHistogramProps) => {
 							formatOptions={props.formatOptions}
 							graphHeight={props.graphHeight}
 							hoverManager={props.hoverManager}
+							isApproximate={!!props.columnHistogram.is_approximate}
 							xAxisHeight={props.xAxisHeight}
 						/>
 					);